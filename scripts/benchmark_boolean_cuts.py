@@ -0,0 +1,227 @@
+"""
+Boolean Cut Benchmark
+
+Times the Phase 1A cutouts applied one boolean per cutout
+(create_boolean_cutter) against one joined cutter and a single boolean per
+wall (apply_boolean_cuts), and checks that both paths leave walls with the
+same volume and bounds.
+
+Walls are rebuilt from the spec for every run: the straight walls exactly as
+the Phase 1A template builds them, the angled alcove walls as rotated boxes of
+the same length and thickness (close enough for timing and parity).
+
+Runs inside Blender (headless).
+
+Usage:
+    blender -b -P scripts/benchmark_boolean_cuts.py
+    blender -b -P scripts/benchmark_boolean_cuts.py -- --repeat 5 --out work/metrics/boolean_cut_benchmark.json
+"""
+
+import sys
+import json
+import math
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import bmesh
+import bpy
+import yaml
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+if str(scripts_dir) not in sys.path:
+    sys.path.append(str(scripts_dir))
+
+from blender_helpers import create_box, create_boolean_cutter, apply_boolean_cuts, plan_cutout_cutters
+
+
+MODES = ['sequential', 'batched']
+DEFAULT_SPEC = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
+
+
+def parse_args():
+    """Parse command-line arguments passed after '--' in Blender invocation."""
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs batched boolean cuts")
+    parser.add_argument("--spec", default=str(DEFAULT_SPEC), help="Phase 1A spec YAML")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best time is reported)")
+    parser.add_argument("--out", default=None, help="Optional JSON output path")
+
+    if "--" in sys.argv:
+        args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        args = parser.parse_args([])
+
+    return args
+
+
+def reset_scene():
+    """Remove all objects and orphaned meshes without using operators."""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def build_walls(spec):
+    """
+    Build the walls that carry cutouts.
+
+    Returns:
+        dict: Wall object name -> object
+    """
+    walls = spec['walls']
+    width = spec['overall']['footprint']['width']
+    depth = spec['overall']['footprint']['depth']
+    height = walls['height']
+    t = walls['thickness']
+
+    objects = {
+        'Wall_Front': create_box("Wall_Front", width, t, height, (0, -depth/2, height/2)),
+        'Wall_Rear': create_box("Wall_Rear", width, t, height, (0, depth/2, height/2)),
+        'Wall_Left': create_box("Wall_Left", t, depth, height, (-width/2, 0, height/2)),
+        'Wall_Right': create_box("Wall_Right", t, depth, height, (width/2, 0, height/2)),
+    }
+
+    door_alcove = spec.get('door_alcove', {})
+    if door_alcove.get('enabled', False):
+        alcove_t = door_alcove['walls']['thickness']
+        alcove_h = door_alcove['height']
+        y_front = door_alcove['position']['y_front']
+        y_back = door_alcove['position']['y_back'] - alcove_t / 2
+
+        for side in ('left', 'right'):
+            front_x = door_alcove['walls'][side]['front_x']
+            back_x = door_alcove['walls'][side]['back_x']
+            dx, dy = back_x - front_x, y_back - y_front
+            name = f"Alcove_Wall_{side.title()}"
+            wall = create_box(name, math.hypot(dx, dy), alcove_t, alcove_h,
+                              ((front_x + back_x) / 2, (y_front + y_back) / 2, alcove_h / 2))
+            wall.rotation_euler[2] = math.atan2(dy, dx)
+            objects[name] = wall
+
+        back = door_alcove['walls'].get('back', {})
+        if back.get('enabled', False):
+            objects['Alcove_Wall_Back'] = create_box(
+                "Alcove_Wall_Back", back['width'], alcove_t, back['height'],
+                (0, back['position_y'], back['height'] / 2)
+            )
+
+    return objects
+
+
+def wall_metrics(obj):
+    """Volume, face count and world bounds of an object (for parity)."""
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bm.transform(obj.matrix_world)
+    volume = bm.calc_volume()
+    coords = [v.co for v in bm.verts]
+    bm.free()
+    return {
+        'volume': volume,
+        'faces': len(obj.data.polygons),
+        'min': [min(c[i] for c in coords) for i in range(3)],
+        'max': [max(c[i] for c in coords) for i in range(3)],
+    }
+
+
+def run_mode(spec, mode):
+    """
+    Build the walls and apply every cutout with one path.
+
+    Returns:
+        tuple: (elapsed seconds, {wall: seconds}, {wall: wall_metrics})
+    """
+    reset_scene()
+    walls = build_walls(spec)
+    cutters = plan_cutout_cutters(spec)
+    per_wall = {}
+
+    start = time.perf_counter()
+    for wall_name, cutter_specs in cutters.items():
+        if wall_name not in walls:
+            continue
+        wall_start = time.perf_counter()
+        if mode == 'batched':
+            apply_boolean_cuts(walls[wall_name], cutter_specs)
+        else:
+            for cutter in cutter_specs:
+                create_boolean_cutter(walls[wall_name], cutter['name'], cutter['width'], cutter['depth'],
+                                      cutter['height'], cutter['location'], rotation_z=cutter['rotation_z'])
+        per_wall[wall_name] = time.perf_counter() - wall_start
+    elapsed = time.perf_counter() - start
+
+    metrics = {name: wall_metrics(walls[name]) for name in per_wall}
+    reset_scene()
+    return elapsed, per_wall, metrics
+
+
+def compare_metrics(sequential, batched, tolerance=1e-4):
+    """Compare per-wall volume and bounds between the two paths."""
+    walls = {}
+    for name, seq in sequential.items():
+        bat = batched[name]
+        walls[name] = {
+            'volume_match': abs(seq['volume'] - bat['volume']) <= tolerance * max(1.0, abs(seq['volume'])),
+            'bounds_match': all(abs(a - b) <= tolerance for a, b in zip(seq['min'] + seq['max'], bat['min'] + bat['max'])),
+            'faces': {'sequential': seq['faces'], 'batched': bat['faces']},
+        }
+    passed = all(w['volume_match'] and w['bounds_match'] for w in walls.values())
+    return {'passed': passed, 'walls': walls}
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    with open(args.spec, 'r') as f:
+        spec = yaml.safe_load(f)
+
+    print("=" * 70)
+    print(" Boolean Cut Benchmark (sequential vs batched)")
+    print("=" * 70)
+
+    results = {}
+    for mode in MODES:
+        runs = [run_mode(spec, mode) for _ in range(max(1, args.repeat))]
+        best = min(runs, key=lambda run: run[0])
+        results[mode] = {'best_s': best[0], 'runs_s': [run[0] for run in runs], 'per_wall_s': best[1], 'metrics': best[2]}
+
+    parity = compare_metrics(results['sequential']['metrics'], results['batched']['metrics'])
+
+    print(f"\n{'Wall':<20} {'Cutouts':>8} {'sequential (ms)':>16} {'batched (ms)':>13}")
+    cutters = plan_cutout_cutters(spec)
+    for wall in results['sequential']['per_wall_s']:
+        print(f"{wall:<20} {len(cutters[wall]):>8} "
+              f"{results['sequential']['per_wall_s'][wall] * 1000:>16.1f} "
+              f"{results['batched']['per_wall_s'][wall] * 1000:>13.1f}")
+
+    sequential_s, batched_s = results['sequential']['best_s'], results['batched']['best_s']
+    speedup = sequential_s / batched_s if batched_s else float('inf')
+    print(f"\nTotal: sequential {sequential_s:.3f}s, batched {batched_s:.3f}s ({speedup:.1f}x)")
+    print(f"Parity (volume and bounds per wall): {'PASSED' if parity['passed'] else 'FAILED'}")
+    for wall, result in parity['walls'].items():
+        if not (result['volume_match'] and result['bounds_match']):
+            print(f"  ❌ {wall}: {result}")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(),
+                'blender_version': bpy.app.version_string,
+                'spec': str(args.spec),
+                'parity': parity,
+                'results': {mode: {k: v for k, v in r.items() if k != 'metrics'} for mode, r in results.items()}
+            }, f, indent=2)
+        print(f"\nWrote results to {out_path}")
+
+    print("=" * 70)
+    return 0 if parity['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Box Construction Engine Benchmark
+
+Times blender_helpers.create_box with the 'ops' engine (primitive_cube_add +
+transform_apply) against the 'data' engine (direct bpy.data mesh creation)
+as the number of boxes grows, and checks that both engines produce identical
+vertex positions and dimensions.
+
+Runs inside Blender (headless).
+
+Usage:
+    blender -b -P scripts/benchmark_box_engines.py -- --counts 10 100 1000 5000
+    blender -b -P scripts/benchmark_box_engines.py -- --out work/metrics/box_engine_benchmark.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import bpy
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+if str(scripts_dir) not in sys.path:
+    sys.path.append(str(scripts_dir))
+
+from blender_helpers import create_box
+
+
+ENGINES = ['ops', 'data']
+DEFAULT_COUNTS = [10, 100, 500, 1000, 2500, 5000]
+
+# Representative pieces: wall, trim, muntin, glass pane
+PARITY_CASES = [
+    ("Parity_Wall", 8.5, 0.18, 3.75, (0, -7.5, 1.875)),
+    ("Parity_Trim", 2.36, 0.02, 0.12, (-2.5, -7.49, 2.86)),
+    ("Parity_Muntin", 0.03, 0.04, 2.04, (0.33, -6.5, 1.33)),
+    ("Parity_Glass", 0.2883, 0.01, 0.3472, (-0.55, -6.5, 2.1)),
+]
+
+
+def parse_args():
+    """Parse command-line arguments passed after '--' in Blender invocation."""
+    parser = argparse.ArgumentParser(description="Benchmark create_box construction engines")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS,
+                        help="Box counts to benchmark")
+    parser.add_argument("--engines", nargs="+", default=ENGINES, choices=ENGINES,
+                        help="Engines to benchmark")
+    parser.add_argument("--out", default=None, help="Optional JSON output path")
+
+    if "--" in sys.argv:
+        args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        args = parser.parse_args([])
+
+    return args
+
+
+def reset_scene():
+    """Remove all objects and orphaned meshes without using operators."""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def time_engine(engine, count):
+    """
+    Build `count` boxes with the given engine and return elapsed seconds.
+
+    Boxes are laid out on a grid with varying sizes, similar to trim/muntin pieces.
+    """
+    reset_scene()
+
+    start = time.perf_counter()
+    for i in range(count):
+        create_box(
+            f"Bench_Box_{i}",
+            width=0.05 + (i % 7) * 0.1,
+            depth=0.02 + (i % 3) * 0.05,
+            height=0.1 + (i % 5) * 0.2,
+            location=((i % 50) * 1.0, (i // 50) * 1.0, 0.5),
+            engine=engine
+        )
+    elapsed = time.perf_counter() - start
+
+    reset_scene()
+    return elapsed
+
+
+def check_parity():
+    """
+    Build each parity case with both engines and compare geometry.
+
+    Returns:
+        dict: {'passed': bool, 'cases': {name: {'vertices_match', 'dimensions_match'}}}
+    """
+    reset_scene()
+    cases = {}
+
+    for name, width, depth, height, location in PARITY_CASES:
+        ops_obj = create_box(f"{name}_ops", width, depth, height, location, engine='ops')
+        data_obj = create_box(f"{name}_data", width, depth, height, location, engine='data')
+
+        ops_verts = [tuple(v.co) for v in ops_obj.data.vertices]
+        data_verts = [tuple(v.co) for v in data_obj.data.vertices]
+
+        cases[name] = {
+            'vertices_match': ops_verts == data_verts,
+            'dimensions_match': tuple(ops_obj.dimensions) == tuple(data_obj.dimensions),
+            'location_match': tuple(ops_obj.location) == tuple(data_obj.location),
+        }
+
+    reset_scene()
+    passed = all(all(case.values()) for case in cases.values())
+    return {'passed': passed, 'cases': cases}
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    print("=" * 70)
+    print(" create_box Engine Benchmark")
+    print("=" * 70)
+
+    parity = check_parity()
+    print(f"\nParity check (ops vs data): {'PASSED' if parity['passed'] else 'FAILED'}")
+    for name, result in parity['cases'].items():
+        print(f"  {name}: {result}")
+
+    results = []
+    print(f"\n{'Boxes':>8}  " + "  ".join(f"{engine + ' (s)':>12}" for engine in args.engines) + "  per-box (ms)")
+    for count in args.counts:
+        row = {'count': count}
+        for engine in args.engines:
+            row[engine] = time_engine(engine, count)
+        per_box = "  ".join(f"{row[engine] / count * 1000:.3f}" for engine in args.engines)
+        print(f"{count:>8}  " + "  ".join(f"{row[engine]:>12.3f}" for engine in args.engines) + f"  {per_box}")
+        results.append(row)
+
+    if 'ops' in args.engines and 'data' in args.engines:
+        largest = results[-1]
+        print(f"\nSpeedup at {largest['count']} boxes: {largest['ops'] / largest['data']:.1f}x")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(),
+                'blender_version': bpy.app.version_string,
+                'parity': parity,
+                'results': results
+            }, f, indent=2)
+        print(f"\nWrote results to {out_path}")
+
+    print("=" * 70)
+    return 0 if parity['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
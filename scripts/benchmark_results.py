@@ -0,0 +1,244 @@
+"""
+Benchmark Results
+Machine info, result files and baseline comparison for benchmark_suite.py
+
+A results file holds the machine it was measured on and one entry per
+(case, scale) with the best and median of the timed runs. Comparing against a
+baseline flags a case as a regression when its best time is both
+`threshold` (relative) and MIN_DELTA_S (absolute) slower than the baseline's,
+so millisecond-level noise in the small scales does not trip it. Timings from
+a different machine or Blender version are compared but reported as such.
+
+Needs no Blender, so stored results can be compared anywhere.
+
+Usage:
+    from benchmark_results import machine_info, compare_results, print_comparison
+
+    python scripts/benchmark_results.py work/metrics/benchmarks/latest.json
+    python scripts/benchmark_results.py latest.json --baseline work/metrics/benchmarks/baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BENCHMARK_DIR = PROJECT_ROOT / 'work' / 'metrics' / 'benchmarks'
+DEFAULT_BASELINE = BENCHMARK_DIR / 'baseline.json'
+
+# Relative slowdown that counts as a regression
+DEFAULT_THRESHOLD = 0.2
+
+# Slowdowns smaller than this (seconds) are noise, whatever the ratio
+MIN_DELTA_S = 0.005
+
+# Machine fields that must match for timings to be comparable
+MACHINE_KEYS = ['system', 'machine', 'processor', 'cpu_count', 'python', 'blender']
+
+RESULTS_VERSION = 1
+
+
+def git_commit():
+    """Current commit hash of the project (None outside a git checkout)."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def machine_info(blender_version=None):
+    """
+    Describe the machine a benchmark ran on.
+
+    Args:
+        blender_version (str): bpy.app.version_string (None outside Blender)
+
+    Returns:
+        dict: OS, architecture, CPU, Python and Blender versions, host and commit
+    """
+    return {
+        'system': f"{platform.system()} {platform.release()}",
+        'machine': platform.machine(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'blender': blender_version,
+        'host': platform.node(),
+        'commit': git_commit(),
+    }
+
+
+def summarize_runs(case, scale, runs_s, items=None):
+    """
+    Build one result entry from the timed runs of a case at one scale.
+
+    Args:
+        case (str): Case name ('create_box')
+        scale (int): Scale the case ran at (boxes, cutters, partitions, ...)
+        runs_s (list): Seconds per run
+        items (int): Objects the case produced per run (for per-item times)
+
+    Returns:
+        dict: 'case', 'scale', 'runs_s', 'best_s', 'median_s', 'items', 'per_item_ms'
+    """
+    best = min(runs_s)
+    return {
+        'case': case,
+        'scale': scale,
+        'runs_s': list(runs_s),
+        'best_s': best,
+        'median_s': statistics.median(runs_s),
+        'items': items,
+        'per_item_ms': best / items * 1000 if items else None,
+    }
+
+
+def result_key(entry):
+    """Identify an entry across result files."""
+    return f"{entry['case']}@{entry['scale']}"
+
+
+def write_results(path, results, machine, repeat=None):
+    """Write a results file (parents created)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            'machine': machine,
+            'repeat': repeat,
+            'results': results,
+        }, f, indent=2)
+    return path
+
+
+def load_results(path):
+    """
+    Load a results file.
+
+    Raises:
+        ValueError: If the file is not a benchmark results file of this version
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if data.get('version') != RESULTS_VERSION or 'results' not in data:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark results file")
+    return data
+
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD, min_delta_s=MIN_DELTA_S):
+    """
+    Compare a results file against a baseline.
+
+    Args:
+        current (dict): Loaded results
+        baseline (dict): Loaded baseline results
+        threshold (float): Relative slowdown of best_s that counts as a regression
+        min_delta_s (float): Smaller absolute slowdowns are never regressions
+
+    Returns:
+        dict: 'cases' (one dict per current entry with 'key', 'best_s',
+            'baseline_s', 'ratio' and 'status': regression / improved / ok / new),
+            'regressions' (keys), 'missing' (baseline keys not measured now),
+            'machine_mismatch' (machine fields that differ) and 'passed'
+    """
+    base_entries = {result_key(e): e for e in baseline['results']}
+    cases = []
+    for entry in current['results']:
+        key = result_key(entry)
+        base = base_entries.get(key)
+        row = {'key': key, 'best_s': entry['best_s'], 'baseline_s': None, 'ratio': None, 'status': 'new'}
+        if base is not None:
+            delta = entry['best_s'] - base['best_s']
+            row['baseline_s'] = base['best_s']
+            row['ratio'] = entry['best_s'] / base['best_s'] if base['best_s'] else None
+            if delta > min_delta_s and delta > base['best_s'] * threshold:
+                row['status'] = 'regression'
+            elif -delta > min_delta_s and -delta > base['best_s'] * threshold:
+                row['status'] = 'improved'
+            else:
+                row['status'] = 'ok'
+        cases.append(row)
+
+    measured = {row['key'] for row in cases}
+    current_machine = current.get('machine') or {}
+    base_machine = baseline.get('machine') or {}
+    regressions = [row['key'] for row in cases if row['status'] == 'regression']
+    return {
+        'cases': cases,
+        'regressions': regressions,
+        'missing': [key for key in base_entries if key not in measured],
+        'machine_mismatch': [k for k in MACHINE_KEYS if current_machine.get(k) != base_machine.get(k)],
+        'passed': not regressions,
+    }
+
+
+def print_results(results):
+    """Print the timing table of one run."""
+    print(f"\n{'Case':<28} {'Scale':>6} {'Items':>6} {'Best (s)':>10} {'Median (s)':>11} {'ms/item':>8}")
+    print("-" * 74)
+    for e in results:
+        items = "-" if e['items'] is None else e['items']
+        per_item = "-" if e['per_item_ms'] is None else f"{e['per_item_ms']:.2f}"
+        print(f"{e['case']:<28} {e['scale']:>6} {items:>6} {e['best_s']:>10.4f} {e['median_s']:>11.4f} {per_item:>8}")
+
+
+def print_comparison(comparison, threshold=DEFAULT_THRESHOLD):
+    """Print a baseline comparison."""
+    markers = {'regression': "❌", 'improved': "✓", 'ok': " ", 'new': "+"}
+    print(f"\n{'':<2}{'Case':<36} {'Baseline (s)':>12} {'Now (s)':>10} {'Ratio':>7}")
+    print("-" * 70)
+    for row in comparison['cases']:
+        baseline = "-" if row['baseline_s'] is None else f"{row['baseline_s']:.4f}"
+        ratio = "-" if row['ratio'] is None else f"{row['ratio']:.2f}x"
+        print(f"{markers[row['status']]:<2}{row['key']:<36} {baseline:>12} {row['best_s']:>10.4f} {ratio:>7}")
+    print("-" * 70)
+
+    if comparison['machine_mismatch']:
+        print(f"⚠️  Baseline is from a different setup ({', '.join(comparison['machine_mismatch'])} differ); "
+              f"timings may not be comparable")
+    if comparison['missing']:
+        print(f"⚠️  Not measured this run: {', '.join(comparison['missing'])}")
+    if comparison['regressions']:
+        print(f"❌ {len(comparison['regressions'])} regression(s) over {threshold:.0%}: "
+              f"{', '.join(comparison['regressions'])}")
+    else:
+        print(f"✓ No regressions over {threshold:.0%}")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("results", help="Results JSON written by benchmark_suite.py")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown that counts as a regression")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    current = load_results(args.results)
+    baseline = load_results(args.baseline)
+
+    print("=" * 70)
+    print(f" Benchmark Comparison: {Path(args.results).name} vs {Path(args.baseline).name}")
+    print("=" * 70)
+    comparison = compare_results(current, baseline, threshold=args.threshold)
+    print_comparison(comparison, threshold=args.threshold)
+    return 0 if comparison['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Benchmark Suite
+Timing for the helper-library primitives and template build steps
+
+Times each case at several scales (number of boxes, cutters, frames, door
+panels, extra interior partitions, objects verified or exported):
+
+    create_box, create_cylinder      - primitives
+    create_boolean_cutter            - cutters applied to one wall
+    create_window_frame              - 4-piece frames
+    create_french_door_panel         - 10-lite door panels
+    build_interior_geometry          - Phase 1C layout plus extra partitions
+    verify_all_objects               - dimension checks
+    gltf_export                      - GLB export of a scene of boxes
+
+Scene setup is not timed; helper console output is suppressed while timing.
+The best of --repeat runs is kept. Results are written with machine info to
+work/metrics/benchmarks/ and compared against the stored baseline (see
+benchmark_results.py); any regression makes the run exit 1.
+
+Runs inside Blender (headless).
+
+Usage:
+    blender -b -P scripts/benchmark_suite.py
+    blender -b -P scripts/benchmark_suite.py -- --quick --cases create_box gltf_export
+    blender -b -P scripts/benchmark_suite.py -- --save-baseline
+    blender -b -P scripts/benchmark_suite.py -- --repeat 5 --threshold 0.1
+"""
+
+import sys
+import copy
+import contextlib
+import gc
+import io
+import math
+import tempfile
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import bpy
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+if str(scripts_dir) not in sys.path:
+    sys.path.append(str(scripts_dir))
+
+from benchmark_results import (
+    BENCHMARK_DIR, DEFAULT_BASELINE, DEFAULT_THRESHOLD,
+    machine_info, summarize_runs, write_results, load_results,
+    compare_results, print_results, print_comparison
+)
+from blender_helpers import (
+    create_box, create_cylinder, create_boolean_cutter, apply_material,
+    verify_all_objects, reset_instance_meshes
+)
+from interior_layout import load_interior_spec
+from phase_1b_helpers import create_window_frame, create_french_door_panel
+from phase_1c_helpers import build_interior_geometry
+
+
+COLORS = ["#D3D3D3", "#8B7355", "#FFFFFF", "#2F4F4F"]
+
+
+def parse_args():
+    """Parse command-line arguments passed after '--' in Blender invocation."""
+    parser = argparse.ArgumentParser(description="Benchmark helper-library primitives and build steps")
+    parser.add_argument("--cases", nargs="+", default=None, choices=list(CASES),
+                        help="Cases to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Only the two smallest scales of each case")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case and scale (best time is kept)")
+    parser.add_argument("--out", default=None,
+                        help="Results JSON (default: work/metrics/benchmarks/benchmark_<timestamp>.json)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline results JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown that counts as a regression")
+
+    if "--" in sys.argv:
+        args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        args = parser.parse_args([])
+
+    return args
+
+
+def reset_scene():
+    """Remove all objects and orphaned meshes without using operators, and drop shared meshes."""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    reset_instance_meshes()
+
+
+def grid_location(i, spacing=1.0, columns=50, z=0.5):
+    """Location of item i on a grid in the XY plane."""
+    return ((i % columns) * spacing, (i // columns) * spacing, z)
+
+
+def build_boxes(count):
+    """Scene of `count` boxes of varying size (setup for verification/export)."""
+    boxes = []
+    for i in range(count):
+        dims = (0.05 + (i % 7) * 0.1, 0.02 + (i % 3) * 0.05, 0.1 + (i % 5) * 0.2)
+        obj = create_box(f"Bench_Box_{i}", *dims, location=grid_location(i), engine='data')
+        apply_material(obj, COLORS[i % len(COLORS)])
+        boxes.append((obj, dims))
+    return boxes
+
+
+def scaled_interior_spec(spec, partitions):
+    """
+    Add evenly spaced X-running partitions, each with one doorway, to an interior spec.
+
+    Args:
+        spec (dict): Loaded interior_layout.yaml
+        partitions (int): Extra wall segments to add
+
+    Returns:
+        dict: New spec (the input is not modified)
+    """
+    spec = copy.deepcopy(spec)
+    bounds = spec['interior_dimensions']
+    segments = spec.setdefault('wall_segments', {})
+    step = (bounds['back_y'] - bounds['front_y']) / (partitions + 1)
+    center_x = (bounds['left_x'] + bounds['right_x']) / 2
+    for i in range(1, partitions + 1):
+        segments[f"bench_partition_{i:03d}"] = {
+            'start_x': bounds['left_x'],
+            'end_x': bounds['right_x'],
+            'y_position': bounds['front_y'] + i * step,
+            'doorways': [{'position_x': center_x, 'width': 0.9, 'height': 2.1}],
+        }
+    return spec
+
+
+# ============================================================================
+# CASES
+# Each case takes a scale, sets up the scene (not timed) and returns the
+# callable to time.
+# ============================================================================
+
+def case_create_box(count):
+    def run():
+        for i in range(count):
+            create_box(f"Bench_Box_{i}", 0.05 + (i % 7) * 0.1, 0.02 + (i % 3) * 0.05,
+                       0.1 + (i % 5) * 0.2, location=grid_location(i))
+    return run
+
+
+def case_create_cylinder(count):
+    def run():
+        for i in range(count):
+            create_cylinder(f"Bench_Cylinder_{i}", 0.05 + (i % 4) * 0.05, 0.5 + (i % 3) * 0.5,
+                            location=grid_location(i))
+    return run
+
+
+def case_create_boolean_cutter(count):
+    wall = create_box("Bench_Wall", max(4.0, count * 1.0), 0.2, 3.0, location=(count * 0.5, 0, 1.5))
+
+    def run():
+        for i in range(count):
+            create_boolean_cutter(wall, f"Bench_Cutter_{i}", 0.5, 0.4, 1.0,
+                                  location=(0.5 + i * 1.0, 0, 1.5), rotation_z=0.3 if i % 2 else 0)
+    return run
+
+
+def case_create_window_frame(count):
+    def run():
+        for i in range(count):
+            create_window_frame(f"Bench_Window_{i}", 1.2, 1.6, 0.05, 0.1,
+                                location=grid_location(i, spacing=2.0, z=1.5),
+                                rotation_z=math.pi / 2 if i % 2 else 0)
+    return run
+
+
+def case_create_french_door_panel(count):
+    def run():
+        for i in range(count):
+            create_french_door_panel(f"Bench_Door_{i}", 0.9, 2.1, location=grid_location(i, spacing=2.0, z=1.05))
+    return run
+
+
+def case_build_interior_geometry(partitions):
+    spec = scaled_interior_spec(load_interior_spec(), partitions)
+
+    def run():
+        build_interior_geometry(spec)
+    return run
+
+
+def case_verify_all_objects(count):
+    specs = [{'object': obj, 'width': w, 'depth': d, 'height': h} for obj, (w, d, h) in build_boxes(count)]
+
+    def run():
+        verify_all_objects(specs)
+    return run
+
+
+def case_gltf_export(count):
+    build_boxes(count)
+    output_file = Path(tempfile.mkdtemp(prefix="bench_export_")) / "bench.glb"
+
+    def run():
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in bpy.data.objects:
+            if obj.type == 'MESH':
+                obj.select_set(True)
+        bpy.ops.export_scene.gltf(
+            filepath=str(output_file),
+            export_format='GLB',
+            use_selection=True,
+            export_materials='EXPORT'
+        )
+        output_file.unlink()
+    return run
+
+
+# Case name -> (setup function, scales, what the scale counts)
+CASES = {
+    'create_box': (case_create_box, [10, 100, 1000], "boxes"),
+    'create_cylinder': (case_create_cylinder, [10, 100, 500], "cylinders"),
+    'create_boolean_cutter': (case_create_boolean_cutter, [1, 5, 20], "cutters"),
+    'create_window_frame': (case_create_window_frame, [5, 25, 100], "frames"),
+    'create_french_door_panel': (case_create_french_door_panel, [1, 5, 20], "panels"),
+    'build_interior_geometry': (case_build_interior_geometry, [0, 10, 40], "extra partitions"),
+    'verify_all_objects': (case_verify_all_objects, [100, 1000, 5000], "objects"),
+    'gltf_export': (case_gltf_export, [100, 1000, 5000], "objects"),
+}
+
+
+def time_case(name, scale, repeat):
+    """
+    Time one case at one scale.
+
+    Returns:
+        dict: Result entry (see benchmark_results.summarize_runs); 'items' is
+            the number of objects the timed part created
+    """
+    setup = CASES[name][0]
+    runs = []
+    items = None
+    for _ in range(max(1, repeat)):
+        reset_scene()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run = setup(scale)
+            before = len(bpy.data.objects)
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            runs.append(time.perf_counter() - start)
+        items = len(bpy.data.objects) - before or scale
+    reset_scene()
+    return summarize_runs(name, scale, runs, items)
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    names = args.cases or list(CASES)
+
+    print("=" * 70)
+    print(" Benchmark Suite")
+    print("=" * 70)
+    machine = machine_info(bpy.app.version_string)
+    print(f"Blender {machine['blender']} | Python {machine['python']} | {machine['system']} "
+          f"| {machine['cpu_count']} CPUs | commit {machine['commit']}")
+
+    results = []
+    for name in names:
+        _, scales, unit = CASES[name]
+        for scale in (scales[:2] if args.quick else scales):
+            entry = time_case(name, scale, args.repeat)
+            results.append(entry)
+            print(f"  {name} ({scale} {unit}): {entry['best_s']:.4f}s")
+
+    print_results(results)
+
+    out_path = Path(args.out) if args.out else BENCHMARK_DIR / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    write_results(out_path, results, machine, repeat=args.repeat)
+    print(f"\nWrote results to {out_path}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        write_results(baseline_path, results, machine, repeat=args.repeat)
+        print(f"✓ Saved as baseline: {baseline_path}")
+        print("=" * 70)
+        return 0
+
+    if not baseline_path.exists():
+        print(f"⚠️  No baseline at {baseline_path} (store one with --save-baseline)")
+        print("=" * 70)
+        return 0
+
+    comparison = compare_results(load_results(out_path), load_results(baseline_path), threshold=args.threshold)
+    print_comparison(comparison, threshold=args.threshold)
+    print("=" * 70)
+    return 0 if comparison['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,9 @@ Designed to run in Blender's Python environment (headless or GUI).
 
 Usage:
     blender -b -P build_from_spec.py -- --spec building_v001.yaml --out_glb output.glb --out_renders_dir ./renders --out_metrics_json metrics.json
+
+    # Reopen the previous build and rebuild only changed spec components
+    blender -b -P build_from_spec.py -- --spec building_v002.yaml --out_glb output.glb --out_renders_dir ./renders --out_metrics_json metrics.json --incremental --previous previous.glb
 """
 
 import sys
@@ -29,6 +32,14 @@ except ImportError:
     YAML_AVAILABLE = False
     print("WARNING: PyYAML not installed. Install with: pip install pyyaml")
 
+# Add scripts to path
+scripts_dir = Path(__file__).parent.parent
+if str(scripts_dir) not in sys.path:
+    sys.path.append(str(scripts_dir))
+
+from spec_loader import load_spec_data, SpecValidationError
+from build_cache import plan_rebuild, print_plan, load_manifest, save_manifest, manifest_path_for
+
 
 def parse_args():
     """Parse command-line arguments passed after '--' in Blender invocation."""
@@ -37,6 +48,10 @@ def parse_args():
     parser.add_argument("--out_glb", required=True, help="Output GLB file path")
     parser.add_argument("--out_renders_dir", required=True, help="Output directory for renders")
     parser.add_argument("--out_metrics_json", required=True, help="Output JSON file for geometry metrics")
+    parser.add_argument("--out_blend", help="Saved .blend path (default: next to the GLB)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reopen the previous build and rebuild only changed components")
+    parser.add_argument("--previous", help="Previous build GLB (default: --out_glb); its .build.json manifest is used")
 
     # Blender passes args after '--', so we need to extract them
     if "--" in sys.argv:
@@ -49,18 +64,17 @@ def parse_args():
 
 def load_spec(spec_path):
     """
-    Load and parse YAML specification file.
+    Load, validate (docs/CONTRACT.md schema) and cache a YAML specification file.
+
+    Raises:
+        SpecValidationError: If required fields are missing or invalid
 
-    TODO: Implement full schema validation
     TODO: Handle version differences in spec format
     """
     if not YAML_AVAILABLE:
         raise RuntimeError("PyYAML not available. Cannot load spec.")
 
-    with open(spec_path, 'r') as f:
-        spec = yaml.safe_load(f)
-
-    # TODO: Validate required fields: units, overall, walls, openings, tolerances
+    spec = load_spec_data(spec_path)
     print(f"Loaded spec version: {spec.get('version', 'unknown')}")
     return spec
 
@@ -97,16 +111,20 @@ def build_footprint(spec):
     pass
 
 
-def build_walls(spec):
+def build_walls(spec, component=None):
     """
     Create exterior walls from spec.
 
+    Args:
+        spec: Loaded specification
+        component: Wall to build ('walls.front', ..., 'door_alcove'; None = all)
+
     TODO: Extract walls.thickness, height from spec
     TODO: Create wall meshes (could use Array modifier or extrude)
     TODO: Handle wall material assignment
     TODO: Cut openings for doors/windows
     """
-    print("TODO: build_walls()")
+    print(f"TODO: build_walls({component or ''})")
     # walls = spec.get('walls', {})
     # thickness = walls.get('thickness', 0.25)
     # height = walls.get('height', 3.0)
@@ -127,16 +145,32 @@ def build_roof(spec):
     pass
 
 
-def build_openings(spec):
+def build_canopy(spec):
+    """
+    Create the entrance canopy from spec.
+
+    TODO: Extract canopy depth, width, elevation and posts from spec
+    TODO: Create canopy slab and support posts
+    """
+    print("TODO: build_canopy()")
+    # canopy = spec.get('canopy', {})
+    pass
+
+
+def build_openings(spec, component=None):
     """
     Create door and window openings.
 
+    Args:
+        spec: Loaded specification
+        component: Cutout to cut ('cutouts.<name>'; None = all)
+
     TODO: Extract openings.doors and openings.windows from spec
     TODO: Use Boolean modifier to cut openings in walls
     TODO: Create door/window frame geometry
     TODO: Apply glass materials to windows
     """
-    print("TODO: build_openings()")
+    print(f"TODO: build_openings({component or ''})")
     # openings = spec.get('openings', {})
     # doors = openings.get('doors', [])
     # windows = openings.get('windows', [])
@@ -156,18 +190,157 @@ def apply_materials(spec):
     pass
 
 
-def calculate_metrics(spec):
+# (stage name, builder, spec components it builds). A stage reruns when any of
+# its components is in the rebuild plan; its previous objects are removed first.
+# 'cutouts.*' matches every cutout component, 'walls.*' every exterior wall.
+BUILD_STAGES = [
+    ('footprint', build_footprint, ['footprint_geometry', 'foundation']),
+    ('walls', build_walls, ['walls.*', 'door_alcove']),
+    ('roof', build_roof, ['roof', 'parapet', 'chimney']),
+    ('canopy', build_canopy, ['canopy']),
+    ('openings', build_openings, ['cutouts.*']),
+]
+
+# Stages built one component at a time (builder(spec, component)), so a
+# changed wall or cutout does not rebuild its neighbours. Their objects are
+# recorded per component ('walls.front', 'cutouts.rear_service_door').
+PER_COMPONENT_STAGES = {'walls', 'openings'}
+
+
+def component_matches(component, patterns):
+    """Check whether a component matches any stage pattern ('cutouts.*' or an exact name)."""
+    for pattern in patterns:
+        if pattern.endswith('.*'):
+            if component.startswith(pattern[:-1]):
+                return True
+        elif component == pattern:
+            return True
+    return False
+
+
+def stage_is_dirty(components, rebuild):
+    """Check whether any of a stage's components is in the rebuild set."""
+    return any(component_matches(c, components) for c in rebuild)
+
+
+def stage_units(stage, builder, components, spec_components):
+    """
+    Split a stage into build units.
+
+    Returns:
+        list: (unit name, build callable, components) tuples; one per matching
+            component for PER_COMPONENT_STAGES, otherwise the stage itself
+    """
+    if stage not in PER_COMPONENT_STAGES:
+        return [(stage, builder, components)]
+    return [(component, lambda spec, c=component: builder(spec, c), [component])
+            for component in sorted(spec_components) if component_matches(component, components)]
+
+
+def remove_objects(names):
+    """Remove objects (and their now-unused meshes) by name."""
+    if not BLENDER_AVAILABLE:
+        return
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        mesh = obj.data if obj.type == 'MESH' else None
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def scene_object_names():
+    """Get the names of all objects currently in bpy.data."""
+    if not BLENDER_AVAILABLE:
+        return set()
+    return {obj.name for obj in bpy.data.objects}
+
+
+def run_build_stages(spec, plan, previous_objects=None):
+    """
+    Run the build stages, skipping stages whose components are unchanged.
+
+    Args:
+        spec: Loaded specification
+        plan: Rebuild plan from build_cache.plan_rebuild
+        previous_objects: stage -> object names from the previous manifest
+
+    Returns:
+        tuple: (objects dict unit -> created/reused object names,
+                report dict with 'rebuilt' and 'reused' unit lists; units are
+                stages, or single components for PER_COMPONENT_STAGES)
+    """
+    previous_objects = previous_objects or {}
+    rebuild = set(plan['rebuild'])
+    spec_components = set(plan['hashes']) - {'__global__'}
+    objects = {}
+    report = {'rebuilt': [], 'reused': []}
+
+    # Objects of components no longer in the spec (removed cutouts)
+    for component in plan['removed']:
+        remove_objects(previous_objects.get(component, []))
+
+    for stage, builder, components in BUILD_STAGES:
+        for unit, build, unit_components in stage_units(stage, builder, components, spec_components):
+            if not plan['full'] and not stage_is_dirty(unit_components, rebuild):
+                objects[unit] = previous_objects.get(unit, [])
+                report['reused'].append(unit)
+                print(f"↺ {unit}: reused {len(objects[unit])} object(s)")
+                continue
+
+            remove_objects(previous_objects.get(unit, []))
+            before = scene_object_names()
+            build(spec)
+            objects[unit] = sorted(scene_object_names() - before)
+            report['rebuilt'].append(unit)
+            print(f"✓ {unit}: built {len(objects[unit])} object(s)")
+
+    return objects, report
+
+
+def open_previous_scene(blend_path):
+    """Open the previous build's .blend file."""
+    if not BLENDER_AVAILABLE:
+        print(f"STUB: Would open {blend_path}")
+        return
+    bpy.ops.wm.open_mainfile(filepath=str(blend_path))
+
+
+def save_blend(blend_path):
+    """Save the current scene so the next build can reopen it."""
+    if not BLENDER_AVAILABLE:
+        print(f"STUB: Would save {blend_path}")
+        return
+    bpy.ops.wm.save_as_mainfile(filepath=str(Path(blend_path).resolve()), copy=True)
+
+
+def calculate_metrics(spec, glb_path=None):
     """
     Calculate geometry metrics for validation.
 
-    TODO: Check for non-manifold edges
-    TODO: Check for intersecting faces
+    If the exported GLB exists, counts, non-manifold edges and intersecting
+    faces are computed from it by glb_analyzer (same numbers CI gets without
+    Blender).
+
     TODO: Measure actual dimensions vs spec
-    TODO: Count vertices, faces, edges
+
+    Args:
+        spec: Loaded specification
+        glb_path: Optional path to the exported GLB
 
     Returns:
         dict: Metrics dictionary to be written to JSON
     """
+    if glb_path and Path(glb_path).exists():
+        from glb_analyzer import analyze_glb
+
+        metrics = analyze_glb(glb_path, intersections=True)
+        metrics.pop('nodes', None)
+        metrics["dimension_errors"] = []
+        return metrics
+
     print("TODO: calculate_metrics()")
 
     metrics = {
@@ -252,24 +425,54 @@ def main():
     Path(args.out_renders_dir).mkdir(parents=True, exist_ok=True)
     Path(args.out_metrics_json).parent.mkdir(parents=True, exist_ok=True)
 
-    # Load specification
-    spec = load_spec(args.spec)
+    # Load specification (invalid specs fail here, before any geometry is built)
+    try:
+        spec = load_spec(args.spec)
+    except SpecValidationError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        write_metrics_json({"status": "error", "errors": e.errors, "warnings": []}, args.out_metrics_json)
+        sys.exit(1)
+
+    # Plan: rebuild everything, or only components whose spec subtree changed
+    blend_path = Path(args.out_blend) if args.out_blend else Path(args.out_glb).with_suffix('.blend')
+    previous = None
+    if args.incremental:
+        previous = load_manifest(manifest_path_for(args.previous or args.out_glb))
+        if previous and not (previous.get('blend') and Path(previous['blend']).exists()):
+            print("⚠️  Previous .blend not found - doing a full rebuild")
+            previous = None
+
+    plan = plan_rebuild(spec, previous)
+    print_plan(plan)
 
     # Build geometry
-    clear_scene()
-    build_footprint(spec)
-    build_walls(spec)
-    build_roof(spec)
-    build_openings(spec)
+    if plan['full']:
+        clear_scene()
+        objects, build_report = run_build_stages(spec, plan)
+    else:
+        open_previous_scene(previous['blend'])
+        objects, build_report = run_build_stages(spec, plan, previous.get('objects'))
     apply_materials(spec)
 
-    # Calculate metrics
-    metrics = calculate_metrics(spec)
-    write_metrics_json(metrics, args.out_metrics_json)
-
     # Export GLB
     export_glb(args.out_glb)
 
+    # Save scene + manifest for the next incremental build
+    save_blend(blend_path)
+    save_manifest(manifest_path_for(args.out_glb), spec, args.spec, plan['hashes'], objects,
+                  blend_path=blend_path, glb_path=args.out_glb)
+
+    # Calculate metrics (from the exported GLB when available)
+    metrics = calculate_metrics(spec, args.out_glb)
+    metrics["build"] = {
+        "mode": "full" if plan['full'] else "incremental",
+        "reason": plan['reason'],
+        "changed_components": plan['changed'],
+        "rebuilt_stages": build_report['rebuilt'],
+        "reused_stages": build_report['reused'],
+    }
+    write_metrics_json(metrics, args.out_metrics_json)
+
     # Render views
     setup_cameras_and_render(args.out_renders_dir)
 
@@ -6,15 +6,29 @@ Designed to run in Blender's Python environment (headless or GUI).
 
 Usage:
     blender -b scene.blend -P render_views.py -- --output_dir ./renders/iter_001
+
+    # Render a subset of views with a fixed thread count (used by render_parallel.py)
+    blender -b scene.blend -P render_views.py -- --output_dir ./renders/iter_001 --views front iso --threads 8
 """
 
 import sys
+import json
+import time
+import hashlib
 import argparse
 from pathlib import Path
 
+# Add scripts to path
+scripts_dir = Path(__file__).parent.parent
+if str(scripts_dir) not in sys.path:
+    sys.path.append(str(scripts_dir))
+
 # TODO: Import Blender Python API (bpy) - only available when run inside Blender
 try:
     import bpy
+    import numpy as np
+    from bpy_extras.object_utils import world_to_camera_view
+    from mathutils import Vector
     BLENDER_AVAILABLE = True
 except ImportError:
     BLENDER_AVAILABLE = False
@@ -28,6 +42,14 @@ def parse_args():
     parser.add_argument("--resolution_x", type=int, default=1920, help="Render width in pixels")
     parser.add_argument("--resolution_y", type=int, default=1080, help="Render height in pixels")
     parser.add_argument("--samples", type=int, default=128, help="Cycles samples (if using Cycles)")
+    parser.add_argument("--views", nargs="+", default=None,
+                        choices=VIEW_NAMES,
+                        help="Subset of views to render (default: all six)")
+    parser.add_argument("--engine", default=None, help="Render engine override (CYCLES, BLENDER_EEVEE, BLENDER_WORKBENCH)")
+    parser.add_argument("--threads", type=int, default=None, help="Fixed render thread count (default: all cores)")
+    parser.add_argument("--timing_json", default=None, help="Write per-view render times to this JSON file")
+    parser.add_argument("--no_cache", action="store_true", help="Always render, ignoring the render cache")
+    parser.add_argument("--cache_dir", default=None, help="Render cache directory (default: work/renders/.cache)")
 
     # Blender passes args after '--'
     if "--" in sys.argv:
@@ -40,21 +62,29 @@ def parse_args():
 
 def get_scene_bounds():
     """
-    Calculate bounding box of all objects in scene.
-
-    TODO: Implement using bpy.data.objects
-    TODO: Calculate min/max X, Y, Z coordinates
-    TODO: Return dict with center and size
+    Calculate bounding box of all mesh objects in scene.
 
     Returns:
         dict: {"center": (x, y, z), "size": (width, depth, height)}
     """
-    print("TODO: get_scene_bounds()")
+    if not BLENDER_AVAILABLE:
+        print("STUB: get_scene_bounds()")
+        return {
+            "center": (0.0, 0.0, 1.5),
+            "size": (10.0, 15.0, 3.5)
+        }
 
-    # STUB values
+    from scene_bounds import WorldBoundsCache
+
+    meshes = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH' and not obj.hide_render]
+    box = WorldBoundsCache().union(meshes)
+    if box is None:
+        return {"center": (0.0, 0.0, 0.0), "size": (1.0, 1.0, 1.0)}
+
+    lo, hi = box
     return {
-        "center": (0.0, 0.0, 1.5),
-        "size": (10.0, 15.0, 3.5)
+        "center": tuple(float(v) for v in (lo + hi) / 2),
+        "size": tuple(float(v) for v in hi - lo)
     }
 
 
@@ -62,37 +92,50 @@ def create_camera(name, location, rotation, target):
     """
     Create a camera at specified location looking at target.
 
-    TODO: Implement camera creation
-    TODO: Set camera.location = location
-    TODO: Set camera.rotation_euler = rotation OR use track-to constraint
-    TODO: Add camera to scene
-
     Args:
         name: Camera object name
         location: (x, y, z) tuple for camera position
-        rotation: (rx, ry, rz) euler angles in radians
-        target: (x, y, z) tuple for look-at point
+        rotation: (rx, ry, rz) euler angles in radians (used when target is None)
+        target: (x, y, z) tuple for look-at point, or None
 
     Returns:
         Camera object
     """
-    print(f"TODO: create_camera({name}, {location}, {rotation}, {target})")
-
     if not BLENDER_AVAILABLE:
         return None
 
-    # TODO: Implement
-    # camera_data = bpy.data.cameras.new(name=name)
-    # camera_object = bpy.data.objects.new(name, camera_data)
-    # bpy.context.collection.objects.link(camera_object)
-    # camera_object.location = location
-    # etc.
-    pass
+    camera_data = bpy.data.cameras.get(name) or bpy.data.cameras.new(name=name)
+    camera_object = bpy.data.objects.get(name)
+    if camera_object is None:
+        camera_object = bpy.data.objects.new(name, camera_data)
+        bpy.context.scene.collection.objects.link(camera_object)
+
+    camera_object.location = location
+    if target is not None:
+        direction = Vector(target) - Vector(location)
+        camera_object.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    else:
+        camera_object.rotation_euler = rotation
+
+    return camera_object
+
+
+# Unit direction from the scene center to each camera
+VIEW_DIRECTIONS = {
+    "front": (0.0, -1.0, 0.0),
+    "left": (-1.0, 0.0, 0.0),
+    "right": (1.0, 0.0, 0.0),
+    "rear": (0.0, 1.0, 0.0),
+    "iso": (0.5774, -0.5774, 0.5774),
+    "top": (0.0, 0.0, 1.0),
+}
+
+VIEW_NAMES = list(VIEW_DIRECTIONS)
 
 
-def setup_view_cameras(bounds):
+def setup_view_cameras(bounds, views=VIEW_NAMES):
     """
-    Create cameras for all standardized views.
+    Create cameras for the standardized views.
 
     Views:
     - front: Looking at -Y face (from -Y direction toward +Y)
@@ -102,92 +145,310 @@ def setup_view_cameras(bounds):
     - iso: Isometric view from (+X, -Y, +Z) looking at center
     - top: Top-down view from +Z looking down
 
-    TODO: Calculate appropriate camera distances based on bounds
-    TODO: Ensure all geometry fits in frame
-    TODO: Use orthographic or perspective (decide which)
+    Cameras are perspective, placed at 2.5x the largest scene dimension so all
+    geometry fits in frame.
 
     Args:
         bounds: Scene bounding box from get_scene_bounds()
+        views: View names to create cameras for
 
     Returns:
         dict: {"front": camera, "left": camera, ...}
     """
-    print("TODO: setup_view_cameras()")
-
     center = bounds["center"]
-    size = bounds["size"]
-    width, depth, height = size
-
-    # TODO: Calculate camera distance (function of max dimension)
-    # distance = max(width, depth, height) * 2.5
+    width, depth, height = bounds["size"]
+    distance = max(width, depth, height) * 2.5
 
     cameras = {}
-
-    # TODO: Create each camera
-    # cameras["front"] = create_camera("camera_front", ...)
-    # cameras["left"] = create_camera("camera_left", ...)
-    # cameras["right"] = create_camera("camera_right", ...)
-    # cameras["rear"] = create_camera("camera_rear", ...)
-    # cameras["iso"] = create_camera("camera_iso", ...)
-    # cameras["top"] = create_camera("camera_top", ...)
+    for view in views:
+        dx, dy, dz = VIEW_DIRECTIONS[view]
+        location = (center[0] + dx * distance, center[1] + dy * distance, center[2] + dz * distance)
+        if view == "top":
+            # Looking straight down: default camera orientation, no look-at (avoids gimbal flip)
+            cameras[view] = create_camera(f"camera_{view}", location, (0.0, 0.0, 0.0), None)
+        else:
+            cameras[view] = create_camera(f"camera_{view}", location, None, center)
 
     return cameras
 
 
-def configure_render_settings(resolution_x, resolution_y, samples):
+def configure_render_settings(resolution_x, resolution_y, samples, engine=None, threads=None):
     """
     Configure Blender render settings.
 
-    TODO: Set render resolution
-    TODO: Set render engine (CYCLES or EEVEE)
-    TODO: Set samples for Cycles
-    TODO: Set file format to PNG
-    TODO: Enable transparency if needed
-
     Args:
         resolution_x: Render width
         resolution_y: Render height
         samples: Cycles samples
+        engine: Render engine ('CYCLES', 'BLENDER_EEVEE', 'BLENDER_WORKBENCH');
+            None keeps the scene's engine
+        threads: Fixed render thread count (None = auto-detect all cores)
     """
-    print(f"TODO: configure_render_settings({resolution_x}, {resolution_y}, {samples})")
-
     if not BLENDER_AVAILABLE:
+        print(f"STUB: configure_render_settings({resolution_x}, {resolution_y}, {samples})")
         return
 
-    # TODO: Implement
-    # scene = bpy.context.scene
-    # scene.render.resolution_x = resolution_x
-    # scene.render.resolution_y = resolution_y
-    # scene.render.engine = 'CYCLES'
-    # scene.cycles.samples = samples
-    # scene.render.image_settings.file_format = 'PNG'
-    pass
+    scene = bpy.context.scene
+    scene.render.resolution_x = resolution_x
+    scene.render.resolution_y = resolution_y
+    scene.render.resolution_percentage = 100
+    scene.render.image_settings.file_format = 'PNG'
+
+    if engine:
+        scene.render.engine = engine
+    if scene.render.engine == 'CYCLES':
+        scene.cycles.samples = samples
+
+    if threads:
+        # Parallel renders share the machine: each process gets its own slice of cores
+        scene.render.threads_mode = 'FIXED'
+        scene.render.threads = threads
+    else:
+        scene.render.threads_mode = 'AUTO'
 
 
 def render_view(camera, output_path):
     """
     Render scene from specified camera.
 
-    TODO: Set active camera to camera
-    TODO: Set output path
-    TODO: Execute render
-    TODO: Handle render errors
-
     Args:
         camera: Camera object to render from
         output_path: Full path to output PNG file
     """
-    print(f"TODO: render_view({camera}, {output_path})")
-
     if not BLENDER_AVAILABLE:
         print(f"STUB: Would render to {output_path}")
         return
 
-    # TODO: Implement
-    # bpy.context.scene.camera = camera
-    # bpy.context.scene.render.filepath = str(output_path)
-    # bpy.ops.render.render(write_still=True)
-    pass
+    scene = bpy.context.scene
+    scene.camera = camera
+    scene.render.filepath = str(output_path)
+    bpy.ops.render.render(write_still=True)
+
+
+# Bump when camera/render code changes in a way that alters images
+# (or the set of objects a view's hash covers)
+RENDER_CACHE_VERSION = 2
+
+
+def _hash_update_floats(h, values):
+    """Feed floats into a hash with fixed rounding (ignores float noise)."""
+    h.update(np.round(np.asarray(values, dtype=np.float64), 6).tobytes())
+
+
+def object_in_frustum(scene, camera, obj):
+    """
+    Conservative frustum test on an object's world bounding box.
+
+    Returns False only if all 8 corners lie outside the same side of the view
+    (left/right/bottom/top) or all are behind the camera. Occlusion is handled
+    separately by occluded_mesh_names.
+    """
+    corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
+    projected = [world_to_camera_view(scene, camera, corner) for corner in corners]
+
+    if all(p.z <= 0 for p in projected):
+        return False
+    if any(p.z <= 0 for p in projected):
+        # Straddles the camera plane: projected x/y are unreliable
+        return True
+
+    return not (
+        all(p.x < 0 for p in projected) or all(p.x > 1 for p in projected) or
+        all(p.y < 0 for p in projected) or all(p.y > 1 for p in projected)
+    )
+
+
+def is_opaque(obj):
+    """Check whether an object can hide others (no blended, transparent or transmissive material)."""
+    for slot in obj.material_slots:
+        mat = slot.material
+        if mat is None:
+            continue
+        if getattr(mat, 'blend_method', 'OPAQUE') != 'OPAQUE':
+            return False
+        bsdf = mat.node_tree.nodes.get("Principled BSDF") if mat.use_nodes and mat.node_tree else None
+        if bsdf is None:
+            continue
+        if "Alpha" in bsdf.inputs and bsdf.inputs["Alpha"].default_value < 1.0:
+            return False
+        for name in ("Transmission Weight", "Transmission"):
+            if name in bsdf.inputs and bsdf.inputs[name].default_value > 0.0:
+                return False
+    return True
+
+
+def scene_triangles(scene, depsgraph):
+    """
+    World-space triangles of every renderable mesh (evaluated, with modifiers).
+
+    Computed once per render run and shared by all views.
+
+    Returns:
+        dict: name -> {'triangles': (N, 3, 3) array, 'opaque': bool}
+    """
+    geometry = {}
+    for obj in scene.objects:
+        if obj.type != 'MESH' or obj.hide_render or not obj.visible_get():
+            continue
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        try:
+            mesh.calc_loop_triangles()
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", coords)
+            corners = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", corners)
+        finally:
+            evaluated.to_mesh_clear()
+
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        world = coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        geometry[obj.name] = {'triangles': world[corners.reshape(-1, 3)], 'opaque': is_opaque(obj)}
+    return geometry
+
+
+def occluded_mesh_names(scene, camera, geometry):
+    """
+    Names of in-frustum meshes hidden behind other opaque geometry.
+
+    Only perspective cameras are tested (rays from the camera location);
+    for other camera types nothing is treated as hidden.
+    """
+    if camera.data.type != 'PERSP':
+        return set()
+    from view_visibility import occluded_objects
+
+    candidates = {
+        name: entry['triangles'] for name, entry in geometry.items()
+        if object_in_frustum(scene, camera, scene.objects[name])
+    }
+    occluders = {name: entry['triangles'] for name, entry in geometry.items() if entry['opaque']}
+    return occluded_objects(np.array(camera.matrix_world.translation), candidates, occluders)
+
+
+def mesh_digest(obj, depsgraph, cache):
+    """Hash an object's evaluated geometry (with modifiers) and material index per face."""
+    evaluated = obj.evaluated_get(depsgraph)
+    key = (evaluated.data.name, tuple(m.name for m in obj.modifiers))
+    if key in cache:
+        return cache[key]
+
+    mesh = evaluated.to_mesh()
+    try:
+        h = hashlib.sha256()
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", coords)
+        _hash_update_floats(h, coords)
+
+        loops = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loops)
+        h.update(loops.tobytes())
+
+        material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("material_index", material_index)
+        h.update(material_index.tobytes())
+    finally:
+        evaluated.to_mesh_clear()
+
+    cache[key] = h.hexdigest()
+    return cache[key]
+
+
+def node_tree_digest(node_tree):
+    """Hash the unlinked input values of every node (colors, roughness, strength, ...)."""
+    h = hashlib.sha256()
+    if node_tree is None:
+        return h.hexdigest()
+    for node in sorted(node_tree.nodes, key=lambda n: n.name):
+        h.update(f"{node.name}:{node.bl_idname}".encode())
+        for socket in node.inputs:
+            if socket.is_linked or not hasattr(socket, "default_value"):
+                continue
+            value = socket.default_value
+            h.update(repr(tuple(value) if hasattr(value, "__len__") else value).encode())
+    for link in node_tree.links:
+        h.update(f"{link.from_node.name}.{link.from_socket.identifier}->{link.to_node.name}.{link.to_socket.identifier}".encode())
+    return h.hexdigest()
+
+
+def compute_view_hash(camera, view, geometry=None):
+    """
+    Hash everything that affects one view's image.
+
+    Includes visible mesh objects (evaluated geometry, transform, material
+    parameters), all lights, the world shader, the camera and the render
+    settings. Objects outside the camera frustum, or hidden from the camera
+    by opaque geometry (interior pieces under the roof in the top view), are
+    left out, so changes to them do not invalidate this view.
+
+    Args:
+        camera: Camera object for the view
+        view: View name
+        geometry: scene_triangles() result to share between views (computed if None)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    scene = bpy.context.scene
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    if geometry is None:
+        geometry = scene_triangles(scene, depsgraph)
+    hidden = occluded_mesh_names(scene, camera, geometry)
+    render = scene.render
+    h = hashlib.sha256()
+    h.update(f"v{RENDER_CACHE_VERSION}:{view}:{bpy.app.version_string}".encode())
+
+    # Render settings
+    h.update(repr((
+        render.engine, render.resolution_x, render.resolution_y, render.resolution_percentage,
+        render.film_transparent, render.image_settings.file_format, render.image_settings.color_mode,
+        scene.view_settings.view_transform, scene.view_settings.look,
+        scene.view_settings.exposure, scene.view_settings.gamma,
+        scene.cycles.samples if render.engine == 'CYCLES' else None,
+    )).encode())
+
+    # Camera
+    _hash_update_floats(h, [v for row in camera.matrix_world for v in row])
+    cam = camera.data
+    h.update(repr((cam.type, cam.lens, cam.sensor_width, cam.sensor_fit, cam.ortho_scale,
+                   cam.clip_start, cam.clip_end, cam.shift_x, cam.shift_y)).encode())
+
+    # World
+    if scene.world:
+        h.update(node_tree_digest(scene.world.node_tree if scene.world.use_nodes else None).encode())
+        _hash_update_floats(h, scene.world.color)
+
+    mesh_cache = {}
+    material_cache = {}
+    for obj in sorted(scene.objects, key=lambda o: o.name):
+        if obj.hide_render or not obj.visible_get():
+            continue
+
+        if obj.type == 'LIGHT':
+            light = obj.data
+            h.update(f"light:{obj.name}:{light.type}".encode())
+            _hash_update_floats(h, [v for row in obj.matrix_world for v in row])
+            _hash_update_floats(h, [light.energy, *light.color])
+            continue
+
+        if obj.type != 'MESH' or obj.name in hidden or not object_in_frustum(scene, camera, obj):
+            continue
+
+        h.update(f"mesh:{obj.name}".encode())
+        _hash_update_floats(h, [v for row in obj.matrix_world for v in row])
+        h.update(mesh_digest(obj, depsgraph, mesh_cache).encode())
+
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat is None:
+                h.update(b"no-material")
+                continue
+            if mat.name not in material_cache:
+                material_cache[mat.name] = node_tree_digest(mat.node_tree if mat.use_nodes else None) + \
+                    repr(tuple(mat.diffuse_color))
+            h.update(material_cache[mat.name].encode())
+
+    return h.hexdigest()
 
 
 def main():
@@ -199,34 +460,65 @@ def main():
     args = parse_args()
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    view_names = args.views or VIEW_NAMES
 
     print(f"Output directory: {output_dir}")
     print(f"Resolution: {args.resolution_x}x{args.resolution_y}")
     print(f"Samples: {args.samples}")
+    print(f"Views: {', '.join(view_names)}")
 
     # Get scene bounds
     bounds = get_scene_bounds()
 
     # Set up cameras
-    cameras = setup_view_cameras(bounds)
+    cameras = setup_view_cameras(bounds, view_names)
 
     # Configure render settings
-    configure_render_settings(args.resolution_x, args.resolution_y, args.samples)
+    configure_render_settings(args.resolution_x, args.resolution_y, args.samples,
+                              engine=args.engine, threads=args.threads)
+
+    # Render cache: skip views whose inputs match an earlier render
+    cache = None
+    if BLENDER_AVAILABLE and not args.no_cache:
+        from render_cache import RenderCache, DEFAULT_CACHE_DIR
+        cache = RenderCache(args.cache_dir or DEFAULT_CACHE_DIR)
+
+    # Scene triangles for the occlusion test, shared by every view's hash
+    geometry = scene_triangles(bpy.context.scene, bpy.context.evaluated_depsgraph_get()) if cache else None
 
     # Render each view
-    view_names = ["front", "left", "right", "rear", "iso", "top"]
+    timings = {}
+    cached_views = []
     for view in view_names:
         output_path = output_dir / f"{view}.png"
-        print(f"Rendering {view} -> {output_path}")
 
-        # TODO: Uncomment when cameras are implemented
-        # if view in cameras:
-        #     render_view(cameras[view], output_path)
-        # else:
-        #     print(f"WARNING: Camera {view} not found")
+        start = time.perf_counter()
+        key = compute_view_hash(cameras[view], view, geometry) if cache else None
+        if cache and cache.fetch(key, output_path):
+            timings[view] = time.perf_counter() - start
+            cached_views.append(view)
+            print(f"  ↺ {view}: cached ({key[:12]})")
+            continue
+
+        print(f"Rendering {view} -> {output_path}")
+        if output_path.exists():
+            # May be a hard link into the cache; never render into it
+            output_path.unlink()
+        render_view(cameras.get(view), output_path)
+        if cache:
+            cache.store(key, output_path, view=view)
+        timings[view] = time.perf_counter() - start
+        print(f"  ✓ {view}: {timings[view]:.2f}s")
+
+    if cache:
+        print(f"Render cache: {len(cached_views)} of {len(view_names)} view(s) reused")
+
+    if args.timing_json:
+        with open(args.timing_json, 'w') as f:
+            json.dump({"views": timings, "cached": cached_views, "threads": args.threads}, f, indent=2)
 
     print("=" * 60)
-    print("Rendering complete (placeholder implementation)")
+    print(f"Rendering complete ({sum(timings.values()):.1f}s total)")
     print("=" * 60)
 
 
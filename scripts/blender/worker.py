@@ -0,0 +1,352 @@
+"""
+Persistent Headless Blender Worker
+
+Keeps one Blender process alive and runs pipeline jobs sent over a local
+socket, so an iteration pays Blender's startup and addon-loading cost once
+instead of once per stage.
+
+Protocol: JSON lines over TCP on 127.0.0.1. Each request is one JSON object
+with a "job" key; each response is one JSON object:
+    {"id", "job", "ok", "result", "error", "reset_s", "elapsed_s", "output"}
+
+Jobs:
+    ping      - report Blender version and jobs served
+    reset     - load an empty scene (read_homefile)
+    exec      - exec a template/script with given globals (like the exec() workflow)
+    build     - run blender/build_from_spec.py with "args"
+    verify    - run verify_phase_1a.py for "iteration_num"
+    export    - export_with_verification.export_glb_phase_1a("iteration_num")
+    render    - run blender/render_views.py with "args"
+    shutdown  - stop the worker
+
+Common options (all optional):
+    reset   - reset the scene before the job (default: true for exec/build)
+    reload  - drop cached scripts/ modules so edited helpers are picked up (default: true)
+    capture - include the job's printed output in the response (default: false)
+
+Jobs run one at a time, on Blender's main thread. A job that calls
+sys.exit() fails with its exit code instead of stopping the worker; exec
+jobs run under the script's own name rather than "__main__", so scripts
+they exec do not take their command-line exit path.
+
+Usage:
+    blender -b -P scripts/blender/worker.py -- --port 8765
+
+    # Then, from plain Python:
+    python scripts/blender_worker_client.py --job ping
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import runpy
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+
+try:
+    import bpy
+except ImportError:  # Imported outside Blender (tests): only jobs without a scene reset work
+    bpy = None
+
+
+DEFAULT_PORT = 8765
+
+BLENDER_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BLENDER_DIR.parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
+
+# Jobs that start from an empty scene unless the request says otherwise
+RESET_BY_DEFAULT = {'exec', 'build'}
+
+
+def parse_args():
+    """Parse command-line arguments passed after '--' in Blender invocation."""
+    parser = argparse.ArgumentParser(description="Persistent headless Blender worker")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+
+    if "--" in sys.argv:
+        args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        args = parser.parse_args([])
+
+    return args
+
+
+def reset_scene():
+    """Load an empty scene, dropping all objects, meshes and materials."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def drop_script_modules():
+    """Remove modules loaded from scripts/ so the next import re-reads them."""
+    for name, module in list(sys.modules.items()):
+        if name == '__main__':
+            continue
+        module_file = getattr(module, '__file__', None)
+        if module_file and Path(module_file).resolve().parent in (SCRIPTS_DIR, BLENDER_DIR):
+            del sys.modules[name]
+
+
+def resolve_path(path):
+    """Resolve a job path relative to the project root."""
+    path = Path(path)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def exit_code(exc):
+    """Process exit code for a SystemExit (sys.exit(None) is 0, a message is 1)."""
+    return exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+
+
+def run_script(script_path, args=(), init_globals=None):
+    """
+    Run a CLI script as if launched with `blender -b -P script -- args`.
+
+    Returns:
+        int: Script exit code (0 if it returned without calling sys.exit)
+    """
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), "--", *[str(a) for a in args]]
+    try:
+        runpy.run_path(str(script_path), init_globals=init_globals, run_name="__main__")
+        return 0
+    except SystemExit as e:
+        return exit_code(e)
+    finally:
+        sys.argv = saved_argv
+
+
+@contextlib.contextmanager
+def main_globals(values):
+    """
+    Temporarily set attributes on __main__.
+
+    verify_phase_1a reads iteration_num from __main__ when exec'd, so exec jobs
+    expose their globals there too.
+    """
+    import __main__
+    missing = object()
+    saved = {key: getattr(__main__, key, missing) for key in values}
+    for key, value in values.items():
+        setattr(__main__, key, value)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is missing:
+                delattr(__main__, key)
+            else:
+                setattr(__main__, key, value)
+
+
+def job_exec(request):
+    """
+    Exec a template with the given globals, like exec(open(...).read()).
+
+    The template runs as module `<script stem>`, not "__main__": scripts it
+    execs in its own globals (verify_phase_1a.py) would otherwise reach their
+    `sys.exit()` main block. A sys.exit() with a non-zero code fails the job.
+    """
+    script = resolve_path(request['script'])
+    job_globals = dict(request.get('globals', {}))
+    namespace = {'__file__': str(script), '__name__': script.stem, **job_globals}
+
+    code = 0
+    with main_globals(job_globals):
+        try:
+            exec(compile(script.read_text(encoding='utf-8'), str(script), 'exec'), namespace)
+        except SystemExit as e:
+            code = exit_code(e)
+    if code != 0:
+        raise RuntimeError(f"{script.name} exited with code {code}")
+
+    # Report simple result values the template left behind
+    return {
+        key: namespace[key] for key in request.get('return', [])
+        if key in namespace
+    }
+
+
+def job_build(request):
+    """Run build_from_spec.py with CLI args."""
+    code = run_script(BLENDER_DIR / 'build_from_spec.py', request.get('args', []))
+    if code != 0:
+        raise RuntimeError(f"build_from_spec.py exited with code {code}")
+    return {'exit_code': code}
+
+
+def job_verify(request):
+    """Run the Phase 1A automated verification for an iteration."""
+    iteration_num = request['iteration_num']
+    with main_globals({'iteration_num': iteration_num}):
+        code = run_script(SCRIPTS_DIR / 'verify_phase_1a.py', init_globals={'iteration_num': iteration_num})
+    return {'exit_code': code}
+
+
+def job_export(request):
+    """Run the gated Phase 1A GLB export."""
+    from export_with_verification import export_glb_phase_1a
+    return {'glb': str(export_glb_phase_1a(request['iteration_num']))}
+
+
+def job_render(request):
+    """Run render_views.py with CLI args on the current scene."""
+    code = run_script(BLENDER_DIR / 'render_views.py', request.get('args', []))
+    if code != 0:
+        raise RuntimeError(f"render_views.py exited with code {code}")
+    return {'exit_code': code}
+
+
+class Worker:
+    """Socket server that runs jobs sequentially in this Blender process."""
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.jobs_served = 0
+        self.running = True
+        self.handlers = {
+            'ping': self.job_ping,
+            'reset': self.job_reset,
+            'exec': job_exec,
+            'build': job_build,
+            'verify': job_verify,
+            'export': job_export,
+            'render': job_render,
+            'shutdown': self.job_shutdown,
+        }
+
+    def job_ping(self, request):
+        return {'blender_version': bpy.app.version_string, 'jobs_served': self.jobs_served}
+
+    def job_reset(self, request):
+        return {}
+
+    def job_shutdown(self, request):
+        self.running = False
+        return {'jobs_served': self.jobs_served}
+
+    def handle(self, request):
+        """
+        Run one job and build its response.
+
+        Args:
+            request: Parsed request dict
+
+        Returns:
+            dict: Response dict (never raises; a job calling sys.exit() fails
+                with its exit code and the worker keeps serving)
+        """
+        job = request.get('job')
+        response = {'id': request.get('id'), 'job': job, 'ok': False,
+                    'result': None, 'error': None, 'reset_s': 0.0, 'elapsed_s': 0.0}
+
+        handler = self.handlers.get(job)
+        if handler is None:
+            response['error'] = f"Unknown job: {job!r} (expected one of {sorted(self.handlers)})"
+            return response
+
+        output = io.StringIO()
+        tee = _Tee(sys.stdout, output) if request.get('capture') else sys.stdout
+
+        try:
+            with contextlib.redirect_stdout(tee):
+                if request.get('reload', True):
+                    drop_script_modules()
+
+                if request.get('reset', job in RESET_BY_DEFAULT) or job == 'reset':
+                    start = time.perf_counter()
+                    reset_scene()
+                    response['reset_s'] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                try:
+                    response['result'] = handler(request)
+                    response['ok'] = True
+                finally:
+                    response['elapsed_s'] = time.perf_counter() - start
+        except SystemExit as e:
+            response['error'] = f"Job called sys.exit() with code {exit_code(e)}"
+        except Exception:
+            response['error'] = traceback.format_exc()
+
+        if request.get('capture'):
+            response['output'] = output.getvalue()
+
+        self.jobs_served += 1
+        return response
+
+    def serve(self):
+        """Accept connections and serve JSON-line requests until shutdown."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind((self.host, self.port))
+            server.listen()
+
+            print("=" * 70)
+            print(f" Blender worker listening on {self.host}:{self.port} (Blender {bpy.app.version_string})")
+            print("=" * 70)
+
+            while self.running:
+                conn, addr = server.accept()
+                with conn, conn.makefile('rwb') as stream:
+                    self.serve_connection(stream)
+
+        print("Blender worker stopped")
+
+    def serve_connection(self, stream):
+        """Serve requests from one client until it disconnects or shuts down the worker."""
+        for line in stream:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {'ok': False, 'error': f"Invalid JSON request: {e}"}
+            else:
+                print(f"\n▶ Job {request.get('id', '-')}: {request.get('job')}")
+                response = self.handle(request)
+                status = "✓" if response['ok'] else "❌"
+                print(f"{status} {request.get('job')} finished in {response['elapsed_s']:.2f}s "
+                      f"(reset {response['reset_s']:.2f}s)")
+
+            stream.write((json.dumps(response, default=str) + "\n").encode('utf-8'))
+            stream.flush()
+
+            if not self.running:
+                return
+
+
+class _Tee(io.TextIOBase):
+    """Write to several text streams at once."""
+
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    Worker(args.host, args.port).serve()
+
+
+if __name__ == "__main__":
+    main()
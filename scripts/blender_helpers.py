@@ -6,10 +6,34 @@ This module provides tested helper functions for creating Blender geometry
 with correct dimensions. Prevents scaling math errors.
 """
 
+import math
+
 import bpy
+import numpy as np
+from mathutils import Vector
+
+from material_registry import get_material
+from build_profiler import profiled
+
+
+# Box construction engine used by create_box():
+#   'ops'  - bpy.ops.mesh.primitive_cube_add + transform_apply (original path)
+#   'data' - build the mesh directly in bpy.data.meshes (no operators, no
+#            depsgraph update per box; see create_box_data)
+BOX_ENGINE = 'ops'
+
+# Unit cube in the exact vertex/face order produced by primitive_cube_add(size=1.0),
+# so both engines yield identical vertex positions for the same inputs.
+_UNIT_CUBE_VERTS = (
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+)
+_UNIT_CUBE_FACES = (
+    (0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4), (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5),
+)
 
 
-def create_box(name, width, depth, height, location=(0, 0, 0)):
+def create_box(name, width, depth, height, location=(0, 0, 0), engine=None):
     """
     Create a box (cube primitive) with exact dimensions.
 
@@ -19,6 +43,7 @@ def create_box(name, width, depth, height, location=(0, 0, 0)):
         depth (float): Y dimension in meters
         height (float): Z dimension in meters
         location (tuple): (x, y, z) center position in meters
+        engine (str, optional): 'ops' or 'data'. If None, uses BOX_ENGINE
 
     Returns:
         bpy.types.Object: Created Blender object
@@ -26,6 +51,12 @@ def create_box(name, width, depth, height, location=(0, 0, 0)):
     Example:
         >>> wall = create_box("Wall_Front", 8.5, 0.18, 3.75, (0, -7.5, 1.875))
     """
+    engine = engine or BOX_ENGINE
+    if engine == 'data':
+        return create_box_data(name, width, depth, height, location)
+    if engine != 'ops':
+        raise ValueError(f"Unknown box engine '{engine}' (expected 'ops' or 'data')")
+
     bpy.ops.mesh.primitive_cube_add(size=1.0, location=location)
     obj = bpy.context.active_object
     obj.name = name
@@ -44,6 +75,173 @@ def create_box(name, width, depth, height, location=(0, 0, 0)):
     return obj
 
 
+def create_box_data(name, width, depth, height, location=(0, 0, 0)):
+    """
+    Create a box with exact dimensions directly in bpy.data (no operators).
+
+    Produces the same vertex positions and obj.dimensions as the 'ops' engine,
+    but skips primitive_cube_add/transform_apply, so no depsgraph update is
+    triggered per box. Build time stays linear in the number of boxes.
+
+    Args:
+        name (str): Object name
+        width (float): X dimension in meters
+        depth (float): Y dimension in meters
+        height (float): Z dimension in meters
+        location (tuple): (x, y, z) center position in meters
+
+    Returns:
+        bpy.types.Object: Created Blender object (linked to the active collection)
+
+    Example:
+        >>> trim = create_box_data("Trim_Top", 2.36, 0.02, 0.12, (-2.5, -7.49, 2.86))
+    """
+    verts = [(x * width, y * depth, z * height) for x, y, z in _UNIT_CUBE_VERTS]
+
+    mesh = bpy.data.meshes.new(f"{name}_Mesh")
+    mesh.from_pydata(verts, [], _UNIT_CUBE_FACES)
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+
+    # Match the ops engine: the new box becomes the active object
+    bpy.context.view_layer.objects.active = obj
+
+    return obj
+
+
+@profiled()
+def create_box_batch(name, box_specs):
+    """
+    Create many boxes as a single mesh object (one datablock per component group).
+
+    Vertex, loop and polygon arrays are filled with NumPy and written with
+    foreach_set, so cost is one object + one mesh regardless of piece count.
+    Each piece keeps its identity: the FACE attribute 'piece_index' maps every
+    polygon to its piece, and obj["piece_names"] lists the piece names in order
+    (see get_batch_piece_dimensions for verification).
+
+    Args:
+        name (str): Object name for the batched mesh
+        box_specs (list): List of dicts with keys:
+            - 'name': piece name (e.g. "Front_Entry_Door_Left_Glass_3")
+            - 'width', 'depth', 'height': piece dimensions in meters
+            - 'location': (x, y, z) piece center in meters
+            - 'rotation_z' (optional): rotation around the piece center in radians
+            - 'color' (optional): hex color; pieces are grouped into material slots
+            - 'material_name' (optional): material name for that color
+
+    Returns:
+        bpy.types.Object: Batched object, located at the centroid of the pieces
+
+    Example:
+        >>> frame = create_box_batch("Window_Frame", [
+        ...     {'name': "Window_Frame_Top", 'width': 2.2, 'depth': 0.15, 'height': 0.05,
+        ...      'location': (-2.5, -7.5, 2.725), 'color': "#FFFFFF"},
+        ...     {'name': "Window_Frame_Bottom", 'width': 2.2, 'depth': 0.15, 'height': 0.05,
+        ...      'location': (-2.5, -7.5, 0.475), 'color': "#FFFFFF"},
+        ... ])
+    """
+    if not box_specs:
+        raise ValueError(f"create_box_batch('{name}') called with no box specs")
+
+    count = len(box_specs)
+    dims = np.array([(s['width'], s['depth'], s['height']) for s in box_specs], dtype=np.float64)
+    centers = np.array([tuple(s['location']) for s in box_specs], dtype=np.float64)
+    rotations = np.array([s.get('rotation_z', 0.0) for s in box_specs], dtype=np.float64)
+    origin = centers.mean(axis=0)
+
+    # (count, 8, 3) local corners, rotated around each piece center, then offset
+    local = np.array(_UNIT_CUBE_VERTS)[None, :, :] * dims[:, None, :]
+    cos_r = np.cos(rotations)[:, None]
+    sin_r = np.sin(rotations)[:, None]
+    verts = np.empty_like(local)
+    verts[..., 0] = local[..., 0] * cos_r - local[..., 1] * sin_r
+    verts[..., 1] = local[..., 0] * sin_r + local[..., 1] * cos_r
+    verts[..., 2] = local[..., 2]
+    verts += (centers - origin)[:, None, :]
+
+    faces = np.array(_UNIT_CUBE_FACES, dtype=np.int32)
+    loop_verts = faces[None, :, :] + (8 * np.arange(count, dtype=np.int32))[:, None, None]
+
+    mesh = bpy.data.meshes.new(f"{name}_Mesh")
+    mesh.vertices.add(count * 8)
+    mesh.loops.add(count * 24)
+    mesh.polygons.add(count * 6)
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", loop_verts.ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, count * 24, 4, dtype=np.int32))
+    # loop_total is derived from loop_start (read-only) in newer Blender versions
+    if not mesh.polygons.bl_rna.properties['loop_total'].is_readonly:
+        mesh.polygons.foreach_set("loop_total", np.full(count * 6, 4, dtype=np.int32))
+
+    # Piece identity per face
+    piece_index = np.repeat(np.arange(count, dtype=np.int32), 6)
+    mesh.attributes.new("piece_index", 'INT', 'FACE').data.foreach_set("value", piece_index)
+
+    # One material slot per distinct color
+    slot_for_color = {}
+    material_index = np.zeros(count, dtype=np.int32)
+    for i, spec in enumerate(box_specs):
+        color = spec.get('color')
+        if color is None:
+            continue
+        if color not in slot_for_color:
+            slot_for_color[color] = len(mesh.materials)
+            mesh.materials.append(get_material(color, name=spec.get('material_name') or f"{name}_mat"))
+        material_index[i] = slot_for_color[color]
+    if slot_for_color:
+        mesh.polygons.foreach_set("material_index", np.repeat(material_index, 6))
+
+    mesh.update(calc_edges=True)
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = tuple(origin)
+    obj["piece_names"] = [s['name'] for s in box_specs]
+    obj["piece_rotation_z"] = [float(r) for r in rotations]
+    bpy.context.collection.objects.link(obj)
+
+    return obj
+
+
+def get_batch_piece_dimensions(obj, piece_name):
+    """
+    Measure one piece of a create_box_batch object in the piece's own frame.
+
+    Args:
+        obj (bpy.types.Object): Object created by create_box_batch
+        piece_name (str): Name of the piece
+
+    Returns:
+        mathutils.Vector: (width, depth, height) of the piece in meters
+
+    Raises:
+        KeyError: If the object has no piece with this name
+    """
+    names = list(obj.get("piece_names", []))
+    if piece_name not in names:
+        raise KeyError(f"'{obj.name}' has no batched piece named '{piece_name}'")
+    index = names.index(piece_name)
+
+    coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", coords)
+    corners = coords.reshape(-1, 3)[index * 8:index * 8 + 8].astype(np.float64)
+
+    # Undo the piece rotation so extents are measured along the piece axes
+    rotation_z = obj["piece_rotation_z"][index]
+    if rotation_z:
+        center = corners.mean(axis=0)
+        cos_r, sin_r = math.cos(-rotation_z), math.sin(-rotation_z)
+        x = corners[:, 0] - center[0]
+        y = corners[:, 1] - center[1]
+        corners = np.column_stack((x * cos_r - y * sin_r, x * sin_r + y * cos_r, corners[:, 2]))
+
+    extents = corners.max(axis=0) - corners.min(axis=0)
+    return Vector(tuple(extents * np.array(obj.scale)))
+
+
 def create_cylinder(name, radius, height, location=(0, 0, 0)):
     """
     Create a cylinder with exact dimensions.
@@ -71,7 +269,156 @@ def create_cylinder(name, radius, height, location=(0, 0, 0)):
     return obj
 
 
-def verify_dimensions(obj, expected_width, expected_depth, expected_height, tolerance=0.01):
+# Shared mesh datablocks for linked duplicates, keyed on shape and color
+# (see instance_key) -> bpy.types.Mesh
+_instance_meshes = {}
+_instance_stats = {'objects': 0, 'meshes': 0}
+
+
+def instance_key(kind, dims, color=None):
+    """
+    Build the shared-mesh key for a primitive.
+
+    Dimensions are rounded so values that differ only by float noise share a
+    mesh. The color is part of the key because materials live on the mesh.
+
+    Returns:
+        tuple: (kind, *dims, color)
+    """
+    return (kind,) + tuple(round(float(v), 6) for v in dims) + (color.lstrip('#').upper() if color else None,)
+
+
+def _get_instance_mesh(key):
+    """Get the shared mesh for key, dropping it if it was removed (scene reset)."""
+    mesh = _instance_meshes.get(key)
+    if mesh is None:
+        return None
+    try:
+        if mesh.name in bpy.data.meshes:
+            return mesh
+    except ReferenceError:
+        pass
+    del _instance_meshes[key]
+    return None
+
+
+def _link_instance(name, mesh, location):
+    """Create an object that reuses an existing mesh (linked duplicate)."""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    _instance_stats['objects'] += 1
+    return obj
+
+
+def create_box_instanced(name, width, depth, height, location=(0, 0, 0), color=None, material_name=None):
+    """
+    Create a box that shares its mesh with every other box of the same size and color.
+
+    The first box of a given size/color builds the mesh (create_box_data) and
+    gets its material; later ones are linked duplicates of that mesh, so the
+    glTF exporter writes one mesh and one node per object. Only use this for
+    pieces whose mesh is never edited afterwards (no booleans, no
+    apply_material with another color) - edits would change every duplicate.
+
+    Args:
+        name (str): Object name
+        width (float): X dimension in meters
+        depth (float): Y dimension in meters
+        height (float): Z dimension in meters
+        location (tuple): (x, y, z) center position in meters
+        color (str, optional): Hex color applied to the shared mesh
+        material_name (str, optional): Material name if the material is created
+
+    Returns:
+        bpy.types.Object: Created Blender object
+
+    Example:
+        >>> panes = [create_box_instanced(f"Door_Glass_{i}", 0.27, 0.01, 0.43, (0, -6.5, z), "#000000")
+        ...          for i, z in enumerate((0.5, 1.0, 1.5))]
+        >>> panes[0].data is panes[2].data
+        True
+    """
+    key = instance_key('box', (width, depth, height), color)
+    mesh = _get_instance_mesh(key)
+    if mesh is not None:
+        return _link_instance(name, mesh, location)
+
+    obj = create_box_data(name, width, depth, height, location)
+    if color:
+        apply_material(obj, color, material_name)
+    _instance_meshes[key] = obj.data
+    _instance_stats['meshes'] += 1
+    _instance_stats['objects'] += 1
+    return obj
+
+
+def create_cylinder_instanced(name, radius, height, location=(0, 0, 0), color=None, material_name=None):
+    """
+    Create a cylinder that shares its mesh with every other cylinder of the same size and color.
+
+    Same rules as create_box_instanced; the first cylinder is built with
+    create_cylinder.
+
+    Args:
+        name (str): Object name
+        radius (float): Radius in meters
+        height (float): Height (Z dimension) in meters
+        location (tuple): (x, y, z) center position in meters
+        color (str, optional): Hex color applied to the shared mesh
+        material_name (str, optional): Material name if the material is created
+
+    Returns:
+        bpy.types.Object: Created Blender object
+
+    Example:
+        >>> post = create_cylinder_instanced("Canopy_Post_1", 0.09, 2.85, (-1.2, -10, 1.425), "#A0A0A0")
+    """
+    key = instance_key('cylinder', (radius, height), color)
+    mesh = _get_instance_mesh(key)
+    if mesh is not None:
+        return _link_instance(name, mesh, location)
+
+    obj = create_cylinder(name, radius, height, location)
+    if color:
+        apply_material(obj, color, material_name)
+    _instance_meshes[key] = obj.data
+    _instance_stats['meshes'] += 1
+    _instance_stats['objects'] += 1
+    return obj
+
+
+def get_instancing_stats():
+    """
+    Get linked-duplicate statistics.
+
+    Returns:
+        dict: {'objects', 'meshes', 'shared'} - shared is objects that reused a mesh
+    """
+    return {
+        'objects': _instance_stats['objects'],
+        'meshes': _instance_stats['meshes'],
+        'shared': _instance_stats['objects'] - _instance_stats['meshes'],
+    }
+
+
+def print_instancing_stats():
+    """Print linked-duplicate statistics."""
+    stats = get_instancing_stats()
+    if stats['objects']:
+        print(f"Instanced meshes: {stats['meshes']} meshes for {stats['objects']} objects "
+              f"({stats['shared']} linked duplicates)")
+
+
+def reset_instance_meshes():
+    """Forget all shared meshes and reset statistics (meshes are not deleted)."""
+    _instance_meshes.clear()
+    for key in _instance_stats:
+        _instance_stats[key] = 0
+
+
+def verify_dimensions(obj, expected_width, expected_depth, expected_height, tolerance=0.01, piece=None):
     """
     Verify object dimensions match expected values within tolerance.
 
@@ -81,6 +428,8 @@ def verify_dimensions(obj, expected_width, expected_depth, expected_height, tole
         expected_depth (float): Expected Y dimension in meters
         expected_height (float): Expected Z dimension in meters
         tolerance (float): Absolute tolerance in meters (default 0.01m = 1cm)
+        piece (str, optional): Piece name inside a create_box_batch object.
+            If given, that piece is measured instead of the whole object.
 
     Returns:
         dict: {
@@ -96,7 +445,7 @@ def verify_dimensions(obj, expected_width, expected_depth, expected_height, tole
         >>> if not result['passed']:
         ...     raise ValueError(f"Wall dimensions incorrect: {result['errors']}")
     """
-    actual = obj.dimensions
+    actual = get_batch_piece_dimensions(obj, piece) if piece else obj.dimensions
     errors = []
     error_pct = {}
 
@@ -144,17 +493,24 @@ def verify_dimensions(obj, expected_width, expected_depth, expected_height, tole
     }
 
 
-def apply_material(obj, color_hex, material_name=None):
+def apply_material(obj, color_hex, material_name=None, roughness=0.5, metallic=0.0, alpha=1.0):
     """
     Apply a simple solid color material to an object.
 
+    Materials come from the shared material registry, so objects with the same
+    color/roughness/metallic/alpha share one material. material_name is only
+    used when the material is created for the first time.
+
     Args:
         obj (bpy.types.Object): Blender object
         color_hex (str): Hex color code (e.g., "#808080")
         material_name (str, optional): Material name. If None, uses obj.name + "_mat"
+        roughness (float): Principled BSDF roughness
+        metallic (float): Principled BSDF metallic
+        alpha (float): Principled BSDF alpha
 
     Returns:
-        bpy.types.Material: Created material
+        bpy.types.Material: Shared material
 
     Example:
         >>> apply_material(wall, "#808080", "Wall_Gray")
@@ -162,20 +518,7 @@ def apply_material(obj, color_hex, material_name=None):
     if material_name is None:
         material_name = f"{obj.name}_mat"
 
-    # Create material
-    mat = bpy.data.materials.new(name=material_name)
-    mat.use_nodes = True
-
-    # Get principled BSDF node
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
-    if bsdf:
-        # Convert hex to RGB
-        color_hex = color_hex.lstrip('#')
-        r = int(color_hex[0:2], 16) / 255.0
-        g = int(color_hex[2:4], 16) / 255.0
-        b = int(color_hex[4:6], 16) / 255.0
-
-        bsdf.inputs["Base Color"].default_value = (r, g, b, 1.0)
+    mat = get_material(color_hex, roughness, metallic, alpha, name=material_name)
 
     # Assign material to object
     if obj.data.materials:
@@ -243,7 +586,144 @@ def create_boolean_cutter(target_obj, cutter_name, width, depth, height, locatio
     return cutter
 
 
+def _cutters_overlap(cutter_specs):
+    """Check whether any two cutters' XY-rotated bounding boxes overlap."""
+    bounds = []
+    for spec in cutter_specs:
+        rotation = spec.get('rotation_z', 0)
+        cos_r, sin_r = abs(math.cos(rotation)), abs(math.sin(rotation))
+        half = np.array([
+            (spec['width'] * cos_r + spec['depth'] * sin_r) / 2,
+            (spec['width'] * sin_r + spec['depth'] * cos_r) / 2,
+            spec['height'] / 2
+        ])
+        center = np.array(tuple(spec['location']), dtype=np.float64)
+        bounds.append((center - half, center + half))
+
+    for i, (lo_a, hi_a) in enumerate(bounds):
+        for lo_b, hi_b in bounds[i + 1:]:
+            if np.all(lo_a < hi_b) and np.all(lo_b < hi_a):
+                return True
+    return False
+
+
+@profiled()
+def apply_boolean_cuts(target_obj, cutter_specs, cutter_name=None):
+    """
+    Cut several openings into one object with a single Boolean difference.
+
+    All cutter boxes are built as one mesh (create_box_batch, rotation baked
+    into the vertices) and subtracted with one EXACT boolean, so the target is
+    re-solved once instead of once per opening as with repeated
+    create_boolean_cutter calls. Self-intersection handling is only enabled
+    when cutter boxes overlap.
+
+    Args:
+        target_obj (bpy.types.Object): Object to cut
+        cutter_specs (list): Dicts with 'name', 'width', 'depth', 'height',
+            'location' and optional 'rotation_z' (see plan_cutout_cutters)
+        cutter_name (str, optional): Name for the joined cutter.
+            Defaults to "Cutter_{target}" (cutter names start with "Cutter_"
+            so wall lookups by name can tell them apart).
+
+    Returns:
+        bpy.types.Object: Joined cutter object (hidden); piece names are kept
+            in obj["piece_names"]
+
+    Example:
+        >>> cutters = plan_cutout_cutters(spec)
+        >>> apply_boolean_cuts(wall_front, cutters['Wall_Front'])
+    """
+    cutter_name = cutter_name or f"Cutter_{target_obj.name}"
+    cutter = create_box_batch(cutter_name, cutter_specs)
+
+    bool_mod = target_obj.modifiers.new(name=f"Bool_{cutter_name}", type='BOOLEAN')
+    bool_mod.operation = 'DIFFERENCE'
+    bool_mod.solver = 'EXACT'
+    bool_mod.use_self = len(cutter_specs) > 1 and _cutters_overlap(cutter_specs)
+    bool_mod.object = cutter
+
+    bpy.context.view_layer.objects.active = target_obj
+    bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+
+    cutter.hide_render = True
+    cutter.hide_viewport = True
+
+    return cutter
+
+
+# Wall key in spec cutouts -> wall object name
+WALL_OBJECT_NAMES = {
+    'front': 'Wall_Front',
+    'rear': 'Wall_Rear',
+    'left': 'Wall_Left',
+    'right': 'Wall_Right',
+    'alcove_left': 'Alcove_Wall_Left',
+    'alcove_right': 'Alcove_Wall_Right',
+    'alcove_back': 'Alcove_Wall_Back'
+}
+
+
+def plan_cutout_cutters(spec):
+    """
+    Compute the cutter box for every cutout in a Phase 1A spec, grouped by wall.
+
+    Cutters go through the full wall thickness plus reveal (and recess) depth;
+    cutters on the angled alcove walls are rotated perpendicular to the wall.
+
+    Args:
+        spec (dict): Loaded building_geometry.yaml
+
+    Returns:
+        dict: Wall object name -> list of cutter dicts ('name', 'cutout',
+            'width', 'depth', 'height', 'location', 'rotation_z'), in spec order.
+            Cutouts on unknown walls are listed under None.
+
+    Example:
+        >>> cutters = plan_cutout_cutters(spec)
+        >>> [c['name'] for c in cutters['Wall_Front']]
+        ['front_alcove_opening_Cutter', 'front_left_display_window_Cutter', 'front_right_display_window_Cutter']
+    """
+    walls = spec['walls']
+    door_alcove = spec.get('door_alcove', {})
+
+    alcove_angles = {}
+    if door_alcove.get('enabled', False):
+        alcove_depth_y = door_alcove['position']['y_back'] - door_alcove['position']['y_front']
+        for side in ('left', 'right'):
+            dx = door_alcove['walls'][side]['back_x'] - door_alcove['walls'][side]['front_x']
+            # Rotate 90° from the wall direction to cut perpendicular to it
+            alcove_angles[f"alcove_{side}"] = math.radians(90) - math.atan2(dx, alcove_depth_y)
+
+    cutters = {}
+    for cutout_name, cutout in (spec.get('cutouts') or {}).items():
+        wall_key = cutout.get('wall', '')
+        reveal = cutout.get('reveal_depth', 0)
+
+        if wall_key in ('front', 'rear'):
+            depth = walls['thickness'] + cutout.get('recess_depth', 0) + reveal
+        elif wall_key.startswith('alcove_'):
+            depth = door_alcove['walls']['thickness'] + reveal
+        else:
+            depth = walls['thickness'] + reveal
+
+        pos = cutout['position']
+        cutters.setdefault(WALL_OBJECT_NAMES.get(wall_key), []).append({
+            'name': f"{cutout_name}_Cutter",
+            'cutout': cutout_name,
+            'width': cutout['width'],
+            'depth': depth,
+            'height': cutout['height'],
+            # pos['z'] is in spec coordinates (Z=0 at wall base)
+            'location': (pos['x'], pos['y'], pos['z'] + cutout['height']/2),
+            'rotation_z': alcove_angles.get(wall_key, 0),
+        })
+
+    return cutters
+
+
 # Utility function for batch verification
+@profiled()
 def verify_all_objects(objects_specs, tolerance=0.01):
     """
     Verify dimensions for multiple objects at once.
@@ -254,6 +734,7 @@ def verify_all_objects(objects_specs, tolerance=0.01):
             - 'width': expected width
             - 'depth': expected depth
             - 'height': expected height
+            - 'piece' (optional): piece name inside a create_box_batch object
         tolerance (float): Absolute tolerance in meters
 
     Returns:
@@ -280,15 +761,18 @@ def verify_all_objects(objects_specs, tolerance=0.01):
 
     for spec in objects_specs:
         obj = spec['object']
+        piece = spec.get('piece')
         result = verify_dimensions(
             obj,
             spec['width'],
             spec['depth'],
             spec['height'],
-            tolerance
+            tolerance,
+            piece=piece
         )
 
-        results[obj.name] = result
+        result_name = piece or obj.name
+        results[result_name] = result
 
         if not result['passed']:
             all_passed = False
@@ -296,11 +780,11 @@ def verify_all_objects(objects_specs, tolerance=0.01):
             # Check for critical failures (>10% error in any dimension)
             for dim, err_pct in result['error_pct'].items():
                 if err_pct > 10:
-                    critical_failures.append(obj.name)
+                    critical_failures.append(result_name)
                     break
                 elif err_pct > 5:
-                    if obj.name not in critical_failures:
-                        major_failures.append(obj.name)
+                    if result_name not in critical_failures:
+                        major_failures.append(result_name)
                     break
 
     return {
@@ -0,0 +1,298 @@
+"""
+Blender Worker Client
+
+Plain-Python client for the persistent Blender worker (scripts/blender/worker.py).
+Starts the worker if needed (using BLENDER_PATH from config/local.env) and sends
+jobs over its local socket, so one iteration is a handful of requests to a
+warm Blender instead of several cold `blender -b -P` launches.
+
+Usage:
+    # Start a worker in the background (returns once it accepts jobs)
+    python scripts/blender_worker_client.py --start
+
+    # Run a full Phase 1A iteration in the warm worker
+    python scripts/blender_worker_client.py --job exec --script scripts/build_template_phase_1a.py --set iteration_num=50
+
+    # Other jobs
+    python scripts/blender_worker_client.py --job ping
+    python scripts/blender_worker_client.py --job verify --set iteration_num=50
+    python scripts/blender_worker_client.py --job render --args --output_dir work/renders/iter_050
+    python scripts/blender_worker_client.py --job shutdown
+
+    # From Python
+    from blender_worker_client import BlenderWorker
+    with BlenderWorker(spawn=True) as worker:
+        worker.submit('exec', script='scripts/build_template_phase_1a.py', globals={'iteration_num': 50})
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+STARTUP_TIMEOUT = 120.0
+
+PROJECT_ROOT = Path(__file__).parent.parent
+WORKER_SCRIPT = PROJECT_ROOT / 'scripts' / 'blender' / 'worker.py'
+
+
+def load_local_env(env_path=None):
+    """
+    Read KEY=VALUE pairs from config/local.env.
+
+    Args:
+        env_path: Optional path (default: config/local.env)
+
+    Returns:
+        dict: Configuration values (empty if the file does not exist)
+    """
+    env_path = Path(env_path) if env_path else PROJECT_ROOT / 'config' / 'local.env'
+    config = {}
+    if not env_path.exists():
+        return config
+
+    for line in env_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        config[key.strip()] = value.strip()
+
+    return config
+
+
+def find_blender():
+    """
+    Get the Blender executable path.
+
+    Order: BLENDER_PATH environment variable, config/local.env, then 'blender' on PATH.
+    """
+    return os.environ.get('BLENDER_PATH') or load_local_env().get('BLENDER_PATH') or 'blender'
+
+
+class WorkerError(RuntimeError):
+    """A job failed inside the Blender worker."""
+
+    def __init__(self, response):
+        self.response = response
+        super().__init__(f"Job '{response.get('job')}' failed:\n{response.get('error')}")
+
+
+class BlenderWorker:
+    """Connection to a persistent Blender worker."""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, spawn=False, blender_path=None):
+        """
+        Args:
+            host: Worker address
+            port: Worker port
+            spawn: Start a worker process if none is listening
+            blender_path: Blender executable (default: find_blender())
+        """
+        self.host = host
+        self.port = port
+        self.blender_path = blender_path or find_blender()
+        self.process = None
+        self._ids = itertools.count(1)
+        self._sock = None
+        self._stream = None
+
+        if spawn and not self.is_listening():
+            self.start()
+
+    def is_listening(self):
+        """Check whether a worker accepts connections on host:port."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def start(self, timeout=STARTUP_TIMEOUT, log_path=None):
+        """
+        Launch a headless Blender worker and wait until it accepts connections.
+
+        Args:
+            timeout: Seconds to wait for startup
+            log_path: Optional file for the worker's console output
+
+        Raises:
+            TimeoutError: If the worker does not come up in time
+        """
+        cmd = [self.blender_path, "-b", "-P", str(WORKER_SCRIPT), "--", "--port", str(self.port)]
+        log = open(log_path, 'ab') if log_path else subprocess.DEVNULL
+        self.process = subprocess.Popen(cmd, cwd=str(PROJECT_ROOT), stdout=log, stderr=subprocess.STDOUT)
+
+        start = time.perf_counter()
+        while time.perf_counter() - start < timeout:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Blender worker exited during startup (code {self.process.returncode})")
+            if self.is_listening():
+                return time.perf_counter() - start
+            time.sleep(0.25)
+
+        raise TimeoutError(f"Blender worker did not start within {timeout:.0f}s")
+
+    def connect(self):
+        """Open the request connection (done automatically by submit)."""
+        if self._sock is None:
+            self._sock = socket.create_connection((self.host, self.port))
+            self._stream = self._sock.makefile('rwb')
+
+    def submit(self, job, check=True, **params):
+        """
+        Send one job and wait for its response.
+
+        Args:
+            job: Job name (ping, reset, exec, build, verify, export, render, shutdown)
+            check: Raise WorkerError if the job failed
+            **params: Job parameters (script, globals, args, iteration_num, reset, capture, ...)
+
+        Returns:
+            dict: Response with ok, result, error, reset_s and elapsed_s
+
+        Example:
+            >>> worker.submit('verify', iteration_num=50)['elapsed_s']
+            0.84
+        """
+        self.connect()
+        request = {'id': next(self._ids), 'job': job, **params}
+        self._stream.write((json.dumps(request) + "\n").encode('utf-8'))
+        self._stream.flush()
+
+        line = self._stream.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("Blender worker closed the connection")
+
+        response = json.loads(line)
+        if check and not response.get('ok'):
+            raise WorkerError(response)
+        return response
+
+    def shutdown(self):
+        """Ask the worker to exit and wait for the process if we started it."""
+        try:
+            self.submit('shutdown', check=False)
+        except OSError:
+            pass
+        self.close()
+        if self.process is not None:
+            self.process.wait(timeout=30)
+            self.process = None
+
+    def close(self):
+        """Close the connection (the worker keeps running)."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Workers we spawned are stopped; shared workers are left running
+        if self.process is not None:
+            self.shutdown()
+        else:
+            self.close()
+        return False
+
+
+def parse_value(text):
+    """Parse a --set value as JSON when possible (numbers, bools), else keep the string."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Send jobs to a persistent Blender worker")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--start", action="store_true", help="Start a worker if none is running, then exit")
+    parser.add_argument("--log", help="Worker console log file (with --start)")
+    parser.add_argument("--job", choices=['ping', 'reset', 'exec', 'build', 'verify', 'export', 'render', 'shutdown'])
+    parser.add_argument("--script", help="Script to exec (exec job)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="Global for exec jobs / parameter for verify and export (repeatable)")
+    parser.add_argument("--no-reset", action="store_true", help="Keep the current scene")
+    parser.add_argument("--capture", action="store_true", help="Print the job's output from the response")
+    parser.add_argument("--args", nargs=argparse.REMAINDER, default=[],
+                        help="Remaining arguments are passed to build/render scripts")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    worker = BlenderWorker(args.host, args.port)
+
+    if args.start:
+        if worker.is_listening():
+            print(f"✓ Worker already running on {args.host}:{args.port}")
+        else:
+            print(f"Starting Blender worker: {worker.blender_path}")
+            startup = worker.start(log_path=args.log)
+            # Leave it running for later clients
+            worker.process = None
+            print(f"✓ Worker ready on {args.host}:{args.port} ({startup:.1f}s startup)")
+        if not args.job:
+            return 0
+
+    if not args.job:
+        print("ERROR: Nothing to do (use --job or --start)")
+        return 1
+
+    settings = dict(item.split('=', 1) for item in args.set)
+    settings = {key: parse_value(value) for key, value in settings.items()}
+
+    params = {'capture': args.capture}
+    if args.no_reset:
+        params['reset'] = False
+    if args.job == 'exec':
+        params.update(script=args.script, globals=settings)
+    elif args.job in ('build', 'render'):
+        params['args'] = args.args
+    else:
+        params.update(settings)
+
+    try:
+        response = worker.submit(args.job, check=False, **params)
+    except OSError as e:
+        print(f"❌ Could not reach worker on {args.host}:{args.port}: {e}")
+        print("   Start one with: python scripts/blender_worker_client.py --start")
+        return 1
+    finally:
+        worker.close()
+
+    if args.capture and response.get('output'):
+        print(response['output'])
+
+    if response.get('ok'):
+        print(f"✓ {args.job}: {response['elapsed_s']:.2f}s (reset {response['reset_s']:.2f}s)")
+        if response.get('result'):
+            print(json.dumps(response['result'], indent=2))
+        return 0
+
+    print(f"❌ {args.job} failed after {response.get('elapsed_s', 0):.2f}s")
+    print(response.get('error'))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
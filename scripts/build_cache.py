@@ -0,0 +1,287 @@
+"""
+Incremental Build Cache
+
+Hashes each spec subtree (each exterior wall, roof, parapet, canopy, chimney,
+each cutout, ...) and decides which parts of the building must be rebuilt when the spec
+changes. The hashes and the objects each build stage created are stored in a
+manifest next to the exported GLB/.blend, so the next build can reopen the
+previous scene and only rebuild what changed.
+
+Components:
+    - The four exterior walls are separate hosts ('walls.front', 'walls.rear',
+      'walls.left', 'walls.right'); each is hashed from the shared 'walls'
+      subtree (thickness, height), so a walls change dirties all four.
+    - Each cutout is its own component ('cutouts.<name>').
+    - Every other top-level key (roof, parapet, canopy, door_alcove, ...) is one component.
+
+Dependency rules:
+    - A change to a global key (overall, units, coordinate_system) rebuilds everything.
+    - A cutout change dirties its host wall and every cutout on that wall
+      (booleans are applied destructively, so the wall is re-cut from scratch),
+      and nothing else.
+    - A rebuilt wall dirties every cutout on that wall.
+    - A change to the wall height/thickness or the footprint dirties roof and
+      parapet (they sit on the walls); a roof change dirties parapet and
+      chimney. Re-cutting a wall does not.
+
+Pure Python (no Blender), so plans can be previewed offline.
+
+Usage:
+    python scripts/build_cache.py work/spec/phase_1a/building_geometry.yaml --manifest exports/glb/building_phase_1a_iter_049.build.json
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+MANIFEST_VERSION = 2
+
+# Keys whose change invalidates the whole building
+GLOBAL_KEYS = ['overall', 'units', 'coordinate_system']
+
+# Keys that never affect geometry
+IGNORED_KEYS = {'version', 'phase', 'description', 'assumptions', 'notes',
+                'tolerances', 'validation_targets'}
+
+# Exterior wall host components (built from the shared 'walls' subtree)
+WALL_HOSTS = ['walls.front', 'walls.rear', 'walls.left', 'walls.right']
+
+# Host component for each cutout 'wall' value
+WALL_COMPONENTS = {
+    'front': 'walls.front',
+    'rear': 'walls.rear',
+    'left': 'walls.left',
+    'right': 'walls.right',
+    'alcove_back': 'door_alcove',
+    'alcove_left': 'door_alcove',
+    'alcove_right': 'door_alcove',
+}
+
+# component -> components that must be rebuilt when its spec changes
+# (not when it is only rebuilt to re-cut openings)
+DEPENDENTS = {
+    **{host: ['roof', 'parapet'] for host in WALL_HOSTS},
+    'footprint_geometry': [*WALL_HOSTS, 'roof', 'parapet'],
+    'roof': ['parapet', 'chimney'],
+}
+
+
+def hash_subtree(value):
+    """
+    Hash a spec subtree independent of key order.
+
+    Args:
+        value: Any YAML-loaded value
+
+    Returns:
+        str: Hex SHA-256 digest
+
+    Example:
+        >>> hash_subtree({'a': 1, 'b': 2}) == hash_subtree({'b': 2, 'a': 1})
+        True
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def compute_hashes(spec):
+    """
+    Hash every component subtree of a spec.
+
+    Each top-level key is one component, except 'walls', which contributes
+    one component per exterior wall ('walls.<side>', all hashed from the
+    shared subtree), and 'cutouts', which contributes one component per
+    cutout ('cutouts.<name>'). Global keys are combined into a single
+    '__global__' hash.
+
+    Args:
+        spec: Loaded spec dict
+
+    Returns:
+        dict: component -> hash
+    """
+    hashes = {'__global__': hash_subtree({key: spec.get(key) for key in GLOBAL_KEYS})}
+
+    for key, value in spec.items():
+        if key in IGNORED_KEYS or key in GLOBAL_KEYS:
+            continue
+        if key == 'cutouts' and isinstance(value, dict):
+            for name, cutout in value.items():
+                hashes[f"cutouts.{name}"] = hash_subtree(cutout)
+        elif key == 'walls':
+            for host in WALL_HOSTS:
+                hashes[host] = hash_subtree(value)
+        else:
+            hashes[key] = hash_subtree(value)
+
+    return hashes
+
+
+def cutout_hosts(spec):
+    """Map each cutout component to its host wall component (None for an unknown wall)."""
+    hosts = {}
+    for name, cutout in (spec.get('cutouts') or {}).items():
+        wall = (cutout or {}).get('wall')
+        hosts[f"cutouts.{name}"] = WALL_COMPONENTS.get(wall)
+    return hosts
+
+
+def plan_rebuild(spec, manifest=None):
+    """
+    Decide which components to rebuild.
+
+    Args:
+        spec: New spec dict
+        manifest: Previous build manifest (None = no previous build)
+
+    Returns:
+        dict: {
+            'full': bool,
+            'reason': str,
+            'hashes': new component hashes,
+            'changed': components whose own subtree changed,
+            'rebuild': components to rebuild (changed + dependents),
+            'reuse': components kept from the previous build,
+            'removed': components no longer in the spec
+        }
+    """
+    hashes = compute_hashes(spec)
+    components = set(hashes) - {'__global__'}
+
+    def full(reason):
+        return {'full': True, 'reason': reason, 'hashes': hashes,
+                'changed': sorted(components), 'rebuild': sorted(components),
+                'reuse': [], 'removed': []}
+
+    if not manifest:
+        return full("no previous build")
+    if manifest.get('version') != MANIFEST_VERSION:
+        return full("manifest version changed")
+
+    old = manifest.get('hashes', {})
+    if old.get('__global__') != hashes['__global__']:
+        return full("global dimensions changed (overall/units/coordinate_system)")
+
+    changed = {c for c in components if old.get(c) != hashes[c]}
+    removed = set(old) - set(hashes)
+
+    # Spec changes reshape what sits on the changed component, transitively
+    rebuild = set()
+    pending = list(changed)
+    while pending:
+        component = pending.pop()
+        if component in rebuild:
+            continue
+        rebuild.add(component)
+        pending.extend(c for c in DEPENDENTS.get(component, []) if c in components)
+
+    # Booleans are destructive: a changed or removed cutout re-cuts its host
+    # wall, and a rebuilt wall needs all of its cutouts again
+    hosts = cutout_hosts(spec)
+    old_hosts = manifest.get('cutout_hosts', {})
+    for component in list(rebuild):
+        if hosts.get(component) in components:
+            rebuild.add(hosts[component])
+    for component in removed:
+        if old_hosts.get(component) in components:
+            rebuild.add(old_hosts[component])
+    rebuild.update(c for c, host in hosts.items() if host in rebuild)
+
+    return {
+        'full': False,
+        'reason': f"{len(changed)} changed component(s)" if changed else "no changes",
+        'hashes': hashes,
+        'changed': sorted(changed),
+        'rebuild': sorted(rebuild),
+        'reuse': sorted(components - rebuild),
+        'removed': sorted(removed),
+    }
+
+
+def manifest_path_for(output_path):
+    """Get the manifest path stored next to a GLB or .blend ('<stem>.build.json')."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.build.json")
+
+
+def load_manifest(path):
+    """Load a build manifest, or None if it does not exist or is unreadable."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_manifest(path, spec, spec_path, hashes, objects, blend_path=None, glb_path=None):
+    """
+    Write a build manifest.
+
+    Args:
+        path: Manifest path
+        spec: Spec dict that was built
+        spec_path: Spec file path
+        hashes: Component hashes (from plan_rebuild)
+        objects: stage -> list of object names created by that stage
+        blend_path: Saved .blend path (needed to reopen for incremental builds)
+        glb_path: Exported GLB path
+    """
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'timestamp': datetime.now().isoformat(),
+        'spec': str(spec_path),
+        'blend': str(blend_path) if blend_path else None,
+        'glb': str(glb_path) if glb_path else None,
+        'hashes': hashes,
+        'cutout_hosts': cutout_hosts(spec),
+        'objects': objects,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def print_plan(plan):
+    """Print a rebuild plan."""
+    mode = "FULL REBUILD" if plan['full'] else "INCREMENTAL"
+    print(f"\nBuild plan: {mode} ({plan['reason']})")
+    if not plan['full']:
+        print(f"  Changed:  {', '.join(plan['changed']) or '-'}")
+        print(f"  Rebuild:  {', '.join(plan['rebuild']) or '-'}")
+        print(f"  Reuse:    {', '.join(plan['reuse']) or '-'}")
+        if plan['removed']:
+            print(f"  Removed:  {', '.join(plan['removed'])}")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Preview an incremental rebuild plan")
+    parser.add_argument("spec", help="Spec YAML file")
+    parser.add_argument("--manifest", help="Previous build manifest (.build.json)")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    import yaml
+
+    args = parse_args()
+    with open(args.spec, 'r') as f:
+        spec = yaml.safe_load(f)
+
+    manifest = load_manifest(args.manifest) if args.manifest else None
+    print_plan(plan_rebuild(spec, manifest))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
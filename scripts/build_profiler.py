@@ -0,0 +1,345 @@
+"""
+Build Profiler
+Per-section timing, object/mesh counts, bpy.ops calls and memory for build templates
+
+Sections are timed with a context manager, a decorator (for helper
+functions) or sequential marks (for the numbered template sections, which
+would otherwise need re-indenting). Sections nest; repeated calls of the same
+section under the same parent are aggregated. For each section the profiler
+records:
+
+    wall_s      - wall-clock seconds
+    objects     - net objects created (bpy.data.objects)
+    meshes      - net meshes created (bpy.data.meshes)
+    ops         - bpy.ops calls, plus the most frequent operators
+    py_peak_kb  - peak traced Python memory (only with trace_memory=True)
+    maxrss_kb   - process peak RSS at the end of the section (not on Windows)
+
+Profiling is off until start_profile() is called; decorated helpers then
+cost one flag check. The bpy.ops counter is installed by start_profile() and
+removed again by stop_profile(). The report can be merged into the iteration's metrics
+JSON, with an optional cProfile/pstats dump of the whole build.
+
+Usage:
+    from build_profiler import start_profile, profile_section, profiled, mark_section
+
+    start_profile(trace_memory=True, cprofile=True)
+    mark_section("1.1 Foundation")
+    ...
+    with profile_section("cutters"):
+        ...
+    end_marked_section()
+    write_profile_metrics("work/metrics/phase_1a_metrics_050.json")
+"""
+
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Operators listed per section in the report
+TOP_OPS = 5
+
+_state = {
+    'enabled': False,
+    'trace_memory': False,
+    'cprofile': None,
+    'started': None,
+    'stack': [],
+    'marked': None,
+}
+# Aggregated sections in first-seen order: path tuple -> record
+_records = {}
+# bpy.ops calls by operator id ('mesh.primitive_cube_add'), counted while profiling
+_ops_counts = Counter()
+
+
+def _operator_class():
+    """bpy.ops operator class whose __call__ is wrapped (None outside Blender)."""
+    try:
+        from bpy.ops import _BPyOpsSubModOp
+    except ImportError:
+        return None
+    return _BPyOpsSubModOp
+
+
+def _install_ops_counter(op_class=None):
+    """
+    Count bpy.ops calls by wrapping the operator call (no-op outside Blender).
+
+    The wrapper carries the original call, so a counter left installed by an
+    earlier import of this module (the persistent worker re-imports scripts
+    for every job) is replaced rather than wrapped again.
+    """
+    op_class = op_class or _operator_class()
+    if op_class is None:
+        return False
+
+    current = op_class.__call__
+    original = getattr(current, '_build_profiler_original', current)
+
+    @functools.wraps(original)
+    def counted(self, *args, **kwargs):
+        _ops_counts[f"{getattr(self, '_module', '?')}.{getattr(self, '_func', '?')}"] += 1
+        return original(self, *args, **kwargs)
+
+    counted._build_profiler_original = original
+    op_class.__call__ = counted
+    return True
+
+
+def _remove_ops_counter(op_class=None):
+    """Restore the original operator call, if a counter is installed."""
+    op_class = op_class or _operator_class()
+    if op_class is None:
+        return
+    original = getattr(op_class.__call__, '_build_profiler_original', None)
+    if original is not None:
+        op_class.__call__ = original
+
+
+def _data_counts():
+    """(objects, meshes) in bpy.data, or (None, None) outside Blender."""
+    try:
+        import bpy
+    except ImportError:
+        return None, None
+    return len(bpy.data.objects), len(bpy.data.meshes)
+
+
+def _maxrss_kb():
+    """Process peak resident set size in KB (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class _Section:
+    """One open section: snapshots taken at start, folded into a record at stop."""
+
+    def __init__(self, name):
+        self.name = name
+        self.path = tuple(s.name for s in _state['stack']) + (name,)
+        self.py_peak = 0
+
+    def start(self):
+        if _state['trace_memory']:
+            # Inner sections reset the peak, so hand the peak so far to the open parents
+            peak = tracemalloc.get_traced_memory()[1]
+            for parent in _state['stack']:
+                parent.py_peak = max(parent.py_peak, peak)
+            tracemalloc.reset_peak()
+        _state['stack'].append(self)
+        _records.setdefault(self.path, {
+            'section': " > ".join(self.path), 'depth': len(self.path) - 1, 'calls': 0,
+            'wall_s': 0.0, 'objects': None, 'meshes': None, 'ops': 0, 'top_ops': Counter(),
+            'py_peak_kb': None, 'maxrss_kb': None,
+        })
+        self.objects, self.meshes = _data_counts()
+        self.ops = Counter(_ops_counts)
+        self.t0 = time.perf_counter()
+        return self
+
+    def stop(self):
+        elapsed = time.perf_counter() - self.t0
+        objects, meshes = _data_counts()
+        if _state['stack'] and _state['stack'][-1] is self:
+            _state['stack'].pop()
+
+        record = _records[self.path]
+        record['calls'] += 1
+        record['wall_s'] += elapsed
+        if objects is not None:
+            record['objects'] = (record['objects'] or 0) + objects - self.objects
+            record['meshes'] = (record['meshes'] or 0) + meshes - self.meshes
+        ops = _ops_counts - self.ops
+        record['ops'] += sum(ops.values())
+        record['top_ops'].update(ops)
+        if _state['trace_memory']:
+            peak = max(self.py_peak, tracemalloc.get_traced_memory()[1])
+            for parent in _state['stack']:
+                parent.py_peak = max(parent.py_peak, peak)
+            record['py_peak_kb'] = max(record['py_peak_kb'] or 0, peak // 1024)
+        record['maxrss_kb'] = _maxrss_kb()
+
+
+def start_profile(trace_memory=False, cprofile=False):
+    """
+    Enable profiling and clear earlier results.
+
+    Args:
+        trace_memory: Track peak Python memory per section with tracemalloc
+            (noticeably slows allocation-heavy code)
+        cprofile: Also run cProfile over everything until write_profile_metrics
+    """
+    _records.clear()
+    _state.update(enabled=True, trace_memory=trace_memory, started=time.perf_counter(), stack=[], marked=None)
+    _install_ops_counter()
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if cprofile:
+        import cProfile
+        _state['cprofile'] = cProfile.Profile()
+        _state['cprofile'].enable()
+
+
+def stop_profile():
+    """Close open sections, stop cProfile/tracemalloc and disable profiling."""
+    end_marked_section()
+    while _state['stack']:
+        _state['stack'][-1].stop()
+    if _state['cprofile'] is not None:
+        _state['cprofile'].disable()
+    if _state['trace_memory'] and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _remove_ops_counter()
+    _state['enabled'] = False
+
+
+def is_profiling():
+    """True between start_profile() and stop_profile()."""
+    return _state['enabled']
+
+
+@contextmanager
+def profile_section(name):
+    """
+    Profile a block as a section (does nothing while profiling is off).
+
+    Example:
+        >>> with profile_section("boolean cuts"):
+        ...     apply_boolean_cuts(wall, cutters)
+    """
+    if not _state['enabled']:
+        yield
+        return
+    section = _Section(name).start()
+    try:
+        yield
+    finally:
+        section.stop()
+
+
+def profiled(name=None):
+    """
+    Decorator: profile every call of a function as a section (default name: function name).
+
+    Example:
+        >>> @profiled()
+        ... def build_piece_plan(...):
+    """
+    def decorator(func):
+        section_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state['enabled']:
+                return func(*args, **kwargs)
+            with profile_section(section_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def mark_section(name):
+    """
+    End the previous marked section and start a new one.
+
+    For long scripts split into numbered sections: call at the top of each
+    section instead of wrapping the section in a with block.
+    """
+    end_marked_section()
+    if _state['enabled']:
+        _state['marked'] = _Section(name).start()
+
+
+def end_marked_section():
+    """End the current marked section, if any (and any sections left open inside it)."""
+    marked = _state['marked']
+    if marked is None:
+        return
+    while _state['stack'] and _state['stack'][-1] is not marked:
+        _state['stack'][-1].stop()
+    marked.stop()
+    _state['marked'] = None
+
+
+def get_profile_report():
+    """
+    Get the profile.
+
+    Returns:
+        dict: 'total_s' (since start_profile) and 'sections' (list of records,
+            parents before children, 'top_ops' as {operator: calls})
+    """
+    sections = []
+    for record in _records.values():
+        sections.append({**record, 'top_ops': dict(record['top_ops'].most_common(TOP_OPS))})
+    total = time.perf_counter() - _state['started'] if _state['started'] else 0.0
+    return {'total_s': total, 'sections': sections}
+
+
+def print_profile_report(report=None):
+    """Print the section table."""
+    report = report or get_profile_report()
+    if not report['sections']:
+        return
+    print(f"\n{'Section':<44} {'Calls':>5} {'Time':>8} {'Objs':>5} {'Mesh':>5} {'Ops':>5} {'Peak KB':>9}")
+    print("-" * 86)
+    for s in report['sections']:
+        label = ("  " * s['depth'] + s['section'].split(" > ")[-1])[:44]
+        objects = "-" if s['objects'] is None else s['objects']
+        meshes = "-" if s['meshes'] is None else s['meshes']
+        peak = "-" if s['py_peak_kb'] is None else s['py_peak_kb']
+        print(f"{label:<44} {s['calls']:>5} {s['wall_s']:>7.2f}s {objects:>5} {meshes:>5} {s['ops']:>5} {peak:>9}")
+    print("-" * 86)
+    print(f"Total: {report['total_s']:.2f}s")
+
+
+def write_profile_metrics(metrics_path, pstats_path=None):
+    """
+    Stop profiling and merge the report into a metrics JSON under 'profile'.
+
+    Existing keys in the metrics file are kept.
+
+    Args:
+        metrics_path: Iteration metrics JSON (created if missing)
+        pstats_path: Where to dump cProfile stats (default: next to the metrics
+            file as <stem>.pstats; only if cprofile was enabled)
+
+    Returns:
+        dict: The profile report that was written
+    """
+    stop_profile()
+    report = get_profile_report()
+
+    profiler = _state['cprofile']
+    if profiler is not None:
+        pstats_path = Path(pstats_path) if pstats_path else Path(metrics_path).with_suffix('.pstats')
+        pstats_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(pstats_path))
+        report['pstats'] = str(pstats_path)
+        _state['cprofile'] = None
+
+    metrics_path = Path(metrics_path)
+    metrics = {}
+    if metrics_path.exists():
+        with open(metrics_path, 'r') as f:
+            metrics = json.load(f)
+    metrics['profile'] = report
+    metrics_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(metrics_path, 'w') as f:
+        json.dump(metrics, f, indent=2)
+    return report
@@ -28,17 +28,21 @@ if str(scripts_dir) not in sys.path:
     sys.path.append(str(scripts_dir))
 
 import bpy
-import yaml
+from spec_loader import load_spec_data
 from blender_helpers import (
     create_box,
-    create_cylinder,
+    create_cylinder_instanced,
     verify_dimensions,
     verify_all_objects,
     apply_material,
-    create_boolean_cutter
+    create_boolean_cutter,
+    apply_boolean_cuts,
+    plan_cutout_cutters
 )
+from wall_generator import create_wall_with_openings, openings_for_wall
 from verification_checkpoints import create_checkpoint
 from export_with_verification import export_glb_phase_1a
+from build_profiler import start_profile, mark_section, write_profile_metrics, print_profile_report
 
 # ============================================================================
 # CONFIGURATION
@@ -56,16 +60,45 @@ if 'iteration_num' not in globals():
         "="*70 + "\n"
     )
 
+# OPTIONAL: Subtract all cutouts on a wall with one joined cutter and a single
+# boolean instead of one boolean per cutout
+batch_boolean_cuts = globals().get('batch_boolean_cuts', False)
+
+# OPTIONAL: Build the straight walls with their openings already in the mesh
+# (wall_generator) instead of boxes plus boolean cutters. The angled alcove
+# walls still use booleans.
+analytic_walls = globals().get('analytic_walls', False)
+
+# OPTIONAL: Build from another spec file, export to another directory and keep
+# checkpoints in another directory (used by param_sweep.py for spec variants)
+spec_path = Path(globals().get('spec_path', scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'))
+export_dir = globals().get('export_dir', None)
+checkpoint_dir = globals().get('checkpoint_dir', None)
+
+# OPTIONAL: Per-section profiling (time, objects/meshes created, bpy.ops calls,
+# peak memory) written to the iteration's metrics JSON; off unless
+# profile_build=True is passed. profile_memory traces
+# Python allocations (slower); profile_cprofile also dumps cProfile stats.
+profile_build = globals().get('profile_build', False)
+profile_memory = globals().get('profile_memory', False)
+profile_cprofile = globals().get('profile_cprofile', False)
+
+if profile_build:
+    start_profile(trace_memory=profile_memory, cprofile=profile_cprofile)
+
 print("="*70)
 print(f" Phase 1A Iteration {iteration_num:03d} - Build with Enforced Verification")
 print("="*70)
 print(f"\nThis build process has mandatory verification gates.")
 print(f"Export will be BLOCKED if any verification step is incomplete.\n")
 
-# Load specification
-spec_path = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
-with open(spec_path, 'r') as f:
-    spec = yaml.safe_load(f)
+if checkpoint_dir is not None:
+    from checkpoint_store import open_checkpoint_store
+    from verification_checkpoints import set_checkpoint_store
+    set_checkpoint_store(open_checkpoint_store(directory=checkpoint_dir))
+
+# Load specification (validated; cached on mtime/content hash)
+spec = load_spec_data(spec_path)
 
 overall = spec['overall']
 walls = spec['walls']
@@ -87,10 +120,12 @@ print(" SECTION 1: Building Geometry")
 print("="*70)
 
 # Clear existing scene
+mark_section("1.0 Clear Scene")
 bpy.ops.object.select_all(action='SELECT')
 bpy.ops.object.delete()
 
 # Foundation
+mark_section("1.1 Foundation")
 print("\n[1.1] Building Foundation...")
 foundation_height = 0.28
 foundation = create_box(
@@ -103,45 +138,36 @@ foundation = create_box(
 apply_material(foundation, spec.get('phase_1a_colors', {}).get('foundation', '#606060'))
 
 # Walls (start at Z=0, which is top of foundation in spec coordinate system)
+mark_section("1.2 Walls")
 print("[1.2] Building Walls...")
 wall_base_z = wall_height/2  # Walls start at Z=0
 
-wall_front = create_box(
-    "Wall_Front",
-    width=building_width,
-    depth=walls['thickness'],
-    height=wall_height,
-    location=(0, -building_depth/2, wall_base_z)
-)
+# Walls whose openings are part of the mesh (skipped in [1.7])
+analytic_wall_names = set()
 
-wall_rear = create_box(
-    "Wall_Rear",
-    width=building_width,
-    depth=walls['thickness'],
-    height=wall_height,
-    location=(0, building_depth/2, wall_base_z)
-)
 
-wall_left = create_box(
-    "Wall_Left",
-    width=walls['thickness'],
-    depth=building_depth,
-    height=wall_height,
-    location=(-building_width/2, 0, wall_base_z)
-)
+def build_wall(name, wall_key, length, location, axis):
+    """Build one straight wall, with its openings when analytic_walls is set."""
+    if analytic_walls:
+        openings = openings_for_wall(spec, wall_key, location[:2], axis)
+        analytic_wall_names.add(name)
+        return create_wall_with_openings(name, length, walls['thickness'], wall_height,
+                                         location, openings, axis=axis)
+    if axis == 'x':
+        return create_box(name, width=length, depth=walls['thickness'], height=wall_height, location=location)
+    return create_box(name, width=walls['thickness'], depth=length, height=wall_height, location=location)
 
-wall_right = create_box(
-    "Wall_Right",
-    width=walls['thickness'],
-    depth=building_depth,
-    height=wall_height,
-    location=(building_width/2, 0, wall_base_z)
-)
+
+wall_front = build_wall("Wall_Front", 'front', building_width, (0, -building_depth/2, wall_base_z), 'x')
+wall_rear = build_wall("Wall_Rear", 'rear', building_width, (0, building_depth/2, wall_base_z), 'x')
+wall_left = build_wall("Wall_Left", 'left', building_depth, (-building_width/2, 0, wall_base_z), 'y')
+wall_right = build_wall("Wall_Right", 'right', building_depth, (building_width/2, 0, wall_base_z), 'y')
 
 for wall in [wall_front, wall_rear, wall_left, wall_right]:
     apply_material(wall, spec.get('phase_1a_colors', {}).get('walls', '#808080'))
 
 # Door Alcove Walls (ANGLED - trapezoid shape)
+mark_section("1.2.5 Door Alcove Walls")
 print("[1.2.5] Building Door Alcove Walls...")
 door_alcove = spec.get('door_alcove', {})
 if door_alcove.get('enabled', False):
@@ -225,13 +251,24 @@ if door_alcove.get('enabled', False):
         back_wall_height = door_alcove['walls']['back']['height']
         back_wall_y = door_alcove['walls']['back']['position_y']
 
-        alcove_back_wall = create_box(
-            "Alcove_Wall_Back",
-            width=back_wall_width,
-            depth=alcove_wall_thickness,
-            height=back_wall_height,
-            location=(0, back_wall_y, back_wall_height/2)
-        )
+        if analytic_walls:
+            alcove_back_wall = create_wall_with_openings(
+                "Alcove_Wall_Back",
+                back_wall_width,
+                alcove_wall_thickness,
+                back_wall_height,
+                (0, back_wall_y, back_wall_height/2),
+                openings_for_wall(spec, 'alcove_back', (0, back_wall_y))
+            )
+            analytic_wall_names.add("Alcove_Wall_Back")
+        else:
+            alcove_back_wall = create_box(
+                "Alcove_Wall_Back",
+                width=back_wall_width,
+                depth=alcove_wall_thickness,
+                height=back_wall_height,
+                location=(0, back_wall_y, back_wall_height/2)
+            )
         apply_material(alcove_back_wall, spec.get('phase_1a_colors', {}).get('walls', '#808080'))
 
     # Alcove ceiling (trapezoidal piece covering the top)
@@ -316,6 +353,7 @@ else:
     print("  Alcove disabled in spec")
 
 # Roof
+mark_section("1.3 Roof")
 print("[1.3] Building Roof...")
 roof_z = wall_height + roof['thickness']/2  # Roof sits on walls at Z=wall_height
 # Roof extends to outer wall faces (flush with walls)
@@ -332,6 +370,7 @@ apply_material(roof_obj, spec.get('phase_1a_colors', {}).get('roof', '#404040'))
 print(f"  Roof: {roof_width}m × {roof_depth}m (extends to outer wall faces)")
 
 # Parapet (3-level stepped)
+mark_section("1.3.5 Parapet")
 print("[1.3.5] Building Parapet...")
 parapet_spec = spec.get('parapet', {})
 if parapet_spec.get('enabled', True):  # Default to enabled since it's in baseline
@@ -429,6 +468,7 @@ else:
     print("  Parapet disabled in spec")
 
 # Canopy
+mark_section("1.4 Canopy")
 print("[1.4] Building Canopy...")
 canopy_thickness = canopy.get('roof_thickness', canopy.get('thickness', 0.35))
 canopy_roof_z = canopy['height'] + canopy_thickness/2
@@ -442,17 +482,20 @@ canopy_roof = create_box(
 apply_material(canopy_roof, spec.get('phase_1a_colors', {}).get('canopy', '#A0A0A0'))
 
 # Canopy posts
+mark_section("1.5 Canopy Posts")
 print("[1.5] Building Canopy Posts...")
 for i, post_spec in enumerate(canopy['posts']):
-    post = create_cylinder(
+    # Posts of the same diameter share one mesh (linked duplicates)
+    post = create_cylinder_instanced(
         f"Canopy_Post_{i+1}",
         radius=post_spec['diameter']/2,
         height=canopy['height'],
-        location=(post_spec['x'], post_spec['y'], canopy['height']/2)
+        location=(post_spec['x'], post_spec['y'], canopy['height']/2),
+        color=spec.get('phase_1a_colors', {}).get('canopy', '#A0A0A0')
     )
-    apply_material(post, spec.get('phase_1a_colors', {}).get('canopy', '#A0A0A0'))
 
 # Chimney
+mark_section("1.6 Chimney")
 print("[1.6] Building Chimney...")
 # Chimney sits ON the roof, so Z position is: roof_top + height_above_roof/2
 chimney_height = chimney.get('height_above_roof', 1.5)
@@ -515,90 +558,59 @@ if gabled_roof_spec.get('enabled', False):
     print(f"  ✓ Chimney gabled roof created: {gable_height}m tall")
 
 # Boolean cutouts
+mark_section("1.7 Boolean Cutouts")
 print("[1.7] Applying Boolean Cutouts...")
-cutout_count = 0
-
-# Wall name mapping: spec uses "front"/"rear"/"left"/"right", objects use "Wall_Front" etc
-wall_name_map = {
-    'front': 'Wall_Front',
-    'rear': 'Wall_Rear',
-    'left': 'Wall_Left',
-    'right': 'Wall_Right',
-    'alcove_left': 'Alcove_Wall_Left',
-    'alcove_right': 'Alcove_Wall_Right',
-    'alcove_back': 'Alcove_Wall_Back'
-}
-
-# Calculate alcove wall angles for rotated cutters
 import math
-if door_alcove.get('enabled', False):
-    alcove_y_front = door_alcove['position']['y_front']  # -7.5
-    alcove_y_back = door_alcove['position']['y_back']    # -6.5
-    alcove_depth_y = alcove_y_back - alcove_y_front      # 1.0
-
-    # Left wall angle: from front_x to back_x over alcove depth
-    left_dx = door_alcove['walls']['left']['back_x'] - door_alcove['walls']['left']['front_x']
-    left_wall_direction_angle = math.atan2(left_dx, alcove_depth_y)  # Angle parallel to wall
-    # Rotate 90° from wall direction to cut perpendicular (user confirmed this worked initially)
-    alcove_left_angle = math.radians(90) - left_wall_direction_angle
-
-    # Right wall angle: mirror of left
-    right_dx = door_alcove['walls']['right']['back_x'] - door_alcove['walls']['right']['front_x']
-    right_wall_direction_angle = math.atan2(right_dx, alcove_depth_y)  # Angle parallel to wall
-    # Rotate 90° from wall direction to cut perpendicular (user confirmed this worked initially)
-    alcove_right_angle = math.radians(90) - right_wall_direction_angle
-
-    print(f"  Alcove wall direction angles: left={math.degrees(left_wall_direction_angle):.1f}°, right={math.degrees(right_wall_direction_angle):.1f}°")
-    print(f"  Alcove cutter angles (perpendicular): left={math.degrees(alcove_left_angle):.1f}°, right={math.degrees(alcove_right_angle):.1f}°")
-
-# Iterate over dictionary items (not just keys)
-for cutout_name, cutout_spec in cutouts.items():
-    # Get wall object using mapped name
-    wall_key = cutout_spec.get('wall', '')
-    wall_obj_name = wall_name_map.get(wall_key)
-    wall_obj = bpy.data.objects.get(wall_obj_name) if wall_obj_name else None
-
-    if wall_obj:
-        # Extract position from nested structure
-        pos = cutout_spec['position']
-
-        # Determine cutter depth and rotation based on wall orientation
-        rotation_z = 0  # Default: no rotation
-
-        if wall_key in ['front', 'rear']:
-            # Front/rear walls are thin in Y direction
-            cutter_depth = walls['thickness'] + cutout_spec.get('recess_depth', 0) + cutout_spec.get('reveal_depth', 0)
-        elif wall_key == 'alcove_left':
-            # Left alcove wall: angled, rotate cutter to match
-            cutter_depth = door_alcove['walls']['thickness'] + cutout_spec.get('reveal_depth', 0)
-            rotation_z = alcove_left_angle
-        elif wall_key == 'alcove_right':
-            # Right alcove wall: angled, rotate cutter to match
-            cutter_depth = door_alcove['walls']['thickness'] + cutout_spec.get('reveal_depth', 0)
-            rotation_z = alcove_right_angle
-        elif wall_key == 'alcove_back':
-            # Alcove back wall is thin in Y direction
-            cutter_depth = door_alcove['walls']['thickness'] + cutout_spec.get('reveal_depth', 0)
-        else:
-            # Left/right walls are thin in X direction
-            cutter_depth = walls['thickness'] + cutout_spec.get('reveal_depth', 0)
-
-        create_boolean_cutter(
-            wall_obj,
-            f"{cutout_name}_Cutter",
-            cutout_spec['width'],
-            cutter_depth,
-            cutout_spec['height'],
-            (pos['x'], pos['y'], pos['z'] + cutout_spec['height']/2),  # pos['z'] already in spec coordinates (Z=0 at wall base)
-            rotation_z=rotation_z
-        )
+import time
+
+# Cutter boxes per wall object (alcove cutters rotated perpendicular to the angled walls)
+wall_cutters = plan_cutout_cutters(spec)
+cutout_count = 0
+boolean_start = time.perf_counter()
+
+for cutter in wall_cutters.pop(None, []):
+    print(f"  WARNING: Wall '{cutouts[cutter['cutout']].get('wall', '')}' not found for cutout '{cutter['cutout']}'")
+
+for wall_obj_name, cutter_specs in wall_cutters.items():
+    if wall_obj_name in analytic_wall_names:
+        # Openings already built into the wall mesh
+        for cutter in cutter_specs:
+            cutout_count += 1
+            print(f"  Built-in opening: {cutter['cutout']} in {wall_obj_name}")
+        continue
+
+    wall_obj = bpy.data.objects.get(wall_obj_name)
+    if not wall_obj:
+        for cutter in cutter_specs:
+            print(f"  WARNING: Wall object '{wall_obj_name}' not found for cutout '{cutter['cutout']}'")
+        continue
+
+    if batch_boolean_cuts:
+        # One joined cutter and one boolean per wall
+        apply_boolean_cuts(wall_obj, cutter_specs)
+    else:
+        for cutter in cutter_specs:
+            create_boolean_cutter(
+                wall_obj,
+                cutter['name'],
+                cutter['width'],
+                cutter['depth'],
+                cutter['height'],
+                cutter['location'],
+                rotation_z=cutter['rotation_z']
+            )
+
+    for cutter in cutter_specs:
         cutout_count += 1
-        if rotation_z != 0:
-            print(f"  Applied cutout: {cutout_name} to {wall_obj_name} (rotated {math.degrees(rotation_z):.1f}°)")
+        if cutter['rotation_z'] != 0:
+            print(f"  Applied cutout: {cutter['cutout']} to {wall_obj_name} (rotated {math.degrees(cutter['rotation_z']):.1f}°)")
         else:
-            print(f"  Applied cutout: {cutout_name} to {wall_obj_name}")
-    else:
-        print(f"  WARNING: Wall '{wall_key}' not found for cutout '{cutout_name}'")
+            print(f"  Applied cutout: {cutter['cutout']} to {wall_obj_name}")
+
+boolean_mode = "batched per wall" if batch_boolean_cuts else "one per cutout"
+if analytic_walls:
+    boolean_mode += f", {len(analytic_wall_names)} walls analytic"
+print(f"  Boolean time: {time.perf_counter() - boolean_start:.3f}s ({boolean_mode})")
 
 print(f"✓ Geometry complete: {cutout_count} cutouts applied")
 
@@ -608,6 +620,7 @@ print(f"✓ Geometry complete: {cutout_count} cutouts applied")
 print("\n" + "="*70)
 print(" SECTION 2: Inline Verification (REQUIRED)")
 print("="*70)
+mark_section("2 Inline Verification")
 print("Verifying dimensions of each element...\n")
 
 verification_specs = [
@@ -659,6 +672,7 @@ create_checkpoint(
 print("\n" + "="*70)
 print(" SECTION 3: Batch Verification (REQUIRED)")
 print("="*70)
+mark_section("3 Batch Verification")
 print("Re-verifying all objects together...\n")
 
 # Re-run batch verification to ensure nothing changed
@@ -687,11 +701,20 @@ create_checkpoint(
 print("\n" + "="*70)
 print(" SECTION 4: Automated Verification Script (REQUIRED)")
 print("="*70)
+mark_section("4 Automated Verification")
 print("Running automated verification against spec targets...\n")
 
+def run_automated_verification():
+    """Run verify_phase_1a with this template's settings (checkpoint 3 if it passes)."""
+    # Not run as __main__: verify_phase_1a's main block would sys.exit() and stop the build
+    namespace = dict(globals(), __name__='verify_phase_1a')
+    exec(open(scripts_dir / 'verify_phase_1a.py').read(), namespace)
+    return namespace['main']()
+
+
 # Run the automated verification script
 # This script will create checkpoint 3 if it passes
-exec(open(scripts_dir / 'verify_phase_1a.py').read())
+run_automated_verification()
 
 print("\n✓ Automated verification complete (checkpoint created if passed)")
 
@@ -701,11 +724,22 @@ print("\n✓ Automated verification complete (checkpoint created if passed)")
 print("\n" + "="*70)
 print(" SECTION 5: Exporting GLB (GATED)")
 print("="*70)
+mark_section("5 Export")
 print("\nAttempting export with verification gates...\n")
 
 # This will FAIL if any checkpoint is missing
-# The export function checks for all 3 checkpoints before proceeding
-glb_file = export_glb_phase_1a(iteration_num)
+# The export function checks for all 3 checkpoints before proceeding, and
+# compares their scene fingerprints; if objects changed since verification,
+# their dimensions are re-checked and the automated verification re-runs.
+# New or removed objects, or changed objects without a dimension spec, block.
+glb_file = export_glb_phase_1a(
+    iteration_num,
+    reverify=lambda names: verify_all_objects(
+        [spec for spec in verification_specs if spec['object'].name in names], tolerance=0.01
+    ),
+    output_dir=export_dir,
+    reautomate=run_automated_verification
+)
 
 print(f"\n✓ Export succeeded: {glb_file}")
 
@@ -719,6 +753,12 @@ print("="*70)
 # TODO: Add render generation code here
 # TODO: Add metrics JSON generation code here
 
+if profile_build:
+    metrics_path = scripts_dir.parent / 'work' / 'metrics' / f"phase_1a_metrics_{iteration_num:03d}.json"
+    profile_report = write_profile_metrics(metrics_path)
+    print_profile_report(profile_report)
+    print(f"\n✓ Build profile written to {metrics_path.name}")
+
 print("\n" + "="*70)
 print(f" ✅ ITERATION {iteration_num:03d} COMPLETE")
 print("="*70)
@@ -727,5 +767,10 @@ print("  ✓ Inline verification (checkpoint 1)")
 print("  ✓ Batch verification (checkpoint 2)")
 print("  ✓ Automated verification (checkpoint 3)")
 print("  ✓ GLB export succeeded")
+
+from material_registry import print_material_stats
+from blender_helpers import print_instancing_stats
+print_material_stats()
+print_instancing_stats()
 print("\nYou may now present results to the user.")
 print("="*70 + "\n")
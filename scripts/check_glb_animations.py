@@ -1,8 +1,35 @@
 #!/usr/bin/env python3
-"""Script to check for animations in GLB files."""
+"""
+Script to check for animations in GLB files.
 
+Reads only the GLB JSON chunk (via glb_reader), so even large exports are
+checked without loading any geometry.
+
+Usage:
+    python scripts/check_glb_animations.py exports/glb/building_phase_2_iter_001.glb
+    python scripts/check_glb_animations.py          # latest GLB in exports/glb
+    python scripts/check_glb_animations.py --batch  # every GLB in exports/glb and viewer/public
+"""
+
+import argparse
 import sys
-from pygltflib import GLTF2
+import time
+from pathlib import Path
+
+from glb_reader import GLBReader
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BATCH_DIRS = [PROJECT_ROOT / 'exports' / 'glb', PROJECT_ROOT / 'viewer' / 'public']
+
+
+def find_nodes(glb, keyword):
+    """Get (index, node) pairs whose name contains keyword (case-insensitive)."""
+    return [
+        (i, node) for i, node in enumerate(glb.nodes)
+        if node.get('name') and keyword in node['name'].lower()
+    ]
+
 
 def check_glb_animations(glb_path):
     """Check for animations in a GLB file."""
@@ -11,76 +38,132 @@ def check_glb_animations(glb_path):
     print(f"CHECKING: {glb_path}")
     print('='*60)
 
-    gltf = GLTF2().load(glb_path)
-
-    # Check for animations
-    print("\n--- ANIMATIONS ---")
-    if gltf.animations:
-        print(f"Found {len(gltf.animations)} animation(s):")
-        for i, anim in enumerate(gltf.animations):
-            print(f"\n  Animation {i}: '{anim.name}'")
-            print(f"    Channels: {len(anim.channels)}")
-            print(f"    Samplers: {len(anim.samplers)}")
-            for j, channel in enumerate(anim.channels):
-                node_idx = channel.target.node
-                node_name = gltf.nodes[node_idx].name if node_idx is not None else "Unknown"
-                print(f"      Channel {j}: Node '{node_name}' - {channel.target.path}")
-    else:
-        print("No animations found in the GLB file.")
-
-    # Look for door-related nodes
-    print("\n--- DOOR-RELATED NODES ---")
-    door_nodes = []
-    for i, node in enumerate(gltf.nodes):
-        if node.name and 'door' in node.name.lower():
-            door_nodes.append((i, node))
-
-    if door_nodes:
-        for idx, node in door_nodes:
-            print(f"\n  Node {idx}: '{node.name}'")
-            print(f"    Translation: {node.translation}")
-            print(f"    Rotation: {node.rotation}")
-            print(f"    Scale: {node.scale}")
-            if node.children:
-                print(f"    Children: {len(node.children)} nodes")
-    else:
-        print("No door-related nodes found.")
-
-    # Look for pivot nodes
-    print("\n--- PIVOT NODES ---")
-    pivot_nodes = []
-    for i, node in enumerate(gltf.nodes):
-        if node.name and 'pivot' in node.name.lower():
-            pivot_nodes.append((i, node))
-
-    if pivot_nodes:
-        for idx, node in pivot_nodes:
-            print(f"\n  Node {idx}: '{node.name}'")
-            print(f"    Translation: {node.translation}")
-            print(f"    Rotation: {node.rotation}")
-            if node.children:
-                print(f"    Children: {len(node.children)} child nodes")
-                # List some children
-                for child_idx in node.children[:5]:
-                    child = gltf.nodes[child_idx]
-                    print(f"      - '{child.name}'")
-                if len(node.children) > 5:
-                    print(f"      ... and {len(node.children) - 5} more")
-    else:
-        print("No pivot nodes found.")
+    with GLBReader(glb_path) as glb:
+        # Check for animations
+        print("\n--- ANIMATIONS ---")
+        if glb.animations:
+            print(f"Found {len(glb.animations)} animation(s):")
+            for i, anim in enumerate(glb.animations):
+                channels = anim.get('channels', [])
+                print(f"\n  Animation {i}: '{anim.get('name')}'")
+                print(f"    Channels: {len(channels)}")
+                print(f"    Samplers: {len(anim.get('samplers', []))}")
+                for j, channel in enumerate(channels):
+                    target = channel.get('target', {})
+                    node_name = glb.node_name(target.get('node'))
+                    print(f"      Channel {j}: Node '{node_name}' - {target.get('path')}")
+        else:
+            print("No animations found in the GLB file.")
+
+        # Look for door-related nodes
+        print("\n--- DOOR-RELATED NODES ---")
+        door_nodes = find_nodes(glb, 'door')
+
+        if door_nodes:
+            for idx, node in door_nodes:
+                print(f"\n  Node {idx}: '{node['name']}'")
+                print(f"    Translation: {node.get('translation')}")
+                print(f"    Rotation: {node.get('rotation')}")
+                print(f"    Scale: {node.get('scale')}")
+                if node.get('children'):
+                    print(f"    Children: {len(node['children'])} nodes")
+        else:
+            print("No door-related nodes found.")
 
-    # Summary of all nodes
-    print(f"\n--- SUMMARY ---")
-    print(f"Total nodes: {len(gltf.nodes)}")
-    print(f"Total meshes: {len(gltf.meshes) if gltf.meshes else 0}")
-    print(f"Total materials: {len(gltf.materials) if gltf.materials else 0}")
-    print(f"Total animations: {len(gltf.animations) if gltf.animations else 0}")
+        # Look for pivot nodes
+        print("\n--- PIVOT NODES ---")
+        pivot_nodes = find_nodes(glb, 'pivot')
+
+        if pivot_nodes:
+            for idx, node in pivot_nodes:
+                print(f"\n  Node {idx}: '{node['name']}'")
+                print(f"    Translation: {node.get('translation')}")
+                print(f"    Rotation: {node.get('rotation')}")
+                children = node.get('children', [])
+                if children:
+                    print(f"    Children: {len(children)} child nodes")
+                    # List some children
+                    for child_idx in children[:5]:
+                        print(f"      - '{glb.node_name(child_idx)}'")
+                    if len(children) > 5:
+                        print(f"      ... and {len(children) - 5} more")
+        else:
+            print("No pivot nodes found.")
+
+        # Summary of all nodes
+        print(f"\n--- SUMMARY ---")
+        print(f"Total nodes: {len(glb.nodes)}")
+        print(f"Total meshes: {len(glb.meshes)}")
+        print(f"Total materials: {len(glb.materials)}")
+        print(f"Total animations: {len(glb.animations)}")
 
     print("\n" + "="*60 + "\n")
 
+
+def summarize_glb(glb_path):
+    """
+    Collect animation, door and pivot counts for one GLB.
+
+    Returns:
+        dict: nodes, meshes, materials, animations, channels, door_nodes, pivot_nodes
+    """
+    with GLBReader(glb_path) as glb:
+        return {
+            'nodes': len(glb.nodes),
+            'meshes': len(glb.meshes),
+            'materials': len(glb.materials),
+            'animations': len(glb.animations),
+            'channels': sum(len(anim.get('channels', [])) for anim in glb.animations),
+            'door_nodes': len(find_nodes(glb, 'door')),
+            'pivot_nodes': len(find_nodes(glb, 'pivot')),
+        }
+
+
+def check_batch(directories=BATCH_DIRS):
+    """Scan every GLB in the given directories and print one table."""
+    paths = [path for directory in directories for path in sorted(Path(directory).glob("*.glb"))]
+
+    print(f"\n{'File':<56} {'Nodes':>6} {'Mats':>5} {'Anims':>6} {'Chans':>6} {'Doors':>6} {'Pivots':>7}")
+    print("-" * 98)
+
+    start = time.perf_counter()
+    failures = 0
+    for path in paths:
+        label = f"{path.parent.parent.name}/{path.parent.name}/{path.name}"
+        try:
+            s = summarize_glb(path)
+        except (OSError, ValueError) as e:
+            failures += 1
+            print(f"{label:<56} ❌ {e}")
+            continue
+        print(f"{label:<56} {s['nodes']:>6} {s['materials']:>5} {s['animations']:>6} "
+              f"{s['channels']:>6} {s['door_nodes']:>6} {s['pivot_nodes']:>7}")
+    elapsed = time.perf_counter() - start
+
+    print(f"\nScanned {len(paths)} GLB file(s) in {elapsed:.2f}s")
+    return 1 if failures else 0
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Check GLB files for animations, door and pivot nodes")
+    parser.add_argument("glb", nargs="*", help="GLB files to check")
+    parser.add_argument("--batch", action="store_true",
+                        help="Scan every GLB in exports/glb and viewer/public")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        check_glb_animations(sys.argv[1])
+    args = parse_args()
+    if args.batch:
+        sys.exit(check_batch())
+    elif args.glb:
+        for path in args.glb:
+            check_glb_animations(path)
     else:
         # Check the latest GLB
-        check_glb_animations("/home/user/creepy-building-blender-automated/exports/glb/building_phase_2_iter_001.glb")
+        latest = max((PROJECT_ROOT / 'exports' / 'glb').glob("*.glb"), key=lambda p: p.stat().st_mtime, default=None)
+        if latest is None:
+            print("No GLB files found in exports/glb")
+            sys.exit(1)
+        check_glb_animations(latest)
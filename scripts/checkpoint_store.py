@@ -0,0 +1,471 @@
+"""
+Checkpoint Storage Backends
+Where verification_checkpoints keeps its checkpoint records
+
+Two interchangeable stores behind the same small interface (write, read,
+delete, names, timestamps, location):
+
+    JSONCheckpointStore   - one <name>.json file per checkpoint (original layout)
+    SQLiteCheckpointStore - one checkpoints.sqlite3 file (WAL mode), indexed on
+                            iteration and checkpoint type, so status and
+                            listing queries are one indexed query instead of a
+                            glob plus one file open per checkpoint
+
+Checkpoint names end in the iteration number (e.g. "batch_verification_049");
+the prefix is the checkpoint type.
+
+Records are stamped with a SHA-256 of their canonical JSON (stamp_record) and
+checked on read (verify_record), so a truncated or edited checkpoint raises
+CheckpointIntegrityError instead of passing a gate. JSON files are written
+atomically (temp file, fsync, rename) and can be gzip- or zstd-compressed
+(CHECKPOINT_COMPRESSION=gzip|zstd; zstd needs the optional zstandard package).
+
+Select the backend with the CHECKPOINT_BACKEND environment variable
+('json' or 'sqlite', default 'json') or verification_checkpoints.set_checkpoint_store().
+
+Usage:
+    python scripts/checkpoint_store.py import              # JSON files -> SQLite store
+    python scripts/checkpoint_store.py status 49 --backend sqlite
+    python scripts/checkpoint_store.py list --backend sqlite --iteration 49
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CHECKPOINT_DIR = Path(os.environ.get('CHECKPOINT_DIR', _PROJECT_ROOT / "work" / "verification" / "checkpoints"))
+SQLITE_FILENAME = "checkpoints.sqlite3"
+BACKENDS = ('json', 'sqlite')
+
+# File suffix per JSON store compression
+COMPRESSION_SUFFIXES = {None: '.json', 'gzip': '.json.gz', 'zstd': '.json.zst'}
+
+_NAME_PATTERN = re.compile(r'^(?P<type>.+)_(?P<iteration>\d+)$')
+
+
+def parse_checkpoint_name(checkpoint_name):
+    """
+    Split a checkpoint name into (type, iteration).
+
+    Example:
+        >>> parse_checkpoint_name("batch_verification_049")
+        ('batch_verification', 49)
+        >>> parse_checkpoint_name("notes")
+        ('notes', None)
+    """
+    match = _NAME_PATTERN.match(checkpoint_name)
+    if not match:
+        return checkpoint_name, None
+    return match.group('type'), int(match.group('iteration'))
+
+
+class CheckpointIntegrityError(ValueError):
+    """Checkpoint exists but is truncated, unreadable or fails its digest."""
+
+    def __init__(self, checkpoint_name, location, reason):
+        self.checkpoint_name = checkpoint_name
+        self.location = location
+        self.reason = reason
+        super().__init__(
+            f"\n{'='*70}\n"
+            f"❌ VERIFICATION CHECKPOINT CORRUPT: {checkpoint_name}\n"
+            f"{'='*70}\n\n"
+            f"{reason}\n"
+            f"Checkpoint: {location}\n\n"
+            f"Re-run the verification step that creates this checkpoint.\n"
+        )
+
+
+def _canonical_json(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'))
+
+
+def record_digest(record):
+    """SHA-256 of a record's canonical JSON, excluding its own 'sha256' field."""
+    payload = {key: value for key, value in record.items() if key != 'sha256'}
+    return hashlib.sha256(_canonical_json(payload).encode()).hexdigest()
+
+
+def stamp_record(record):
+    """
+    Return a JSON-normalized copy of record with its 'sha256' digest.
+
+    The copy is what a reader will load (tuples become lists, keys strings),
+    so the digest matches on read.
+    """
+    normalized = json.loads(json.dumps(record))
+    normalized['sha256'] = record_digest(normalized)
+    return normalized
+
+
+def verify_record(checkpoint_name, record, location=None):
+    """
+    Check a loaded record against its digest.
+
+    Records written before digests were added have no 'sha256' and are
+    accepted as-is.
+
+    Raises:
+        CheckpointIntegrityError: If the digest does not match
+    """
+    expected = record.get('sha256') if isinstance(record, dict) else None
+    if not isinstance(record, dict):
+        raise CheckpointIntegrityError(checkpoint_name, location, "Checkpoint is not a JSON object.")
+    if expected is not None and record_digest(record) != expected:
+        raise CheckpointIntegrityError(checkpoint_name, location, "Checkpoint contents do not match their SHA-256 digest.")
+    return record
+
+
+def _fsync_directory(directory):
+    """Persist a rename on POSIX (not supported on Windows; best effort)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JSONCheckpointStore:
+    """One JSON file per checkpoint in a directory (optionally compressed)."""
+
+    backend = 'json'
+
+    def __init__(self, directory=DEFAULT_CHECKPOINT_DIR, compression=None):
+        """
+        Args:
+            directory: Checkpoint directory
+            compression: None (pretty-printed .json), 'gzip' (.json.gz) or
+                'zstd' (.json.zst, falls back to gzip without zstandard)
+        """
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown checkpoint compression '{compression}' (expected gzip, zstd or None)")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            print("⚠️  zstandard not installed - writing gzip checkpoints instead (pip install zstandard)")
+            compression = 'gzip'
+        self.directory = Path(directory)
+        self.compression = compression
+
+    def _existing(self, checkpoint_name):
+        for suffix in COMPRESSION_SUFFIXES.values():
+            path = self.directory / f"{checkpoint_name}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def location(self, checkpoint_name):
+        return self._existing(checkpoint_name) or self.directory / f"{checkpoint_name}{COMPRESSION_SUFFIXES[self.compression]}"
+
+    def _encode(self, record):
+        if self.compression is None:
+            return json.dumps(record, indent=2).encode()
+        payload = json.dumps(record, separators=(',', ':')).encode()
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=10).compress(payload)
+        return gzip.compress(payload, mtime=0)
+
+    def write(self, checkpoint_name, record):
+        """Write atomically: temp file in the same directory, fsync, rename."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{checkpoint_name}{COMPRESSION_SUFFIXES[self.compression]}"
+        tmp = self.directory / f".{checkpoint_name}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(self._encode(record))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        _fsync_directory(self.directory)
+
+        # Drop the same checkpoint stored with a different compression
+        for suffix in COMPRESSION_SUFFIXES.values():
+            other = self.directory / f"{checkpoint_name}{suffix}"
+            if other != path and other.exists():
+                other.unlink()
+        return path
+
+    def read(self, checkpoint_name):
+        """
+        Load a checkpoint record (None if missing).
+
+        Raises:
+            CheckpointIntegrityError: If the file is truncated or not valid JSON
+        """
+        path = self._existing(checkpoint_name)
+        if path is None:
+            return None
+        try:
+            raw = path.read_bytes()
+            if path.name.endswith('.gz'):
+                raw = gzip.decompress(raw)
+            elif path.name.endswith('.zst'):
+                if not ZSTD_AVAILABLE:
+                    raise CheckpointIntegrityError(checkpoint_name, path, "zstandard is needed to read this checkpoint.")
+                raw = zstandard.ZstdDecompressor().decompress(raw)
+            return json.loads(raw)
+        except CheckpointIntegrityError:
+            raise
+        except (OSError, EOFError, ValueError) + ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ()) as e:
+            raise CheckpointIntegrityError(checkpoint_name, path, f"Checkpoint is truncated or unreadable ({e}).") from e
+
+    def _files(self, iteration_num=None):
+        if not self.directory.exists():
+            return []
+        stem = "*" if iteration_num is None else f"*_{iteration_num:03d}"
+        return [path for suffix in COMPRESSION_SUFFIXES.values()
+                for path in self.directory.glob(f"{stem}{suffix}")]
+
+    @staticmethod
+    def _name(path):
+        for suffix in sorted(COMPRESSION_SUFFIXES.values(), key=len, reverse=True):
+            if path.name.endswith(suffix):
+                return path.name[:-len(suffix)]
+        return path.stem
+
+    def names(self, iteration_num=None):
+        return sorted({self._name(path) for path in self._files(iteration_num)})
+
+    def delete(self, iteration_num=None):
+        files = self._files(iteration_num)
+        for path in files:
+            path.unlink()
+        return len(files)
+
+    def timestamps(self, checkpoint_names):
+        """Map each existing checkpoint in checkpoint_names to its timestamp (None if unreadable)."""
+        result = {}
+        for name in checkpoint_names:
+            try:
+                record = self.read(name)
+            except CheckpointIntegrityError:
+                result[name] = None
+                continue
+            if record is not None:
+                result[name] = record.get('timestamp')
+        return result
+
+
+class SQLiteCheckpointStore:
+    """All checkpoints in one SQLite database (WAL mode)."""
+
+    backend = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            name TEXT PRIMARY KEY,
+            checkpoint_type TEXT NOT NULL,
+            iteration INTEGER,
+            timestamp TEXT,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_checkpoints_iteration_type
+            ON checkpoints (iteration, checkpoint_type);
+    """
+
+    def __init__(self, db_path=DEFAULT_CHECKPOINT_DIR / SQLITE_FILENAME):
+        self.db_path = Path(db_path)
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def location(self, checkpoint_name):
+        return self.db_path
+
+    def write(self, checkpoint_name, record):
+        self.write_many([(checkpoint_name, record)])
+        return self.db_path
+
+    def write_many(self, items):
+        """Insert or replace (name, record) pairs in one transaction."""
+        rows = []
+        for checkpoint_name, record in items:
+            checkpoint_type, iteration = parse_checkpoint_name(checkpoint_name)
+            rows.append((checkpoint_name, checkpoint_type, iteration, record.get('timestamp'),
+                         json.dumps(record, separators=(',', ':'))))
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO checkpoints (name, checkpoint_type, iteration, timestamp, record) "
+                "VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def read(self, checkpoint_name):
+        row = self._connect().execute(
+            "SELECT record FROM checkpoints WHERE name = ?", (checkpoint_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError as e:
+            raise CheckpointIntegrityError(checkpoint_name, self.db_path, f"Checkpoint record is not valid JSON ({e}).") from e
+
+    def names(self, iteration_num=None):
+        conn = self._connect()
+        if iteration_num is None:
+            rows = conn.execute("SELECT name FROM checkpoints ORDER BY name")
+        else:
+            rows = conn.execute("SELECT name FROM checkpoints WHERE iteration = ? ORDER BY name", (iteration_num,))
+        return [row[0] for row in rows]
+
+    def delete(self, iteration_num=None):
+        conn = self._connect()
+        with conn:
+            if iteration_num is None:
+                cursor = conn.execute("DELETE FROM checkpoints")
+            else:
+                cursor = conn.execute("DELETE FROM checkpoints WHERE iteration = ?", (iteration_num,))
+        return cursor.rowcount
+
+    def timestamps(self, checkpoint_names):
+        """Map each existing checkpoint in checkpoint_names to its timestamp (one query)."""
+        checkpoint_names = list(checkpoint_names)
+        if not checkpoint_names:
+            return {}
+        placeholders = ",".join("?" * len(checkpoint_names))
+        return dict(self._connect().execute(
+            f"SELECT name, timestamp FROM checkpoints WHERE name IN ({placeholders})", checkpoint_names
+        ).fetchall())
+
+
+def open_checkpoint_store(backend=None, directory=None, compression=None):
+    """
+    Open a checkpoint store.
+
+    Args:
+        backend: 'json' or 'sqlite' (default: CHECKPOINT_BACKEND env var, else 'json')
+        directory: Checkpoint directory (default: CHECKPOINT_DIR env var, else
+            work/verification/checkpoints)
+        compression: JSON store compression, 'gzip' or 'zstd' (default:
+            CHECKPOINT_COMPRESSION env var, else uncompressed)
+
+    Returns:
+        JSONCheckpointStore or SQLiteCheckpointStore
+    """
+    backend = (backend or os.environ.get('CHECKPOINT_BACKEND', 'json')).lower()
+    directory = Path(directory) if directory else DEFAULT_CHECKPOINT_DIR
+    compression = compression or os.environ.get('CHECKPOINT_COMPRESSION', '').lower() or None
+    if compression == 'none':
+        compression = None
+    if backend == 'json':
+        return JSONCheckpointStore(directory, compression)
+    if backend == 'sqlite':
+        return SQLiteCheckpointStore(directory / SQLITE_FILENAME)
+    raise ValueError(f"Unknown checkpoint backend '{backend}' (expected one of {BACKENDS})")
+
+
+def import_json_checkpoints(source_dir=DEFAULT_CHECKPOINT_DIR, store=None):
+    """
+    Copy every JSON checkpoint file in source_dir into a store.
+
+    Existing records with the same name are replaced; the JSON files are left
+    in place. Files that are unreadable or fail their digest are skipped.
+
+    Args:
+        source_dir: Directory of JSON checkpoint files
+        store: Destination store (default: SQLite store in source_dir)
+
+    Returns:
+        tuple: (imported count, list of (file, error) for unreadable files)
+    """
+    source = JSONCheckpointStore(source_dir)
+    store = store or SQLiteCheckpointStore(Path(source_dir) / SQLITE_FILENAME)
+
+    items, errors = [], []
+    for name in source.names():
+        try:
+            items.append((name, verify_record(name, source.read(name), source.location(name))))
+        except CheckpointIntegrityError as e:
+            errors.append((str(source.location(name)), e.reason))
+
+    if hasattr(store, 'write_many'):
+        count = store.write_many(items)
+    else:
+        for name, record in items:
+            store.write(name, record)
+        count = len(items)
+    return count, errors
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Manage verification checkpoint stores")
+    parser.add_argument("--dir", default=None, help="Checkpoint directory (default: work/verification/checkpoints)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("import", help="Import JSON checkpoint files into the SQLite store")
+
+    status = sub.add_parser("status", help="Show checkpoints for an iteration")
+    status.add_argument("iteration", type=int)
+    status.add_argument("--backend", choices=BACKENDS, default=None)
+
+    listing = sub.add_parser("list", help="List checkpoint names")
+    listing.add_argument("--iteration", type=int, default=None)
+    listing.add_argument("--backend", choices=BACKENDS, default=None)
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    directory = Path(args.dir) if args.dir else DEFAULT_CHECKPOINT_DIR
+
+    if args.command == "import":
+        store = SQLiteCheckpointStore(directory / SQLITE_FILENAME)
+        count, errors = import_json_checkpoints(directory, store)
+        print(f"✓ Imported {count} checkpoint(s) into {store.db_path}")
+        for path, error in errors:
+            print(f"  ⚠️  Skipped {path}: {error}")
+        store.close()
+        return 1 if errors else 0
+
+    store = open_checkpoint_store(args.backend, directory)
+    if args.command == "list":
+        for name in store.names(args.iteration):
+            print(name)
+        return 0
+
+    names = store.names(args.iteration)
+    for name, timestamp in store.timestamps(names).items():
+        print(f"  ✓ {name} ({timestamp})")
+    if not names:
+        print(f"  No checkpoints for iteration {args.iteration}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,8 +10,14 @@ to export without completing verification.
 Usage:
     from export_with_verification import export_glb_phase_1a
 
-    # This will FAIL if any verification checkpoint is missing
+    # This will FAIL if any verification checkpoint is missing, or if the
+    # scene changed since the checkpoints were created
     glb_file = export_glb_phase_1a(iteration_num=5)
+
+    # Re-verify only the objects that changed instead of blocking, and re-run
+    # the automated (spec target) verification
+    glb_file = export_glb_phase_1a(5, reverify=lambda names: verify_all_objects(
+        [s for s in specs if s['object'].name in names]), reautomate=run_automated_verification)  # see build_template_phase_1a.py
 """
 
 import bpy
@@ -24,10 +30,20 @@ scripts_dir = Path(__file__).parent
 if str(scripts_dir) not in sys.path:
     sys.path.append(str(scripts_dir))
 
-from verification_checkpoints import require_all_checkpoints, get_checkpoint_status
+from verification_checkpoints import (
+    require_all_checkpoints,
+    refresh_checkpoints,
+    get_checkpoint_status,
+    dimension_checkpoints,
+    CheckpointIntegrityError,
+    StaleCheckpointError
+)
+from scene_fingerprint import scene_fingerprint
+from build_profiler import profiled
 
 
-def export_glb_phase_1a(iteration_num):
+@profiled()
+def export_glb_phase_1a(iteration_num, reverify=None, output_dir=None, reautomate=None):
     """
     Export GLB with mandatory verification gates.
 
@@ -36,19 +52,37 @@ def export_glb_phase_1a(iteration_num):
     is missing, making it impossible to skip verification.
 
     GATES:
-    1. Verification checkpoints (inline, batch, automated)
+    1. Verification checkpoints (inline, batch, automated), bound to the
+       current scene fingerprint
     2. Required objects present in scene
     3. GLB export
 
     Args:
         iteration_num (int): Iteration number (e.g., 5)
+        reverify (callable, optional): Called with the names of objects that
+            changed since verification; returns verify_all_objects results for
+            them. Refreshes the dimension checkpoints instead of blocking, as
+            long as every changed object has a dimension spec.
+        output_dir (str, optional): Export directory (default: exports/glb)
+        reautomate (callable, optional): Re-runs the automated verification
+            (verify_phase_1a), re-creating its checkpoint for the current
+            scene if it passes. Required alongside reverify, since spec targets
+            (overall size, opening positions) can change without any object
+            changing size.
 
     Returns:
         str: Path to exported GLB file
 
     Raises:
         FileNotFoundError: If any verification checkpoint is missing
-        ValueError: If required objects are missing from scene
+        CheckpointIntegrityError: If a checkpoint is truncated or fails its digest
+        StaleCheckpointError: If the scene changed since verification and the
+            checkpoints could not all be re-created for it (no reverify or
+            reautomate given, objects added or removed, a dimension checkpoint
+            without a recorded fingerprint, or automated verification failed
+            on the changed scene)
+        ValueError: If required objects are missing from scene, or re-verification
+            fails or does not cover every changed object
 
     Example:
         >>> export_glb_phase_1a(5)
@@ -60,6 +94,7 @@ def export_glb_phase_1a(iteration_num):
         ✓ Checkpoint validated: inline_verification_005
         ✓ Checkpoint validated: batch_verification_005
         ✓ Checkpoint validated: automated_verification_005
+        ✓ Checkpoints match the current scene fingerprint
         ✓ All verification checkpoints validated for iteration 5
 
         GATE 2: Checking scene has required objects...
@@ -83,9 +118,40 @@ def export_glb_phase_1a(iteration_num):
     # ========================================================================
     print("\nGATE 1: Checking verification checkpoints...")
 
+    fingerprint = scene_fingerprint()
+
     try:
-        require_all_checkpoints(iteration_num)
-    except FileNotFoundError as e:
+        require_all_checkpoints(iteration_num, fingerprint=fingerprint)
+    except StaleCheckpointError as e:
+        print(f"\n⚠️  {e}")
+        unbound_dimensions = set(e.unbound) & set(dimension_checkpoints(iteration_num))
+        if reverify is None or reautomate is None or e.removed_objects or e.added_objects or unbound_dimensions:
+            print(f"\n❌ EXPORT BLOCKED - checkpoints do not match the current scene")
+            print("Re-run verification (objects added or removed, or checkpoints without a scene "
+                  "fingerprint, always need a full re-run).\n")
+            raise
+
+        if e.changed_objects:
+            print(f"\nRe-verifying {len(e.changed_objects)} changed object(s)...")
+            results = reverify(e.changed_objects)
+            try:
+                refreshed = refresh_checkpoints(iteration_num, results, fingerprint, e.changed_objects)
+            except ValueError:
+                print(f"\n❌ EXPORT BLOCKED - changed objects could not be re-verified")
+                raise
+            print(f"✓ Refreshed {len(refreshed)} dimension checkpoint(s) for the current scene")
+
+        print("\nRe-running automated verification against spec targets...")
+        reautomate()
+
+        # Every checkpoint must now match the scene (automated verification
+        # only re-creates its checkpoint if it passed)
+        try:
+            require_all_checkpoints(iteration_num, fingerprint=fingerprint)
+        except StaleCheckpointError:
+            print(f"\n❌ EXPORT BLOCKED - automated verification did not pass on the changed scene\n")
+            raise
+    except (FileNotFoundError, CheckpointIntegrityError) as e:
         print(f"\n❌ EXPORT BLOCKED")
         print(f"{'='*70}")
         print(str(e))
@@ -95,7 +161,9 @@ def export_glb_phase_1a(iteration_num):
         print("Checkpoint status:")
         status = get_checkpoint_status(iteration_num)
         for checkpoint_name, info in status.items():
-            if info['exists']:
+            if info['exists'] and info['timestamp'] is None:
+                print(f"  ✗ {checkpoint_name} (CORRUPT - re-run this verification)")
+            elif info['exists']:
                 print(f"  ✓ {checkpoint_name} (completed {info['timestamp']})")
             else:
                 print(f"  ✗ {checkpoint_name} (NOT COMPLETED)")
@@ -140,7 +208,7 @@ def export_glb_phase_1a(iteration_num):
     print("\nGATE 3: Exporting GLB...")
 
     # Ensure export directory exists
-    export_dir = Path("exports/glb")
+    export_dir = Path(output_dir or "exports/glb")
     export_dir.mkdir(parents=True, exist_ok=True)
 
     output_file = export_dir / f"building_phase_1a_iter_{iteration_num:03d}.glb"
@@ -0,0 +1,385 @@
+"""
+GLB Geometry Analyzer
+
+Computes geometry metrics for exported GLB files without Blender.
+Decodes glTF accessors (via glb_reader) into NumPy arrays and reports:
+    - vertex / triangle / edge counts (vertices welded by position)
+    - non-manifold edges (shared by more than 2 triangles)
+    - boundary edges (used by exactly 1 triangle)
+    - degenerate triangles (repeated vertex or zero area)
+    - per-node world-space AABBs (Blender Z-up coordinates)
+    - optionally, intersecting faces (see glb_intersections)
+
+Edges are found by sorted edge-key counting, per mesh node (the same scope
+Blender's "Select Non-Manifold" uses), so two separate objects touching each
+other are not reported as non-manifold.
+
+The output uses the metrics JSON keys from docs/CONTRACT.md, so it can be fed
+straight into validate_geometry.GeometryValidator.
+
+Usage:
+    python scripts/glb_analyzer.py exports/glb/building_phase_1a_iter_049.glb
+    python scripts/glb_analyzer.py --dir exports/glb
+    python scripts/glb_analyzer.py --dir exports/glb --out work/metrics/glb_analysis.json
+    python scripts/glb_analyzer.py model.glb --nodes    # per-node breakdown
+    python scripts/glb_analyzer.py model.glb --intersections
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from glb_reader import GLBReader, read_accessor
+
+
+MODE_TRIANGLES = 4
+MODE_TRIANGLE_STRIP = 5
+MODE_TRIANGLE_FAN = 6
+
+# Positions closer than this (meters) are welded into one vertex
+WELD_TOLERANCE = 1e-5
+
+# Triangles with area below this (square meters) are degenerate
+DEGENERATE_AREA = 1e-12
+
+# glTF is Y-up; Blender (and the spec) is Z-up: (x, y, z)_gltf -> (x, -z, y)_blender
+GLTF_TO_BLENDER = np.array([
+    [1, 0, 0, 0],
+    [0, 0, -1, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+], dtype=np.float64)
+
+
+def node_local_matrix(node):
+    """
+    Get a node's local transform as a 4x4 matrix.
+
+    Args:
+        node: glTF node dict (matrix or translation/rotation/scale)
+
+    Returns:
+        np.ndarray: 4x4 float64 matrix
+    """
+    if 'matrix' in node:
+        # glTF matrices are column-major
+        return np.array(node['matrix'], dtype=np.float64).reshape(4, 4).T
+
+    tx, ty, tz = node.get('translation', (0.0, 0.0, 0.0))
+    qx, qy, qz, qw = node.get('rotation', (0.0, 0.0, 0.0, 1.0))
+    sx, sy, sz = node.get('scale', (1.0, 1.0, 1.0))
+
+    rotation = np.array([
+        [1 - 2*(qy*qy + qz*qz), 2*(qx*qy - qz*qw), 2*(qx*qz + qy*qw)],
+        [2*(qx*qy + qz*qw), 1 - 2*(qx*qx + qz*qz), 2*(qy*qz - qx*qw)],
+        [2*(qx*qz - qy*qw), 2*(qy*qz + qx*qw), 1 - 2*(qx*qx + qy*qy)],
+    ], dtype=np.float64)
+
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.array([sx, sy, sz])
+    matrix[:3, 3] = (tx, ty, tz)
+    return matrix
+
+
+def iter_mesh_nodes(gltf):
+    """
+    Yield (node_index, node, world_matrix) for every node with a mesh.
+
+    World matrices are in Blender Z-up coordinates. Nodes in the default scene
+    are walked from the roots; if the file has no scenes, every root node is used.
+    """
+    nodes = gltf.get('nodes', [])
+    scenes = gltf.get('scenes', [])
+
+    if scenes:
+        roots = scenes[gltf.get('scene', 0)].get('nodes', [])
+    else:
+        children = {child for node in nodes for child in node.get('children', [])}
+        roots = [i for i in range(len(nodes)) if i not in children]
+
+    stack = [(index, GLTF_TO_BLENDER) for index in reversed(roots)]
+    while stack:
+        index, parent_matrix = stack.pop()
+        node = nodes[index]
+        world = parent_matrix @ node_local_matrix(node)
+        if 'mesh' in node:
+            yield index, node, world
+        for child in reversed(node.get('children', [])):
+            stack.append((child, world))
+
+
+def primitive_triangles(gltf, binary, primitive):
+    """
+    Get (positions, triangles) for one mesh primitive.
+
+    Returns:
+        tuple: (positions (N,3) float64, triangles (M,3) int64), or None for
+        non-triangle primitives (points, lines)
+    """
+    mode = primitive.get('mode', MODE_TRIANGLES)
+    if mode not in (MODE_TRIANGLES, MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN):
+        return None
+
+    positions = read_accessor(gltf, binary, primitive['attributes']['POSITION']).astype(np.float64)
+    if 'indices' in primitive:
+        indices = read_accessor(gltf, binary, primitive['indices']).astype(np.int64)
+    else:
+        indices = np.arange(len(positions), dtype=np.int64)
+
+    if mode == MODE_TRIANGLES:
+        triangles = indices[:len(indices) - len(indices) % 3].reshape(-1, 3)
+    elif mode == MODE_TRIANGLE_STRIP:
+        n = max(len(indices) - 2, 0)
+        triangles = np.stack([indices[:n], indices[1:n + 1], indices[2:n + 2]], axis=1)
+        # Every other strip triangle is wound the other way
+        triangles[1::2, [0, 1]] = triangles[1::2, [1, 0]]
+    else:
+        n = max(len(indices) - 2, 0)
+        triangles = np.stack([np.full(n, indices[0] if n else 0), indices[1:n + 1], indices[2:n + 2]], axis=1)
+
+    return positions, triangles
+
+
+def analyze_triangles(positions, triangles, weld_tolerance=WELD_TOLERANCE):
+    """
+    Compute topology metrics for one triangle mesh.
+
+    Args:
+        positions: (N, 3) vertex positions
+        triangles: (M, 3) vertex indices
+        weld_tolerance: Distance under which vertices are merged
+
+    Returns:
+        dict: vertex_count, face_count, edge_count, non_manifold_edges,
+        boundary_edges, degenerate_triangles
+
+    Example:
+        >>> analyze_triangles(cube_positions, cube_triangles)['non_manifold_edges']
+        0
+    """
+    if len(positions) == 0 or len(triangles) == 0:
+        return {
+            'vertex_count': int(len(positions)),
+            'face_count': 0,
+            'edge_count': 0,
+            'non_manifold_edges': 0,
+            'boundary_edges': 0,
+            'degenerate_triangles': 0,
+        }
+
+    # Weld: glTF splits vertices at normal/UV seams, so merge by position
+    keys = np.round(positions / weld_tolerance).astype(np.int64)
+    _, weld = np.unique(keys, axis=0, return_inverse=True)
+    weld = weld.ravel()
+    welded = weld[triangles]
+
+    # Degenerate: collapsed after welding, or zero area
+    collapsed = (
+        (welded[:, 0] == welded[:, 1]) |
+        (welded[:, 1] == welded[:, 2]) |
+        (welded[:, 0] == welded[:, 2])
+    )
+    corners = positions[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    tiny = 0.5 * np.linalg.norm(cross, axis=1) < DEGENERATE_AREA
+    degenerate = collapsed | tiny
+
+    # Edge keys: sorted vertex pairs of every valid triangle, counted
+    valid = welded[~collapsed]
+    edges = np.concatenate([valid[:, [0, 1]], valid[:, [1, 2]], valid[:, [2, 0]]])
+    edges.sort(axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+
+    return {
+        'vertex_count': int(weld.max() + 1),
+        'face_count': int(len(triangles)),
+        'edge_count': int(len(counts)),
+        'non_manifold_edges': int(np.count_nonzero(counts > 2)),
+        'boundary_edges': int(np.count_nonzero(counts == 1)),
+        'degenerate_triangles': int(np.count_nonzero(degenerate)),
+    }
+
+
+def analyze_gltf(gltf, binary, weld_tolerance=WELD_TOLERANCE, intersections=False):
+    """
+    Compute metrics for a decoded glTF document.
+
+    Args:
+        gltf: glTF JSON document
+        binary: GLB BIN chunk
+        weld_tolerance: Distance under which vertices are merged
+        intersections: Also find intersecting triangles ('intersecting_faces',
+            plus the offending node pairs under 'intersections')
+
+    Returns:
+        dict: Metrics (docs/CONTRACT.md keys plus boundary_edges,
+        degenerate_triangles, node_count and a per-node 'nodes' breakdown)
+    """
+    totals = {
+        'vertex_count': 0,
+        'face_count': 0,
+        'edge_count': 0,
+        'non_manifold_edges': 0,
+        'boundary_edges': 0,
+        'degenerate_triangles': 0,
+    }
+    nodes = {}
+    warnings = []
+
+    for index, node, world in iter_mesh_nodes(gltf):
+        name = node.get('name', f"node_{index}")
+        mesh = gltf['meshes'][node['mesh']]
+
+        # All primitives of a node share its vertices for topology purposes
+        positions = []
+        triangles = []
+        offset = 0
+        for primitive in mesh.get('primitives', []):
+            result = primitive_triangles(gltf, binary, primitive)
+            if result is None:
+                warnings.append(f"{name}: skipped non-triangle primitive (mode {primitive.get('mode')})")
+                continue
+            prim_positions, prim_triangles = result
+            positions.append(prim_positions)
+            triangles.append(prim_triangles + offset)
+            offset += len(prim_positions)
+
+        if not positions:
+            continue
+
+        positions = np.concatenate(positions)
+        triangles = np.concatenate(triangles)
+        world_positions = positions @ world[:3, :3].T + world[:3, 3]
+
+        node_metrics = analyze_triangles(world_positions, triangles, weld_tolerance)
+        if len(world_positions):
+            node_metrics['aabb_min'] = world_positions.min(axis=0).round(6).tolist()
+            node_metrics['aabb_max'] = world_positions.max(axis=0).round(6).tolist()
+        nodes[name] = node_metrics
+
+        for key in totals:
+            totals[key] += node_metrics[key]
+
+    metrics = {'status': 'success', **totals, 'node_count': len(nodes)}
+    if nodes:
+        metrics['aabb_min'] = np.min([n['aabb_min'] for n in nodes.values() if 'aabb_min' in n], axis=0).tolist()
+        metrics['aabb_max'] = np.max([n['aabb_max'] for n in nodes.values() if 'aabb_max' in n], axis=0).tolist()
+    if intersections:
+        from glb_intersections import find_gltf_intersections
+
+        report = find_gltf_intersections(gltf, binary)
+        metrics['intersecting_faces'] = report['intersecting_faces']
+        metrics['intersections'] = {key: report[key] for key in ('intersecting_pairs', 'between_nodes', 'within_nodes')}
+    metrics['nodes'] = nodes
+    metrics['warnings'] = warnings
+    return metrics
+
+
+def analyze_glb(glb_path, weld_tolerance=WELD_TOLERANCE, intersections=False):
+    """
+    Compute metrics for a GLB file.
+
+    Args:
+        glb_path: Path to .glb file
+        weld_tolerance: Distance under which vertices are merged
+        intersections: Also find intersecting triangles (see analyze_gltf)
+
+    Returns:
+        dict: Metrics dictionary (see analyze_gltf), with 'source' set to the file path
+
+    Example:
+        >>> metrics = analyze_glb("exports/glb/building_phase_1a_iter_049.glb")
+        >>> metrics['non_manifold_edges']
+        0
+    """
+    with GLBReader(glb_path) as glb:
+        metrics = analyze_gltf(glb.json, glb.binary, weld_tolerance, intersections)
+    metrics['source'] = str(glb_path)
+    return metrics
+
+
+def print_summary(results):
+    """Print a one-line-per-file summary table."""
+    print(f"\n{'File':<44} {'Nodes':>6} {'Verts':>8} {'Tris':>8} {'NonMan':>7} {'Bound':>7} {'Degen':>6}")
+    print("-" * 92)
+    for path, metrics in results:
+        if 'error' in metrics:
+            print(f"{Path(path).name:<44} ❌ {metrics['error']}")
+            continue
+        print(
+            f"{Path(path).name:<44} {metrics['node_count']:>6} {metrics['vertex_count']:>8} "
+            f"{metrics['face_count']:>8} {metrics['non_manifold_edges']:>7} "
+            f"{metrics['boundary_edges']:>7} {metrics['degenerate_triangles']:>6}"
+        )
+
+
+def print_nodes(metrics):
+    """Print per-node metrics for one file."""
+    print(f"\n{metrics['source']}")
+    print(f"{'Node':<44} {'Tris':>6} {'NonMan':>7} {'Bound':>7}  AABB min / max (m)")
+    for name, node in sorted(metrics['nodes'].items()):
+        lo = ", ".join(f"{v:.3f}" for v in node.get('aabb_min', []))
+        hi = ", ".join(f"{v:.3f}" for v in node.get('aabb_max', []))
+        print(f"{name:<44} {node['face_count']:>6} {node['non_manifold_edges']:>7} "
+              f"{node['boundary_edges']:>7}  ({lo}) / ({hi})")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Compute geometry metrics from GLB files (no Blender)")
+    parser.add_argument("glb", nargs="*", help="GLB files to analyze")
+    parser.add_argument("--dir", help="Analyze every .glb in this directory")
+    parser.add_argument("--out", help="Write all metrics to this JSON file")
+    parser.add_argument("--nodes", action="store_true", help="Print per-node breakdown")
+    parser.add_argument("--intersections", action="store_true", help="Also count intersecting faces")
+    parser.add_argument("--weld-tolerance", type=float, default=WELD_TOLERANCE,
+                        help=f"Vertex weld distance in meters (default {WELD_TOLERANCE})")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    paths = [Path(p) for p in args.glb]
+    if args.dir:
+        paths.extend(sorted(Path(args.dir).glob("*.glb")))
+    if not paths:
+        paths = sorted((Path(__file__).parent.parent / 'exports' / 'glb').glob("*.glb"))
+    if not paths:
+        print("ERROR: No GLB files to analyze")
+        return 1
+
+    start = time.perf_counter()
+    results = []
+    for path in paths:
+        try:
+            results.append((path, analyze_glb(path, args.weld_tolerance, args.intersections)))
+        except (OSError, ValueError, KeyError) as e:
+            results.append((path, {'error': str(e)}))
+    elapsed = time.perf_counter() - start
+
+    print_summary(results)
+    if args.nodes:
+        for _, metrics in results:
+            if 'nodes' in metrics:
+                print_nodes(metrics)
+
+    print(f"\nAnalyzed {len(results)} file(s) in {elapsed:.2f}s")
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump({str(path): metrics for path, metrics in results}, f, indent=2)
+        print(f"Wrote metrics to {out_path}")
+
+    return 1 if any('error' in metrics for _, metrics in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""
+GLB Intersection Checker
+Triangle-triangle intersections in exported GLB files, without Blender
+
+Collects every triangle of every mesh node in world space (Blender Z-up),
+finds candidate pairs with a uniform grid over the triangle bounding boxes
+(sort-based, so roughly O(n log n) plus the number of overlapping boxes
+instead of all n^2 pairs), and runs an exact, vectorized triangle-triangle
+test (Moller's interval test) on the candidates.
+
+Only penetrating triangles count. Triangles that merely touch - neighbours
+sharing an edge or vertex, a box resting flush on another, trim laid flat on
+a wall face, coplanar overlap - are within the tolerance and not reported.
+
+Pairs are reported between distinct nodes (trim sunk into brick, alcove walls
+through Wall_Front) and within one node (overlapping pieces of a batched
+mesh). The number of triangles involved is the metrics JSON
+'intersecting_faces' value that validate_geometry checks.
+
+Usage:
+    from glb_intersections import check_glb_intersections
+
+    python scripts/glb_intersections.py exports/glb/building_phase_1a_iter_049.glb
+    python scripts/glb_intersections.py model.glb --out work/metrics/intersections.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from glb_analyzer import iter_mesh_nodes, primitive_triangles, DEGENERATE_AREA
+from glb_reader import GLBReader
+
+
+# Distances (meters) within which triangles touch rather than intersect
+INTERSECTION_TOLERANCE = 1e-5
+
+# Grid cells are coarsened until triangles occupy at most this many cells on average
+MAX_CELLS_PER_TRIANGLE = 16
+
+# Candidate pairs tested per vectorized batch (bounds temporary memory)
+PAIR_CHUNK = 200_000
+
+
+def gltf_triangles(gltf, binary):
+    """
+    Collect the world-space triangles of every mesh node.
+
+    Degenerate (zero-area) triangles are dropped; they cannot intersect anything.
+
+    Returns:
+        tuple: (corners (T,3,3) float64, node ids (T,) int64, node names list)
+    """
+    corners, node_ids, names = [], [], []
+
+    for index, node, world in iter_mesh_nodes(gltf):
+        node_id = len(names)
+        names.append(node.get('name', f"node_{index}"))
+        for primitive in gltf['meshes'][node['mesh']].get('primitives', []):
+            result = primitive_triangles(gltf, binary, primitive)
+            if result is None:
+                continue
+            positions, triangles = result
+            world_positions = positions @ world[:3, :3].T + world[:3, 3]
+            tris = world_positions[triangles]
+            area = 0.5 * np.linalg.norm(np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0]), axis=1)
+            tris = tris[area >= DEGENERATE_AREA]
+            corners.append(tris)
+            node_ids.append(np.full(len(tris), node_id, dtype=np.int64))
+
+    if not corners:
+        return np.empty((0, 3, 3)), np.empty(0, dtype=np.int64), names
+    return np.concatenate(corners), np.concatenate(node_ids), names
+
+
+def grid_candidate_pairs(lo, hi, tolerance=INTERSECTION_TOLERANCE):
+    """
+    Find pairs of boxes that overlap, using a uniform grid.
+
+    Every box is entered into the cells it covers. Sorting the entries by cell
+    groups the boxes sharing a cell, and pairs are generated only within a
+    group. Two overlapping boxes share every cell of their overlap, so a pair
+    is kept only in the cell holding the component-wise max of the two lo
+    corners (always inside the overlap); each pair then comes out once
+    without deduplication. The cell size starts at the median box extent
+    (a few large triangles such as floor and walls do not coarsen it) and
+    doubles until boxes cover at most MAX_CELLS_PER_TRIANGLE cells on
+    average, so those large triangles cannot blow up the entry count either.
+
+    Args:
+        lo: (T, 3) box minimum corners
+        hi: (T, 3) box maximum corners
+        tolerance: Boxes closer than this count as overlapping
+
+    Returns:
+        tuple: (first, second) index arrays with first < second; each pair once
+    """
+    count = len(lo)
+    if count < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    lo = lo - tolerance
+    hi = hi + tolerance
+    origin = lo.min(axis=0)
+    cell = max(float(np.median((hi - lo).max(axis=1))), tolerance)
+    while True:
+        cell_lo = np.floor((lo - origin) / cell).astype(np.int64)
+        cell_hi = np.floor((hi - origin) / cell).astype(np.int64)
+        span = cell_hi - cell_lo + 1
+        cells_per_box = span.prod(axis=1)
+        if cells_per_box.sum() <= MAX_CELLS_PER_TRIANGLE * count:
+            break
+        cell *= 2
+
+    # One entry per (box, covered cell)
+    box = np.repeat(np.arange(count), cells_per_box)
+    offset = np.arange(len(box)) - np.repeat(np.cumsum(cells_per_box) - cells_per_box, cells_per_box)
+    sx, sy = span[box, 0], span[box, 1]
+    ix = cell_lo[box, 0] + offset % sx
+    iy = cell_lo[box, 1] + (offset // sx) % sy
+    iz = cell_lo[box, 2] + offset // (sx * sy)
+    dims = cell_hi.max(axis=0) + 1
+    key = (ix * dims[1] + iy) * dims[2] + iz
+
+    order = np.lexsort((box, key))
+    key, box = key[order], box[order]
+
+    # Pair each entry with the entries after it in the same cell
+    position = np.arange(len(key))
+    new_group = np.r_[True, key[1:] != key[:-1]]
+    group_end = np.r_[np.flatnonzero(new_group)[1:], len(key)]
+    end = group_end[np.cumsum(new_group) - 1]
+    partners = end - position - 1
+    first = np.repeat(box, partners)
+    step = np.arange(len(first)) - np.repeat(np.cumsum(partners) - partners, partners)
+    shared = np.repeat(position, partners)
+    second = box[shared + 1 + step]
+
+    overlap = np.all((lo[first] <= hi[second]) & (lo[second] <= hi[first]), axis=1)
+    first, second, shared = first[overlap], second[overlap], shared[overlap]
+
+    # The same pair shows up once per shared cell; keep only its canonical cell
+    cx, cy, cz = np.maximum(cell_lo[first], cell_lo[second]).T
+    canonical = (cx * dims[1] + cy) * dims[2] + cz
+    keep = key[shared] == canonical
+    return first[keep], second[keep]
+
+
+def _line_interval(projected, distance):
+    """
+    Interval a triangle covers on the planes' intersection line.
+
+    Args:
+        projected: (K, 3) vertex positions projected onto the line
+        distance: (K, 3) signed vertex distances to the other triangle's plane
+            (zero within tolerance)
+
+    Returns:
+        tuple: (start, end) arrays (inf/-inf where the triangle misses the line)
+    """
+    values = np.where(distance == 0, projected, np.nan)
+    crossings = []
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        d_i, d_j = distance[:, i], distance[:, j]
+        crosses = d_i * d_j < 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = projected[:, i] + (projected[:, j] - projected[:, i]) * d_i / (d_i - d_j)
+        crossings.append(np.where(crosses, t, np.nan))
+    values = np.column_stack([values] + crossings)
+    valid = ~np.isnan(values)
+    start = np.where(valid, values, np.inf).min(axis=1)
+    end = np.where(valid, values, -np.inf).max(axis=1)
+    return start, end
+
+
+def triangles_intersect(a, b, tolerance=INTERSECTION_TOLERANCE):
+    """
+    Exact test for K triangle pairs at once (Moller's interval test).
+
+    Args:
+        a: (K, 3, 3) first triangles
+        b: (K, 3, 3) second triangles
+        tolerance: Distances within this are contact, not intersection
+
+    Returns:
+        np.ndarray: (K,) bool, True where the triangles penetrate each other
+    """
+    normal_a = np.cross(a[:, 1] - a[:, 0], a[:, 2] - a[:, 0])
+    normal_b = np.cross(b[:, 1] - b[:, 0], b[:, 2] - b[:, 0])
+    normal_a /= np.linalg.norm(normal_a, axis=1)[:, None]
+    normal_b /= np.linalg.norm(normal_b, axis=1)[:, None]
+
+    # Signed distances of each triangle's vertices to the other's plane
+    dist_b = np.einsum('kij,kj->ki', b - a[:, None, 0], normal_a)
+    dist_a = np.einsum('kij,kj->ki', a - b[:, None, 0], normal_b)
+    dist_a[np.abs(dist_a) <= tolerance] = 0.0
+    dist_b[np.abs(dist_b) <= tolerance] = 0.0
+
+    # Both triangles must have vertices strictly on both sides of the other's plane
+    straddles = ((dist_a.max(axis=1) > 0) & (dist_a.min(axis=1) < 0) &
+                 (dist_b.max(axis=1) > 0) & (dist_b.min(axis=1) < 0))
+
+    line = np.cross(normal_a, normal_b)
+    line_length = np.linalg.norm(line, axis=1)
+    straddles &= line_length > 1e-12
+    line /= np.where(line_length > 0, line_length, 1.0)[:, None]
+
+    start_a, end_a = _line_interval(np.einsum('kij,kj->ki', a, line), dist_a)
+    start_b, end_b = _line_interval(np.einsum('kij,kj->ki', b, line), dist_b)
+    with np.errstate(invalid='ignore'):
+        overlap = np.minimum(end_a, end_b) - np.maximum(start_a, start_b)
+    return straddles & (overlap > tolerance)
+
+
+def find_intersections(corners, node_ids, names, tolerance=INTERSECTION_TOLERANCE):
+    """
+    Find intersecting triangle pairs.
+
+    Args:
+        corners: (T, 3, 3) world-space triangles
+        node_ids: (T,) node index of each triangle
+        names: Node names (indexed by node_ids)
+        tolerance: Distances within this are contact, not intersection
+
+    Returns:
+        dict: 'triangles', 'candidate_pairs', 'intersecting_pairs',
+            'intersecting_faces' (triangles involved in any pair),
+            'between_nodes' ({"A | B": pairs}) and 'within_nodes' ({node: pairs}),
+            both sorted by pair count
+    """
+    first, second = grid_candidate_pairs(corners.min(axis=1), corners.max(axis=1), tolerance)
+
+    hits = []
+    for start in range(0, len(first), PAIR_CHUNK):
+        i, j = first[start:start + PAIR_CHUNK], second[start:start + PAIR_CHUNK]
+        mask = triangles_intersect(corners[i], corners[j], tolerance)
+        hits.append((i[mask], j[mask]))
+    hit_first = np.concatenate([h[0] for h in hits]) if hits else np.empty(0, dtype=np.int64)
+    hit_second = np.concatenate([h[1] for h in hits]) if hits else np.empty(0, dtype=np.int64)
+
+    between, within = Counter(), Counter()
+    for node_a, node_b in zip(node_ids[hit_first].tolist(), node_ids[hit_second].tolist()):
+        if node_a == node_b:
+            within[names[node_a]] += 1
+        else:
+            between[" | ".join(sorted((names[node_a], names[node_b])))] += 1
+
+    return {
+        'triangles': int(len(corners)),
+        'candidate_pairs': int(len(first)),
+        'intersecting_pairs': int(len(hit_first)),
+        'intersecting_faces': int(len(np.union1d(hit_first, hit_second))),
+        'between_nodes': dict(between.most_common()),
+        'within_nodes': dict(within.most_common()),
+    }
+
+
+def find_gltf_intersections(gltf, binary, tolerance=INTERSECTION_TOLERANCE):
+    """Find intersecting triangles in a decoded glTF document (see find_intersections)."""
+    corners, node_ids, names = gltf_triangles(gltf, binary)
+    return find_intersections(corners, node_ids, names, tolerance)
+
+
+def check_glb_intersections(glb_path, tolerance=INTERSECTION_TOLERANCE):
+    """
+    Find intersecting triangles in a GLB file.
+
+    Returns:
+        dict: Report (see find_intersections) with 'source' and 'elapsed_s'
+
+    Example:
+        >>> report = check_glb_intersections("exports/glb/building_phase_1a_iter_049.glb")
+        >>> report['between_nodes']
+        {'Alcove_Wall_Left | Wall_Front': 12}
+    """
+    start = time.perf_counter()
+    with GLBReader(glb_path) as glb:
+        report = find_gltf_intersections(glb.json, glb.binary, tolerance)
+    report['source'] = str(glb_path)
+    report['elapsed_s'] = time.perf_counter() - start
+    return report
+
+
+def print_report(report, limit=20):
+    """Print one file's intersections, worst node pairs first."""
+    status = "✓" if report['intersecting_pairs'] == 0 else "❌"
+    print(f"\n{status} {report['source']}: {report['intersecting_pairs']} intersecting pairs, "
+          f"{report['intersecting_faces']} faces ({report['triangles']} triangles, "
+          f"{report['candidate_pairs']} candidates, {report['elapsed_s']:.2f}s)")
+    for label, pairs in (('Between nodes', report['between_nodes']), ('Within node', report['within_nodes'])):
+        if not pairs:
+            continue
+        print(f"  {label}:")
+        for name, count in list(pairs.items())[:limit]:
+            print(f"    {count:>6}  {name}")
+        if len(pairs) > limit:
+            print(f"    ... {len(pairs) - limit} more")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Find intersecting triangles in GLB files (no Blender)")
+    parser.add_argument("glb", nargs="+", help="GLB files to check")
+    parser.add_argument("--tolerance", type=float, default=INTERSECTION_TOLERANCE,
+                        help=f"Contact distance in meters (default {INTERSECTION_TOLERANCE})")
+    parser.add_argument("--out", help="Write all reports to this JSON file")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    reports = []
+    for path in args.glb:
+        try:
+            report = check_glb_intersections(path, args.tolerance)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"\n❌ {path}: {e}")
+            return 1
+        print_report(report)
+        reports.append(report)
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w') as f:
+            json.dump({report['source']: report for report in reports}, f, indent=2)
+        print(f"\nWrote intersections to {out_path}")
+
+    return 1 if any(report['intersecting_pairs'] for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Lightweight GLB Reader
+
+Memory-maps a GLB file and parses only the JSON chunk up front. The binary
+chunk is exposed as a zero-copy memoryview, and buffer views / accessors are
+turned into NumPy views only when asked for. Listing nodes, meshes or
+animation channels therefore never reads the geometry.
+
+Replaces pygltflib for our offline tools (check_glb_animations, glb_analyzer).
+
+Usage:
+    from glb_reader import GLBReader
+
+    with GLBReader("exports/glb/building_phase_1b_iter_030.glb") as glb:
+        print([node.get('name') for node in glb.nodes])
+        positions = glb.accessor(0)   # NumPy view into the mapped file
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+
+GLB_MAGIC = 0x46546C67  # 'glTF'
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+COMPONENT_DTYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+
+TYPE_SIZES = {
+    'SCALAR': 1,
+    'VEC2': 2,
+    'VEC3': 3,
+    'VEC4': 4,
+    'MAT2': 4,
+    'MAT3': 9,
+    'MAT4': 16,
+}
+
+
+class GLBReader:
+    """Memory-mapped GLB file with lazily decoded binary data."""
+
+    def __init__(self, glb_path):
+        """
+        Open a GLB file and parse its JSON chunk.
+
+        Args:
+            glb_path: Path to .glb file
+
+        Raises:
+            ValueError: If the file is not a valid GLB 2.0 file
+        """
+        self.path = Path(glb_path)
+        self._file = open(self.path, 'rb')
+        self._mmap = None
+        self._binary = None
+
+        try:
+            size = self.path.stat().st_size
+            if size < 12:
+                raise ValueError(f"Not a GLB file (too short): {self.path}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.json, self._bin_range = self._parse_chunks(size)
+        except Exception:
+            self.close()
+            raise
+
+    def _parse_chunks(self, size):
+        """Parse the header and chunk table; decode only the JSON chunk."""
+        magic, version, length = struct.unpack_from('<III', self._mmap, 0)
+        if magic != GLB_MAGIC:
+            raise ValueError(f"Not a GLB file (bad magic): {self.path}")
+        if version != 2:
+            raise ValueError(f"Unsupported GLB version {version}: {self.path}")
+
+        gltf = None
+        bin_range = None
+        offset = 12
+        end = min(length, size)
+        while offset + 8 <= end:
+            chunk_length, chunk_type = struct.unpack_from('<II', self._mmap, offset)
+            start = offset + 8
+            if chunk_type == CHUNK_JSON and gltf is None:
+                gltf = json.loads(self._mmap[start:start + chunk_length])
+            elif chunk_type == CHUNK_BIN and bin_range is None:
+                bin_range = (start, start + chunk_length)
+            offset = start + chunk_length
+
+        if gltf is None:
+            raise ValueError(f"GLB has no JSON chunk: {self.path}")
+
+        return gltf, bin_range
+
+    # ------------------------------------------------------------------
+    # JSON document
+    # ------------------------------------------------------------------
+
+    @property
+    def nodes(self):
+        return self.json.get('nodes', [])
+
+    @property
+    def meshes(self):
+        return self.json.get('meshes', [])
+
+    @property
+    def materials(self):
+        return self.json.get('materials', [])
+
+    @property
+    def animations(self):
+        return self.json.get('animations', [])
+
+    def node_name(self, index):
+        """Get a node's name (or 'node_<index>' if unnamed)."""
+        if index is None:
+            return "Unknown"
+        return self.nodes[index].get('name', f"node_{index}")
+
+    # ------------------------------------------------------------------
+    # Binary data (lazy, zero-copy)
+    # ------------------------------------------------------------------
+
+    @property
+    def binary(self):
+        """Zero-copy memoryview of the BIN chunk (empty if the file has none)."""
+        if self._binary is None:
+            if self._bin_range is None:
+                self._binary = memoryview(b'')
+            else:
+                start, end = self._bin_range
+                self._binary = memoryview(self._mmap)[start:end]
+        return self._binary
+
+    def buffer_view(self, index):
+        """
+        Get a buffer view as a zero-copy memoryview.
+
+        Args:
+            index: Index into bufferViews
+
+        Returns:
+            memoryview: Bytes of the buffer view
+        """
+        view = self.json['bufferViews'][index]
+        start = view.get('byteOffset', 0)
+        return self.binary[start:start + view['byteLength']]
+
+    def accessor(self, index):
+        """
+        Decode an accessor as a NumPy array (a view into the file when tightly packed).
+
+        Args:
+            index: Index into accessors
+
+        Returns:
+            np.ndarray: Shape (count,) for SCALAR, else (count, components)
+        """
+        return read_accessor(self.json, self.binary, index)
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._binary is not None:
+            self._binary.release()
+            self._binary = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # NumPy views still reference the map; it is freed with them
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def read_accessor(gltf, binary, accessor_index):
+    """
+    Decode a glTF accessor into a NumPy array.
+
+    Tightly packed accessors are returned as read-only views into `binary`;
+    interleaved (strided) accessors are copied.
+
+    Args:
+        gltf: glTF JSON document
+        binary: GLB BIN chunk (bytes-like)
+        accessor_index: Index into gltf['accessors']
+
+    Returns:
+        np.ndarray: Shape (count,) for SCALAR, else (count, components)
+
+    Raises:
+        ValueError: For sparse accessors or external buffers (not produced by our exports)
+    """
+    accessor = gltf['accessors'][accessor_index]
+    dtype = np.dtype(COMPONENT_DTYPES[accessor['componentType']]).newbyteorder('<')
+    components = TYPE_SIZES[accessor['type']]
+    count = accessor['count']
+
+    if 'sparse' in accessor:
+        raise ValueError(f"Sparse accessor {accessor_index} is not supported")
+
+    if 'bufferView' not in accessor:
+        # No buffer view: all zeros by spec
+        values = np.zeros(count * components, dtype=dtype)
+    else:
+        view = gltf['bufferViews'][accessor['bufferView']]
+        if view.get('buffer', 0) != 0 or 'uri' in gltf['buffers'][view.get('buffer', 0)]:
+            raise ValueError(f"Accessor {accessor_index} uses an external buffer")
+
+        start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+        element_size = dtype.itemsize * components
+        stride = view.get('byteStride') or element_size
+
+        if stride == element_size:
+            values = np.frombuffer(binary, dtype=dtype, count=count * components, offset=start)
+        else:
+            # Interleaved: view rows with the stride, then keep the element bytes
+            raw = np.frombuffer(binary, dtype=np.uint8)
+            rows = np.lib.stride_tricks.as_strided(
+                raw[start:], shape=(count, element_size), strides=(stride, 1)
+            )
+            values = np.ascontiguousarray(rows).view(dtype).ravel()
+
+    if components == 1:
+        return values
+    return values.reshape(count, components)
@@ -0,0 +1,328 @@
+"""
+Interior Layout Engine
+Spec-driven partition walls, doorway headers, floor and ceiling for Phase 1C
+
+Reads the partition walls in interior_layout.yaml ('wall_segments') as a 2D
+segment graph, splits every segment at its doorway intervals and plans the
+solid wall pieces, a header above each doorway, and the floor and ceiling
+slabs as plain piece_spec dicts. Everything is then built in one pass (by
+default one batched mesh per group), so larger floor plans need no
+per-segment operator calls and no throw-away objects.
+
+Segments run along X (start_x/end_x/y_position) or along Y
+(x_position/start_y/end_y). Doorways come from the top-level 'doorways'
+section (matched by 'wall') and from a segment's own 'doorways' list;
+segments marked already_defined are skipped.
+
+Planning needs no Blender, so plans can be inspected and checked offline.
+
+Usage:
+    from interior_layout import load_interior_spec, plan_interior_layout, build_interior_layout
+
+    plan = plan_interior_layout(load_interior_spec())
+    objects = build_interior_layout(plan)
+
+    python scripts/interior_layout.py    # print the plan for the current spec
+"""
+
+import sys
+from pathlib import Path
+
+from build_profiler import profiled
+from phase_1b_helpers import piece_spec, build_piece_plan
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_SPEC = PROJECT_ROOT / 'work' / 'spec' / 'phase_1c' / 'interior_layout.yaml'
+
+# Material names used by the previous hand-built interior
+WALL_MATERIAL = "Phase1C_Interior_Wall"
+FLOOR_MATERIAL = "Phase1C_Floor"
+CEILING_MATERIAL = "Phase1C_Ceiling"
+
+# Headers shorter than this are not built (doorway reaches the ceiling)
+MIN_HEADER_HEIGHT = 0.01
+
+# Endpoints closer than this are the same graph node
+NODE_TOLERANCE = 1e-6
+
+
+def load_interior_spec(spec_path=DEFAULT_SPEC):
+    """Load the Phase 1C interior layout spec (validated and cached, see spec_loader)."""
+    from spec_loader import load_spec_data
+
+    return load_spec_data(spec_path)
+
+
+def object_name(key, suffix=None):
+    """Object name for a spec key, e.g. 'room_2_door' -> 'Interior_Room_2_Door'."""
+    name = "Interior_" + "_".join(part.capitalize() for part in key.split('_'))
+    return f"{name}_{suffix}" if suffix else name
+
+
+def wall_segments(spec):
+    """
+    Read the partition wall segments as 2D line segments.
+
+    Args:
+        spec (dict): Loaded interior_layout.yaml
+
+    Returns:
+        list: Dicts with 'key', 'axis' ('x' or 'y'), 'start' and 'end' (x, y)
+            with start before end along the axis, 'height' and 'thickness'
+
+    Raises:
+        ValueError: If a segment is neither X-running nor Y-running
+    """
+    defaults = spec.get('partition_walls', {})
+    segments = []
+
+    for key, wall in (spec.get('wall_segments') or {}).items():
+        if wall.get('already_defined', False):
+            continue
+
+        if 'y_position' in wall:
+            axis = 'x'
+            lo, hi = sorted((wall['start_x'], wall['end_x']))
+            start, end = (lo, wall['y_position']), (hi, wall['y_position'])
+        elif 'x_position' in wall:
+            axis = 'y'
+            lo, hi = sorted((wall['start_y'], wall['end_y']))
+            start, end = (wall['x_position'], lo), (wall['x_position'], hi)
+        else:
+            raise ValueError(f"Wall segment '{key}' needs y_position (X-running) or x_position (Y-running)")
+
+        segments.append({
+            'key': key,
+            'axis': axis,
+            'start': start,
+            'end': end,
+            'height': wall.get('height', defaults.get('height')),
+            'thickness': wall.get('thickness', defaults.get('thickness')),
+        })
+
+    return segments
+
+
+def segment_doorways(spec, segment_key, axis):
+    """
+    Get the doorways of one segment, ordered along it.
+
+    Top-level 'doorways' entries win over identical entries in the segment's
+    own 'doorways' list (the spec currently lists them in both places).
+
+    Returns:
+        list: Dicts with 'name', 'center' (along the segment axis), 'width',
+            'height' and 'z_bottom' (None to use the floor)
+    """
+    position_key = 'position_y' if axis == 'y' else 'position_x'
+    doorways = []
+
+    for name, door in (spec.get('doorways') or {}).items():
+        if door.get('wall') == segment_key:
+            doorways.append({
+                'name': name,
+                'center': door[position_key],
+                'width': door['width'],
+                'height': door['height'],
+                'z_bottom': door.get('z_bottom'),
+            })
+
+    inline = spec['wall_segments'][segment_key].get('doorways') or []
+    for i, door in enumerate(inline, start=1):
+        duplicate = any(abs(d['center'] - door[position_key]) < NODE_TOLERANCE and
+                        abs(d['width'] - door['width']) < NODE_TOLERANCE for d in doorways)
+        if not duplicate:
+            doorways.append({
+                'name': f"{segment_key}_door_{i}",
+                'center': door[position_key],
+                'width': door['width'],
+                'height': door['height'],
+                'z_bottom': door.get('z_bottom'),
+            })
+
+    return sorted(doorways, key=lambda d: d['center'])
+
+
+def split_segment(lo, hi, doorways, segment_key=''):
+    """
+    Split a segment [lo, hi] at its doorway intervals.
+
+    Args:
+        lo, hi (float): Segment extent along its axis
+        doorways (list): Output of segment_doorways (sorted by center)
+
+    Returns:
+        list: Solid (start, end) intervals between the doorways
+
+    Raises:
+        ValueError: If a doorway leaves the segment or overlaps another doorway
+    """
+    solid = []
+    cursor = lo
+    for door in doorways:
+        d_lo = door['center'] - door['width'] / 2
+        d_hi = door['center'] + door['width'] / 2
+        if d_lo < lo - NODE_TOLERANCE or d_hi > hi + NODE_TOLERANCE:
+            raise ValueError(f"Doorway '{door['name']}' extends past wall segment '{segment_key}'")
+        if d_lo < cursor - NODE_TOLERANCE:
+            raise ValueError(f"Doorway '{door['name']}' overlaps another doorway in '{segment_key}'")
+        if d_lo - cursor > NODE_TOLERANCE:
+            solid.append((cursor, d_lo))
+        cursor = d_hi
+    if hi - cursor > NODE_TOLERANCE:
+        solid.append((cursor, hi))
+    return solid
+
+
+def segment_graph(segments):
+    """
+    Build the wall graph: segment endpoints are nodes, segments are edges.
+
+    Endpoints lying on another segment (T-junctions) are recorded so the
+    report can show how walls connect.
+
+    Returns:
+        dict: 'nodes' list of (x, y), 'edges' list of (start_node, end_node, key),
+            'degree' list (edges meeting at each node, T-junctions included)
+    """
+    nodes = []
+
+    def node(point):
+        for i, existing in enumerate(nodes):
+            if abs(existing[0] - point[0]) < NODE_TOLERANCE and abs(existing[1] - point[1]) < NODE_TOLERANCE:
+                return i
+        nodes.append(tuple(point))
+        return len(nodes) - 1
+
+    edges = [(node(seg['start']), node(seg['end']), seg['key']) for seg in segments]
+    degree = [0] * len(nodes)
+    for a, b, _ in edges:
+        degree[a] += 1
+        degree[b] += 1
+
+    # T-junctions: a node strictly inside another segment
+    for i, (x, y) in enumerate(nodes):
+        for seg in segments:
+            along, across = (0, 1) if seg['axis'] == 'x' else (1, 0)
+            point = (x, y)
+            if (abs(point[across] - seg['start'][across]) < NODE_TOLERANCE and
+                    seg['start'][along] + NODE_TOLERANCE < point[along] < seg['end'][along] - NODE_TOLERANCE):
+                degree[i] += 2
+
+    return {'nodes': nodes, 'edges': edges, 'degree': degree}
+
+
+def plan_interior_layout(spec):
+    """
+    Plan every Phase 1C interior piece.
+
+    Args:
+        spec (dict): Loaded interior_layout.yaml
+
+    Returns:
+        dict: 'groups' (walls, headers, floor, ceiling -> piece_spec lists, for
+            build_piece_plan), 'segments' (per-segment summary) and 'graph'
+            (see segment_graph)
+
+    Raises:
+        ValueError: If a segment is malformed or a doorway does not fit its segment
+    """
+    colors = spec.get('phase_1c_colors', {})
+    wall_color = colors.get('interior_walls', "#D3D3D3")
+    floor = spec['floor']
+    ceiling = spec['ceiling']
+    bounds = spec['interior_dimensions']
+    z_bottom = floor['z_position']
+
+    segments = wall_segments(spec)
+    groups = {'walls': [], 'headers': [], 'floor': [], 'ceiling': []}
+    summary = []
+
+    for seg in segments:
+        along = 0 if seg['axis'] == 'x' else 1
+        across = seg['start'][1 - along]
+        height, thickness = seg['height'], seg['thickness']
+        doorways = segment_doorways(spec, seg['key'], seg['axis'])
+        solid = split_segment(seg['start'][along], seg['end'][along], doorways, seg['key'])
+
+        def box(name, lo, hi, z0, z1):
+            center = (lo + hi) / 2
+            location = (center, across, (z0 + z1) / 2) if along == 0 else (across, center, (z0 + z1) / 2)
+            width, depth = (hi - lo, thickness) if along == 0 else (thickness, hi - lo)
+            return piece_spec(name, width, depth, z1 - z0, location, wall_color, WALL_MATERIAL)
+
+        for i, (lo, hi) in enumerate(solid, start=1):
+            name = object_name(seg['key'], f"Seg{i}" if len(solid) > 1 else None)
+            groups['walls'].append(box(name, lo, hi, z_bottom, z_bottom + height))
+
+        for door in doorways:
+            door_top = (door['z_bottom'] if door['z_bottom'] is not None else z_bottom) + door['height']
+            if z_bottom + height - door_top > MIN_HEADER_HEIGHT:
+                groups['headers'].append(box(
+                    object_name(door['name'], "Header"),
+                    door['center'] - door['width'] / 2, door['center'] + door['width'] / 2,
+                    door_top, z_bottom + height
+                ))
+
+        summary.append({'key': seg['key'], 'axis': seg['axis'], 'pieces': len(solid), 'doorways': len(doorways)})
+
+    width = bounds['right_x'] - bounds['left_x']
+    depth = bounds['back_y'] - bounds['front_y']
+    center_x = (bounds['left_x'] + bounds['right_x']) / 2
+    center_y = (bounds['front_y'] + bounds['back_y']) / 2
+    groups['floor'].append(piece_spec(
+        "Interior_Floor", width, depth, floor['thickness'],
+        (center_x, center_y, floor['z_position'] - floor['thickness'] / 2),
+        floor.get('color', colors.get('floor', "#8B7355")), FLOOR_MATERIAL
+    ))
+    groups['ceiling'].append(piece_spec(
+        "Interior_Ceiling", width, depth, ceiling['thickness'],
+        (center_x, center_y, ceiling['z_position'] + ceiling['thickness'] / 2),
+        ceiling.get('color', colors.get('ceiling', "#F5F5DC")), CEILING_MATERIAL
+    ))
+
+    return {'groups': groups, 'segments': summary, 'graph': segment_graph(segments)}
+
+
+@profiled()
+def build_interior_layout(plan, batched=True, instanced=True):
+    """
+    Build a planned interior.
+
+    Args:
+        plan: Output of plan_interior_layout
+        batched: True for one create_box_batch mesh per group (Interior_Walls,
+            Interior_Headers, Interior_Floor, Interior_Ceiling), False for one
+            object per piece
+        instanced: For unbatched pieces, share meshes between identical pieces
+
+    Returns:
+        list: Created objects
+    """
+    result = build_piece_plan("Interior", plan['groups'], batched=batched, instanced=instanced)
+    return [obj for objects in result.values() for obj in objects]
+
+
+def print_interior_plan(plan):
+    """Print per-segment pieces and group totals."""
+    graph = plan['graph']
+    print(f"\n{'Segment':<28} {'Axis':<5} {'Pieces':>7} {'Doorways':>9}")
+    print("-" * 52)
+    for seg in plan['segments']:
+        print(f"{seg['key']:<28} {seg['axis']:<5} {seg['pieces']:>7} {seg['doorways']:>9}")
+    print("-" * 52)
+    totals = ", ".join(f"{group} {len(pieces)}" for group, pieces in plan['groups'].items())
+    print(f"Pieces: {totals}")
+    junctions = sum(1 for d in graph['degree'] if d > 1)
+    print(f"Graph: {len(graph['nodes'])} nodes, {len(graph['edges'])} segments, {junctions} junctions")
+
+
+def main():
+    """Print the interior plan for the current Phase 1C spec."""
+    print_interior_plan(plan_interior_layout(load_interior_spec()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
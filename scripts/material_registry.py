@@ -0,0 +1,158 @@
+"""
+Material Registry
+Shared solid-color materials for all helper modules
+
+Every helper that colors geometry (blender_helpers.apply_material,
+phase_1b_helpers.apply_material_helper, phase_1c_helpers.get_or_create_material)
+gets its material from here. Materials are keyed on their look
+(color, roughness, metallic, alpha), so two pieces with the same color share one
+material instead of each getting its own node tree. This keeps the exported GLB
+material table small.
+
+The first requester's name is used for the material; later requests with a
+different name but the same look reuse it.
+
+Usage:
+    from material_registry import get_material, get_material_stats
+
+    mat = get_material("#808080", name="Wall_Gray")
+    print(get_material_stats())
+"""
+
+import bpy
+
+
+DEFAULT_ROUGHNESS = 0.5
+DEFAULT_METALLIC = 0.0
+DEFAULT_ALPHA = 1.0
+
+# (color, roughness, metallic, alpha) -> bpy.types.Material
+_materials = {}
+_stats = {'hits': 0, 'misses': 0, 'stale': 0}
+
+
+def hex_to_rgb(color_hex):
+    """
+    Convert hex color string to RGB tuple (0-1 range).
+
+    Args:
+        color_hex (str): Hex color code (e.g., "#808080" or "808080")
+
+    Returns:
+        tuple: (r, g, b) floats in 0-1 range
+
+    Example:
+        >>> hex_to_rgb("#FF0000")
+        (1.0, 0.0, 0.0)
+    """
+    color_hex = color_hex.lstrip('#')
+    return tuple(int(color_hex[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+
+
+def material_key(color_hex, roughness=DEFAULT_ROUGHNESS, metallic=DEFAULT_METALLIC, alpha=DEFAULT_ALPHA):
+    """
+    Build the registry key for a material look.
+
+    Hex case and the leading '#' are ignored; float parameters are rounded so
+    values that differ only by float noise share a material.
+
+    Returns:
+        tuple: (color, roughness, metallic, alpha)
+    """
+    return (
+        color_hex.lstrip('#').upper(),
+        round(float(roughness), 4),
+        round(float(metallic), 4),
+        round(float(alpha), 4)
+    )
+
+
+def get_material(color_hex, roughness=DEFAULT_ROUGHNESS, metallic=DEFAULT_METALLIC,
+                 alpha=DEFAULT_ALPHA, name=None):
+    """
+    Get the shared material for a look, creating it on first use.
+
+    Args:
+        color_hex (str): Hex base color (e.g., "#808080")
+        roughness (float): Principled BSDF roughness
+        metallic (float): Principled BSDF metallic
+        alpha (float): Principled BSDF alpha (< 1.0 enables blending)
+        name (str, optional): Name used if the material has to be created.
+            Defaults to "Mat_<COLOR>".
+
+    Returns:
+        bpy.types.Material: Shared material
+
+    Example:
+        >>> trim_mat = get_material("#FFFFFF", name="Front_Left_Window_Trim_Mat")
+        >>> get_material("#ffffff") is trim_mat
+        True
+    """
+    key = material_key(color_hex, roughness, metallic, alpha)
+
+    mat = _materials.get(key)
+    if mat is not None:
+        try:
+            # Removed materials (scene reset, read_homefile) raise ReferenceError
+            if mat.name in bpy.data.materials:
+                _stats['hits'] += 1
+                return mat
+        except ReferenceError:
+            pass
+        del _materials[key]
+        _stats['stale'] += 1
+
+    _stats['misses'] += 1
+    mat = _create_material(name or f"Mat_{key[0]}", color_hex, roughness, metallic, alpha)
+    _materials[key] = mat
+    return mat
+
+
+def _create_material(name, color_hex, roughness, metallic, alpha):
+    """Create a Principled BSDF material with the given parameters."""
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if bsdf:
+        r, g, b = hex_to_rgb(color_hex)
+        bsdf.inputs["Base Color"].default_value = (r, g, b, 1.0)
+        bsdf.inputs["Roughness"].default_value = roughness
+        bsdf.inputs["Metallic"].default_value = metallic
+        bsdf.inputs["Alpha"].default_value = alpha
+
+    if alpha < 1.0 and hasattr(mat, "blend_method"):
+        mat.blend_method = 'BLEND'
+
+    return mat
+
+
+def get_material_stats():
+    """
+    Get registry cache statistics.
+
+    Returns:
+        dict: {'hits', 'misses', 'stale', 'materials', 'hit_rate'}
+    """
+    lookups = _stats['hits'] + _stats['misses']
+    return {
+        'hits': _stats['hits'],
+        'misses': _stats['misses'],
+        'stale': _stats['stale'],
+        'materials': len(_materials),
+        'hit_rate': _stats['hits'] / lookups if lookups else 0.0
+    }
+
+
+def print_material_stats():
+    """Print registry cache statistics."""
+    stats = get_material_stats()
+    print(f"Materials: {stats['materials']} shared "
+          f"({stats['hits']} hits, {stats['misses']} misses, {stats['hit_rate']:.0%} hit rate)")
+
+
+def reset_material_registry():
+    """Forget all cached materials and reset statistics (materials are not deleted)."""
+    _materials.clear()
+    for key in _stats:
+        _stats[key] = 0
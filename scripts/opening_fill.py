@@ -0,0 +1,518 @@
+"""
+Opening Fill Engine
+Spec-driven window and door fill for Phase 1B
+
+Joins every Phase 1A cutout (building_geometry.yaml 'cutouts') with its entry
+in opening_fill.yaml (matched by cutout_ref), plans every frame, glass, trim,
+inner frame, sill, muntin and door piece as plain piece_spec dicts, then builds
+all openings in one pass. Recess and setback offsets are applied while
+planning, so nothing is moved after it is created.
+
+Planning needs no Blender, so plans can be inspected and piece counts checked
+offline. Adding an opening is a spec change only: a new Phase 1A cutout plus an
+opening_fill.yaml entry that references it.
+
+Usage:
+    from opening_fill import plan_opening_fill, build_opening_fill, print_opening_fill_report
+
+    plans = plan_opening_fill(phase_1a_spec, spec)
+    report = build_opening_fill(plans)
+    print_opening_fill_report(report)
+    phase_1b_objects = report['objects']
+
+    python scripts/opening_fill.py    # print the plan for the current specs
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+from build_profiler import profiled
+from phase_1b_helpers import (
+    piece_spec,
+    plan_french_door_panel,
+    plan_half_lite_door_panel,
+    build_piece_plan
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Object name prefixes for the existing openings (the viewer matches on these)
+OBJECT_PREFIXES = {
+    'front_left_display_window': "Front_Left_Window",
+    'front_right_display_window': "Front_Right_Window",
+    'door_alcove_left_window': "Alcove_Left_Window",
+    'door_alcove_right_window': "Alcove_Right_Window",
+    'front_entry_door': "Front_Entry_Door",
+    'rear_service_door': "Rear_Service_Door",
+}
+
+# Alcove window placement measured from the Phase 1A wall mesh: (x, y, rotation_z degrees).
+# The spec positions are the wall centerline, not where the cutter actually lands.
+ALCOVE_WINDOW_PLACEMENT = {
+    'door_alcove_left_window': (-1.067, -6.947, 63.7),
+    'door_alcove_right_window': (0.993, -6.981, -63.7),
+}
+
+# Outer trim and sill sit this far in front of the brick face
+TRIM_FACE_OFFSET = 0.01
+
+# Sill depth beyond its forward projection (overlap with the trim)
+SILL_TRIM_OVERLAP = 0.06
+
+
+def object_prefix(cutout_name, fill):
+    """Get the object name prefix for an opening ('object_prefix' in the fill spec overrides)."""
+    if fill.get('object_prefix'):
+        return fill['object_prefix']
+    return OBJECT_PREFIXES.get(cutout_name) or cutout_name.title()
+
+
+def fill_entries(spec):
+    """
+    Index opening_fill.yaml entries by the cutout they fill.
+
+    Args:
+        spec: Loaded opening_fill.yaml
+
+    Returns:
+        dict: cutout name -> fill spec
+    """
+    return {
+        value['cutout_ref']: value
+        for value in spec.values()
+        if isinstance(value, dict) and 'cutout_ref' in value
+    }
+
+
+def opening_placement(cutout_name, cutout, phase_1a_spec):
+    """
+    Get the (x, y, z, rotation_z) placement of an opening.
+
+    z is the cutout bottom. Alcove windows use the measured cutter placement
+    when the alcove is enabled.
+    """
+    position = cutout['position']
+    door_alcove = phase_1a_spec.get('door_alcove', {})
+    if door_alcove.get('enabled', False) and cutout_name in ALCOVE_WINDOW_PLACEMENT:
+        x, y, angle = ALCOVE_WINDOW_PLACEMENT[cutout_name]
+        return x, y, position['z'], math.radians(angle)
+    return position['x'], position['y'], position['z'], 0
+
+
+def offset_location(location, offset, rotation_z=0):
+    """Offset a location by a local (x, y, z) offset rotated around Z."""
+    cos_r, sin_r = math.cos(rotation_z), math.sin(rotation_z)
+    return (
+        location[0] + offset[0] * cos_r - offset[1] * sin_r,
+        location[1] + offset[0] * sin_r + offset[1] * cos_r,
+        location[2] + offset[2]
+    )
+
+
+def shift_y(pieces, y_offset):
+    """Move planned pieces along world Y (negative = into wall)."""
+    for piece in pieces:
+        x, y, z = piece['location']
+        piece['location'] = (x, y + y_offset, z)
+
+
+def plan_rect_frame(name, sides, location, rotation_z, color, material_name):
+    """
+    Plan rectangular frame pieces around a center.
+
+    Args:
+        name: Piece name prefix ("{name}_{Side}")
+        sides: List of (side, width, depth, height, local offset)
+        location: (x, y, z) frame center
+        rotation_z: Rotation around Z in radians
+        color: Hex color
+        material_name: Material name for every piece
+
+    Returns:
+        list: piece_spec dicts
+    """
+    return [
+        piece_spec(f"{name}_{side}", w, d, h, offset_location(location, offset, rotation_z),
+                   color, material_name, rotation_z)
+        for side, w, d, h, offset in sides
+    ]
+
+
+def plan_window(prefix, fill, placement):
+    """
+    Plan one window: frame, glass (single or divided light) and optional detail.
+
+    Args:
+        prefix: Object name prefix (e.g. "Front_Left_Window")
+        fill: Window entry from opening_fill.yaml
+        placement: (x, y, z, rotation_z) from opening_placement
+
+    Returns:
+        tuple: (units, notes) - build units and report lines
+    """
+    x, y, z, rotation_z = placement
+    frame, glass_spec = fill['frame'], fill['glass']
+    width, height, t = frame['width'], frame['height'], frame['thickness']
+    center = (x, y, z + height/2)
+    half_w, half_h = width / 2, height / 2
+
+    groups = {'frame': [], 'glass': [], 'muntins': [], 'outer_trim': [], 'inner_frame': [], 'sill': []}
+    notes = []
+
+    groups['frame'] = plan_rect_frame(f"{prefix}_Frame", [
+        ('Top', width, frame['depth'], t, (0, 0, half_h - t/2)),
+        ('Bottom', width, frame['depth'], t, (0, 0, -half_h + t/2)),
+        ('Left', t, frame['depth'], height - 2*t, (-half_w + t/2, 0, 0)),
+        ('Right', t, frame['depth'], height - 2*t, (half_w - t/2, 0, 0)),
+    ], center, rotation_z, frame['color'], f"{prefix}_Frame_Mat")
+    rotated = f" (rotated {math.degrees(rotation_z):.1f}°)" if rotation_z else ""
+    notes.append(f"✓ Frame: {width}m × {height}m{rotated}")
+
+    divided_light = fill.get('divided_light', {})
+    if divided_light.get('enabled'):
+        glass_width = glass_spec['width']
+        glass_total_height = glass_spec['height']
+        muntin_thickness = divided_light['muntin_thickness']
+        division_ratio = divided_light['division_ratio']
+
+        usable_height = glass_total_height - muntin_thickness
+        upper_height = usable_height * division_ratio
+        lower_height = usable_height * (1 - division_ratio)
+        bottom_z = center[2] - glass_total_height/2
+
+        panes = [
+            ('Upper', upper_height, bottom_z + lower_height + muntin_thickness + upper_height/2),
+            ('Lower', lower_height, bottom_z + lower_height/2),
+        ]
+        for pane, pane_height, pane_z in panes:
+            groups['glass'].append(piece_spec(
+                f"{prefix}_Glass_{pane}", glass_width, glass_spec['thickness'], pane_height,
+                (x, y, pane_z), glass_spec['color'], f"{prefix}_Glass_{pane}_Mat", rotation_z
+            ))
+        groups['muntins'].append(piece_spec(
+            f"{prefix}_Muntin", glass_width, divided_light['muntin_depth'], muntin_thickness,
+            (x, y, bottom_z + lower_height + muntin_thickness/2),
+            frame['color'], f"{prefix}_Muntin_Mat", rotation_z
+        ))
+        notes.append(f"✓ Divided light: upper {upper_height:.2f}m + muntin {muntin_thickness}m + lower {lower_height:.2f}m")
+    else:
+        groups['glass'].append(piece_spec(
+            f"{prefix}_Glass", glass_spec['width'], glass_spec['thickness'], glass_spec['height'],
+            center, glass_spec['color'], f"{prefix}_Glass_Mat", rotation_z
+        ))
+        notes.append(f"✓ Glass: {glass_spec['width']}m × {glass_spec['height']}m")
+
+    detail = fill.get('detail')
+    if detail:
+        notes.extend(plan_window_detail(prefix, frame, detail, groups, center, rotation_z))
+
+    return [{'name': prefix, 'kind': 'window', 'groups': groups}], notes
+
+
+def plan_window_detail(prefix, frame, detail, groups, center, rotation_z):
+    """
+    Add outer trim, inner frame and sill to a window plan and apply the recesses.
+
+    Modifies groups in place.
+
+    Returns:
+        list: Report lines
+    """
+    width, height, t = frame['width'], frame['height'], frame['thickness']
+    half_w, half_h = width / 2, height / 2
+    color = frame['color']
+    notes = []
+
+    # Outer trim around brick opening (3 or 4 pieces depending on bottom_enabled)
+    trim = detail.get('outer_trim', {})
+    if trim.get('enabled'):
+        sides, top, bottom, depth = trim['sides_width'], trim['top_width'], trim['bottom_width'], trim['depth']
+        bottom_enabled = trim.get('bottom_enabled', True)
+        trim_center = (center[0], center[1] + TRIM_FACE_OFFSET, center[2])
+
+        trim_sides = [('Top', width + 2*sides, depth, top, (0, 0, half_h + top/2))]
+        if bottom_enabled:
+            trim_sides.append(('Bottom', width + 2*sides, depth, bottom, (0, 0, -half_h - bottom/2)))
+        trim_sides += [
+            ('Left', sides, depth, height, (-half_w - sides/2, 0, 0)),
+            ('Right', sides, depth, height, (half_w + sides/2, 0, 0)),
+        ]
+        groups['outer_trim'] = plan_rect_frame(
+            f"{prefix}_OuterTrim", trim_sides, trim_center, rotation_z, color, f"{prefix}_Trim_Mat"
+        )
+        bottom_status = "enabled" if bottom_enabled else "disabled"
+        notes.append(f"  ✓ Outer trim: sides {sides}m, top {top}m, bottom {bottom_status}, depth {depth}m")
+
+    # Frame recessed behind the trim
+    frame_recess = detail.get('frame_recess', 0)
+    if frame_recess > 0:
+        shift_y(groups['frame'], -frame_recess)
+        notes.append(f"  ✓ Frame recessed: {frame_recess}m into wall")
+
+    # Inner frame (window stop) for layered look
+    inner = detail.get('inner_frame', {})
+    inner_setback = 0
+    if inner.get('enabled'):
+        inner_setback = inner['setback']
+        it, depth = inner['thickness'], inner['depth']
+        inner_w, inner_h = width - 2*t, height - 2*t
+        inner_center = (center[0], center[1] - frame_recess - inner_setback, center[2])
+        groups['inner_frame'] = plan_rect_frame(f"{prefix}_Inner", [
+            ('Top', inner_w, depth, it, (0, 0, inner_h/2 - it/2)),
+            ('Bottom', inner_w, depth, it, (0, 0, -inner_h/2 + it/2)),
+            ('Left', it, depth, inner_h - 2*it, (-inner_w/2 + it/2, 0, 0)),
+            ('Right', it, depth, inner_h - 2*it, (inner_w/2 - it/2, 0, 0)),
+        ], inner_center, rotation_z, color, f"{prefix}_Inner_Mat")
+        notes.append(f"  ✓ Inner frame: {it}m thick, {inner_setback}m setback")
+
+    # Window sill at the cutout bottom
+    sill = detail.get('window_sill', {})
+    if sill.get('enabled'):
+        sill_width = width + 2 * sill['overhang']
+        sill_y = center[1] + TRIM_FACE_OFFSET + sill['projection']
+        sill_z = center[2] - half_h + sill['height']/2
+        groups['sill'].append(piece_spec(
+            f"{prefix}_Sill", sill_width, sill['projection'] + SILL_TRIM_OVERLAP, sill['height'],
+            (center[0], sill_y, sill_z), color, f"{prefix}_Sill_Mat", rotation_z
+        ))
+        notes.append(f"  ✓ Window sill: {sill_width}m wide × {sill['height']}m thick, projects {sill['projection']}m")
+
+    # Glass behind recess + inner frame setback + glass setback
+    glass_offset = -(frame_recess + inner_setback + detail.get('glass_setback', 0))
+    if glass_offset != 0:
+        shift_y(groups['glass'] + groups['muntins'], glass_offset)
+        notes.append(f"  ✓ Glass recessed: {-glass_offset}m from outer trim")
+
+    return notes
+
+
+def plan_door_leaf(name, style, leaf, width, height, location):
+    """
+    Plan one door leaf in the given style ('10-lite', 'half-lite' or solid).
+
+    Returns:
+        dict: Piece plan (group -> piece_spec list)
+    """
+    if style == '10-lite':
+        return plan_french_door_panel(
+            name, width, height, location,
+            stile_width=leaf['stile_width'],
+            rail_width=leaf['rail_width'],
+            muntin_width=leaf['muntin_width'],
+            glass_thickness=leaf['glass_thickness'],
+            panel_depth=leaf.get('panel_depth', 0.04),
+            rows=leaf['grid']['rows'],
+            cols=leaf['grid']['cols'],
+            frame_color=leaf['frame_color'],
+            glass_color=leaf['glass_color']
+        )
+
+    if style == 'half-lite':
+        return plan_half_lite_door_panel(
+            name, width, height, location,
+            glass_ratio=leaf['glass_ratio'],
+            stile_width=leaf['stile_width'],
+            rail_width=leaf['rail_width'],
+            mid_rail_width=leaf['mid_rail_width'],
+            muntin_width=leaf['muntin_width'],
+            glass_thickness=leaf['glass_thickness'],
+            panel_depth=leaf['panel_depth'],
+            rows=leaf['grid']['rows'],
+            cols=leaf['grid']['cols'],
+            panel_inset=leaf['panel_inset'],
+            frame_color=leaf['frame_color'],
+            glass_color=leaf['glass_color'],
+            panel_color=leaf['panel_color']
+        )
+
+    thickness = leaf.get('panel_thickness', leaf.get('thickness', leaf.get('panel_depth', 0.04)))
+    color = leaf.get('color', '#1A1A1A')
+    return {'panel': [piece_spec(f"{name}_Panel", width, thickness, height, location, color, f"{name}_Panel_Mat")]}
+
+
+def plan_door(prefix, fill, placement):
+    """
+    Plan one door: 3-sided frame plus one leaf ('door_panel') or two ('door_panels').
+
+    Args:
+        prefix: Object name prefix (e.g. "Front_Entry_Door")
+        fill: Door entry from opening_fill.yaml
+        placement: (x, y, z, rotation_z) from opening_placement
+
+    Returns:
+        tuple: (units, notes) - build units and report lines
+    """
+    x, y, z, rotation_z = placement
+    frame = fill['frame']
+    width, height, t = frame['width'], frame['height'], frame['thickness']
+    half_w, half_h = width / 2, height / 2
+
+    casing = plan_rect_frame(f"{prefix}_Frame", [
+        ('Top', width, frame['depth'], t, (0, 0, half_h - t/2)),
+        ('Left', t, frame['depth'], height, (-half_w + t/2, 0, 0)),
+        ('Right', t, frame['depth'], height, (half_w - t/2, 0, 0)),
+    ], (x, y, z + half_h), rotation_z, frame['color'], f"{prefix}_Frame_Mat")
+
+    units = [{'name': prefix, 'kind': 'door_frame', 'groups': {'casing': casing}}]
+    notes = [f"✓ Frame: {width}m × {height}m"]
+
+    double = 'door_panels' in fill
+    leaf = fill['door_panels'] if double else fill['door_panel']
+    style = leaf.get('style', 'solid')
+    leaf_width = leaf.get('panel_width', leaf.get('width'))
+    leaf_height = leaf.get('panel_height', leaf.get('height'))
+    leaf_z = z + leaf_height/2
+
+    if double:
+        gap = leaf.get('center_gap', 0)
+        leaves = [
+            (f"{prefix}_Left", x - leaf_width/2 - gap/2),
+            (f"{prefix}_Right", x + leaf_width/2 + gap/2),
+        ]
+    else:
+        leaves = [(prefix, x)]
+
+    for leaf_name, leaf_x in leaves:
+        units.append({
+            'name': leaf_name,
+            'kind': 'door_leaf',
+            'groups': plan_door_leaf(leaf_name, style, leaf, leaf_width, leaf_height, (leaf_x, y, leaf_z)),
+        })
+
+    notes.append(f"✓ {style} panel: {len(leaves)}× {leaf_width}m × {leaf_height}m")
+    return units, notes
+
+
+def plan_opening_fill(phase_1a_spec, spec):
+    """
+    Plan the fill for every Phase 1A cutout that has an opening_fill.yaml entry.
+
+    Args:
+        phase_1a_spec: Loaded building_geometry.yaml (cutout positions)
+        spec: Loaded opening_fill.yaml
+
+    Returns:
+        list: One dict per opening with 'cutout', 'prefix', 'kind', 'units'
+            (name, kind, groups of piece_spec dicts), 'pieces' and 'notes'
+
+    Raises:
+        ValueError: If a fill entry references a cutout Phase 1A does not have
+    """
+    cutouts = phase_1a_spec.get('cutouts') or {}
+    fills = fill_entries(spec)
+
+    unknown = sorted(set(fills) - set(cutouts))
+    if unknown:
+        raise ValueError(f"opening_fill.yaml references unknown Phase 1A cutouts: {', '.join(unknown)}")
+
+    plans = []
+    for cutout_name, cutout in cutouts.items():
+        fill = fills.get(cutout_name)
+        if fill is None:
+            continue
+
+        prefix = object_prefix(cutout_name, fill)
+        placement = opening_placement(cutout_name, cutout, phase_1a_spec)
+        is_door = 'door_panels' in fill or 'door_panel' in fill
+        planner = plan_door if is_door else plan_window
+        units, notes = planner(prefix, fill, placement)
+
+        plans.append({
+            'cutout': cutout_name,
+            'prefix': prefix,
+            'kind': 'door' if is_door else 'window',
+            'units': units,
+            'pieces': sum(len(pieces) for unit in units for pieces in unit['groups'].values()),
+            'notes': notes,
+        })
+
+    return plans
+
+
+@profiled()
+def build_opening_fill(plans, batched=False, instanced=True, verbose=True):
+    """
+    Build planned openings.
+
+    Args:
+        plans: Output of plan_opening_fill
+        batched: True to build one create_box_batch mesh per unit group, False for
+            one object per piece, or a collection of unit kinds to batch
+            (e.g. {'door_leaf'})
+        instanced: Share one mesh between unbatched pieces with identical
+            dimensions and color (linked duplicates)
+        verbose: Print each opening's notes as it is built
+
+    Returns:
+        dict: {'objects': created objects, 'openings': per-opening
+            {cutout, prefix, kind, pieces, objects, build_s}, 'build_s': total}
+    """
+    report = {'objects': [], 'openings': [], 'build_s': 0.0}
+
+    for plan in plans:
+        start = time.perf_counter()
+        created = []
+        for unit in plan['units']:
+            batch_unit = batched if isinstance(batched, bool) else unit['kind'] in batched
+            result = build_piece_plan(unit['name'], unit['groups'], batched=batch_unit, instanced=instanced)
+            for objects in result.values():
+                created.extend(objects)
+        build_s = time.perf_counter() - start
+
+        if verbose:
+            print(f"\n[{plan['prefix']}] {plan['pieces']} pieces, {len(created)} objects, {build_s * 1000:.1f}ms")
+            for note in plan['notes']:
+                print(f"  {note}")
+
+        report['objects'].extend(created)
+        report['build_s'] += build_s
+        report['openings'].append({
+            'cutout': plan['cutout'],
+            'prefix': plan['prefix'],
+            'kind': plan['kind'],
+            'pieces': plan['pieces'],
+            'objects': len(created),
+            'build_s': build_s,
+        })
+
+    return report
+
+
+def print_opening_fill_report(report):
+    """Print per-opening piece counts and build times."""
+    print(f"\n{'Opening':<28} {'Kind':<8} {'Pieces':>7} {'Objects':>8} {'Build (ms)':>11}")
+    print("-" * 66)
+    for opening in report['openings']:
+        print(f"{opening['prefix']:<28} {opening['kind']:<8} {opening['pieces']:>7} "
+              f"{opening['objects']:>8} {opening['build_s'] * 1000:>11.1f}")
+    print("-" * 66)
+    pieces = sum(o['pieces'] for o in report['openings'])
+    print(f"{'Total':<37} {pieces:>7} {len(report['objects']):>8} {report['build_s'] * 1000:>11.1f}")
+
+
+def main():
+    """Print the opening fill plan for the current Phase 1A/1B specs."""
+    import yaml
+
+    with open(PROJECT_ROOT / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml', 'r') as f:
+        phase_1a_spec = yaml.safe_load(f)
+    with open(PROJECT_ROOT / 'work' / 'spec' / 'phase_1b' / 'opening_fill.yaml', 'r') as f:
+        spec = yaml.safe_load(f)
+
+    plans = plan_opening_fill(phase_1a_spec, spec)
+    for plan in plans:
+        print(f"\n[{plan['prefix']}] {plan['kind']} in cutout '{plan['cutout']}': {plan['pieces']} pieces")
+        for unit in plan['units']:
+            for group, pieces in unit['groups'].items():
+                if pieces:
+                    print(f"  {unit['name']} / {group}: {len(pieces)}")
+
+    print(f"\nTotal: {sum(plan['pieces'] for plan in plans)} pieces in {len(plans)} openings")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""
+Parameter Sweep
+Build and export many Phase 1A spec variants across a pool of Blender workers
+
+A sweep file names a base spec and the overrides to try, as a grid (every
+combination) and/or an explicit list of variants. Override paths are dotted
+spec paths; a segment may be a glob matching several keys:
+
+    base: work/spec/phase_1a/building_geometry.yaml
+    grid:
+      canopy.depth: [2.0, 2.5, 3.0]
+      parapet.stepped_configuration.level_*_height: [0.9, 1.1]
+    variants:
+      - door_alcove.walls.*.front_x: 1.3
+
+Each variant spec is validated offline, then built with the Phase 1A template
+(verification gates and export included) in one of N persistent headless
+Blender workers. Every variant gets its own directory under work/sweeps/<name>/
+with its spec, checkpoints and GLB; results (GLB size, build time,
+verification outcome) are collected into results.json and results.csv.
+
+Usage:
+    python scripts/param_sweep.py canopy_sweep.yaml --workers 4
+    python scripts/param_sweep.py canopy_sweep.yaml --dry-run    # write and validate specs only
+"""
+
+import argparse
+import copy
+import csv
+import fnmatch
+import itertools
+import json
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+from checkpoint_store import JSONCheckpointStore
+from spec_loader import compile_spec, load_spec_data, SpecValidationError
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SWEEPS_DIR = PROJECT_ROOT / 'work' / 'sweeps'
+TEMPLATE = PROJECT_ROOT / 'scripts' / 'build_template_phase_1a.py'
+
+# Ports for spawned sweep workers (kept clear of the shared worker's 8765)
+BASE_PORT = 8800
+
+RESULT_COLUMNS = ['variant', 'ok', 'build_s', 'glb_kb', 'verified', 'critical', 'major', 'overrides', 'error']
+
+
+def set_path(spec, path, value):
+    """
+    Set a dotted spec path in place; segments may be globs ('level_*_height').
+
+    Args:
+        spec (dict): Spec to modify
+        path (str): Dotted path, e.g. 'door_alcove.walls.*.front_x'
+        value: New value
+
+    Returns:
+        int: Number of values set
+
+    Raises:
+        KeyError: If the path matches nothing (typos must not add new keys)
+
+    Example:
+        >>> set_path(spec, 'parapet.stepped_configuration.level_*_height', 1.0)
+        4
+    """
+    def apply(node, parts):
+        if not isinstance(node, dict):
+            return 0
+        head, rest = parts[0], parts[1:]
+        keys = [k for k in node if fnmatch.fnmatchcase(str(k), head)]
+        if not rest:
+            for key in keys:
+                node[key] = copy.deepcopy(value)
+            return len(keys)
+        return sum(apply(node[key], rest) for key in keys)
+
+    count = apply(spec, path.split('.'))
+    if count == 0:
+        raise KeyError(f"Override path '{path}' matches nothing in the spec")
+    return count
+
+
+def expand_variants(sweep):
+    """
+    Expand a sweep definition into override dicts.
+
+    Args:
+        sweep (dict): Parsed sweep file ('grid' and/or 'variants')
+
+    Returns:
+        list: One {path: value} dict per variant (grid combinations first)
+    """
+    variants = []
+    grid = sweep.get('grid') or {}
+    if grid:
+        paths = list(grid)
+        for values in itertools.product(*(grid[p] if isinstance(grid[p], list) else [grid[p]] for p in paths)):
+            variants.append(dict(zip(paths, values)))
+    variants.extend(dict(v) for v in sweep.get('variants') or [])
+    return variants
+
+
+def write_variant_specs(base_spec, variants, out_dir):
+    """
+    Apply each variant's overrides to the base spec, validate and write it.
+
+    Args:
+        base_spec (dict): Base spec data
+        variants (list): Override dicts from expand_variants
+        out_dir: Sweep directory; variant N goes to out_dir/variant_NNN/spec.yaml
+
+    Returns:
+        list: Dicts with 'variant', 'overrides', 'dir', 'spec_path', and
+            'error' (None if the variant spec is valid)
+    """
+    out_dir = Path(out_dir)
+    jobs = []
+    for index, overrides in enumerate(variants, start=1):
+        name = f"variant_{index:03d}"
+        variant_dir = out_dir / name
+        job = {'variant': name, 'overrides': overrides, 'dir': variant_dir,
+               'spec_path': variant_dir / 'spec.yaml', 'error': None}
+        try:
+            spec = copy.deepcopy(base_spec)
+            for path, value in overrides.items():
+                set_path(spec, path, value)
+            compile_spec(spec, path=job['spec_path'])
+        except (KeyError, SpecValidationError) as e:
+            job['error'] = str(e)
+        else:
+            variant_dir.mkdir(parents=True, exist_ok=True)
+            with open(job['spec_path'], 'w') as f:
+                yaml.safe_dump(spec, f, sort_keys=False)
+        jobs.append(job)
+    return jobs
+
+
+def read_verification(checkpoint_dir, iteration_num=1):
+    """
+    Summarize a variant's verification checkpoints.
+
+    Returns:
+        dict: 'verified' (all three checkpoints present), 'critical' and 'major'
+            issue counts from automated verification (None if it did not run)
+    """
+    store = JSONCheckpointStore(checkpoint_dir)
+    names = [f"{kind}_{iteration_num:03d}" for kind in
+             ('inline_verification', 'batch_verification', 'automated_verification')]
+    records = {name: store.read(name) for name in names}
+    automated = (records[names[2]] or {}).get('data', {})
+    return {
+        'verified': all(records.values()),
+        'critical': automated.get('critical_count'),
+        'major': automated.get('major_count'),
+    }
+
+
+def empty_row(job, error=None):
+    """Results row for a variant that produced nothing (yet)."""
+    return {'variant': job['variant'], 'overrides': job['overrides'], 'ok': False,
+            'build_s': None, 'glb_kb': None, 'verified': False, 'critical': None, 'major': None,
+            'error': error or job['error']}
+
+
+def build_variant(worker, job, template=TEMPLATE):
+    """
+    Build and export one variant in a Blender worker.
+
+    Returns:
+        dict: One results row (see RESULT_COLUMNS)
+
+    Raises:
+        OSError: If the worker connection fails (e.g. the worker died)
+    """
+    variant_dir = job['dir']
+    checkpoint_dir = variant_dir / 'checkpoints'
+    row = empty_row(job)
+    if job['error']:
+        return row
+
+    start = time.perf_counter()
+    response = worker.submit('exec', check=False, script=str(template), globals={
+        'iteration_num': 1,
+        'spec_path': str(job['spec_path']),
+        'export_dir': str(variant_dir),
+        'checkpoint_dir': str(checkpoint_dir),
+    })
+    row['build_s'] = response.get('elapsed_s') or time.perf_counter() - start
+
+    glb = variant_dir / 'building_phase_1a_iter_001.glb'
+    if glb.exists():
+        row['glb_kb'] = round(glb.stat().st_size / 1024, 1)
+    row.update(read_verification(checkpoint_dir))
+    row['ok'] = bool(response.get('ok')) and glb.exists()
+    if not response.get('ok'):
+        lines = (response.get('error') or 'failed').strip().splitlines()
+        row['error'] = lines[-1] if lines else 'failed'
+    return row
+
+
+def build_in_pool(pool, job, template=TEMPLATE):
+    """
+    Build one variant on a worker taken from the pool.
+
+    A worker that fails (connection dropped, process gone) yields an error
+    row instead of aborting the sweep; it is restarted before going back to
+    the pool if its process has exited.
+
+    Returns:
+        dict: One results row
+    """
+    worker = pool.get()
+    try:
+        return build_variant(worker, job, template)
+    except (OSError, RuntimeError) as e:
+        worker.close()
+        if worker.process is not None and worker.process.poll() is not None:
+            try:
+                worker.start()
+            except (OSError, RuntimeError) as restart_error:
+                print(f"⚠️  Could not restart worker on port {worker.port}: {restart_error}")
+        return empty_row(job, f"Worker failed: {e}")
+    finally:
+        pool.put(worker)
+
+
+def run_sweep(jobs, workers=None, base_port=BASE_PORT, template=TEMPLATE):
+    """
+    Build variant jobs across a pool of persistent Blender workers.
+
+    Each pool thread holds one worker (spawned on base_port + i), so every
+    Blender process pays its startup cost once for the whole sweep.
+
+    Returns:
+        list: Result rows in job order
+    """
+    from blender_worker_client import BlenderWorker
+
+    buildable = [job for job in jobs if not job['error']]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(buildable) or 1))
+
+    pool = queue.Queue()
+    started = []
+    try:
+        for i in range(workers if buildable else 0):
+            worker = BlenderWorker(port=base_port + i, spawn=True)
+            started.append(worker)
+            pool.put(worker)
+
+        def run(job):
+            if job['error']:
+                return build_variant(None, job, template)
+            row = build_in_pool(pool, job, template)
+            status = "✓" if row['ok'] else "❌"
+            build = f"{row['build_s']:.1f}s" if row['build_s'] is not None else "-"
+            print(f"{status} {job['variant']}: {build} {job['overrides']}")
+            return row
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, jobs))
+    finally:
+        for worker in started:
+            worker.shutdown()
+
+
+def write_results(rows, out_dir, sweep_path=None, wall_s=None):
+    """Write results.json and results.csv to the sweep directory."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / 'results.json', 'w') as f:
+        json.dump({'timestamp': datetime.now().isoformat(), 'sweep': str(sweep_path) if sweep_path else None,
+                   'wall_s': wall_s, 'variants': rows}, f, indent=2)
+    with open(out_dir / 'results.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, 'overrides': json.dumps(row['overrides'])})
+
+
+def print_results(rows):
+    """Print the results table."""
+    print(f"\n{'Variant':<12} {'OK':<3} {'Build':>8} {'GLB KB':>8} {'Verified':>9} {'Crit':>5} {'Major':>6}  Overrides")
+    print("-" * 90)
+    for row in rows:
+        build = f"{row['build_s']:.1f}s" if row['build_s'] is not None else "-"
+        glb = f"{row['glb_kb']:.1f}" if row['glb_kb'] is not None else "-"
+        crit = "-" if row['critical'] is None else row['critical']
+        major = "-" if row['major'] is None else row['major']
+        overrides = ", ".join(f"{k}={v}" for k, v in row['overrides'].items())
+        print(f"{row['variant']:<12} {'✓' if row['ok'] else '✗':<3} {build:>8} {glb:>8} "
+              f"{'yes' if row['verified'] else 'no':>9} {crit:>5} {major:>6}  {overrides}")
+        if row['error']:
+            print(f"{'':<12} {row['error']}")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Build Phase 1A spec variants in parallel Blender workers")
+    parser.add_argument("sweep", help="Sweep YAML (base, grid, variants)")
+    parser.add_argument("--out_dir", help="Output directory (default: work/sweeps/<sweep name>)")
+    parser.add_argument("--workers", type=int, default=None, help="Blender workers (default: CPU count)")
+    parser.add_argument("--base-port", type=int, default=BASE_PORT, help="First worker port")
+    parser.add_argument("--dry-run", action="store_true", help="Write and validate variant specs only")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    sweep_path = Path(args.sweep)
+    with open(sweep_path, 'r') as f:
+        sweep = yaml.safe_load(f) or {}
+
+    base_path = PROJECT_ROOT / sweep.get('base', 'work/spec/phase_1a/building_geometry.yaml')
+    out_dir = Path(args.out_dir) if args.out_dir else SWEEPS_DIR / sweep_path.stem
+
+    print("=" * 70)
+    print(f" Parameter Sweep: {sweep_path.name}")
+    print("=" * 70)
+
+    variants = expand_variants(sweep)
+    if not variants:
+        print("ERROR: Sweep defines no variants (add 'grid' or 'variants')")
+        return 1
+
+    jobs = write_variant_specs(load_spec_data(base_path), variants, out_dir)
+    invalid = [job for job in jobs if job['error']]
+    print(f"Base spec: {base_path}")
+    print(f"Variants:  {len(jobs)} ({len(invalid)} invalid) -> {out_dir}")
+    for job in invalid:
+        print(f"  ❌ {job['variant']}: {job['error']}")
+
+    if args.dry_run:
+        return 1 if invalid else 0
+
+    start = time.perf_counter()
+    rows = run_sweep(jobs, workers=args.workers, base_port=args.base_port)
+    wall_s = time.perf_counter() - start
+
+    write_results(rows, out_dir, sweep_path, wall_s)
+    print_results(rows)
+    build_s = sum(row['build_s'] or 0 for row in rows)
+    print(f"\nWall clock {wall_s:.1f}s (sum of builds {build_s:.1f}s)")
+    print(f"Results: {out_dir / 'results.csv'}")
+
+    return 0 if all(row['ok'] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ Blender Helper Library for Phase 1B - Opening Fill
 Window frames, glass, and door panels
 """
 
-import bpy
+from build_profiler import profiled
 
 
 def create_window_frame(name, width, height, thickness, depth, location, rotation_z=0, color="#FFFFFF"):
@@ -510,7 +510,8 @@ def create_inner_window_frame(name, outer_width, outer_height, outer_frame_thick
 
 def create_french_door_panel(name, width, height, location, stile_width=0.05, rail_width=0.08,
                              muntin_width=0.03, glass_thickness=0.01, panel_depth=0.04,
-                             rows=5, cols=2, frame_color="#FFFFFF", glass_color="#000000"):
+                             rows=5, cols=2, frame_color="#FFFFFF", glass_color="#000000",
+                             batched=False):
     """
     Create a French door panel with grid of glass panes (10-lite style).
 
@@ -528,13 +529,30 @@ def create_french_door_panel(name, width, height, location, stile_width=0.05, ra
         cols (int): Number of glass columns (default 2)
         frame_color (str): Hex color for frame/muntins
         glass_color (str): Hex color for glass
+        batched (bool): If True, build one mesh object per group
+            ("{name}_Frame", "{name}_Muntins", "{name}_Glass") instead of one
+            object per piece. Piece names are kept on the batched mesh.
 
     Returns:
         dict: Dictionary with 'frame', 'muntins', 'glass' keys containing lists of objects
     """
-    import math
+    plan = plan_french_door_panel(
+        name, width, height, location, stile_width, rail_width, muntin_width,
+        glass_thickness, panel_depth, rows, cols, frame_color, glass_color
+    )
+    return build_piece_plan(name, plan, batched=batched)
 
-    result = {'frame': [], 'muntins': [], 'glass': []}
+
+def plan_french_door_panel(name, width, height, location, stile_width=0.05, rail_width=0.08,
+                           muntin_width=0.03, glass_thickness=0.01, panel_depth=0.04,
+                           rows=5, cols=2, frame_color="#FFFFFF", glass_color="#000000"):
+    """
+    Plan a French door panel as piece_spec data (see create_french_door_panel).
+
+    Returns:
+        dict: Piece plan with 'frame', 'muntins', 'glass' lists
+    """
+    plan = {'frame': [], 'muntins': [], 'glass': []}
 
     half_w = width / 2
     half_h = height / 2
@@ -542,122 +560,52 @@ def create_french_door_panel(name, width, height, location, stile_width=0.05, ra
     # --- Create outer stiles and rails ---
 
     # Left stile
-    left_stile = create_box_helper(
-        f"{name}_Stile_Left",
-        width=stile_width,
-        depth=panel_depth,
-        height=height,
-        location=(location[0] - half_w + stile_width/2, location[1], location[2])
-    )
-    apply_material_helper(left_stile, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(left_stile)
+    plan['frame'].append(piece_spec(
+        f"{name}_Stile_Left", stile_width, panel_depth, height,
+        (location[0] - half_w + stile_width/2, location[1], location[2]),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Right stile
-    right_stile = create_box_helper(
-        f"{name}_Stile_Right",
-        width=stile_width,
-        depth=panel_depth,
-        height=height,
-        location=(location[0] + half_w - stile_width/2, location[1], location[2])
-    )
-    apply_material_helper(right_stile, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(right_stile)
+    plan['frame'].append(piece_spec(
+        f"{name}_Stile_Right", stile_width, panel_depth, height,
+        (location[0] + half_w - stile_width/2, location[1], location[2]),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Top rail
-    top_rail = create_box_helper(
-        f"{name}_Rail_Top",
-        width=width - 2*stile_width,
-        depth=panel_depth,
-        height=rail_width,
-        location=(location[0], location[1], location[2] + half_h - rail_width/2)
-    )
-    apply_material_helper(top_rail, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(top_rail)
+    plan['frame'].append(piece_spec(
+        f"{name}_Rail_Top", width - 2*stile_width, panel_depth, rail_width,
+        (location[0], location[1], location[2] + half_h - rail_width/2),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Bottom rail (typically thicker)
-    bottom_rail = create_box_helper(
-        f"{name}_Rail_Bottom",
-        width=width - 2*stile_width,
-        depth=panel_depth,
-        height=rail_width,
-        location=(location[0], location[1], location[2] - half_h + rail_width/2)
-    )
-    apply_material_helper(bottom_rail, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(bottom_rail)
+    plan['frame'].append(piece_spec(
+        f"{name}_Rail_Bottom", width - 2*stile_width, panel_depth, rail_width,
+        (location[0], location[1], location[2] - half_h + rail_width/2),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # --- Calculate glass area ---
     glass_area_width = width - 2*stile_width
     glass_area_height = height - 2*rail_width
     glass_area_center_z = location[2]
 
-    # --- Create muntins ---
-    # Vertical muntins: cols-1 muntins
-    vertical_muntins_count = cols - 1
-    if vertical_muntins_count > 0:
-        glass_col_width = (glass_area_width - vertical_muntins_count * muntin_width) / cols
-        for i in range(vertical_muntins_count):
-            x_pos = location[0] - glass_area_width/2 + (i+1) * glass_col_width + i * muntin_width + muntin_width/2
-            v_muntin = create_box_helper(
-                f"{name}_VMuntin_{i+1}",
-                width=muntin_width,
-                depth=panel_depth,
-                height=glass_area_height,
-                location=(x_pos, location[1], glass_area_center_z)
-            )
-            apply_material_helper(v_muntin, frame_color, f"{name}_Muntin_Mat")
-            result['muntins'].append(v_muntin)
-    else:
-        glass_col_width = glass_area_width
-
-    # Horizontal muntins: rows-1 muntins
-    horizontal_muntins_count = rows - 1
-    if horizontal_muntins_count > 0:
-        glass_row_height = (glass_area_height - horizontal_muntins_count * muntin_width) / rows
-        for i in range(horizontal_muntins_count):
-            z_pos = glass_area_center_z + glass_area_height/2 - (i+1) * glass_row_height - i * muntin_width - muntin_width/2
-            h_muntin = create_box_helper(
-                f"{name}_HMuntin_{i+1}",
-                width=glass_area_width,
-                depth=panel_depth,
-                height=muntin_width,
-                location=(location[0], location[1], z_pos)
-            )
-            apply_material_helper(h_muntin, frame_color, f"{name}_Muntin_Mat")
-            result['muntins'].append(h_muntin)
-    else:
-        glass_row_height = glass_area_height
-
-    # --- Create glass panes ---
-    # Recalculate dimensions based on muntins
-    glass_col_width = (glass_area_width - vertical_muntins_count * muntin_width) / cols
-    glass_row_height = (glass_area_height - horizontal_muntins_count * muntin_width) / rows
-
-    pane_num = 1
-    for row in range(rows):
-        for col in range(cols):
-            # Calculate pane center position
-            x_pos = location[0] - glass_area_width/2 + col * (glass_col_width + muntin_width) + glass_col_width/2
-            z_pos = glass_area_center_z + glass_area_height/2 - row * (glass_row_height + muntin_width) - glass_row_height/2
-
-            glass_pane = create_box_helper(
-                f"{name}_Glass_{pane_num}",
-                width=glass_col_width,
-                depth=glass_thickness,
-                height=glass_row_height,
-                location=(x_pos, location[1], z_pos)
-            )
-            apply_material_helper(glass_pane, glass_color, f"{name}_Glass_Mat")
-            result['glass'].append(glass_pane)
-            pane_num += 1
+    plan_glass_grid(
+        plan, name, location, glass_area_width, glass_area_height, glass_area_center_z,
+        rows, cols, muntin_width, glass_thickness, panel_depth, frame_color, glass_color
+    )
 
-    return result
+    return plan
 
 
 def create_half_lite_door_panel(name, width, height, location, glass_ratio=0.5,
                                  stile_width=0.05, rail_width=0.08, mid_rail_width=0.10,
                                  muntin_width=0.03, glass_thickness=0.01, panel_depth=0.04,
                                  rows=3, cols=3, panel_inset=0.02,
-                                 frame_color="#FFFFFF", glass_color="#000000", panel_color="#FFFFFF"):
+                                 frame_color="#FFFFFF", glass_color="#000000", panel_color="#FFFFFF",
+                                 batched=False):
     """
     Create a half-lite door panel with upper glass grid and lower raised panels.
 
@@ -679,11 +627,32 @@ def create_half_lite_door_panel(name, width, height, location, glass_ratio=0.5,
         frame_color (str): Hex color for frame/muntins
         glass_color (str): Hex color for glass
         panel_color (str): Hex color for raised panels
+        batched (bool): If True, build one mesh object per group instead of
+            one object per piece (see create_french_door_panel)
 
     Returns:
         dict: Dictionary with 'frame', 'muntins', 'glass', 'panels' keys
     """
-    result = {'frame': [], 'muntins': [], 'glass': [], 'panels': []}
+    plan = plan_half_lite_door_panel(
+        name, width, height, location, glass_ratio, stile_width, rail_width, mid_rail_width,
+        muntin_width, glass_thickness, panel_depth, rows, cols, panel_inset,
+        frame_color, glass_color, panel_color
+    )
+    return build_piece_plan(name, plan, batched=batched)
+
+
+def plan_half_lite_door_panel(name, width, height, location, glass_ratio=0.5,
+                              stile_width=0.05, rail_width=0.08, mid_rail_width=0.10,
+                              muntin_width=0.03, glass_thickness=0.01, panel_depth=0.04,
+                              rows=3, cols=3, panel_inset=0.02,
+                              frame_color="#FFFFFF", glass_color="#000000", panel_color="#FFFFFF"):
+    """
+    Plan a half-lite door panel as piece_spec data (see create_half_lite_door_panel).
+
+    Returns:
+        dict: Piece plan with 'frame', 'muntins', 'glass', 'panels' lists
+    """
+    plan = {'frame': [], 'muntins': [], 'glass': [], 'panels': []}
 
     half_w = width / 2
     half_h = height / 2
@@ -695,161 +664,200 @@ def create_half_lite_door_panel(name, width, height, location, glass_ratio=0.5,
     # --- Create outer stiles and rails ---
 
     # Left stile (full height)
-    left_stile = create_box_helper(
-        f"{name}_Stile_Left",
-        width=stile_width,
-        depth=panel_depth,
-        height=height,
-        location=(location[0] - half_w + stile_width/2, location[1], location[2])
-    )
-    apply_material_helper(left_stile, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(left_stile)
+    plan['frame'].append(piece_spec(
+        f"{name}_Stile_Left", stile_width, panel_depth, height,
+        (location[0] - half_w + stile_width/2, location[1], location[2]),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Right stile (full height)
-    right_stile = create_box_helper(
-        f"{name}_Stile_Right",
-        width=stile_width,
-        depth=panel_depth,
-        height=height,
-        location=(location[0] + half_w - stile_width/2, location[1], location[2])
-    )
-    apply_material_helper(right_stile, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(right_stile)
+    plan['frame'].append(piece_spec(
+        f"{name}_Stile_Right", stile_width, panel_depth, height,
+        (location[0] + half_w - stile_width/2, location[1], location[2]),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Top rail
     inner_width = width - 2*stile_width
-    top_rail = create_box_helper(
-        f"{name}_Rail_Top",
-        width=inner_width,
-        depth=panel_depth,
-        height=rail_width,
-        location=(location[0], location[1], location[2] + half_h - rail_width/2)
-    )
-    apply_material_helper(top_rail, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(top_rail)
+    plan['frame'].append(piece_spec(
+        f"{name}_Rail_Top", inner_width, panel_depth, rail_width,
+        (location[0], location[1], location[2] + half_h - rail_width/2),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Bottom rail
-    bottom_rail = create_box_helper(
-        f"{name}_Rail_Bottom",
-        width=inner_width,
-        depth=panel_depth,
-        height=rail_width,
-        location=(location[0], location[1], location[2] - half_h + rail_width/2)
-    )
-    apply_material_helper(bottom_rail, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(bottom_rail)
+    plan['frame'].append(piece_spec(
+        f"{name}_Rail_Bottom", inner_width, panel_depth, rail_width,
+        (location[0], location[1], location[2] - half_h + rail_width/2),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # Mid rail (between glass and panel sections)
     mid_rail_z = location[2] + half_h - rail_width - glass_section_height - mid_rail_width/2
-    mid_rail = create_box_helper(
-        f"{name}_Rail_Mid",
-        width=inner_width,
-        depth=panel_depth,
-        height=mid_rail_width,
-        location=(location[0], location[1], mid_rail_z)
-    )
-    apply_material_helper(mid_rail, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(mid_rail)
+    plan['frame'].append(piece_spec(
+        f"{name}_Rail_Mid", inner_width, panel_depth, mid_rail_width,
+        (location[0], location[1], mid_rail_z),
+        frame_color, f"{name}_Frame_Mat"
+    ))
 
     # --- Glass section (upper) ---
-    glass_area_width = inner_width
-    glass_area_height = glass_section_height
     glass_center_z = location[2] + half_h - rail_width - glass_section_height/2
 
-    # Vertical muntins
-    vertical_muntins_count = cols - 1
-    if vertical_muntins_count > 0:
-        glass_col_width = (glass_area_width - vertical_muntins_count * muntin_width) / cols
-        for i in range(vertical_muntins_count):
-            x_pos = location[0] - glass_area_width/2 + (i+1) * glass_col_width + i * muntin_width + muntin_width/2
-            v_muntin = create_box_helper(
-                f"{name}_VMuntin_{i+1}",
-                width=muntin_width,
-                depth=panel_depth,
-                height=glass_area_height,
-                location=(x_pos, location[1], glass_center_z)
-            )
-            apply_material_helper(v_muntin, frame_color, f"{name}_Muntin_Mat")
-            result['muntins'].append(v_muntin)
-    else:
-        glass_col_width = glass_area_width
+    plan_glass_grid(
+        plan, name, location, inner_width, glass_section_height, glass_center_z,
+        rows, cols, muntin_width, glass_thickness, panel_depth, frame_color, glass_color
+    )
 
-    # Horizontal muntins
-    horizontal_muntins_count = rows - 1
-    if horizontal_muntins_count > 0:
-        glass_row_height = (glass_area_height - horizontal_muntins_count * muntin_width) / rows
-        for i in range(horizontal_muntins_count):
-            z_pos = glass_center_z + glass_area_height/2 - (i+1) * glass_row_height - i * muntin_width - muntin_width/2
-            h_muntin = create_box_helper(
-                f"{name}_HMuntin_{i+1}",
-                width=glass_area_width,
-                depth=panel_depth,
-                height=muntin_width,
-                location=(location[0], location[1], z_pos)
-            )
-            apply_material_helper(h_muntin, frame_color, f"{name}_Muntin_Mat")
-            result['muntins'].append(h_muntin)
-    else:
-        glass_row_height = glass_area_height
+    # --- Panel section (lower) with 2 raised panels ---
+    panel_area_height = panel_section_height
+    panel_center_z = location[2] - half_h + rail_width + panel_area_height/2
 
-    # Glass panes
+    # Center stile between panels
+    plan['frame'].append(piece_spec(
+        f"{name}_Stile_Center", stile_width, panel_depth, panel_area_height,
+        (location[0], location[1], panel_center_z),
+        frame_color, f"{name}_Frame_Mat"
+    ))
+
+    # Left raised panel
+    panel_width = (inner_width - stile_width) / 2
+    plan['panels'].append(piece_spec(
+        f"{name}_Panel_Left", panel_width - 0.02, panel_depth - panel_inset, panel_area_height - 0.02,  # Small gap
+        (location[0] - panel_width/2 - stile_width/4, location[1] + panel_inset/2, panel_center_z),
+        panel_color, f"{name}_Panel_Mat"
+    ))
+
+    # Right raised panel
+    plan['panels'].append(piece_spec(
+        f"{name}_Panel_Right", panel_width - 0.02, panel_depth - panel_inset, panel_area_height - 0.02,  # Small gap
+        (location[0] + panel_width/2 + stile_width/4, location[1] + panel_inset/2, panel_center_z),
+        panel_color, f"{name}_Panel_Mat"
+    ))
+
+    return plan
+
+
+def plan_glass_grid(plan, name, location, glass_area_width, glass_area_height, glass_area_center_z,
+                    rows, cols, muntin_width, glass_thickness, panel_depth, frame_color, glass_color):
+    """
+    Add muntins and glass panes for a rows × cols glass grid to a piece plan.
+
+    Args:
+        plan (dict): Piece plan with 'muntins' and 'glass' lists (modified in place)
+        name (str): Door panel base name
+        location (tuple): (x, y, z) door panel center (x and y are used)
+        glass_area_width (float): Width of the glazed area between stiles
+        glass_area_height (float): Height of the glazed area
+        glass_area_center_z (float): Z center of the glazed area
+        rows (int): Number of glass rows
+        cols (int): Number of glass columns
+        muntin_width (float): Width/height of muntin bars
+        glass_thickness (float): Glass pane thickness
+        panel_depth (float): Depth of muntins
+        frame_color (str): Hex color for muntins
+        glass_color (str): Hex color for glass
+    """
+    # Vertical muntins: cols-1 muntins
+    vertical_muntins_count = cols - 1
     glass_col_width = (glass_area_width - vertical_muntins_count * muntin_width) / cols
+    for i in range(vertical_muntins_count):
+        x_pos = location[0] - glass_area_width/2 + (i+1) * glass_col_width + i * muntin_width + muntin_width/2
+        plan['muntins'].append(piece_spec(
+            f"{name}_VMuntin_{i+1}", muntin_width, panel_depth, glass_area_height,
+            (x_pos, location[1], glass_area_center_z),
+            frame_color, f"{name}_Muntin_Mat"
+        ))
+
+    # Horizontal muntins: rows-1 muntins
+    horizontal_muntins_count = rows - 1
     glass_row_height = (glass_area_height - horizontal_muntins_count * muntin_width) / rows
+    for i in range(horizontal_muntins_count):
+        z_pos = glass_area_center_z + glass_area_height/2 - (i+1) * glass_row_height - i * muntin_width - muntin_width/2
+        plan['muntins'].append(piece_spec(
+            f"{name}_HMuntin_{i+1}", glass_area_width, panel_depth, muntin_width,
+            (location[0], location[1], z_pos),
+            frame_color, f"{name}_Muntin_Mat"
+        ))
 
+    # Glass panes
     pane_num = 1
     for row in range(rows):
         for col in range(cols):
+            # Calculate pane center position
             x_pos = location[0] - glass_area_width/2 + col * (glass_col_width + muntin_width) + glass_col_width/2
-            z_pos = glass_center_z + glass_area_height/2 - row * (glass_row_height + muntin_width) - glass_row_height/2
-
-            glass_pane = create_box_helper(
-                f"{name}_Glass_{pane_num}",
-                width=glass_col_width,
-                depth=glass_thickness,
-                height=glass_row_height,
-                location=(x_pos, location[1], z_pos)
-            )
-            apply_material_helper(glass_pane, glass_color, f"{name}_Glass_Mat")
-            result['glass'].append(glass_pane)
+            z_pos = glass_area_center_z + glass_area_height/2 - row * (glass_row_height + muntin_width) - glass_row_height/2
+
+            plan['glass'].append(piece_spec(
+                f"{name}_Glass_{pane_num}", glass_col_width, glass_thickness, glass_row_height,
+                (x_pos, location[1], z_pos),
+                glass_color, f"{name}_Glass_Mat"
+            ))
             pane_num += 1
 
-    # --- Panel section (lower) with 2 raised panels ---
-    panel_area_height = panel_section_height
-    panel_center_z = location[2] - half_h + rail_width + panel_area_height/2
 
-    # Center stile between panels
-    center_stile = create_box_helper(
-        f"{name}_Stile_Center",
-        width=stile_width,
-        depth=panel_depth,
-        height=panel_area_height,
-        location=(location[0], location[1], panel_center_z)
-    )
-    apply_material_helper(center_stile, frame_color, f"{name}_Frame_Mat")
-    result['frame'].append(center_stile)
+def piece_spec(name, width, depth, height, location, color, material_name, rotation_z=0):
+    """Describe one box piece as plain data (see blender_helpers.create_box_batch)."""
+    return {
+        'name': name,
+        'width': width,
+        'depth': depth,
+        'height': height,
+        'location': location,
+        'rotation_z': rotation_z,
+        'color': color,
+        'material_name': material_name
+    }
 
-    # Left raised panel
-    panel_width = (inner_width - stile_width) / 2
-    left_panel = create_box_helper(
-        f"{name}_Panel_Left",
-        width=panel_width - 0.02,  # Small gap
-        depth=panel_depth - panel_inset,
-        height=panel_area_height - 0.02,
-        location=(location[0] - panel_width/2 - stile_width/4, location[1] + panel_inset/2, panel_center_z)
-    )
-    apply_material_helper(left_panel, panel_color, f"{name}_Panel_Mat")
-    result['panels'].append(left_panel)
 
-    # Right raised panel
-    right_panel = create_box_helper(
-        f"{name}_Panel_Right",
-        width=panel_width - 0.02,  # Small gap
-        depth=panel_depth - panel_inset,
-        height=panel_area_height - 0.02,
-        location=(location[0] + panel_width/2 + stile_width/4, location[1] + panel_inset/2, panel_center_z)
-    )
-    apply_material_helper(right_panel, panel_color, f"{name}_Panel_Mat")
-    result['panels'].append(right_panel)
+@profiled()
+def build_piece_plan(name, plan, batched=False, instanced=True):
+    """
+    Build a piece plan, either as individual objects or one batched mesh per group.
+
+    Args:
+        name (str): Base name; batched groups are named "{name}_{Group}"
+        plan (dict): Mapping of group name (e.g. 'frame') to lists of piece_spec dicts
+        batched (bool): If True, build one create_box_batch object per non-empty group
+        instanced (bool): For individual objects, share one mesh between pieces
+            with identical dimensions and color (linked duplicates, see
+            blender_helpers.create_box_instanced)
+
+    Returns:
+        dict: Mapping of group name to list of created objects
+    """
+    result = {group: [] for group in plan}
+
+    for group, pieces in plan.items():
+        if not pieces:
+            continue
+
+        if batched:
+            result[group].append(create_box_batch_helper(f"{name}_{group.title()}", pieces))
+            continue
+
+        for piece in pieces:
+            if instanced:
+                obj = create_box_instanced_helper(
+                    piece['name'],
+                    width=piece['width'],
+                    depth=piece['depth'],
+                    height=piece['height'],
+                    location=piece['location'],
+                    color=piece['color'],
+                    material_name=piece['material_name']
+                )
+            else:
+                obj = create_box_helper(
+                    piece['name'],
+                    width=piece['width'],
+                    depth=piece['depth'],
+                    height=piece['height'],
+                    location=piece['location']
+                )
+                apply_material_helper(obj, piece['color'], piece['material_name'])
+            if piece.get('rotation_z', 0) != 0:
+                obj.rotation_euler[2] = piece['rotation_z']
+            result[group].append(obj)
 
     return result
 
@@ -891,6 +899,18 @@ def create_box_helper(name, width, depth, height, location):
     return create_box(name, width, depth, height, location)
 
 
+def create_box_instanced_helper(name, width, depth, height, location, color=None, material_name=None):
+    """Create linked-duplicate box using blender_helpers.create_box_instanced"""
+    from blender_helpers import create_box_instanced
+    return create_box_instanced(name, width, depth, height, location, color, material_name)
+
+
+def create_box_batch_helper(name, box_specs):
+    """Create batched box mesh using blender_helpers.create_box_batch"""
+    from blender_helpers import create_box_batch
+    return create_box_batch(name, box_specs)
+
+
 def apply_material_helper(obj, color_hex, material_name=None):
     """Apply material using blender_helpers.apply_material"""
     from blender_helpers import apply_material
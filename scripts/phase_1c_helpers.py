@@ -7,25 +7,12 @@ import bpy
 import bmesh
 from mathutils import Vector
 
-
-def hex_to_rgb(hex_color):
-    """Convert hex color string to RGB tuple (0-1 range)."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+from material_registry import get_material, hex_to_rgb
 
 
 def get_or_create_material(name, hex_color):
-    """Get existing material or create new one with given color."""
-    if name in bpy.data.materials:
-        return bpy.data.materials[name]
-
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get('Principled BSDF')
-    if bsdf:
-        rgb = hex_to_rgb(hex_color)
-        bsdf.inputs['Base Color'].default_value = (rgb[0], rgb[1], rgb[2], 1.0)
-    return mat
+    """Get the shared material for hex_color (named `name` if newly created)."""
+    return get_material(hex_color, name=name)
 
 
 def create_floor(interior_bounds, z_position=0.01, thickness=0.02, color="#8B7355"):
@@ -275,170 +262,29 @@ def create_vertical_wall(name, x_pos, y_start, y_end, height, thickness, z_botto
     return wall
 
 
-def build_interior_geometry():
+def build_interior_geometry(spec=None, batched=True):
     """
-    Build all Phase 1C interior geometry.
+    Build all Phase 1C interior geometry from interior_layout.yaml.
+
+    Partition walls are split at their doorways, and walls, doorway headers,
+    floor and ceiling are built in one pass (see interior_layout).
+
+    Args:
+        spec: Loaded interior_layout.yaml (default: load work/spec/phase_1c)
+        batched: One mesh per group (walls, headers, floor, ceiling) instead of
+            one object per piece
+
     Returns list of created objects.
     """
-    created_objects = []
-
-    # Interior bounds (from spec)
-    interior_bounds = {
-        'left_x': -4.07,
-        'right_x': 4.07,
-        'front_y': -7.32,
-        'back_y': 7.32
-    }
-
-    # Phase 1C colors
-    FLOOR_COLOR = "#8B7355"
-    CEILING_COLOR = "#F5F5DC"
-    WALL_COLOR = "#D3D3D3"
-
-    # Wall parameters
-    WALL_THICKNESS = 0.10
-    WALL_HEIGHT = 3.60
-    Z_BOTTOM = 0.01
-    DOORWAY_WIDTH = 0.9
-    DOORWAY_HEIGHT = 2.1
-
-    # Create floor
-    floor = create_floor(interior_bounds, z_position=0.01, thickness=0.02, color=FLOOR_COLOR)
-    created_objects.append(floor)
-    print(f"Created: {floor.name}")
-
-    # Create ceiling
-    ceiling = create_ceiling(interior_bounds, z_position=3.58, thickness=0.02, color=CEILING_COLOR)
-    created_objects.append(ceiling)
-    print(f"Created: {ceiling.name}")
-
-    # Create partition walls
-
-    # 1. Storefront back wall (horizontal wall at y=-1.0, from left edge to hallway)
-    storefront_wall = create_horizontal_wall(
-        name="Interior_Storefront_BackWall",
-        y_pos=-1.0,
-        x_start=-4.07,
-        x_end=0.0,
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(storefront_wall)
-    print(f"Created: {storefront_wall.name}")
-
-    # 2. Hallway left wall (vertical wall at x=0.0, from y=-1.0 to back)
-    hallway_left_wall = create_vertical_wall(
-        name="Interior_Hallway_LeftWall",
-        x_pos=0.0,
-        y_start=-1.0,
-        y_end=7.32,
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(hallway_left_wall)
-    print(f"Created: {hallway_left_wall.name}")
-
-    # 3. Hallway right wall with two doorways (at x=2.0)
-    # Door to Room 2 at y=1.75, Door to Room 1 at y=5.0
-    # We need to create segments around the doorways
-
-    # Segment from y=-1.0 to first door (y=1.75 - 0.45 = 1.30)
-    seg1 = create_vertical_wall(
-        name="Interior_Hallway_RightWall_Seg1",
-        x_pos=2.0,
-        y_start=-1.0,
-        y_end=1.30,  # Door center 1.75 - half width 0.45
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(seg1)
-    print(f"Created: {seg1.name}")
-
-    # Header above Room 2 door
-    header1_height = WALL_HEIGHT - DOORWAY_HEIGHT
-    header1 = create_horizontal_wall(
-        name="Interior_Room2_Door_Header",
-        y_pos=1.75,
-        x_start=2.0 - WALL_THICKNESS/2,
-        x_end=2.0 + WALL_THICKNESS/2,
-        height=header1_height,
-        thickness=DOORWAY_WIDTH,
-        z_bottom=Z_BOTTOM + DOORWAY_HEIGHT,
-        color=WALL_COLOR
-    )
-    # Fix orientation - this should be a vertical slice
-    bpy.data.objects.remove(header1, do_unlink=True)
-
-    # Create header properly
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(2.0, 1.75, Z_BOTTOM + DOORWAY_HEIGHT + header1_height/2))
-    header1 = bpy.context.active_object
-    header1.name = "Interior_Room2_Door_Header"
-    header1.scale = (WALL_THICKNESS, DOORWAY_WIDTH, header1_height)
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    mat = get_or_create_material("Phase1C_Interior_Wall", WALL_COLOR)
-    header1.data.materials.append(mat)
-    created_objects.append(header1)
-    print(f"Created: {header1.name}")
-
-    # Segment between doors (y=2.20 to y=4.55)
-    seg2 = create_vertical_wall(
-        name="Interior_Hallway_RightWall_Seg2",
-        x_pos=2.0,
-        y_start=2.20,  # Door center 1.75 + half width 0.45
-        y_end=4.55,    # Door center 5.0 - half width 0.45
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(seg2)
-    print(f"Created: {seg2.name}")
-
-    # Header above Room 1 door
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(2.0, 5.0, Z_BOTTOM + DOORWAY_HEIGHT + header1_height/2))
-    header2 = bpy.context.active_object
-    header2.name = "Interior_Room1_Door_Header"
-    header2.scale = (WALL_THICKNESS, DOORWAY_WIDTH, header1_height)
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    header2.data.materials.append(mat)
-    created_objects.append(header2)
-    print(f"Created: {header2.name}")
-
-    # Segment from second door to back wall (y=5.45 to y=7.32)
-    seg3 = create_vertical_wall(
-        name="Interior_Hallway_RightWall_Seg3",
-        x_pos=2.0,
-        y_start=5.45,  # Door center 5.0 + half width 0.45
-        y_end=7.32,
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(seg3)
-    print(f"Created: {seg3.name}")
-
-    # 4. Room 1/Room 2 divider (horizontal wall at y=3.5)
-    room_divider = create_horizontal_wall(
-        name="Interior_Room_Divider",
-        y_pos=3.5,
-        x_start=2.0,
-        x_end=4.07,
-        height=WALL_HEIGHT,
-        thickness=WALL_THICKNESS,
-        z_bottom=Z_BOTTOM,
-        color=WALL_COLOR
-    )
-    created_objects.append(room_divider)
-    print(f"Created: {room_divider.name}")
+    from interior_layout import load_interior_spec, plan_interior_layout, build_interior_layout
+
+    plan = plan_interior_layout(spec if spec is not None else load_interior_spec())
+    created_objects = build_interior_layout(plan, batched=batched)
+    for obj in created_objects:
+        print(f"Created: {obj.name}")
 
-    print(f"\nPhase 1C: Created {len(created_objects)} interior objects")
+    pieces = sum(len(group) for group in plan['groups'].values())
+    print(f"\nPhase 1C: Created {len(created_objects)} interior objects ({pieces} pieces)")
     return created_objects
 
 
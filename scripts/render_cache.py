@@ -0,0 +1,261 @@
+"""
+Render Result Cache
+
+Content-addressed store for rendered view PNGs, keyed on a hash of everything
+that affects the image (visible geometry, materials, camera, render settings;
+see render_views.compute_view_hash). A view whose hash matches an earlier
+render is hard-linked (or copied) from the cache instead of re-rendered.
+
+The cache lives under work/renders/.cache. Each entry is a <key>.png plus a
+small <key>.json recording its size and last use; there is no shared index,
+so several render processes (render_parallel.py) can use one cache at once.
+Every file is written to a per-process temporary name and moved into place
+atomically. Once the cache exceeds its size limit the least recently used
+entries are evicted.
+
+Pure Python (no Blender).
+
+Usage:
+    from render_cache import RenderCache
+
+    cache = RenderCache()
+    if not cache.fetch(key, "work/renders/iter_050/top.png"):
+        render(...)
+        cache.store(key, "work/renders/iter_050/top.png", view="top")
+
+    python scripts/render_cache.py            # show cache statistics
+    python scripts/render_cache.py --clear    # empty the cache
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / 'work' / 'renders' / '.cache'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# PNGs without metadata older than this are leftovers of an interrupted store
+ORPHAN_AGE_S = 3600
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered PNGs, safe for concurrent processes."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Cache directory (created if missing)
+            max_bytes: Total size limit for cached PNGs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def _write_atomic(self, path, write):
+        """Write via a temporary file unique to this process, then move into place."""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _write_entry(self, key, entry):
+        def write(tmp_path):
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+        self._write_atomic(self._entry_path(key), write)
+
+    def _read_entry(self, key):
+        """Entry metadata, or None if missing, unreadable or its PNG is gone."""
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(entry, dict) or 'file' not in entry or not (self.cache_dir / entry['file']).exists():
+            return None
+        return entry
+
+    def entries(self):
+        """
+        Get every complete cache entry.
+
+        Returns:
+            dict: key -> entry ('file', 'view', 'size', 'created', 'last_used', 'hits')
+        """
+        entries = {}
+        for path in self.cache_dir.glob('*.json'):
+            entry = self._read_entry(path.stem)
+            if entry is not None:
+                entries[path.stem] = entry
+        return entries
+
+    def total_bytes(self):
+        """Total size of cached PNGs."""
+        return sum(entry['size'] for entry in self.entries().values())
+
+    def fetch(self, key, dest_path):
+        """
+        Place the cached render for key at dest_path.
+
+        Args:
+            key: View hash
+            dest_path: Where the PNG should appear
+
+        Returns:
+            bool: True on cache hit (file placed), False on miss
+        """
+        entry = self._read_entry(key)
+        if entry is None:
+            self.misses += 1
+            return False
+
+        source = self.cache_dir / entry['file']
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.exists():
+            dest_path.unlink()
+
+        try:
+            try:
+                os.link(source, dest_path)
+            except OSError:
+                # Cross-device or no hard-link support: copy instead
+                shutil.copy2(source, dest_path)
+        except FileNotFoundError:
+            # Evicted by another process since the entry was read
+            self.misses += 1
+            return False
+
+        entry['last_used'] = time.time()
+        entry['hits'] = entry.get('hits', 0) + 1
+        try:
+            self._write_entry(key, entry)
+        except OSError:
+            # Usage stats are best effort; the render was placed
+            pass
+        self.hits += 1
+        return True
+
+    def store(self, key, png_path, view=None):
+        """
+        Add a freshly rendered PNG to the cache, evicting LRU entries if needed.
+
+        The PNG is moved into place before its metadata, so readers never see
+        an entry without its image.
+
+        Args:
+            key: View hash
+            png_path: Rendered PNG
+            view: View name (for the metadata only)
+        """
+        png_path = Path(png_path)
+        if not png_path.exists():
+            return
+
+        filename = f"{key}.png"
+        self._write_atomic(self.cache_dir / filename, lambda tmp_path: shutil.copy2(png_path, tmp_path))
+        now = time.time()
+        self._write_entry(key, {
+            'file': filename,
+            'view': view,
+            'size': png_path.stat().st_size,
+            'created': now,
+            'last_used': now,
+            'hits': 0,
+        })
+        self.evict()
+
+    def _remove(self, key, filename):
+        self._entry_path(key).unlink(missing_ok=True)
+        (self.cache_dir / filename).unlink(missing_ok=True)
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+
+        Also removes PNGs left without metadata (a process killed mid-store)
+        once they are older than ORPHAN_AGE_S.
+        """
+        entries = self.entries()
+        cutoff = time.time() - ORPHAN_AGE_S
+        for png in self.cache_dir.glob('*.png'):
+            try:
+                if png.stem not in entries and png.stat().st_mtime < cutoff:
+                    png.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+
+        total = sum(entry['size'] for entry in entries.values())
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            self._remove(key, entry['file'])
+            total -= entry['size']
+
+    def clear(self):
+        """Remove every cached render."""
+        for key, entry in self.entries().items():
+            self._remove(key, entry['file'])
+        for png in self.cache_dir.glob('*.png'):
+            png.unlink(missing_ok=True)
+        # Index from before entries had their own metadata
+        (self.cache_dir / 'index.json').unlink(missing_ok=True)
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses (this session)
+        """
+        entries = self.entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(entry['size'] for entry in entries.values()),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Inspect or clear the render result cache")
+    parser.add_argument("--cache_dir", default=str(DEFAULT_CACHE_DIR))
+    parser.add_argument("--clear", action="store_true", help="Remove every cached render")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+    cache = RenderCache(args.cache_dir)
+
+    if args.clear:
+        cache.clear()
+        print(f"✓ Cleared render cache: {cache.cache_dir}")
+        return 0
+
+    stats = cache.stats()
+    print(f"Render cache: {cache.cache_dir}")
+    print(f"  Entries: {stats['entries']}")
+    print(f"  Size:    {stats['bytes'] / 1024 / 1024:.1f} MB / {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Parallel Multi-View Renderer
+
+Splits the standard views (front, left, right, rear, iso, top) across N
+headless Blender processes that all load the same saved .blend, and gathers
+the PNGs into work/renders/<iteration>/. Each process gets a fixed slice of
+the CPU cores, so wall-clock render time scales with the core count instead
+of leaving most cores idle during Eevee/Workbench renders.
+
+Writes render_manifest.json next to the PNGs with per-view and per-worker timing.
+
+Usage:
+    python scripts/render_parallel.py --blend exports/blend/building_iter_050.blend --iteration iter_050
+    python scripts/render_parallel.py --blend scene.blend --out_dir work/renders/test --workers 3 --engine BLENDER_EEVEE
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from blender_worker_client import find_blender
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RENDER_SCRIPT = PROJECT_ROOT / 'scripts' / 'blender' / 'render_views.py'
+VIEW_NAMES = ["front", "left", "right", "rear", "iso", "top"]
+
+
+def split_views(views, workers):
+    """
+    Distribute views round-robin across workers.
+
+    Args:
+        views: View names
+        workers: Number of worker processes
+
+    Returns:
+        list: One list of views per worker (no empty lists)
+
+    Example:
+        >>> split_views(["front", "left", "right", "rear", "iso", "top"], 4)
+        [['front', 'iso'], ['left', 'top'], ['right'], ['rear']]
+    """
+    workers = max(1, min(workers, len(views)))
+    return [views[i::workers] for i in range(workers)]
+
+
+def render_parallel(blend_path, out_dir, views=VIEW_NAMES, workers=None, resolution=(1920, 1080),
+                    samples=128, engine=None, blender_path=None):
+    """
+    Render views in parallel Blender processes.
+
+    Args:
+        blend_path: Saved .blend file every worker loads
+        out_dir: Directory for <view>.png and render_manifest.json
+        views: Views to render
+        workers: Process count (default: one per view, capped by CPU count)
+        resolution: (width, height)
+        samples: Cycles samples
+        engine: Render engine override
+        blender_path: Blender executable (default: find_blender())
+
+    Returns:
+        dict: Render manifest
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    timing_dir = out_dir / '.timing'
+    timing_dir.mkdir(exist_ok=True)
+
+    cpu_count = os.cpu_count() or 1
+    workers = workers or min(len(views), cpu_count)
+    chunks = split_views(list(views), workers)
+    threads = max(1, cpu_count // len(chunks))
+    blender_path = blender_path or find_blender()
+
+    print(f"Rendering {len(views)} view(s) with {len(chunks)} worker(s), {threads} thread(s) each")
+
+    start = time.perf_counter()
+    processes = []
+    for i, chunk in enumerate(chunks):
+        timing_json = timing_dir / f"worker_{i}.json"
+        cmd = [
+            blender_path, "-b", str(blend_path), "-P", str(RENDER_SCRIPT), "--",
+            "--output_dir", str(out_dir),
+            "--resolution_x", str(resolution[0]),
+            "--resolution_y", str(resolution[1]),
+            "--samples", str(samples),
+            "--threads", str(threads),
+            "--timing_json", str(timing_json),
+            "--views", *chunk,
+        ]
+        if engine:
+            cmd += ["--engine", engine]
+
+        log = open(timing_dir / f"worker_{i}.log", 'wb')
+        process = subprocess.Popen(cmd, cwd=str(PROJECT_ROOT), stdout=log, stderr=subprocess.STDOUT)
+        processes.append((i, chunk, process, log, time.perf_counter(), timing_json))
+
+    worker_reports = []
+    view_reports = {}
+    for i, chunk, process, log, started, timing_json in processes:
+        exit_code = process.wait()
+        log.close()
+        wall_s = time.perf_counter() - started
+
+        timings, cached = {}, []
+        if timing_json.exists():
+            with open(timing_json, 'r') as f:
+                timing = json.load(f)
+            timings, cached = timing.get('views', {}), timing.get('cached', [])
+
+        worker_reports.append({'worker': i, 'views': chunk, 'exit_code': exit_code, 'wall_s': wall_s})
+        for view in chunk:
+            png = out_dir / f"{view}.png"
+            view_reports[view] = {
+                'png': str(png) if png.exists() else None,
+                'worker': i,
+                'render_s': timings.get(view),
+                'cached': view in cached,
+            }
+
+        status = "✓" if exit_code == 0 else "❌"
+        print(f"{status} Worker {i} ({', '.join(chunk)}): {wall_s:.1f}s")
+
+    wall_s = time.perf_counter() - start
+    render_s = sum(v['render_s'] or 0 for v in view_reports.values())
+
+    manifest = {
+        'timestamp': datetime.now().isoformat(),
+        'blend': str(blend_path),
+        'resolution': list(resolution),
+        'engine': engine,
+        'cpu_count': cpu_count,
+        'threads_per_worker': threads,
+        'wall_s': wall_s,
+        'render_s_total': render_s,
+        'speedup': render_s / wall_s if wall_s else None,
+        'workers': worker_reports,
+        'views': view_reports,
+    }
+    with open(out_dir / 'render_manifest.json', 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Render standard views in parallel Blender processes")
+    parser.add_argument("--blend", required=True, help="Saved .blend file to render")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--iteration", help="Output to work/renders/<iteration>/ (e.g. iter_050)")
+    target.add_argument("--out_dir", help="Explicit output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per view)")
+    parser.add_argument("--views", nargs="+", default=VIEW_NAMES, choices=VIEW_NAMES)
+    parser.add_argument("--resolution_x", type=int, default=1920)
+    parser.add_argument("--resolution_y", type=int, default=1080)
+    parser.add_argument("--samples", type=int, default=128)
+    parser.add_argument("--engine", default=None, help="CYCLES, BLENDER_EEVEE or BLENDER_WORKBENCH")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    blend_path = Path(args.blend)
+    if not blend_path.exists():
+        print(f"ERROR: .blend file not found: {blend_path}")
+        return 1
+
+    out_dir = Path(args.out_dir) if args.out_dir else PROJECT_ROOT / 'work' / 'renders' / args.iteration
+
+    print("=" * 70)
+    print(" Parallel View Render")
+    print("=" * 70)
+
+    manifest = render_parallel(
+        blend_path, out_dir, views=args.views, workers=args.workers,
+        resolution=(args.resolution_x, args.resolution_y),
+        samples=args.samples, engine=args.engine
+    )
+
+    missing = [view for view, report in manifest['views'].items() if not report['png']]
+    print(f"\nWall clock: {manifest['wall_s']:.1f}s "
+          f"(sum of view renders {manifest['render_s_total']:.1f}s)")
+    print(f"Manifest: {out_dir / 'render_manifest.json'}")
+
+    if missing:
+        print(f"❌ Missing renders: {', '.join(missing)}")
+        return 1
+
+    print("✅ All views rendered")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
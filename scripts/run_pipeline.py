@@ -0,0 +1,540 @@
+"""
+Pipeline Runner
+Cross-platform replacement for run_iteration.ps1 / new_iteration.ps1
+
+Runs one iteration as a DAG of stages with declared inputs and outputs:
+
+    spec ──> build ──┬──> render
+                     ├──> metrics
+                     └──> validate
+
+    spec     - validate the spec (spec_loader, in-process)
+    build    - headless Blender build_from_spec.py: geometry, GLB export,
+               saved .blend and build metrics (one Blender process)
+    render   - render_parallel.py from the saved .blend
+    metrics  - glb_analyzer.py per-node analysis of the GLB (no Blender)
+    validate - validate_geometry.py on the GLB (no Blender)
+
+A stage is skipped when the hash of its inputs (file contents, including
+upstream outputs) matches the last successful run and its outputs still
+exist. A stage's scripts are declared together with every project module
+they import, directly or indirectly (script_closure), so editing a helper
+re-runs the stages that use it. Stages whose dependencies are done run concurrently, so render,
+metrics and validation overlap. Every run writes per-stage logs, the cache
+state and a timing report to work/logs/iter_###/.
+
+Usage:
+    python scripts/run_pipeline.py run                     # latest spec, next iteration
+    python scripts/run_pipeline.py run --iteration 12      # re-run iter_012, skipping up-to-date stages
+    python scripts/run_pipeline.py run --dry-run           # show which stages would run
+    python scripts/run_pipeline.py new-spec -m "Raise parapet level 2"
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
+from pathlib import Path
+
+from blender_worker_client import find_blender
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / 'scripts'
+SPEC_DIR = PROJECT_ROOT / 'work' / 'spec'
+RENDERS_DIR = PROJECT_ROOT / 'work' / 'renders'
+LOGS_DIR = PROJECT_ROOT / 'work' / 'logs'
+
+STATE_VERSION = 1
+SPEC_PATTERN = re.compile(r'building_v(\d+)\.yaml$')
+
+
+class Stage:
+    """One pipeline step: a command or a Python callable plus its declared files."""
+
+    def __init__(self, name, action, inputs=(), outputs=(), deps=()):
+        """
+        Args:
+            name: Stage name
+            action: Command (list of str, run as a subprocess) or a callable
+                taking the stage's log file
+            inputs: Files or directories the stage reads
+            outputs: Files or directories the stage must produce
+            deps: Names of stages that must finish first
+        """
+        self.name = name
+        self.action = action
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.deps = list(deps)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, deps={self.deps})"
+
+
+def file_digest(path):
+    """
+    Hash a file's contents, or every file under a directory.
+
+    Returns:
+        str: Hex SHA-256, or None if the path does not exist
+    """
+    path = Path(path)
+    if path.is_file():
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        return h.hexdigest()
+    if path.is_dir():
+        h = hashlib.sha256()
+        for child in sorted(p for p in path.rglob('*') if p.is_file()):
+            h.update(str(child.relative_to(path)).encode('utf-8'))
+            h.update(file_digest(child).encode('ascii'))
+        return h.hexdigest()
+    return None
+
+
+def stage_input_hash(stage):
+    """Hash a stage's action and the current contents of all its inputs."""
+    action = stage.action if isinstance(stage.action, (list, tuple)) else getattr(stage.action, '__qualname__', '')
+    h = hashlib.sha256(json.dumps([stage.name, list(map(str, action))]).encode('utf-8'))
+    for path in stage.inputs:
+        h.update(str(path).encode('utf-8'))
+        h.update((file_digest(path) or 'missing').encode('ascii'))
+    return h.hexdigest()
+
+
+def script_imports(script, scripts_dir=SCRIPTS_DIR):
+    """
+    Project modules a script imports, at any level (including imports inside functions).
+
+    Args:
+        script: Python file to parse
+        scripts_dir: Directory holding the project modules
+
+    Returns:
+        list: Paths of the imported modules found in scripts_dir
+    """
+    tree = ast.parse(Path(script).read_text(encoding='utf-8'), filename=str(script))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split('.')[0])
+    return sorted(p for p in (Path(scripts_dir) / f"{name}.py" for name in names) if p.is_file())
+
+
+def script_closure(*scripts, scripts_dir=SCRIPTS_DIR):
+    """
+    Scripts plus every project module they import, transitively.
+
+    Args:
+        *scripts: Entry-point Python files
+        scripts_dir: Directory holding the project modules
+
+    Returns:
+        list: Paths, entry points first, without duplicates
+    """
+    closure = []
+    pending = [Path(s) for s in scripts]
+    while pending:
+        script = pending.pop(0)
+        if script in closure:
+            continue
+        closure.append(script)
+        if script.is_file():
+            pending.extend(script_imports(script, scripts_dir))
+    return closure
+
+
+def topological_order(stages):
+    """
+    Order stages so every stage comes after its dependencies.
+
+    Raises:
+        ValueError: On duplicate names, unknown dependencies or cycles
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage '{stage.name}'")
+        by_name[stage.name] = stage
+
+    order, visiting, done = [], set(), set()
+
+    def visit(stage):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"Dependency cycle through stage '{stage.name}'")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+            visit(by_name[dep])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+        order.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return order
+
+
+def load_state(state_path):
+    """Load the stage cache state ({stage: {'input_hash', ...}}), empty if missing or stale."""
+    try:
+        with open(state_path, 'r') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return state.get('stages', {}) if state.get('version') == STATE_VERSION else {}
+
+
+def save_state(state_path, stages):
+    """Write the stage cache state atomically."""
+    state_path = Path(state_path)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_name(f".{state_path.name}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': STATE_VERSION, 'stages': stages}, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def is_up_to_date(stage, input_hash, state):
+    """Check whether a stage can be skipped."""
+    previous = state.get(stage.name)
+    return (previous is not None and previous.get('input_hash') == input_hash
+            and all(path.exists() for path in stage.outputs))
+
+
+def execute_stage(stage, log_path):
+    """
+    Run one stage, logging its output.
+
+    Returns:
+        float: Elapsed seconds
+
+    Raises:
+        RuntimeError: If the command fails or a declared output is missing
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    for path in stage.outputs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with open(log_path, 'w') as log:
+        if callable(stage.action):
+            stage.action(log)
+        else:
+            log.write("$ " + " ".join(map(str, stage.action)) + "\n")
+            log.flush()
+            exit_code = subprocess.call([str(a) for a in stage.action], cwd=str(PROJECT_ROOT),
+                                        stdout=log, stderr=subprocess.STDOUT)
+            if exit_code != 0:
+                raise RuntimeError(f"exited with code {exit_code} (see {log_path})")
+    elapsed = time.perf_counter() - start
+
+    missing = [str(path) for path in stage.outputs if not path.exists()]
+    if missing:
+        raise RuntimeError(f"did not produce {', '.join(missing)}")
+    return elapsed
+
+
+def run_pipeline(stages, log_dir, force=False, max_workers=None, dry_run=False):
+    """
+    Run a stage DAG, skipping up-to-date stages and overlapping independent ones.
+
+    Args:
+        stages: List of Stage
+        log_dir: Directory for <stage>.log, pipeline_state.json and pipeline_report.json
+        force: Run every stage even if its inputs are unchanged
+        max_workers: Concurrent stages (default: all ready stages)
+        dry_run: Only report which stages would run (inputs hashed as they are now)
+
+    Returns:
+        dict: Report with per-stage 'status' (ran, skipped, failed, blocked,
+            would_run), 'elapsed_s', 'error', plus 'wall_s' and 'passed'
+    """
+    log_dir = Path(log_dir)
+    order = topological_order(stages)
+    state_path = log_dir / 'pipeline_state.json'
+    state = {} if force else load_state(state_path)
+    new_state = dict(state)
+    results = {stage.name: {'status': 'pending', 'elapsed_s': 0.0, 'error': None} for stage in order}
+
+    if dry_run:
+        for stage in order:
+            skip = is_up_to_date(stage, stage_input_hash(stage), state)
+            results[stage.name]['status'] = 'skipped' if skip else 'would_run'
+        return {'stages': results, 'wall_s': 0.0, 'passed': True}
+
+    start = time.perf_counter()
+    pending = list(order)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(order) or 1) as pool:
+        while pending or running:
+            # Start (or skip) every stage whose dependencies are done
+            for stage in list(pending):
+                statuses = [results[dep]['status'] for dep in stage.deps]
+                if any(s in ('failed', 'blocked') for s in statuses):
+                    results[stage.name]['status'] = 'blocked'
+                    pending.remove(stage)
+                    print(f"  ✗ {stage.name}: blocked by failed dependency")
+                    continue
+                if not all(s in ('ran', 'skipped') for s in statuses):
+                    continue
+
+                pending.remove(stage)
+                input_hash = stage_input_hash(stage)
+                if is_up_to_date(stage, input_hash, state):
+                    results[stage.name]['status'] = 'skipped'
+                    print(f"  ↺ {stage.name}: inputs unchanged, skipped")
+                    continue
+
+                print(f"  ▶ {stage.name}: running...")
+                future = pool.submit(execute_stage, stage, log_dir / f"{stage.name}.log")
+                running[future] = (stage, input_hash)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, input_hash = running.pop(future)
+                result = results[stage.name]
+                try:
+                    result['elapsed_s'] = future.result()
+                except Exception as e:
+                    result['status'] = 'failed'
+                    result['error'] = str(e)
+                    new_state.pop(stage.name, None)
+                    print(f"  ❌ {stage.name}: {e}")
+                else:
+                    result['status'] = 'ran'
+                    new_state[stage.name] = {
+                        'input_hash': input_hash,
+                        'elapsed_s': result['elapsed_s'],
+                        'timestamp': datetime.now().isoformat(),
+                    }
+                    print(f"  ✓ {stage.name}: {result['elapsed_s']:.1f}s")
+                save_state(state_path, new_state)
+
+    wall_s = time.perf_counter() - start
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'wall_s': wall_s,
+        'stage_s_total': sum(r['elapsed_s'] for r in results.values()),
+        'passed': all(r['status'] in ('ran', 'skipped') for r in results.values()),
+        'stages': results,
+    }
+    with open(log_dir / 'pipeline_report.json', 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def latest_spec(spec_dir=SPEC_DIR):
+    """
+    Find the highest building_v###.yaml.
+
+    Returns:
+        tuple: (version int, Path)
+
+    Raises:
+        FileNotFoundError: If there are no versioned specs
+    """
+    versions = []
+    for path in Path(spec_dir).glob('building_v*.yaml'):
+        match = SPEC_PATTERN.search(path.name)
+        if match:
+            versions.append((int(match.group(1)), path))
+    if not versions:
+        raise FileNotFoundError(f"No building_v###.yaml specs in {spec_dir}")
+    return max(versions)
+
+
+def next_iteration(renders_dir=RENDERS_DIR):
+    """Next iteration number (one past the highest work/renders/iter_### directory)."""
+    numbers = [int(m.group(1)) for p in Path(renders_dir).glob('iter_*')
+               if p.is_dir() and (m := re.match(r'iter_(\d+)$', p.name))]
+    return max(numbers, default=0) + 1
+
+
+def iteration_stages(spec_path, iteration, blender_path=None, python=None, render_workers=None):
+    """
+    Build the standard iteration DAG (same outputs as run_iteration.ps1).
+
+    Args:
+        spec_path: Spec YAML to build
+        iteration: Iteration number
+        blender_path: Blender executable (default: find_blender())
+        python: Python for the offline stages (default: this interpreter)
+        render_workers: Blender processes for rendering (default: render_parallel's)
+
+    Returns:
+        list: Stages spec, build, render, metrics, validate
+    """
+    blender_path = blender_path or find_blender()
+    python = python or sys.executable
+    tag = f"iter_{iteration:03d}"
+    glb = PROJECT_ROOT / 'exports' / 'glb' / f"building_{tag}.glb"
+    blend = PROJECT_ROOT / 'exports' / 'blend' / f"building_{tag}.blend"
+    renders_dir = RENDERS_DIR / tag
+    metrics_json = PROJECT_ROOT / 'work' / 'metrics' / f"metrics_{iteration:03d}.json"
+    analysis_json = PROJECT_ROOT / 'work' / 'metrics' / f"glb_analysis_{iteration:03d}.json"
+    blender_dir = SCRIPTS_DIR / 'blender'
+
+    def validate_spec(log):
+        from spec_loader import load_spec
+
+        spec = load_spec(spec_path)
+        log.write(f"{spec_path}: {spec.kind} spec, version {spec.version}\n")
+
+    render_cmd = [python, SCRIPTS_DIR / 'render_parallel.py', '--blend', blend, '--out_dir', renders_dir]
+    if render_workers:
+        render_cmd += ['--workers', str(render_workers)]
+
+    return [
+        Stage('spec', validate_spec,
+              inputs=[spec_path, *script_closure(SCRIPTS_DIR / 'spec_loader.py')]),
+        Stage('build',
+              [blender_path, '-b', '-P', blender_dir / 'build_from_spec.py', '--',
+               '--spec', spec_path, '--out_glb', glb, '--out_blend', blend,
+               '--out_renders_dir', renders_dir, '--out_metrics_json', metrics_json],
+              inputs=[spec_path, *script_closure(blender_dir / 'build_from_spec.py')],
+              outputs=[glb, blend, metrics_json],
+              deps=['spec']),
+        Stage('render', render_cmd,
+              inputs=[blend, *script_closure(SCRIPTS_DIR / 'render_parallel.py', blender_dir / 'render_views.py')],
+              outputs=[renders_dir / 'render_manifest.json'],
+              deps=['build']),
+        Stage('metrics',
+              [python, SCRIPTS_DIR / 'glb_analyzer.py', glb, '--out', analysis_json],
+              inputs=[glb, *script_closure(SCRIPTS_DIR / 'glb_analyzer.py')],
+              outputs=[analysis_json],
+              deps=['build']),
+        Stage('validate',
+              [python, SCRIPTS_DIR / 'validate_geometry.py', '--glb', glb],
+              inputs=[glb, *script_closure(SCRIPTS_DIR / 'validate_geometry.py')],
+              deps=['build']),
+    ]
+
+
+def create_next_spec(message=None, spec_dir=SPEC_DIR, dry_run=False):
+    """
+    Copy the latest building_v###.yaml to the next version (new_iteration.ps1).
+
+    A header with the timestamp, previous version and change message is
+    prepended, and a 'version: v###' line is updated to the new version.
+
+    Returns:
+        Path: The new spec path
+
+    Raises:
+        FileNotFoundError: If there is no spec to copy
+        FileExistsError: If the next version already exists
+    """
+    version, path = latest_spec(spec_dir)
+    next_path = Path(spec_dir) / f"building_v{version + 1:03d}.yaml"
+    if next_path.exists():
+        raise FileExistsError(f"Next version already exists: {next_path}")
+    if dry_run:
+        return next_path
+
+    message = message or f"New iteration from v{version:03d}"
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    header = (
+        f"# Updated: {timestamp}\n"
+        f"# Previous version: v{version:03d}\n"
+        f"# Changes: {message}\n"
+        f"# Version: v{version:03d} -> v{version + 1:03d}\n"
+        f"#\n"
+    )
+    content = path.read_text(encoding='utf-8')
+    content, count = re.subn(r'(?m)^version:\s*v\d+', f"version: v{version + 1:03d}", content)
+    if not count:
+        print("⚠️  No version field found in spec, leaving it unchanged")
+
+    next_path.write_text(header + content, encoding='utf-8')
+    return next_path
+
+
+def print_report(report):
+    """Print the per-stage timing table."""
+    print(f"\n{'Stage':<12} {'Status':<10} {'Time':>9}")
+    print("-" * 33)
+    for name, result in report['stages'].items():
+        elapsed = f"{result['elapsed_s']:.1f}s" if result['status'] == 'ran' else "-"
+        print(f"{name:<12} {result['status']:<10} {elapsed:>9}")
+    print("-" * 33)
+    if report['wall_s']:
+        print(f"Wall clock {report['wall_s']:.1f}s (stages total {report['stage_s_total']:.1f}s)")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run pipeline iterations (cached stage DAG)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="Run one iteration")
+    run.add_argument("--spec", help="Spec YAML (default: latest work/spec/building_v###.yaml)")
+    run.add_argument("--iteration", type=int, help="Iteration number (default: next)")
+    run.add_argument("--force", action="store_true", help="Run every stage, ignoring the cache")
+    run.add_argument("--jobs", type=int, default=None, help="Maximum concurrent stages")
+    run.add_argument("--render-workers", type=int, default=None, help="Blender processes for rendering")
+    run.add_argument("--dry-run", action="store_true", help="Show which stages would run")
+
+    new_spec = sub.add_parser('new-spec', help="Copy the latest spec to the next version")
+    new_spec.add_argument("-m", "--message", default=None, help="Change message for the spec header")
+    new_spec.add_argument("--dry-run", action="store_true", help="Show the new path only")
+    return parser.parse_args()
+
+
+def main():
+    """Main execution."""
+    args = parse_args()
+
+    print("=" * 70)
+    print(" Pipeline Runner" if args.command == 'run' else " New Spec Version")
+    print("=" * 70)
+
+    try:
+        if args.command == 'new-spec':
+            next_path = create_next_spec(args.message, dry_run=args.dry_run)
+            print(f"{'[dry run] Would create' if args.dry_run else '✓ Created'}: {next_path}")
+            return 0
+
+        spec_path = Path(args.spec) if args.spec else latest_spec()[1]
+    except (FileNotFoundError, FileExistsError) as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    iteration = args.iteration or next_iteration()
+    log_dir = LOGS_DIR / f"iter_{iteration:03d}"
+    print(f"Spec:      {spec_path}")
+    print(f"Iteration: iter_{iteration:03d}")
+    print(f"Logs:      {log_dir}\n")
+
+    stages = iteration_stages(spec_path.resolve(), iteration, render_workers=args.render_workers)
+    report = run_pipeline(stages, log_dir, force=args.force, max_workers=args.jobs, dry_run=args.dry_run)
+    print_report(report)
+
+    if not report['passed']:
+        print("\n❌ Pipeline failed")
+        return 1
+    print("\n✅ Pipeline complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+World-Space Bounds Cache
+Vectorized per-object world AABBs for verification scripts
+
+Pulls vertex coordinates with foreach_get into NumPy, transforms them with a
+single matmul per object, and caches the resulting world-space axis-aligned
+bounding box. One cache is meant to live for one verification run, so each
+object's vertices are read at most once no matter how many measurements use it.
+
+Measurements use the object's mesh data (obj.data), not the evaluated mesh, so
+results match the previous per-vertex loops exactly.
+
+Usage:
+    from scene_bounds import WorldBoundsCache
+
+    bounds = WorldBoundsCache()
+    lo, hi = bounds.union(walls)
+    width = hi[0] - lo[0]
+"""
+
+import bpy
+import numpy as np
+
+
+class WorldBoundsCache:
+    """Cache of world-space AABBs keyed by object name."""
+
+    def __init__(self):
+        self._aabbs = {}
+        self.vertices_read = 0
+
+    def world_coords(self, obj):
+        """
+        Get world-space vertex coordinates for a mesh object (not cached).
+
+        Args:
+            obj (bpy.types.Object): Mesh object
+
+        Returns:
+            np.ndarray: (N, 3) float64 array of world coordinates
+        """
+        vertices = obj.data.vertices
+        coords = np.empty(len(vertices) * 3, dtype=np.float64)
+        vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        self.vertices_read += len(coords)
+        return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+    def aabb(self, obj):
+        """
+        Get the world-space AABB of a mesh object.
+
+        Args:
+            obj (bpy.types.Object): Mesh object
+
+        Returns:
+            tuple: (min_xyz, max_xyz) NumPy arrays, or None if the mesh has no vertices
+
+        Example:
+            >>> lo, hi = bounds.aabb(bpy.data.objects['Chimney'])
+            >>> chimney_top = hi[2]
+        """
+        if obj.name not in self._aabbs:
+            coords = self.world_coords(obj)
+            if len(coords) == 0:
+                self._aabbs[obj.name] = None
+            else:
+                self._aabbs[obj.name] = (coords.min(axis=0), coords.max(axis=0))
+        return self._aabbs[obj.name]
+
+    def union(self, objects):
+        """
+        Get the combined world-space AABB of several objects.
+
+        Args:
+            objects (iterable): Mesh objects
+
+        Returns:
+            tuple: (min_xyz, max_xyz) NumPy arrays, or None if no vertices
+        """
+        boxes = [box for box in (self.aabb(obj) for obj in objects) if box is not None]
+        if not boxes:
+            return None
+        return (
+            np.min([lo for lo, _ in boxes], axis=0),
+            np.max([hi for _, hi in boxes], axis=0)
+        )
+
+    def invalidate(self, obj=None):
+        """Forget the cached AABB for one object, or for all objects if obj is None."""
+        if obj is None:
+            self._aabbs.clear()
+        else:
+            self._aabbs.pop(obj.name, None)
+
+    def __len__(self):
+        return len(self._aabbs)
@@ -0,0 +1,510 @@
+"""
+Spec Loader
+Validated, compiled and cached loading for every spec phase
+
+Parses spec YAML with libyaml's CSafeLoader when PyYAML was built with it
+(falls back to the pure-Python SafeLoader), validates it against the schema
+for its kind, and compiles it into a CompiledSpec: the raw dict (what the
+builders index into) plus typed views of the footprint, walls, cutouts and
+openings.
+
+Spec kinds:
+    building   - work/spec/building_v###.yaml (docs/CONTRACT.md schema)
+    phase_1a   - work/spec/phase_1a/building_geometry.yaml (cutouts)
+    phase_1b   - work/spec/phase_1b/opening_fill.yaml (entries with cutout_ref)
+    phase_1c   - work/spec/phase_1c/interior_layout.yaml (wall_segments)
+
+Compiled specs are cached twice:
+    - in memory, keyed on (mtime, size): a repeated load is one os.stat
+    - on disk (work/spec/.cache), keyed on mtime and size, falling back to the
+      SHA-256 of the file contents, so a touched-but-unchanged file is not
+      re-parsed and a new process skips YAML parsing entirely
+
+Invalid specs raise SpecValidationError with every problem found, so they
+can be rejected before Blender starts.
+
+Usage:
+    from spec_loader import load_spec, load_spec_data
+
+    spec = load_spec_data('work/spec/phase_1a/building_geometry.yaml')   # dict
+    compiled = load_spec('work/spec/phase_1a/building_geometry.yaml')    # CompiledSpec
+    compiled.walls.thickness, [c.name for c in compiled.cutouts]
+
+    python scripts/spec_loader.py                       # validate every spec under work/spec
+    python scripts/spec_loader.py work/spec/building_v004.yaml --no-cache
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SpecYAMLLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as SpecYAMLLoader
+    LIBYAML_AVAILABLE = False
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SPEC_DIR = PROJECT_ROOT / 'work' / 'spec'
+DEFAULT_CACHE_DIR = SPEC_DIR / '.cache'
+
+# Bump when validation or the compiled dataclasses change (invalidates disk cache)
+CACHE_VERSION = 1
+
+CONTRACT_WALLS = {'front', 'rear', 'left', 'right'}
+PHASE_1A_WALLS = CONTRACT_WALLS | {'alcove_left', 'alcove_right', 'alcove_back'}
+
+
+class SpecValidationError(ValueError):
+    """Spec failed schema validation; .errors lists every problem found."""
+
+    def __init__(self, path, errors):
+        self.path = str(path)
+        self.errors = list(errors)
+        details = "\n".join(f"  - {error}" for error in self.errors)
+        super().__init__(f"Invalid spec {self.path} ({len(self.errors)} errors):\n{details}")
+
+
+@dataclass(slots=True)
+class Footprint:
+    width: float
+    depth: float
+    shape: str = 'rectangle'
+
+
+@dataclass(slots=True)
+class WallSpec:
+    thickness: float
+    height: float
+
+
+@dataclass(slots=True)
+class Cutout:
+    """Phase 1A rectangular cutout (position z is the bottom, from the wall base)."""
+    name: str
+    wall: str
+    width: float
+    height: float
+    x: float
+    y: float
+    z: float
+
+
+@dataclass(slots=True)
+class Opening:
+    """CONTRACT.md door or window."""
+    id: str
+    kind: str
+    wall: str
+    width: float
+    height: float
+    x: float
+    sill_height: float
+
+
+@dataclass(slots=True)
+class FillEntry:
+    """Phase 1B opening fill entry."""
+    name: str
+    cutout_ref: str
+    type: str
+
+
+@dataclass(slots=True)
+class CompiledSpec:
+    path: str
+    kind: str
+    sha256: str
+    data: dict
+    version: Optional[str] = None
+    units: Optional[str] = None
+    footprint: Optional[Footprint] = None
+    walls: Optional[WallSpec] = None
+    cutouts: tuple = field(default_factory=tuple)
+    openings: tuple = field(default_factory=tuple)
+    fills: tuple = field(default_factory=tuple)
+
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+def _lookup(data, dotted):
+    """Follow a dotted path through nested dicts; returns (found, value)."""
+    value = data
+    for key in dotted.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return False, None
+        value = value[key]
+    return True, value
+
+
+def _require(errors, data, dotted, kind=None, positive=False, prefix=''):
+    """Check one required field, appending a message to errors if it is bad."""
+    found, value = _lookup(data, dotted)
+    path = f"{prefix}{dotted}"
+    if not found:
+        errors.append(f"{path}: required field missing")
+        return None
+    if kind == 'number':
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            errors.append(f"{path}: expected a number, got {value!r}")
+            return None
+        if positive and value <= 0:
+            errors.append(f"{path}: must be positive, got {value}")
+    elif kind is not None and not isinstance(value, kind):
+        errors.append(f"{path}: expected {kind.__name__}, got {type(value).__name__}")
+        return None
+    return value
+
+
+def detect_kind(data):
+    """Work out which schema a parsed spec follows."""
+    phase = str(data.get('phase', '')).lower()
+    if phase in ('1a', '1b', '1c'):
+        return f"phase_{phase}"
+    if 'cutouts' in data:
+        return 'phase_1a'
+    if 'wall_segments' in data:
+        return 'phase_1c'
+    if any(isinstance(v, dict) and 'cutout_ref' in v for v in data.values()):
+        return 'phase_1b'
+    return 'building'
+
+
+def _validate_building(data, errors):
+    _require(errors, data, 'version', str)
+    _require(errors, data, 'units', str)
+    _require(errors, data, 'overall.footprint.shape', str)
+    _require(errors, data, 'overall.footprint.width', 'number', positive=True)
+    _require(errors, data, 'overall.footprint.depth', 'number', positive=True)
+    _require(errors, data, 'walls.thickness', 'number', positive=True)
+    _require(errors, data, 'walls.height', 'number', positive=True)
+    _require(errors, data, 'roof.type', str)
+    _require(errors, data, 'roof.thickness', 'number', positive=True)
+    _require(errors, data, 'roof.elevation', 'number')
+    _require(errors, data, 'tolerances', dict)
+
+    openings = _require(errors, data, 'openings', dict) or {}
+    for group in ('doors', 'windows'):
+        for i, opening in enumerate(openings.get(group) or []):
+            prefix = f"openings.{group}[{i}]."
+            if not isinstance(opening, dict):
+                errors.append(f"{prefix[:-1]}: expected a mapping")
+                continue
+            _require(errors, opening, 'id', str, prefix=prefix)
+            _require(errors, opening, 'width', 'number', positive=True, prefix=prefix)
+            _require(errors, opening, 'height', 'number', positive=True, prefix=prefix)
+            _require(errors, opening, 'position.x', 'number', prefix=prefix)
+            wall = _require(errors, opening, 'wall', str, prefix=prefix)
+            if wall is not None and wall not in CONTRACT_WALLS:
+                errors.append(f"{prefix}wall: unknown wall '{wall}' (expected one of {sorted(CONTRACT_WALLS)})")
+
+
+def _validate_phase_1a(data, errors):
+    _require(errors, data, 'units', str)
+    _require(errors, data, 'overall.footprint.width', 'number', positive=True)
+    _require(errors, data, 'overall.footprint.depth', 'number', positive=True)
+    _require(errors, data, 'walls.thickness', 'number', positive=True)
+    _require(errors, data, 'walls.height', 'number', positive=True)
+
+    cutouts = _require(errors, data, 'cutouts', dict) or {}
+    for name, cutout in cutouts.items():
+        prefix = f"cutouts.{name}."
+        if not isinstance(cutout, dict):
+            errors.append(f"cutouts.{name}: expected a mapping")
+            continue
+        _require(errors, cutout, 'width', 'number', positive=True, prefix=prefix)
+        _require(errors, cutout, 'height', 'number', positive=True, prefix=prefix)
+        for axis in ('x', 'y', 'z'):
+            _require(errors, cutout, f'position.{axis}', 'number', prefix=prefix)
+        wall = _require(errors, cutout, 'wall', str, prefix=prefix)
+        if wall is not None and wall not in PHASE_1A_WALLS:
+            errors.append(f"{prefix}wall: unknown wall '{wall}' (expected one of {sorted(PHASE_1A_WALLS)})")
+
+
+def _validate_phase_1b(data, errors):
+    entries = {name: entry for name, entry in data.items() if isinstance(entry, dict) and 'cutout_ref' in entry}
+    if not entries:
+        errors.append("no opening fill entries (mappings with cutout_ref)")
+    for name, entry in entries.items():
+        _require(errors, entry, 'cutout_ref', str, prefix=f"{name}.")
+        _require(errors, entry, 'type', str, prefix=f"{name}.")
+
+
+def _validate_phase_1c(data, errors):
+    for key in ('left_x', 'right_x', 'front_y', 'back_y'):
+        _require(errors, data, f'interior_dimensions.{key}', 'number')
+    for section in ('floor', 'ceiling'):
+        _require(errors, data, f'{section}.z_position', 'number')
+        _require(errors, data, f'{section}.thickness', 'number', positive=True)
+
+    defaults = data.get('partition_walls') or {}
+    segments = _require(errors, data, 'wall_segments', dict) or {}
+    for name, wall in segments.items():
+        prefix = f"wall_segments.{name}."
+        if not isinstance(wall, dict):
+            errors.append(f"wall_segments.{name}: expected a mapping")
+            continue
+        if wall.get('already_defined', False):
+            continue
+        if 'y_position' in wall:
+            for key in ('start_x', 'end_x', 'y_position'):
+                _require(errors, wall, key, 'number', prefix=prefix)
+        elif 'x_position' in wall:
+            for key in ('start_y', 'end_y', 'x_position'):
+                _require(errors, wall, key, 'number', prefix=prefix)
+        else:
+            errors.append(f"{prefix[:-1]}: needs y_position (X-running) or x_position (Y-running)")
+        for key in ('height', 'thickness'):
+            source = wall if key in wall else defaults
+            _require(errors, source, key, 'number', positive=True, prefix=prefix if key in wall else 'partition_walls.')
+
+    for name, door in (data.get('doorways') or {}).items():
+        wall = door.get('wall') if isinstance(door, dict) else None
+        if wall not in segments:
+            errors.append(f"doorways.{name}.wall: unknown wall segment {wall!r}")
+
+
+VALIDATORS = {
+    'building': _validate_building,
+    'phase_1a': _validate_phase_1a,
+    'phase_1b': _validate_phase_1b,
+    'phase_1c': _validate_phase_1c,
+}
+
+
+def validate_spec(data, kind=None):
+    """
+    Validate a parsed spec.
+
+    Args:
+        data: Parsed YAML
+        kind: Schema to use (default: detect_kind)
+
+    Returns:
+        list: Error messages (empty if valid)
+    """
+    if not isinstance(data, dict):
+        return [f"top level must be a mapping, got {type(data).__name__}"]
+    errors = []
+    VALIDATORS[kind or detect_kind(data)](data, errors)
+    return errors
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+def compile_spec(data, path='<memory>', sha256='', kind=None):
+    """
+    Validate a parsed spec and build its CompiledSpec.
+
+    Raises:
+        SpecValidationError: If the spec does not match its schema
+    """
+    kind = kind or (detect_kind(data) if isinstance(data, dict) else 'building')
+    errors = validate_spec(data, kind)
+    if errors:
+        raise SpecValidationError(path, errors)
+
+    compiled = CompiledSpec(path=str(path), kind=kind, sha256=sha256, data=data,
+                            version=data.get('version'), units=data.get('units'))
+
+    footprint = (data.get('overall') or {}).get('footprint')
+    if footprint:
+        compiled.footprint = Footprint(float(footprint['width']), float(footprint['depth']),
+                                       footprint.get('shape', 'rectangle'))
+    if kind in ('building', 'phase_1a'):
+        compiled.walls = WallSpec(float(data['walls']['thickness']), float(data['walls']['height']))
+
+    if kind == 'phase_1a':
+        compiled.cutouts = tuple(
+            Cutout(name, c['wall'], float(c['width']), float(c['height']),
+                   float(c['position']['x']), float(c['position']['y']), float(c['position']['z']))
+            for name, c in data['cutouts'].items()
+        )
+    elif kind == 'building':
+        compiled.openings = tuple(
+            Opening(o['id'], group[:-1], o['wall'], float(o['width']), float(o['height']),
+                    float(o['position']['x']), float(o['position'].get('sill_height', 0.0)))
+            for group in ('doors', 'windows') for o in (data['openings'].get(group) or [])
+        )
+    elif kind == 'phase_1b':
+        compiled.fills = tuple(
+            FillEntry(name, entry['cutout_ref'], entry['type'])
+            for name, entry in data.items() if isinstance(entry, dict) and 'cutout_ref' in entry
+        )
+
+    return compiled
+
+
+# ============================================================================
+# CACHED LOADING
+# ============================================================================
+
+# Resolved path -> (mtime_ns, size, CompiledSpec)
+_memo = {}
+_stats = {'memo_hits': 0, 'disk_hits': 0, 'parses': 0}
+
+
+def _cache_file(cache_dir, path):
+    return Path(cache_dir) / f"{hashlib.sha256(str(path).encode()).hexdigest()[:16]}.pickle"
+
+
+def _read_cache(cache_file):
+    try:
+        with open(cache_file, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, TypeError):
+        return None
+    return entry if isinstance(entry, dict) and entry.get('version') == CACHE_VERSION else None
+
+
+def _write_cache(cache_file, entry):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # Cache is an optimization; a read-only tree still loads
+
+
+def load_spec(spec_path, use_cache=True, cache_dir=DEFAULT_CACHE_DIR, kind=None):
+    """
+    Load, validate and compile a spec file, using the memo and disk cache.
+
+    The returned CompiledSpec (and its .data dict) is shared between callers;
+    copy it before mutating.
+
+    Args:
+        spec_path: Spec YAML path
+        use_cache: False to always parse and validate from scratch
+        cache_dir: Disk cache directory (None for memory only)
+        kind: Schema to validate against (default: detect_kind)
+
+    Returns:
+        CompiledSpec
+
+    Raises:
+        FileNotFoundError: If the spec does not exist
+        SpecValidationError: If the spec does not match its schema
+
+    Example:
+        >>> spec = load_spec('work/spec/phase_1a/building_geometry.yaml')
+        >>> spec.kind, spec.walls.thickness
+        ('phase_1a', 0.18)
+    """
+    path = Path(spec_path).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    if use_cache:
+        memo = _memo.get(path)
+        if memo and memo[:2] == key and (kind is None or memo[2].kind == kind):
+            _stats['memo_hits'] += 1
+            return memo[2]
+
+    content = path.read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+    cache_file = _cache_file(cache_dir, path) if (use_cache and cache_dir) else None
+
+    if cache_file is not None:
+        entry = _read_cache(cache_file)
+        if entry and entry['sha256'] == sha256 and (kind is None or entry['compiled'].kind == kind):
+            _stats['disk_hits'] += 1
+            compiled = entry['compiled']
+            if (entry['mtime_ns'], entry['size']) != key:
+                _write_cache(cache_file, dict(entry, mtime_ns=key[0], size=key[1]))
+            _memo[path] = (key[0], key[1], compiled)
+            return compiled
+
+    _stats['parses'] += 1
+    try:
+        data = yaml.load(content, Loader=SpecYAMLLoader)
+    except yaml.YAMLError as e:
+        raise SpecValidationError(path, [f"YAML parse error: {e}"]) from e
+    compiled = compile_spec(data, path, sha256, kind)
+
+    if use_cache:
+        _memo[path] = (key[0], key[1], compiled)
+        if cache_file is not None:
+            _write_cache(cache_file, {'version': CACHE_VERSION, 'path': str(path), 'mtime_ns': key[0],
+                                      'size': key[1], 'sha256': sha256, 'compiled': compiled})
+    return compiled
+
+
+def load_spec_data(spec_path, **kwargs):
+    """Load a spec (see load_spec) and return its dict, for code that indexes into the YAML."""
+    return load_spec(spec_path, **kwargs).data
+
+
+def get_spec_cache_stats():
+    """Memo hits, disk cache hits and full parses since start (or clear_spec_cache)."""
+    return dict(_stats)
+
+
+def clear_spec_cache(cache_dir=None):
+    """Drop the in-memory memo (and the disk cache files if cache_dir is given)."""
+    _memo.clear()
+    for key in _stats:
+        _stats[key] = 0
+    if cache_dir is not None:
+        for cache_file in Path(cache_dir).glob('*.pickle'):
+            cache_file.unlink(missing_ok=True)
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Validate and compile spec files")
+    parser.add_argument("specs", nargs='*', help="Spec YAML files (default: every spec under work/spec)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse and validate without the disk cache")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Disk cache directory")
+    return parser.parse_args()
+
+
+def main():
+    """Validate every given spec; exit 1 if any is invalid."""
+    args = parse_args()
+    specs = [Path(p) for p in args.specs] or sorted(p for p in SPEC_DIR.rglob('*.yaml') if '.cache' not in p.parts)
+
+    print("=" * 70)
+    print(f" Spec Validation ({'libyaml' if LIBYAML_AVAILABLE else 'pure-Python'} parser)")
+    print("=" * 70)
+
+    failed = 0
+    for spec_path in specs:
+        start = time.perf_counter()
+        try:
+            compiled = load_spec(spec_path, use_cache=not args.no_cache, cache_dir=args.cache_dir)
+        except (OSError, SpecValidationError) as e:
+            failed += 1
+            print(f"❌ {spec_path}\n{e}")
+            continue
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"✓ {spec_path} [{compiled.kind}] {elapsed_ms:.2f}ms")
+
+    stats = get_spec_cache_stats()
+    print(f"\n{len(specs) - failed}/{len(specs)} valid "
+          f"(parsed {stats['parses']}, disk cache {stats['disk_hits']})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
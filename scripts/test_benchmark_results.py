@@ -0,0 +1,103 @@
+"""
+Test Benchmark Results
+
+Checks the baseline comparison used by benchmark_suite.py: relative and
+absolute regression thresholds, improvements, new and missing cases,
+machine mismatches, and the results file round trip. No Blender required.
+
+Usage:
+    python scripts/test_benchmark_results.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from benchmark_results import machine_info, summarize_runs, write_results, load_results, compare_results
+
+
+def results_file(timings, machine=None):
+    """Results dict from {(case, scale): best_s}."""
+    return {
+        'version': 1,
+        'machine': machine or {'system': 'Linux', 'cpu_count': 8, 'blender': '4.2.0'},
+        'results': [summarize_runs(case, scale, [best, best * 1.1]) for (case, scale), best in timings.items()],
+    }
+
+
+def test_compare_flags_regressions():
+    baseline = results_file({('create_box', 100): 0.200, ('create_box', 10): 0.002,
+                             ('gltf_export', 1000): 1.50, ('verify_all_objects', 100): 0.050})
+    current = results_file({('create_box', 100): 0.300, ('create_box', 10): 0.004,
+                            ('gltf_export', 1000): 0.90, ('create_cylinder', 10): 0.01})
+    comparison = compare_results(current, baseline, threshold=0.2)
+    status = {row['key']: row['status'] for row in comparison['cases']}
+
+    assert status['create_box@100'] == 'regression'
+    # Twice as slow, but only 2 ms: noise
+    assert status['create_box@10'] == 'ok'
+    assert status['gltf_export@1000'] == 'improved'
+    assert status['create_cylinder@10'] == 'new'
+    assert comparison['missing'] == ['verify_all_objects@100']
+    assert comparison['regressions'] == ['create_box@100'] and not comparison['passed']
+    assert comparison['machine_mismatch'] == []
+
+    # Within a looser threshold the same slowdown passes
+    assert compare_results(current, baseline, threshold=0.6)['passed']
+    print("✓ PASS: regressions flagged above relative and absolute thresholds")
+
+
+def test_machine_mismatch_reported():
+    baseline = results_file({('create_box', 100): 0.2})
+    current = results_file({('create_box', 100): 0.2}, machine={'system': 'Linux', 'cpu_count': 16, 'blender': '4.2.0'})
+    comparison = compare_results(current, baseline)
+    assert comparison['machine_mismatch'] == ['cpu_count'], comparison['machine_mismatch']
+    assert comparison['passed']
+    print("✓ PASS: differing machine reported")
+
+
+def test_results_round_trip():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        entry = summarize_runs('create_window_frame', 25, [0.4, 0.2, 0.3], items=100)
+        assert entry['best_s'] == 0.2 and entry['median_s'] == 0.3
+        assert abs(entry['per_item_ms'] - 2.0) < 1e-9
+
+        machine = machine_info()
+        assert machine['blender'] is None and machine['cpu_count'] >= 1
+        path = write_results(tmp / 'nested' / 'run.json', [entry], machine, repeat=3)
+        loaded = load_results(path)
+        assert loaded['results'] == [entry] and loaded['machine'] == machine
+
+        other = tmp / 'metrics.json'
+        other.write_text(json.dumps({'vertex_count': 10}))
+        try:
+            load_results(other)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("non-benchmark file should be rejected")
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: results file round trip")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Benchmark Results")
+    print("="*70)
+    try:
+        test_compare_flags_regressions()
+        test_machine_mismatch_reported()
+        test_results_round_trip()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,97 @@
+"""
+Test Blender Worker
+
+Runs exec jobs through the worker's request handler: a template that execs a
+CLI script in its own globals (as build_template_phase_1a does with
+verify_phase_1a) runs to the end, and a job calling sys.exit() fails with its
+exit code while the worker keeps serving. No Blender required (no scene reset).
+
+Usage:
+    python scripts/test_blender_worker.py
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+sys.path.append(str(scripts_dir / 'blender'))
+
+from worker import Worker
+
+
+# Exec'd by the template below, like verify_phase_1a.py
+CLI_SCRIPT = '''
+import sys
+
+def main():
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+TEMPLATE = '''
+exec(open(script_dir + '/cli_script.py').read())
+verify_result = main()
+finished = True
+'''
+
+
+def exec_job(script, **params):
+    return {'job': 'exec', 'script': str(script), 'reset': False, 'reload': False, **params}
+
+
+def test_exec_job_not_run_as_main():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        (tmp / 'cli_script.py').write_text(CLI_SCRIPT)
+        (tmp / 'template.py').write_text(TEMPLATE)
+        response = Worker().handle(exec_job(tmp / 'template.py', globals={'script_dir': str(tmp)},
+                                            **{'return': ['finished', 'verify_result', '__name__']}))
+        assert response['ok'], response['error']
+        assert response['result'] == {'finished': True, 'verify_result': 1, '__name__': 'template'}, response
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: exec'd template runs past a nested CLI script")
+
+
+def test_sys_exit_fails_job_not_worker():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        (tmp / 'exits.py').write_text("import sys\nsys.exit(3)\n")
+        (tmp / 'exits_ok.py').write_text("import sys\ndone = True\nsys.exit(0)\n")
+        worker = Worker()
+
+        failed = worker.handle(exec_job(tmp / 'exits.py'))
+        assert not failed['ok'] and 'exited with code 3' in failed['error'], failed
+
+        passed = worker.handle(exec_job(tmp / 'exits_ok.py', **{'return': ['done']}))
+        assert passed['ok'] and passed['result'] == {'done': True}, passed
+
+        # Any other handler calling sys.exit() is reported too
+        worker.handlers['exit'] = lambda request: sys.exit(2)
+        other = worker.handle({'job': 'exit', 'reload': False})
+        assert not other['ok'] and 'code 2' in other['error'], other
+
+        assert worker.running and worker.jobs_served == 3
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: sys.exit() fails the job with its code and the worker keeps serving")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Blender Worker")
+    print("="*70)
+    try:
+        test_exec_job_not_run_as_main()
+        test_sys_exit_fails_job_not_worker()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
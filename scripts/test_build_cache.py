@@ -0,0 +1,151 @@
+"""
+Test Incremental Build Cache
+
+Checks build_cache rebuild planning against the Phase 1A spec: unchanged
+specs reuse everything, a cutout change dirties only its own wall and the
+cutouts on it, a wall height change reaches roof and parapet, and global
+changes force a full rebuild.
+
+Usage:
+    python scripts/test_build_cache.py
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+sys.path.append(str(scripts_dir / 'blender'))
+
+from build_cache import plan_rebuild, compute_hashes, cutout_hosts, MANIFEST_VERSION
+from build_from_spec import run_build_stages
+
+SPEC_PATH = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
+
+
+def load_spec():
+    with open(SPEC_PATH, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def manifest_for(spec):
+    """Manifest as build_from_spec would write it after building spec."""
+    return {
+        'version': MANIFEST_VERSION,
+        'hashes': compute_hashes(spec),
+        'cutout_hosts': cutout_hosts(spec),
+        'objects': {},
+    }
+
+
+def test_unchanged_spec_reuses_everything():
+    spec = load_spec()
+    plan = plan_rebuild(spec, manifest_for(spec))
+
+    assert not plan['full'], plan['reason']
+    assert plan['rebuild'] == [], plan['rebuild']
+    assert 'walls.front' in plan['reuse'] and 'canopy' in plan['reuse'], plan['reuse']
+    print("✓ PASS: unchanged spec reuses everything")
+
+
+def test_single_cutout_change_rebuilds_only_its_wall():
+    spec = load_spec()
+    manifest = manifest_for(spec)
+
+    # The only cutout on the rear wall
+    changed = copy.deepcopy(spec)
+    changed['cutouts']['rear_service_door']['width'] += 0.1
+    plan = plan_rebuild(changed, manifest)
+
+    assert not plan['full'], plan['reason']
+    assert plan['changed'] == ['cutouts.rear_service_door'], plan['changed']
+    assert plan['rebuild'] == ['cutouts.rear_service_door', 'walls.rear'], plan['rebuild']
+
+    # build_from_spec runs only those two build units
+    _, report = run_build_stages(changed, plan)
+    assert report['rebuilt'] == ['walls.rear', 'cutouts.rear_service_door'], report['rebuilt']
+    assert 'walls.front' in report['reused'] and 'roof' in report['reused']
+    print("✓ PASS: single cutout change rebuilds only its wall and that cutout")
+
+
+def test_cutout_change_dirties_wall_and_siblings():
+    spec = load_spec()
+    manifest = manifest_for(spec)
+
+    changed = copy.deepcopy(spec)
+    changed['cutouts']['front_alcove_opening']['width'] += 0.05
+    plan = plan_rebuild(changed, manifest)
+
+    assert plan['changed'] == ['cutouts.front_alcove_opening'], plan['changed']
+    # Host wall re-cut from scratch with every cutout on it; nothing on top of the walls
+    assert plan['rebuild'] == ['cutouts.front_alcove_opening', 'cutouts.front_left_display_window',
+                               'cutouts.front_right_display_window', 'walls.front'], plan['rebuild']
+    for component in ['walls.rear', 'roof', 'parapet', 'chimney', 'door_alcove', 'cutouts.front_entry_door']:
+        assert component in plan['reuse'], (component, plan['reuse'])
+    print("✓ PASS: cutout change dirties its wall and sibling cutouts")
+
+
+def test_wall_height_change_reaches_roof():
+    spec = load_spec()
+    manifest = manifest_for(spec)
+
+    changed = copy.deepcopy(spec)
+    changed['walls']['height'] += 0.1
+    plan = plan_rebuild(changed, manifest)
+
+    for component in ['walls.front', 'walls.rear', 'walls.left', 'walls.right', 'roof', 'parapet',
+                      'chimney', 'cutouts.front_alcove_opening', 'cutouts.rear_service_door']:
+        assert component in plan['rebuild'], (component, plan['rebuild'])
+    for component in ['door_alcove', 'cutouts.front_entry_door', 'canopy']:
+        assert component in plan['reuse'], (component, plan['reuse'])
+    print("✓ PASS: wall height change rebuilds walls, their cutouts, roof and parapet")
+
+
+def test_canopy_change_is_isolated():
+    spec = load_spec()
+    manifest = manifest_for(spec)
+
+    changed = copy.deepcopy(spec)
+    changed['canopy']['notes'] = "changed"
+    changed['canopy'].setdefault('extra_key', 1)
+    plan = plan_rebuild(changed, manifest)
+
+    assert plan['rebuild'] == ['canopy'], plan['rebuild']
+    # ...and a build stage owns it
+    assert run_build_stages(changed, plan)[1]['rebuilt'] == ['canopy']
+    print("✓ PASS: canopy change rebuilds only the canopy")
+
+
+def test_global_change_forces_full_rebuild():
+    spec = load_spec()
+    manifest = manifest_for(spec)
+
+    changed = copy.deepcopy(spec)
+    changed['overall']['height'] = 99
+    plan = plan_rebuild(changed, manifest)
+
+    assert plan['full'], plan
+    assert plan_rebuild(spec, None)['full']
+    print("✓ PASS: global change forces a full rebuild")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Incremental Build Cache")
+    print("="*70)
+    try:
+        test_unchanged_spec_reuses_everything()
+        test_single_cutout_change_rebuilds_only_its_wall()
+        test_cutout_change_dirties_wall_and_siblings()
+        test_wall_height_change_reaches_roof()
+        test_canopy_change_is_isolated()
+        test_global_change_forces_full_rebuild()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,166 @@
+"""
+Test Build Profiler
+
+Checks section aggregation (nested sections, repeated calls, sequential
+marks), that decorated helpers are untouched while profiling is off, that
+the bpy.ops counter is not stacked when the module is re-imported, the
+tracemalloc peak, and merging the report into an existing metrics JSON with a
+pstats dump. No Blender required (object/mesh/ops counts stay empty).
+
+Usage:
+    python scripts/test_build_profiler.py
+"""
+
+import importlib
+import json
+import pstats
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from build_profiler import (
+    start_profile, stop_profile, is_profiling, profile_section, profiled,
+    mark_section, get_profile_report, write_profile_metrics
+)
+
+
+@profiled()
+def build_piece(size):
+    """Decorated helper standing in for a blender_helpers function."""
+    return sum(range(size))
+
+
+def sections_by_name(report):
+    return {s['section']: s for s in report['sections']}
+
+
+def test_nested_sections_aggregate():
+    start_profile()
+    mark_section("1.1 Foundation")
+    build_piece(10)
+    build_piece(10)
+    mark_section("1.2 Walls")
+    with profile_section("cutters"):
+        build_piece(10)
+    stop_profile()
+
+    sections = sections_by_name(get_profile_report())
+    assert list(sections) == ["1.1 Foundation", "1.1 Foundation > build_piece",
+                              "1.2 Walls", "1.2 Walls > cutters", "1.2 Walls > cutters > build_piece"], list(sections)
+    assert sections["1.1 Foundation > build_piece"]['calls'] == 2
+    assert sections["1.1 Foundation"]['calls'] == 1
+    assert sections["1.2 Walls > cutters > build_piece"]['depth'] == 2
+    assert sections["1.1 Foundation"]['wall_s'] >= sections["1.1 Foundation > build_piece"]['wall_s']
+    # Outside Blender there is nothing to count
+    assert sections["1.2 Walls"]['objects'] is None and sections["1.2 Walls"]['ops'] == 0
+    print("✓ PASS: nested sections and repeated calls aggregate")
+
+
+def test_disabled_is_passthrough():
+    stop_profile()
+    assert not is_profiling()
+    start_profile()
+    stop_profile()
+    assert build_piece(5) == 10
+    with profile_section("ignored"):
+        pass
+    mark_section("ignored")
+    assert get_profile_report()['sections'] == []
+    print("✓ PASS: profiling off leaves helpers untouched")
+
+
+def test_ops_counter_not_stacked_on_reimport():
+    import build_profiler
+
+    class FakeOp:
+        _module, _func = 'mesh', 'primitive_cube_add'
+
+        def __call__(self):
+            return {'FINISHED'}
+
+    original = FakeOp.__call__
+    first = build_profiler
+    try:
+        first._install_ops_counter(FakeOp)
+        # The persistent worker drops and re-imports scripts before each job
+        del sys.modules['build_profiler']
+        second = importlib.import_module('build_profiler')
+        second._install_ops_counter(FakeOp)
+        second._install_ops_counter(FakeOp)
+        assert FakeOp.__call__._build_profiler_original is original
+
+        first._ops_counts.clear()
+        assert FakeOp()() == {'FINISHED'}
+        assert second._ops_counts == {'mesh.primitive_cube_add': 1}, second._ops_counts
+        assert not first._ops_counts
+
+        second._remove_ops_counter(FakeOp)
+        assert FakeOp.__call__ is original
+    finally:
+        sys.modules['build_profiler'] = first
+    print("✓ PASS: ops counter replaced, not stacked, on re-import and removed on stop")
+
+
+def test_memory_peak():
+    start_profile(trace_memory=True)
+    with profile_section("outer"):
+        with profile_section("allocate"):
+            blob = [bytes(1024) for _ in range(2000)]
+        del blob
+        with profile_section("small"):
+            pass
+    stop_profile()
+
+    sections = sections_by_name(get_profile_report())
+    allocate = sections["outer > allocate"]['py_peak_kb']
+    assert allocate >= 1500, allocate
+    # The parent sees the child's peak even though the child reset it
+    assert sections["outer"]['py_peak_kb'] >= allocate
+    assert sections["outer > small"]['py_peak_kb'] < allocate
+    print("✓ PASS: per-section Python memory peak")
+
+
+def test_write_profile_metrics():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        metrics_path = tmp / 'phase_1a_metrics_001.json'
+        metrics_path.write_text(json.dumps({'vertex_count': 1200}))
+
+        start_profile(cprofile=True)
+        mark_section("5 Export")
+        build_piece(1000)
+        report = write_profile_metrics(metrics_path)
+        assert not is_profiling()
+
+        metrics = json.loads(metrics_path.read_text())
+        assert metrics['vertex_count'] == 1200
+        assert [s['section'] for s in metrics['profile']['sections']] == ["5 Export", "5 Export > build_piece"]
+        pstats_path = tmp / 'phase_1a_metrics_001.pstats'
+        assert report['pstats'] == str(pstats_path) and pstats_path.exists()
+        stats = pstats.Stats(str(pstats_path))
+        assert any(func[2] == 'build_piece' for func in stats.stats), "build_piece missing from pstats"
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: report merged into metrics JSON with pstats dump")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Build Profiler")
+    print("="*70)
+    try:
+        test_nested_sections_aggregate()
+        test_disabled_is_passthrough()
+        test_ops_counter_not_stacked_on_reimport()
+        test_memory_peak()
+        test_write_profile_metrics()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,153 @@
+"""
+Test Checkpoint Storage Backends
+
+Runs the verification_checkpoints API against both the JSON and the SQLite
+store (in a temporary directory), checks the JSON -> SQLite import, and checks
+that compressed checkpoints round-trip while corrupt ones are rejected.
+
+Usage:
+    python scripts/test_checkpoint_store.py
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+import verification_checkpoints as vc
+from checkpoint_store import (
+    JSONCheckpointStore,
+    SQLiteCheckpointStore,
+    import_json_checkpoints,
+    parse_checkpoint_name,
+)
+
+REQUIRED = ['inline_verification', 'batch_verification', 'automated_verification']
+
+
+def exercise_store(store):
+    """Create, require, list, status and clear through the public API."""
+    vc.set_checkpoint_store(store)
+    try:
+        for iteration in (48, 49):
+            for checkpoint_type in REQUIRED:
+                vc.create_checkpoint(f"{checkpoint_type}_{iteration:03d}", {"passed": True, "critical_failures": []})
+
+        assert vc.require_checkpoint("batch_verification_049")['data']['passed'] is True
+        assert vc.require_all_checkpoints(49)
+        assert vc.list_checkpoints(49) == sorted(f"{t}_049" for t in REQUIRED), vc.list_checkpoints(49)
+        assert len(vc.list_checkpoints()) == 6
+
+        vc.clear_checkpoints(48)
+        status = vc.get_checkpoint_status(48)
+        assert not any(info['exists'] for info in status.values()), status
+        status = vc.get_checkpoint_status(49)
+        assert all(info['exists'] and info['timestamp'] for info in status.values()), status
+
+        try:
+            vc.require_checkpoint("inline_verification_048")
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError("cleared checkpoint should be missing")
+    finally:
+        vc.set_checkpoint_store(None)
+
+
+def test_json_store():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        exercise_store(JSONCheckpointStore(tmp))
+        assert (tmp / "batch_verification_049.json").exists()
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: JSON store")
+
+
+def test_sqlite_store():
+    tmp = Path(tempfile.mkdtemp())
+    store = SQLiteCheckpointStore(tmp / "checkpoints.sqlite3")
+    try:
+        exercise_store(store)
+        mode = store._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == 'wal', mode
+        plan = " ".join(row[-1] for row in store._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM checkpoints WHERE iteration = 49"))
+        assert 'idx_checkpoints_iteration_type' in plan, plan
+    finally:
+        store.close()
+        shutil.rmtree(tmp)
+    print("✓ PASS: SQLite store (WAL, indexed on iteration)")
+
+
+def test_import_json_checkpoints():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        source = JSONCheckpointStore(tmp)
+        for checkpoint_type in REQUIRED:
+            source.write(f"{checkpoint_type}_007", {"checkpoint": f"{checkpoint_type}_007",
+                                                    "timestamp": "2026-01-04T12:00:00", "data": {}})
+        (tmp / "broken_007.json").write_text("{not json")
+
+        store = SQLiteCheckpointStore(tmp / "checkpoints.sqlite3")
+        count, errors = import_json_checkpoints(tmp, store)
+        assert count == 3 and len(errors) == 1, (count, errors)
+        assert store.timestamps([f"{t}_007" for t in REQUIRED]) == {
+            f"{t}_007": "2026-01-04T12:00:00" for t in REQUIRED
+        }
+        store.close()
+    finally:
+        shutil.rmtree(tmp)
+    assert parse_checkpoint_name("automated_verification_049") == ('automated_verification', 49)
+    print("✓ PASS: JSON checkpoints import into SQLite")
+
+
+def test_atomic_compressed_and_digest():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        data = {"passed": True, "critical_failures": [], "results": {f"Obj_{i}": {"ok": True} for i in range(200)}}
+
+        vc.set_checkpoint_store(JSONCheckpointStore(tmp))
+        plain = vc.create_checkpoint("batch_verification_050", data)
+        vc.set_checkpoint_store(JSONCheckpointStore(tmp, compression='gzip'))
+        packed = vc.create_checkpoint("batch_verification_051", data)
+        assert packed.name == "batch_verification_051.json.gz", packed
+        assert packed.stat().st_size < plain.stat().st_size / 4, (packed.stat().st_size, plain.stat().st_size)
+        assert vc.require_checkpoint("batch_verification_051")['data'] == data
+        assert vc.require_checkpoint("batch_verification_050")['sha256']
+        assert vc.list_checkpoints() == ["batch_verification_050", "batch_verification_051"]
+        assert not list(tmp.glob(".*.tmp"))
+
+        # Truncated (crash mid-write) and edited checkpoints must not pass
+        packed.write_bytes(packed.read_bytes()[:40])
+        plain.write_text(plain.read_text().replace('"passed": true', '"passed": false', 1))
+        for name in ("batch_verification_051", "batch_verification_050"):
+            try:
+                vc.require_checkpoint(name)
+            except vc.CheckpointIntegrityError:
+                continue
+            raise AssertionError(f"{name} should fail its integrity check")
+    finally:
+        vc.set_checkpoint_store(None)
+        shutil.rmtree(tmp)
+    print("✓ PASS: atomic gzip checkpoints; truncated and edited ones rejected")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Checkpoint Storage Backends")
+    print("="*70)
+    try:
+        test_json_store()
+        test_sqlite_store()
+        test_import_json_checkpoints()
+        test_atomic_compressed_and_digest()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
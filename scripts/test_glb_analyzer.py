@@ -0,0 +1,157 @@
+"""
+Test GLB Geometry Analyzer
+
+Builds small GLB files in memory and checks that glb_analyzer reports the
+expected counts, manifold/boundary edges, degenerate triangles and AABBs.
+
+Usage:
+    python scripts/test_glb_analyzer.py
+"""
+
+import json
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from glb_analyzer import analyze_glb
+
+
+def write_glb(path, meshes):
+    """
+    Write a minimal GLB with one node per mesh.
+
+    Args:
+        path: Output path
+        meshes: List of (name, positions (N,3), triangles (M,3), translation)
+    """
+    gltf = {
+        'asset': {'version': '2.0'},
+        'scene': 0,
+        'scenes': [{'nodes': list(range(len(meshes)))}],
+        'nodes': [], 'meshes': [], 'accessors': [], 'bufferViews': [],
+        'buffers': []
+    }
+    binary = b''
+
+    for name, positions, triangles, translation in meshes:
+        for array, kind in ((np.asarray(positions, dtype='<f4'), 'VEC3'),
+                            (np.asarray(triangles, dtype='<u4').ravel(), 'SCALAR')):
+            gltf['bufferViews'].append({'buffer': 0, 'byteOffset': len(binary), 'byteLength': array.nbytes})
+            gltf['accessors'].append({
+                'bufferView': len(gltf['bufferViews']) - 1,
+                'componentType': 5126 if kind == 'VEC3' else 5125,
+                'count': len(array),
+                'type': kind
+            })
+            binary += array.tobytes()
+
+        position_accessor = len(gltf['accessors']) - 2
+        gltf['meshes'].append({'name': name, 'primitives': [
+            {'attributes': {'POSITION': position_accessor}, 'indices': position_accessor + 1}
+        ]})
+        gltf['nodes'].append({'name': name, 'mesh': len(gltf['meshes']) - 1, 'translation': translation})
+
+    gltf['buffers'].append({'byteLength': len(binary)})
+    json_chunk = json.dumps(gltf).encode()
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    binary += b'\0' * (-len(binary) % 4)
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<III', 0x46546C67, 2, 12 + 8 + len(json_chunk) + 8 + len(binary)))
+        f.write(struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk)
+        f.write(struct.pack('<II', len(binary), 0x004E4942) + binary)
+
+
+def split_cube():
+    """Unit cube with 24 vertices (split per face like the glTF exporter does)."""
+    corners = np.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)])
+    quads = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    positions, triangles = [], []
+    for quad in quads:
+        base = len(positions)
+        positions.extend(corners[list(quad)])
+        triangles.extend([(base, base + 1, base + 2), (base, base + 2, base + 3)])
+    return np.array(positions), np.array(triangles)
+
+
+def test_closed_cube():
+    """A split-vertex cube welds to 8 vertices, 18 edges and is closed."""
+    positions, triangles = split_cube()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'cube.glb'
+        write_glb(path, [('Cube', positions, triangles, [1.0, 2.0, 3.0])])
+        metrics = analyze_glb(path)
+
+    assert metrics['vertex_count'] == 8, metrics
+    assert metrics['face_count'] == 12, metrics
+    assert metrics['edge_count'] == 18, metrics
+    assert metrics['non_manifold_edges'] == 0, metrics
+    assert metrics['boundary_edges'] == 0, metrics
+    assert metrics['degenerate_triangles'] == 0, metrics
+
+    # glTF (x, y, z) translation -> Blender (x, -z, y)
+    node = metrics['nodes']['Cube']
+    assert np.allclose(node['aabb_min'], [0.5, -3.5, 1.5]), node
+    assert np.allclose(node['aabb_max'], [1.5, -2.5, 2.5]), node
+    print("✓ PASS: closed cube")
+
+
+def test_open_and_non_manifold():
+    """Open box reports boundary edges; a fin on an edge makes it non-manifold."""
+    positions, triangles = split_cube()
+
+    open_box = triangles[2:]  # drop one face
+    fin_positions = np.vstack([positions, [[0.5, 0.5, 1.5]]])
+    # Extra triangle on an edge of the first face: that edge gets 3 triangles
+    fin =np.vstack([triangles, [[triangles[0][0], triangles[0][1], len(positions)]]])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'open.glb'
+        write_glb(path, [
+            ('Open', positions, open_box, [0.0, 0.0, 0.0]),
+            ('Fin', fin_positions, fin, [5.0, 0.0, 0.0]),
+        ])
+        metrics = analyze_glb(path)
+
+    assert metrics['nodes']['Open']['boundary_edges'] == 4, metrics['nodes']['Open']
+    assert metrics['nodes']['Open']['non_manifold_edges'] == 0, metrics['nodes']['Open']
+    assert metrics['nodes']['Fin']['non_manifold_edges'] == 1, metrics['nodes']['Fin']
+    assert metrics['non_manifold_edges'] == 1, metrics
+    print("✓ PASS: open box and non-manifold fin")
+
+
+def test_degenerate_triangle():
+    """A triangle with a repeated vertex counts as degenerate."""
+    positions, triangles = split_cube()
+    triangles = np.vstack([triangles, [[0, 0, 1]]])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'degenerate.glb'
+        write_glb(path, [('Degenerate', positions, triangles, [0.0, 0.0, 0.0])])
+        metrics = analyze_glb(path)
+
+    assert metrics['degenerate_triangles'] == 1, metrics
+    assert metrics['non_manifold_edges'] == 0, metrics
+    print("✓ PASS: degenerate triangle")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing GLB Geometry Analyzer")
+    print("="*70)
+    try:
+        test_closed_cube()
+        test_open_and_non_manifold()
+        test_degenerate_triangle()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,149 @@
+"""
+Test GLB Intersection Checker
+
+Checks that penetrating boxes are reported between nodes and within a node,
+that touching geometry (shared edges, flush faces, coplanar overlap) is not,
+that the grid broad phase finds the same pairs as testing every pair, and
+that intersecting faces reach validate_geometry through glb_analyzer.
+
+Usage:
+    python scripts/test_glb_intersections.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from glb_analyzer import analyze_glb
+from glb_intersections import (find_intersections, grid_candidate_pairs, triangles_intersect,
+                               INTERSECTION_TOLERANCE)
+from test_glb_analyzer import write_glb, split_cube
+from validate_geometry import GeometryValidator
+
+
+def box_triangles(center, size):
+    """(12, 3, 3) triangles of an axis-aligned box."""
+    positions, triangles = split_cube()
+    return (positions * np.asarray(size) + np.asarray(center))[triangles]
+
+
+def scene(*boxes):
+    """Corners, node ids and names for (name, center, size) boxes, one node per name."""
+    names = list(dict.fromkeys(name for name, _, _ in boxes))
+    corners = [box_triangles(center, size) for _, center, size in boxes]
+    node_ids = [np.full(12, names.index(name)) for name, _, _ in boxes]
+    return np.concatenate(corners), np.concatenate(node_ids), names
+
+
+def test_penetrating_boxes_between_nodes():
+    # Trim sunk 2 cm into a wall face
+    report = find_intersections(*scene(
+        ('Wall_Front', (0, 0, 1.5), (8.5, 0.18, 3.0)),
+        ('Trim', (0, -0.09, 2.5), (2.0, 0.04, 0.12)),
+    ))
+    assert report['intersecting_pairs'] > 0, report
+    assert list(report['between_nodes']) == ['Trim | Wall_Front'], report
+    assert report['within_nodes'] == {}
+    assert report['intersecting_faces'] >= 4, report
+    print("✓ PASS: penetrating boxes reported between nodes")
+
+
+def test_touching_is_not_intersecting():
+    report = find_intersections(*scene(
+        # Single closed box: neighbours share edges
+        ('Cube', (0, 0, 0), (1, 1, 1)),
+        # Box resting flush on top of another, and trim laid flat on a wall face
+        ('Floor', (5, 0, 0), (2, 2, 0.2)),
+        ('Crate', (5, 0, 0.35), (0.5, 0.5, 0.5)),
+        ('Wall', (10, 0, 1.5), (4, 0.2, 3)),
+        ('Flat_Trim', (10, -0.12, 1.5), (1, 0.04, 0.1)),
+        # Slabs side by side, flush end faces, coplanar tops
+        ('Slab_A', (20, 0, 0), (2, 2, 0.1)),
+        ('Slab_B', (22, 0, 0), (2, 2, 0.1)),
+    ))
+    assert report['intersecting_pairs'] == 0, report
+    assert report['candidate_pairs'] > 0, report
+    print("✓ PASS: touching geometry not reported")
+
+
+def test_overlap_within_node():
+    # Two pieces of one batched mesh, overlapping
+    report = find_intersections(*scene(
+        ('Interior_Walls', (0, 0, 1.5), (4, 0.1, 3)),
+        ('Interior_Walls', (0, 0, 1.5), (0.1, 4, 3)),
+    ))
+    assert list(report['within_nodes']) == ['Interior_Walls'], report
+    assert report['between_nodes'] == {}
+    print("✓ PASS: overlapping pieces reported within a node")
+
+
+def test_grid_matches_all_pairs():
+    rng = np.random.default_rng(7)
+    count = 400
+    centers = rng.uniform(0, 5, size=(count, 1, 3))
+    corners = centers + rng.normal(scale=0.3, size=(count, 3, 3))
+    # A few large triangles spanning the scene, like floors and walls
+    corners[:5] = rng.uniform(-1, 6, size=(5, 3, 3))
+
+    lo, hi = corners.min(axis=1), corners.max(axis=1)
+    first, second = grid_candidate_pairs(lo, hi)
+    grid_hits = {(i, j) for i, j, hit in zip(first, second, triangles_intersect(corners[first], corners[second])) if hit}
+
+    i, j = np.triu_indices(count, k=1)
+    brute_hits = {(a, b) for a, b, hit in zip(i, j, triangles_intersect(corners[i], corners[j])) if hit}
+
+    assert brute_hits and grid_hits == brute_hits, (len(grid_hits), len(brute_hits))
+
+    # Every overlapping box pair comes out exactly once, lower index first
+    tol = INTERSECTION_TOLERANCE
+    boxes_overlap = np.all((lo[i] - tol <= hi[j] + tol) & (lo[j] - tol <= hi[i] + tol), axis=1)
+    pairs = list(zip(first.tolist(), second.tolist()))
+    assert len(pairs) == len(set(pairs)) and bool(np.all(first < second))
+    assert set(pairs) == set(zip(i[boxes_overlap].tolist(), j[boxes_overlap].tolist()))
+    assert len(first) < len(i) // 4, f"broad phase kept {len(first)} of {len(i)} pairs"
+    print("✓ PASS: grid broad phase finds the same pairs as all-pairs")
+
+
+def test_glb_metrics_and_validation():
+    positions, triangles = split_cube()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'overlap.glb'
+        write_glb(path, [
+            ('Header', positions, triangles, [0.0, 0.0, 0.0]),
+            ('Wall', positions, triangles, [0.5, 0.25, 0.0]),
+            ('Apart', positions, triangles, [5.0, 0.0, 0.0]),
+        ])
+        metrics = analyze_glb(path, intersections=True)
+        plain = analyze_glb(path)
+
+    assert 'intersecting_faces' not in plain
+    assert metrics['intersecting_faces'] > 0, metrics
+    assert list(metrics['intersections']['between_nodes']) == ['Header | Wall'], metrics['intersections']
+
+    validator = GeometryValidator(metrics)
+    assert not validator.validate()
+    assert any('Header | Wall' in error for error in validator.errors), validator.errors
+    print("✓ PASS: intersecting faces reach validate_geometry")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing GLB Intersection Checker")
+    print("="*70)
+    try:
+        test_penetrating_boxes_between_nodes()
+        test_touching_is_not_intersecting()
+        test_overlap_within_node()
+        test_grid_matches_all_pairs()
+        test_glb_metrics_and_validation()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
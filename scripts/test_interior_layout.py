@@ -0,0 +1,93 @@
+"""
+Test Interior Layout Engine
+
+Checks interior_layout planning against the Phase 1C spec: partition walls are
+split at their doorways, headers sit above each doorway, floor and ceiling
+cover the interior, and bad doorways are rejected before anything is built.
+
+Usage:
+    python scripts/test_interior_layout.py
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from interior_layout import load_interior_spec, plan_interior_layout
+
+
+def pieces_by_name(plan):
+    return {piece['name']: piece for pieces in plan['groups'].values() for piece in pieces}
+
+
+def test_plans_current_layout():
+    plan = plan_interior_layout(load_interior_spec())
+    counts = {group: len(pieces) for group, pieces in plan['groups'].items()}
+    # back_storage_wall is already_defined; hallway_right_wall splits into 3
+    assert counts == {'walls': 6, 'headers': 2, 'floor': 1, 'ceiling': 1}, counts
+
+    pieces = pieces_by_name(plan)
+    seg2 = pieces['Interior_Hallway_Right_Wall_Seg2']
+    assert abs(seg2['location'][1] - (2.20 + 4.55) / 2) < 1e-9, seg2
+    assert abs(seg2['depth'] - 2.35) < 1e-9, seg2
+
+    header = pieces['Interior_Room_2_Door_Header']
+    assert abs(header['height'] - 1.5) < 1e-9, header           # 3.60 - 2.1
+    assert abs(header['location'][2] - 2.86) < 1e-9, header     # 0.01 + 2.1 + 0.75
+    assert abs(header['depth'] - 0.9) < 1e-9, header
+    print("✓ PASS: current layout planned with walls split at doorways")
+
+
+def test_graph_connects_segments():
+    graph = plan_interior_layout(load_interior_spec())['graph']
+    assert len(graph['edges']) == 4, graph['edges']
+    # storefront wall meets hallway left wall at (0, -1)
+    corner = graph['nodes'].index((0.0, -1.0))
+    assert graph['degree'][corner] == 2, graph
+    print("✓ PASS: segment graph records shared endpoints")
+
+
+def test_new_partition_from_spec_only():
+    spec = copy.deepcopy(load_interior_spec())
+    spec['wall_segments']['storage_closet'] = {
+        'start_x': -4.07, 'end_x': 0.0, 'y_position': 4.0, 'height': 3.60, 'thickness': 0.10,
+        'doorways': [{'position_x': -2.0, 'width': 0.8, 'height': 2.0}],
+    }
+    pieces = pieces_by_name(plan_interior_layout(spec))
+    assert 'Interior_Storage_Closet_Seg1' in pieces and 'Interior_Storage_Closet_Seg2' in pieces
+    assert 'Interior_Storage_Closet_Door_1_Header' in pieces
+    assert abs(pieces['Interior_Storage_Closet_Seg1']['width'] - (4.07 - 2.4)) < 1e-9
+    print("✓ PASS: new partitions and doorways come from the spec alone")
+
+
+def test_rejects_bad_doorways():
+    for position in (7.0, 1.9):  # past the segment end, overlapping room_2_door
+        spec = copy.deepcopy(load_interior_spec())
+        spec['doorways']['extra_door'] = {'wall': 'hallway_right_wall', 'position_y': position,
+                                          'width': 0.9, 'height': 2.1}
+        try:
+            plan_interior_layout(spec)
+        except ValueError:
+            continue
+        raise AssertionError(f"doorway at {position} should raise ValueError")
+    print("✓ PASS: doorways outside or overlapping raise ValueError")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Interior Layout Engine")
+    print("="*70)
+    try:
+        test_plans_current_layout()
+        test_graph_connects_segments()
+        test_new_partition_from_spec_only()
+        test_rejects_bad_doorways()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
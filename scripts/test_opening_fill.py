@@ -0,0 +1,141 @@
+"""
+Test Opening Fill Engine
+
+Checks opening_fill planning against the Phase 1A and 1B specs: every filled
+cutout is planned with the same object names the per-window template code
+produced, recesses are applied while planning, and new openings only need
+spec entries.
+
+Usage:
+    python scripts/test_opening_fill.py
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from opening_fill import plan_opening_fill
+
+SPEC_DIR = scripts_dir.parent / 'work' / 'spec'
+
+
+def load_specs():
+    with open(SPEC_DIR / 'phase_1a' / 'building_geometry.yaml', 'r') as f:
+        phase_1a_spec = yaml.safe_load(f)
+    with open(SPEC_DIR / 'phase_1b' / 'opening_fill.yaml', 'r') as f:
+        spec = yaml.safe_load(f)
+    return phase_1a_spec, spec
+
+
+def piece_names(plan):
+    return {piece['name'] for unit in plan['units'] for pieces in unit['groups'].values() for piece in pieces}
+
+
+def find_piece(plan, name):
+    for unit in plan['units']:
+        for pieces in unit['groups'].values():
+            for piece in pieces:
+                if piece['name'] == name:
+                    return piece
+    raise AssertionError(f"piece {name} not planned")
+
+
+def test_plans_every_filled_cutout():
+    phase_1a_spec, spec = load_specs()
+    plans = {plan['cutout']: plan for plan in plan_opening_fill(phase_1a_spec, spec)}
+
+    # front_alcove_opening has no fill entry
+    assert set(plans) == {'front_entry_door', 'front_left_display_window', 'front_right_display_window',
+                          'door_alcove_left_window', 'door_alcove_right_window', 'rear_service_door'}, set(plans)
+    counts = {name: plan['pieces'] for name, plan in plans.items()}
+    assert counts['front_left_display_window'] == 12, counts  # frame 4, glass 1, trim 3, inner 4
+    assert counts['door_alcove_left_window'] == 7, counts     # frame 4, 2 panes, muntin
+    assert counts['front_entry_door'] == 41, counts           # casing 3, 2 × 19 leaf pieces
+    assert counts['rear_service_door'] == 24, counts          # casing 3, 21 half-lite pieces
+    print("✓ PASS: every filled cutout is planned")
+
+
+def test_object_names_unchanged():
+    phase_1a_spec, spec = load_specs()
+    plans = {plan['cutout']: plan for plan in plan_opening_fill(phase_1a_spec, spec)}
+
+    window = piece_names(plans['front_left_display_window'])
+    for name in ['Front_Left_Window_Frame_Top', 'Front_Left_Window_Glass',
+                 'Front_Left_Window_OuterTrim_Left', 'Front_Left_Window_Inner_Right']:
+        assert name in window, (name, sorted(window))
+    assert 'Front_Left_Window_OuterTrim_Bottom' not in window  # bottom_enabled: false
+
+    alcove = piece_names(plans['door_alcove_right_window'])
+    assert {'Alcove_Right_Window_Glass_Upper', 'Alcove_Right_Window_Muntin'} <= alcove, sorted(alcove)
+
+    door = piece_names(plans['front_entry_door'])
+    assert {'Front_Entry_Door_Frame_Top', 'Front_Entry_Door_Left_Glass_10',
+            'Front_Entry_Door_Right_Stile_Left'} <= door, sorted(door)
+    print("✓ PASS: object names match the previous template")
+
+
+def test_recess_applied_in_plan():
+    phase_1a_spec, spec = load_specs()
+    plans = {plan['cutout']: plan for plan in plan_opening_fill(phase_1a_spec, spec)}
+    plan = plans['front_left_display_window']
+    detail = spec['front_left_display_window']['detail']
+    cutout_y = phase_1a_spec['cutouts']['front_left_display_window']['position']['y']
+
+    frame_y = find_piece(plan, 'Front_Left_Window_Frame_Top')['location'][1]
+    glass_y = find_piece(plan, 'Front_Left_Window_Glass')['location'][1]
+    expected_glass = cutout_y - (detail['frame_recess'] + detail['inner_frame']['setback'] + detail['glass_setback'])
+
+    assert abs(frame_y - (cutout_y - detail['frame_recess'])) < 1e-9, frame_y
+    assert abs(glass_y - expected_glass) < 1e-9, glass_y
+
+    rotation = find_piece(plans['door_alcove_left_window'], 'Alcove_Left_Window_Frame_Left')['rotation_z']
+    assert abs(rotation - 1.1118) < 1e-3, rotation  # 63.7°
+    print("✓ PASS: recesses and rotation applied while planning")
+
+
+def test_new_opening_from_spec_only():
+    phase_1a_spec, spec = load_specs()
+    phase_1a_spec = copy.deepcopy(phase_1a_spec)
+    spec = copy.deepcopy(spec)
+
+    phase_1a_spec['cutouts']['side_window'] = {
+        'width': 1.0, 'height': 1.2, 'wall': 'left', 'position': {'x': -5.0, 'y': 0.0, 'z': 1.0}
+    }
+    spec['side_window'] = copy.deepcopy(spec['front_left_display_window'])
+    spec['side_window']['cutout_ref'] = 'side_window'
+    del spec['side_window']['detail']
+
+    plans = {plan['cutout']: plan for plan in plan_opening_fill(phase_1a_spec, spec)}
+    assert plans['side_window']['prefix'] == 'Side_Window', plans['side_window']['prefix']
+    assert plans['side_window']['pieces'] == 5, plans['side_window']['pieces']
+
+    spec['side_window']['cutout_ref'] = 'missing_cutout'
+    try:
+        plan_opening_fill(phase_1a_spec, spec)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown cutout_ref should raise ValueError")
+    print("✓ PASS: new openings come from spec entries alone")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Opening Fill Engine")
+    print("="*70)
+    try:
+        test_plans_every_filled_cutout()
+        test_object_names_unchanged()
+        test_recess_applied_in_plan()
+        test_new_opening_from_spec_only()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
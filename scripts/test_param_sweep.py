@@ -0,0 +1,163 @@
+"""
+Test Parameter Sweep
+
+Checks variant expansion against the Phase 1A spec (glob override paths,
+grid products, invalid variants caught before any Blender work), the
+results table built from each variant's checkpoints, and that a dead worker
+becomes an error row. When Blender is installed, one variant is built end to
+end and must export its GLB.
+
+Usage:
+    python scripts/test_param_sweep.py
+"""
+
+import csv
+import queue
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from checkpoint_store import JSONCheckpointStore
+from blender_worker_client import find_blender
+from param_sweep import (
+    set_path, expand_variants, write_variant_specs, read_verification, write_results,
+    build_in_pool, run_sweep, BASE_PORT
+)
+from spec_loader import load_spec_data
+
+SPEC_PATH = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
+
+
+def test_set_path_globs():
+    spec = yaml.safe_load(SPEC_PATH.read_text())
+    assert set_path(spec, 'parapet.stepped_configuration.level_*_height', 1.0) == 4
+    assert set_path(spec, 'door_alcove.walls.*.front_x', 1.3) == 2
+    assert spec['door_alcove']['walls']['left']['front_x'] == 1.3
+    assert 'front_x' not in spec['door_alcove']['walls']['back']
+    try:
+        set_path(spec, 'canopy.dpeth', 2.0)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("misspelled path should raise KeyError")
+    print("✓ PASS: glob override paths")
+
+
+def test_expand_and_write_variants():
+    sweep = {
+        'grid': {'canopy.depth': [2.0, 2.5, 3.0], 'parapet.stepped_configuration.level_*_height': [0.9, 1.1]},
+        'variants': [{'walls.thickness': -0.2}, {'canopy.dpeth': 2.0}],
+    }
+    variants = expand_variants(sweep)
+    assert len(variants) == 8, variants
+    assert variants[0] == {'canopy.depth': 2.0, 'parapet.stepped_configuration.level_*_height': 0.9}
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        base = load_spec_data(SPEC_PATH)
+        original_depth = base['canopy']['depth']
+        jobs = write_variant_specs(base, variants, tmp)
+        errors = [job['error'] for job in jobs]
+        assert errors[:6] == [None] * 6, errors
+        assert 'walls.thickness' in errors[6] and 'dpeth' in errors[7], errors
+        written = yaml.safe_load(jobs[5]['spec_path'].read_text())
+        assert written['canopy']['depth'] == 3.0
+        assert written['parapet']['stepped_configuration']['level_3_height'] == 1.1
+        assert not jobs[6]['spec_path'].exists()
+        # The base spec (shared, cached) is untouched
+        assert load_spec_data(SPEC_PATH)['canopy']['depth'] == original_depth
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: grid expansion, validated variant specs")
+
+
+def test_results_from_checkpoints():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        store = JSONCheckpointStore(tmp / 'checkpoints')
+        store.write("inline_verification_001", {"data": {}})
+        store.write("batch_verification_001", {"data": {}})
+        assert read_verification(tmp / 'checkpoints') == {'verified': False, 'critical': None, 'major': None}
+        store.write("automated_verification_001", {"data": {"critical_count": 0, "major_count": 2}})
+        summary = read_verification(tmp / 'checkpoints')
+        assert summary == {'verified': True, 'critical': 0, 'major': 2}, summary
+
+        rows = [{'variant': 'variant_001', 'ok': True, 'build_s': 4.2, 'glb_kb': 50.1,
+                 'overrides': {'canopy.depth': 2.5}, 'error': None, **summary}]
+        write_results(rows, tmp)
+        with open(tmp / 'results.csv', newline='') as f:
+            table = list(csv.DictReader(f))
+        assert table[0]['glb_kb'] == '50.1' and 'canopy.depth' in table[0]['overrides'], table
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: results table from variant checkpoints")
+
+
+class DeadWorker:
+    """Pool worker whose connection was dropped by the Blender process."""
+    port = BASE_PORT
+    process = None
+
+    def submit(self, job, check=True, **params):
+        raise ConnectionError("Blender worker closed the connection")
+
+    def close(self):
+        pass
+
+
+def test_dead_worker_is_error_row():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        jobs = write_variant_specs(load_spec_data(SPEC_PATH), [{'canopy.depth': 2.5}], tmp)
+        pool = queue.Queue()
+        worker = DeadWorker()
+        pool.put(worker)
+
+        row = build_in_pool(pool, jobs[0])
+        assert not row['ok'] and 'closed the connection' in row['error'], row
+        assert row['variant'] == 'variant_001' and row['build_s'] is None
+        # The worker goes back to the pool for the remaining variants
+        assert pool.get_nowait() is worker
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: dead worker reported as an error row")
+
+
+def test_variant_exports_glb():
+    if shutil.which(find_blender()) is None:
+        print("⚠️  SKIP: Blender not found, variant build not run")
+        return
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        jobs = write_variant_specs(load_spec_data(SPEC_PATH), [{'canopy.depth': 2.5}], tmp)
+        rows = run_sweep(jobs, workers=1, base_port=BASE_PORT + 90)
+        glb = tmp / 'variant_001' / 'building_phase_1a_iter_001.glb'
+        assert glb.exists(), rows
+        assert rows[0]['ok'] and rows[0]['verified'] and rows[0]['glb_kb'] > 0, rows
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: variant built and exported in a Blender worker")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Parameter Sweep")
+    print("="*70)
+    try:
+        test_set_path_globs()
+        test_expand_and_write_variants()
+        test_results_from_checkpoints()
+        test_dead_worker_is_error_row()
+        test_variant_exports_glb()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,94 @@
+"""
+Test Render Cache
+
+Checks fetch/store round trips, LRU eviction, and several processes storing
+into one cache directory at once (as render_parallel.py does): no process
+fails, every entry survives, and nothing is left orphaned. No Blender required.
+
+Usage:
+    python scripts/test_render_cache.py
+"""
+
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from render_cache import RenderCache
+
+
+def fake_png(path, size=100, fill=b'x'):
+    path.write_bytes(fill * size)
+    return path
+
+
+def store_many(args):
+    """Worker: store `count` renders under keys prefixed with the worker id."""
+    cache_dir, worker, count = args
+    cache = RenderCache(cache_dir)
+    out_dir = Path(cache_dir).parent / f"renders_{worker}"
+    out_dir.mkdir()
+    for i in range(count):
+        png = fake_png(out_dir / f"view_{i}.png", fill=bytes([65 + worker]))
+        cache.store(f"w{worker}_{i:03d}", png, view=f"view_{i}")
+        cache.fetch(f"w{worker}_{i:03d}", out_dir / f"fetched_{i}.png")
+    return cache.hits
+
+
+def test_fetch_store_and_evict():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        cache = RenderCache(tmp / 'cache', max_bytes=250)
+        assert not cache.fetch('a', tmp / 'out.png')
+        for key in ('a', 'b', 'c'):
+            cache.store(key, fake_png(tmp / f'{key}.png', fill=key.encode()), view=key)
+            cache.fetch(key, tmp / 'out.png')
+        assert (tmp / 'out.png').read_bytes() == b'c' * 100
+        # Third 100-byte entry exceeds 250 bytes: the least recently used ('a') goes
+        assert set(cache.entries()) == {'b', 'c'}, cache.entries()
+        assert not (tmp / 'cache' / 'a.png').exists()
+        assert cache.stats()['bytes'] == 200
+
+        cache.clear()
+        assert cache.stats()['entries'] == 0 and not list((tmp / 'cache').iterdir())
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: fetch, store and LRU eviction")
+
+
+def test_concurrent_processes():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        cache_dir = tmp / 'cache'
+        RenderCache(cache_dir)
+        workers, count = 6, 40
+        with multiprocessing.Pool(workers) as pool:
+            hits = pool.map(store_many, [(str(cache_dir), w, count) for w in range(workers)])
+
+        assert hits == [count] * workers, hits
+        entries = RenderCache(cache_dir).entries()
+        assert len(entries) == workers * count, len(entries)
+        files = {p.name for p in cache_dir.iterdir()}
+        assert len(files) == 2 * workers * count, sorted(f for f in files if f.endswith('.tmp'))[:5]
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: concurrent processes share one cache")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Render Cache")
+    print("="*70)
+    try:
+        test_fetch_store_and_evict()
+        test_concurrent_processes()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
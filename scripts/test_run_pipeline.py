@@ -0,0 +1,181 @@
+"""
+Test Pipeline Runner
+
+Runs small stage DAGs (Python callables in a temporary directory) through
+run_pipeline: unchanged inputs are skipped, changed inputs re-run only the
+affected stages, independent stages overlap, failures block dependents,
+stage scripts pull in the project modules they import, and new-spec
+versions the latest spec.
+
+Usage:
+    python scripts/test_run_pipeline.py
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from run_pipeline import (
+    Stage, run_pipeline, topological_order, create_next_spec, latest_spec, script_closure, iteration_stages
+)
+
+
+def copy_stage(name, source, target, deps=(), calls=None, barrier=None):
+    """Stage that copies source to target (upper-cased), recording each run."""
+    def action(log):
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        calls.append(name)
+        target.write_text(source.read_text().upper())
+    return Stage(name, action, inputs=[source], outputs=[target], deps=deps)
+
+
+def test_skips_unchanged_and_reruns_changed():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        spec, built, render, report = (tmp / n for n in ('spec.txt', 'built.txt', 'render.txt', 'report.txt'))
+        spec.write_text("walls")
+        calls = []
+        stages = [
+            copy_stage('build', spec, built, calls=calls),
+            copy_stage('render', built, render, deps=['build'], calls=calls),
+            copy_stage('validate', built, report, deps=['build'], calls=calls),
+        ]
+
+        first = run_pipeline(stages, tmp / 'logs')
+        assert first['passed'] and sorted(calls) == ['build', 'render', 'validate'], calls
+        assert (tmp / 'logs' / 'pipeline_report.json').exists()
+
+        calls.clear()
+        second = run_pipeline(stages, tmp / 'logs')
+        assert calls == [] and all(r['status'] == 'skipped' for r in second['stages'].values()), second
+
+        # Deleted output: only that stage re-runs
+        render.unlink()
+        run_pipeline(stages, tmp / 'logs')
+        assert calls == ['render'], calls
+
+        # Changed spec: build re-runs, and so do its dependents (their input changed)
+        calls.clear()
+        spec.write_text("walls and roof")
+        run_pipeline(stages, tmp / 'logs')
+        assert calls[0] == 'build' and sorted(calls[1:]) == ['render', 'validate'], calls
+
+        calls.clear()
+        run_pipeline(stages, tmp / 'logs', force=True)
+        assert len(calls) == 3
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: unchanged stages skipped, changed inputs re-run downstream")
+
+
+def test_independent_stages_run_concurrently():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        source = tmp / 'model.glb'
+        source.write_text("glb")
+        calls = []
+        # Both stages must be inside their action at the same time to pass the barrier
+        barrier = threading.Barrier(2)
+        stages = [
+            copy_stage('render', source, tmp / 'render.png', calls=calls, barrier=barrier),
+            copy_stage('validate', source, tmp / 'report.txt', calls=calls, barrier=barrier),
+        ]
+        report = run_pipeline(stages, tmp / 'logs')
+        assert report['passed'], report
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: independent stages overlap")
+
+
+def test_failure_blocks_dependents():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        spec = tmp / 'spec.txt'
+        spec.write_text("spec")
+        calls = []
+
+        def broken(log):
+            raise ValueError("spec invalid")
+
+        stages = [
+            Stage('spec', broken, inputs=[spec]),
+            copy_stage('build', spec, tmp / 'built.txt', deps=['spec'], calls=calls),
+        ]
+        report = run_pipeline(stages, tmp / 'logs')
+        assert not report['passed']
+        assert report['stages']['spec']['status'] == 'failed' and 'spec invalid' in report['stages']['spec']['error']
+        assert report['stages']['build']['status'] == 'blocked' and calls == []
+
+        try:
+            topological_order([Stage('a', broken, deps=['b']), Stage('b', broken, deps=['a'])])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("dependency cycle should be rejected")
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: failed stage blocks its dependents; cycles rejected")
+
+
+def test_script_closure_follows_imports():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        (tmp / 'entry.py').write_text(
+            '"""\nUsage:\n    from unused import thing\n"""\n'
+            "import json\nfrom helper import run\n\n\ndef lazy():\n    import reader\n")
+        (tmp / 'helper.py').write_text("from reader import read\nimport numpy as np\n")
+        (tmp / 'reader.py').write_text("import helper\n")
+        (tmp / 'unused.py').write_text("")
+
+        closure = script_closure(tmp / 'entry.py', scripts_dir=tmp)
+        assert [p.name for p in closure] == ['entry.py', 'helper.py', 'reader.py'], closure
+
+        # Real stages: every project module the stage scripts import is an input
+        stages = {s.name: s for s in iteration_stages(tmp / 'spec.yaml', 1, blender_path='blender')}
+        names = {name: {p.name for p in stage.inputs} for name, stage in stages.items()}
+        assert {'spec_loader.py', 'build_cache.py', 'glb_reader.py'} <= names['build'], names['build']
+        assert 'blender_helpers.py' not in names['build']
+        assert {'render_parallel.py', 'render_views.py', 'render_cache.py'} <= names['render'], names['render']
+        assert 'glb_reader.py' in names['metrics'] and 'glb_reader.py' in names['validate']
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: stage inputs cover the modules their scripts import")
+
+
+def test_new_spec_version():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        (tmp / 'building_v002.yaml').write_text("version: v002\nwalls:\n  height: 3.0\n")
+        (tmp / 'building_v010.yaml').write_text("version: v010\nwalls:\n  height: 3.5\n")
+        new_path = create_next_spec("Raise walls", spec_dir=tmp)
+        assert new_path.name == 'building_v011.yaml'
+        content = new_path.read_text()
+        assert "# Changes: Raise walls" in content and "version: v011" in content, content
+        assert latest_spec(tmp) == (11, new_path)
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: new-spec copies the latest spec to the next version")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Pipeline Runner")
+    print("="*70)
+    try:
+        test_skips_unchanged_and_reruns_changed()
+        test_independent_stages_run_concurrently()
+        test_failure_blocks_dependents()
+        test_script_closure_follows_imports()
+        test_new_spec_version()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,202 @@
+"""
+Test Scene Fingerprints
+
+Checks that fingerprints change exactly when an object's vertices, topology
+or transform change, that shared meshes are hashed once, and that the
+checkpoint gate rejects stale checkpoints and refreshes them from a partial
+re-verification. Uses stand-in objects, so Blender is not required.
+
+Usage:
+    python scripts/test_scene_fingerprint.py
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+import verification_checkpoints as vc
+from checkpoint_store import JSONCheckpointStore
+from scene_fingerprint import hash_geometry, scene_fingerprint, fingerprint_digest, diff_fingerprints
+
+
+class FakeCollection:
+    """Minimal stand-in for a bpy collection supporting foreach_get."""
+
+    def __init__(self, values):
+        self.values = np.asarray(values)
+
+    def __len__(self):
+        return len(self.values) if self.values.ndim == 1 else self.values.shape[0]
+
+    def foreach_get(self, attr, out):
+        out[:] = self.values.ravel()
+
+
+class FakeMesh:
+    def __init__(self, name, co, loops):
+        self.name = name
+        self.vertices = FakeCollection(co)
+        self.loops = FakeCollection(loops)
+        self.reads = 0
+        get = self.vertices.foreach_get
+
+        def counted(attr, out):
+            self.reads += 1
+            get(attr, out)
+        self.vertices.foreach_get = counted
+
+
+class FakeObject:
+    def __init__(self, name, mesh, offset=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.type = 'MESH'
+        self.data = mesh
+        self.matrix_world = np.eye(4)
+        self.matrix_world[:3, 3] = offset
+
+
+def quad_mesh(name, size=1.0):
+    co = [[0, 0, 0], [size, 0, 0], [size, size, 0], [0, size, 0]]
+    return FakeMesh(name, co, [0, 1, 2, 3])
+
+
+def test_hash_sensitivity():
+    co = np.random.default_rng(7).random((1000, 3), dtype=np.float32)
+    base = hash_geometry(co, np.arange(1000), np.eye(4))
+    assert hash_geometry(co.copy(), np.arange(1000), np.eye(4)) == base
+
+    moved = co.copy()
+    moved[500, 2] += 1e-4
+    shifted = np.eye(4)
+    shifted[0, 3] = 0.01
+    for variant in (hash_geometry(moved, np.arange(1000), np.eye(4)),
+                    hash_geometry(co, np.arange(1000)[::-1], np.eye(4)),
+                    hash_geometry(co, np.arange(1000), shifted)):
+        assert variant != base
+    print("✓ PASS: hash changes with vertices, topology and transform")
+
+
+def test_scene_fingerprint_and_diff():
+    shared = quad_mesh("Quad")
+    objects = [FakeObject("A", shared), FakeObject("B", shared, (2, 0, 0)), FakeObject("C", quad_mesh("Big", 2))]
+    recorded = scene_fingerprint(objects)
+    assert shared.reads == 1, shared.reads
+    assert len(set(recorded.values())) == 3
+
+    # Same scene in a different order: same fingerprint
+    assert fingerprint_digest(scene_fingerprint(objects[::-1])) == fingerprint_digest(recorded)
+
+    objects[1].matrix_world[2, 3] = 0.5
+    objects.append(FakeObject("D", quad_mesh("Extra")))
+    diff = diff_fingerprints(recorded, scene_fingerprint(objects[1:]))
+    assert diff == {'changed': ['B'], 'added': ['D'], 'removed': ['A']}, diff
+    print("✓ PASS: fingerprint names changed, added and removed objects")
+
+
+def test_gate_rejects_stale_and_refreshes():
+    tmp = Path(tempfile.mkdtemp())
+    vc.set_checkpoint_store(JSONCheckpointStore(tmp))
+    try:
+        objects = [FakeObject("Wall_Front", quad_mesh("Front")), FakeObject("Roof", quad_mesh("Roof"))]
+        verified = scene_fingerprint(objects)
+        results = {
+            'passed': True, 'critical_failures': [], 'major_failures': [],
+            'results': {'Wall_Front': {'passed': True}, 'Roof': {'passed': True}},
+        }
+        for name in vc.required_checkpoints(60):
+            vc.create_checkpoint(name, results, fingerprint=verified)
+
+        # Unchanged scene: checkpoints reused as-is
+        assert vc.require_all_checkpoints(60, fingerprint=scene_fingerprint(objects))
+
+        objects[1].matrix_world[2, 3] = 0.25
+        current = scene_fingerprint(objects)
+        try:
+            vc.require_all_checkpoints(60, fingerprint=current)
+        except vc.StaleCheckpointError as e:
+            assert e.changed_objects == ['Roof'] and not e.removed_objects, e
+            assert len(e.checkpoints) == 3
+        else:
+            raise AssertionError("moved object should make the checkpoints stale")
+
+        # A re-check that skips a changed object (no dimension spec) refreshes nothing
+        try:
+            vc.refresh_checkpoints(60, {'critical_failures': [], 'results': {}}, current, ['Roof'])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("changed objects without a re-check must not refresh checkpoints")
+
+        # Re-verify only the roof: the dimension checkpoints are refreshed,
+        # automated verification (spec targets) stays stale until re-run
+        roof_results = {'passed': True, 'critical_failures': [], 'major_failures': [],
+                        'results': {'Roof': {'passed': True, 'rechecked': True}}}
+        refreshed = vc.refresh_checkpoints(60, roof_results, current, ['Roof'])
+        assert refreshed == vc.required_checkpoints(60)[:2], refreshed
+        try:
+            vc.require_all_checkpoints(60, fingerprint=current)
+        except vc.StaleCheckpointError as e:
+            assert e.checkpoints == ["automated_verification_060"], e.checkpoints
+        else:
+            raise AssertionError("automated verification must be re-run, not refreshed")
+        vc.create_checkpoint("automated_verification_060", {'critical_count': 0}, fingerprint=current)
+        assert vc.require_all_checkpoints(60, fingerprint=current)
+        record = vc.require_checkpoint("batch_verification_060")
+        assert record['data']['results']['Roof']['rechecked'] and 'Wall_Front' in record['data']['results']
+        assert record['data']['reverified_objects'] == ['Roof']
+
+        # New objects are reported separately (the export gate blocks on them)
+        objects.append(FakeObject("Cutter_Wall_Front", quad_mesh("Cutter")))
+        try:
+            vc.require_all_checkpoints(60, fingerprint=scene_fingerprint(objects))
+        except vc.StaleCheckpointError as e:
+            assert e.added_objects == ["Cutter_Wall_Front"] and e.changed_objects == [], e
+        else:
+            raise AssertionError("added object should make the checkpoints stale")
+
+        try:
+            vc.refresh_checkpoints(60, {'critical_failures': ['Roof'], 'results': {}}, current, ['Roof'])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("critical re-verification failures must not refresh checkpoints")
+
+        # A checkpoint without a fingerprint (plain Python, or from before
+        # fingerprints) proves nothing about this scene
+        objects.pop()
+        vc.create_checkpoint("batch_verification_060", results)
+        assert 'fingerprint' not in vc.require_checkpoint("batch_verification_060")
+        assert vc.require_all_checkpoints(60)
+        try:
+            vc.require_all_checkpoints(60, fingerprint=current)
+        except vc.StaleCheckpointError as e:
+            assert e.checkpoints == ["batch_verification_060"] and e.unbound == e.checkpoints, e
+            assert not (e.changed_objects or e.added_objects or e.removed_objects), e
+        else:
+            raise AssertionError("checkpoint without a fingerprint must count as stale")
+    finally:
+        vc.set_checkpoint_store(None)
+        shutil.rmtree(tmp)
+    print("✓ PASS: stale checkpoints rejected, refreshed from a partial re-verification")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Scene Fingerprints")
+    print("="*70)
+    try:
+        test_hash_sensitivity()
+        test_scene_fingerprint_and_diff()
+        test_gate_rejects_stale_and_refreshes()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,120 @@
+"""
+Test Spec Loader
+
+Checks that spec_loader validates every spec kind, reports all schema problems
+at once, compiles typed views, and serves repeated loads from the memo and
+the disk cache (keyed on mtime, then content hash).
+
+Usage:
+    python scripts/test_spec_loader.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from spec_loader import (
+    load_spec,
+    compile_spec,
+    clear_spec_cache,
+    get_spec_cache_stats,
+    SpecValidationError,
+)
+
+SPEC_DIR = scripts_dir.parent / 'work' / 'spec'
+
+
+def test_current_specs_compile():
+    cases = {
+        'phase_1a/building_geometry.yaml': 'phase_1a',
+        'phase_1b/opening_fill.yaml': 'phase_1b',
+        'phase_1c/interior_layout.yaml': 'phase_1c',
+        'building_v004.yaml': 'building',
+    }
+    for relative, kind in cases.items():
+        spec = load_spec(SPEC_DIR / relative, use_cache=False)
+        assert spec.kind == kind, (relative, spec.kind)
+
+    phase_1a = load_spec(SPEC_DIR / 'phase_1a' / 'building_geometry.yaml', use_cache=False)
+    assert phase_1a.walls.thickness == 0.18, phase_1a.walls
+    door = next(c for c in phase_1a.cutouts if c.name == 'rear_service_door')
+    assert (door.wall, door.width, door.z) == ('rear', 1.0, 0.0), door
+    assert phase_1a.data['cutouts']['rear_service_door']['width'] == 1.0
+    print("✓ PASS: every current spec kind validates and compiles")
+
+
+def test_reports_every_error():
+    data = {
+        'phase': '1a', 'units': 'meters',
+        'overall': {'footprint': {'width': -8.5, 'depth': 15.0}},
+        'walls': {'thickness': 0.18},
+        'cutouts': {'door': {'width': 1.0, 'height': 2.1, 'wall': 'roof', 'position': {'x': 0, 'y': 0}}},
+    }
+    try:
+        compile_spec(data)
+    except SpecValidationError as e:
+        assert isinstance(e, ValueError)
+        messages = "\n".join(e.errors)
+        for expected in ('overall.footprint.width: must be positive', 'walls.height: required',
+                         "cutouts.door.wall: unknown wall 'roof'", 'cutouts.door.position.z: required'):
+            assert expected in messages, (expected, messages)
+    else:
+        raise AssertionError("invalid spec should raise SpecValidationError")
+    print("✓ PASS: validation reports every problem at once")
+
+
+def test_memo_and_disk_cache():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        spec_path = tmp / 'building_geometry.yaml'
+        shutil.copy(SPEC_DIR / 'phase_1a' / 'building_geometry.yaml', spec_path)
+        cache_dir = tmp / 'cache'
+
+        clear_spec_cache()
+        first = load_spec(spec_path, cache_dir=cache_dir)
+        assert load_spec(spec_path, cache_dir=cache_dir) is first
+        assert get_spec_cache_stats() == {'memo_hits': 1, 'disk_hits': 0, 'parses': 1}
+
+        # New process: memo empty, disk cache hit without parsing
+        clear_spec_cache()
+        again = load_spec(spec_path, cache_dir=cache_dir)
+        assert again.cutouts == first.cutouts
+        assert get_spec_cache_stats()['disk_hits'] == 1
+
+        # Touched but unchanged: content hash still matches
+        clear_spec_cache()
+        stat = spec_path.stat()
+        os.utime(spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        load_spec(spec_path, cache_dir=cache_dir)
+        assert get_spec_cache_stats() == {'memo_hits': 0, 'disk_hits': 1, 'parses': 0}
+
+        # Real change: reparsed and revalidated
+        spec_path.write_text(spec_path.read_text().replace('thickness: 0.18', 'thickness: 0.2', 1))
+        changed = load_spec(spec_path, cache_dir=cache_dir)
+        assert changed.walls.thickness == 0.2, changed.walls
+        assert get_spec_cache_stats()['parses'] == 1
+    finally:
+        clear_spec_cache()
+        shutil.rmtree(tmp)
+    print("✓ PASS: memo, mtime and content-hash cache hits")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Spec Loader")
+    print("="*70)
+    try:
+        test_current_specs_compile()
+        test_reports_every_error()
+        test_memo_and_disk_cache()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,131 @@
+"""
+Test View Visibility
+
+Builds a closed building shell (walls, roof, one front window opening) with
+interior pieces and checks the ray-cast occlusion used by the render cache:
+the top view sees none of the interior, the front view sees the partition
+through the window but not the closet behind it, glass left out of the
+occluders does not hide anything, and an interior-only change keeps the
+cached 'top' render. No Blender required.
+
+Usage:
+    python scripts/test_view_visibility.py
+"""
+
+import hashlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from render_cache import RenderCache
+from test_glb_intersections import box_triangles
+from view_visibility import occluded_objects, box_sample_points
+
+# Cameras as render_views places them: 2.5x the largest dimension from the center
+CENTER = np.array([0.0, 0.0, 2.0])
+CAMERAS = {'top': CENTER + [0, 0, 37.5], 'front': CENTER + [0, -37.5, 0]}
+
+
+def shell(closet_x=2.75, partition_y=-5.0):
+    """8.5 x 15 m building with a front window at x -3..-1.5, z 1..2.5, plus interior pieces."""
+    boxes = {
+        'Wall_Front_Left': ((-3.625, -7.5, 1.875), (1.25, 0.18, 3.75)),
+        'Wall_Front_Right': ((1.375, -7.5, 1.875), (5.75, 0.18, 3.75)),
+        'Wall_Front_Sill': ((-2.25, -7.5, 0.5), (1.5, 0.18, 1.0)),
+        'Wall_Front_Head': ((-2.25, -7.5, 3.125), (1.5, 0.18, 1.25)),
+        'Wall_Rear': ((0, 7.5, 1.875), (8.5, 0.18, 3.75)),
+        'Wall_Left': ((-4.25, 0, 1.875), (0.18, 15.0, 3.75)),
+        'Wall_Right': ((4.25, 0, 1.875), (0.18, 15.0, 3.75)),
+        'Roof': ((0, 0, 3.85), (8.68, 15.18, 0.2)),
+        'Interior_Partition': ((0, partition_y, 1.5), (8.0, 0.1, 3.0)),
+        'Interior_Closet': ((closet_x, 4.0, 1.2), (1.5, 2.0, 2.4)),
+    }
+    return {name: box_triangles(center, size) for name, (center, size) in boxes.items()}
+
+
+def view_key(view, objects, hidden):
+    """Stand-in for compute_view_hash: camera plus the geometry of every visible object."""
+    h = hashlib.sha256(view.encode())
+    for name in sorted(set(objects) - hidden):
+        h.update(name.encode())
+        h.update(np.round(objects[name], 6).tobytes())
+    return h.hexdigest()
+
+
+def test_box_samples_cover_faces():
+    points = box_sample_points((0, 0, 0), (1, 2, 3), samples_per_edge=3)
+    # 3x3x3 grid minus the single interior point
+    assert len(points) == 26, len(points)
+    assert points.min(axis=0).tolist() == [0, 0, 0] and points.max(axis=0).tolist() == [1, 2, 3]
+    print("✓ PASS: bounding box sample grid")
+
+
+def test_top_view_hides_interior():
+    objects = shell()
+    hidden = occluded_objects(CAMERAS['top'], objects)
+    assert {'Interior_Partition', 'Interior_Closet'} <= hidden, hidden
+    assert 'Roof' not in hidden
+    print("✓ PASS: roof hides the interior from the top view")
+
+
+def test_front_view_sees_through_window():
+    objects = shell()
+    hidden = occluded_objects(CAMERAS['front'], objects)
+    assert 'Interior_Partition' not in hidden, hidden
+    assert 'Interior_Closet' in hidden, hidden
+    assert not {'Wall_Front_Left', 'Wall_Front_Right', 'Wall_Front_Head', 'Roof'} & hidden, hidden
+
+    # Glass in the window: hides the partition only if it is passed as an occluder
+    objects['Window_Glass'] = box_triangles((-2.25, -7.5, 1.75), (1.5, 0.01, 1.5))
+    opaque = {name: tris for name, tris in objects.items() if name != 'Window_Glass'}
+    assert 'Interior_Partition' not in occluded_objects(CAMERAS['front'], objects, opaque)
+    assert 'Interior_Partition' in occluded_objects(CAMERAS['front'], objects)
+    print("✓ PASS: front view sees the partition through the window only")
+
+
+def test_interior_change_keeps_top_entry():
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        cache = RenderCache(tmp / 'cache')
+        before = shell()
+        keys = {view: view_key(view, before, occluded_objects(origin, before)) for view, origin in CAMERAS.items()}
+        for view, key in keys.items():
+            png = tmp / f'{view}.png'
+            png.write_bytes(view.encode() * 10)
+            cache.store(key, png, view=view)
+
+        # Phase 1C-style interior edit: the partition moves
+        after = shell(partition_y=-4.0)
+        new_keys = {view: view_key(view, after, occluded_objects(origin, after)) for view, origin in CAMERAS.items()}
+        assert new_keys['top'] == keys['top']
+        assert cache.fetch(new_keys['top'], tmp / 'top_again.png')
+        assert (tmp / 'top_again.png').read_bytes() == b'top' * 10
+        # The front view sees the partition through the window, so it re-renders
+        assert new_keys['front'] != keys['front']
+        assert not cache.fetch(new_keys['front'], tmp / 'front_again.png')
+    finally:
+        shutil.rmtree(tmp)
+    print("✓ PASS: interior-only change keeps the cached top view")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing View Visibility")
+    print("="*70)
+    try:
+        test_box_samples_cover_faces()
+        test_top_view_hides_interior()
+        test_front_view_sees_through_window()
+        test_interior_change_keeps_top_entry()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -0,0 +1,120 @@
+"""
+Test Wall Generator
+
+Checks that wall_generator builds closed, consistently wound wall slabs with
+exact openings, handles doors on the wall edge and rejects bad openings.
+
+Usage:
+    python scripts/test_wall_generator.py
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+# Add scripts to path
+scripts_dir = Path(__file__).parent
+sys.path.append(str(scripts_dir))
+
+from glb_analyzer import analyze_triangles
+from wall_generator import wall_mesh, openings_for_wall
+
+SPEC_PATH = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
+
+
+def triangulate(faces):
+    faces = np.array(faces)
+    return np.concatenate([faces[:, [0, 1, 2]], faces[:, [0, 2, 3]]])
+
+
+def signed_volume(verts, faces):
+    tris = verts[triangulate(faces)]
+    return float(np.einsum('ij,ij->i', tris[:, 0], np.cross(tris[:, 1], tris[:, 2])).sum() / 6)
+
+
+def assert_closed(verts, faces):
+    metrics = analyze_triangles(verts, triangulate(faces))
+    assert metrics['boundary_edges'] == 0, metrics
+    assert metrics['non_manifold_edges'] == 0, metrics
+    assert metrics['degenerate_triangles'] == 0, metrics
+
+    # Consistent winding: every directed edge is used exactly once
+    directed = Counter((f[k], f[(k + 1) % 4]) for f in faces for k in range(4))
+    assert max(directed.values()) == 1, directed.most_common(1)
+
+
+def test_plain_wall_is_box():
+    verts, faces = wall_mesh(8.5, 0.18, 3.75)
+    assert len(faces) == 6, len(faces)
+    assert_closed(verts, faces)
+    assert abs(signed_volume(verts, faces) - 8.5 * 0.18 * 3.75) < 1e-9
+    assert np.allclose(verts.min(axis=0), [-4.25, -0.09, -1.875])
+    print("✓ PASS: wall without openings is a box")
+
+
+def test_openings_are_exact_holes():
+    openings = [
+        {'name': 'left', 'x': -2.6, 'z': 0.45, 'width': 2.2, 'height': 2.3},
+        {'name': 'door', 'x': 0.0, 'z': 0.0, 'width': 1.4, 'height': 2.1},  # touches the base
+        {'name': 'right', 'x': 2.6, 'z': 0.45, 'width': 2.2, 'height': 2.3},
+    ]
+    verts, faces = wall_mesh(8.5, 0.18, 3.75, openings)
+    assert_closed(verts, faces)
+
+    expected = 0.18 * (8.5 * 3.75 - sum(o['width'] * o['height'] for o in openings))
+    volume = signed_volume(verts, faces)
+    assert volume > 0, "faces should point outward"
+    assert abs(volume - expected) < 1e-9, (volume, expected)
+
+    # No geometry inside the door opening
+    inside = (np.abs(verts[:, 0]) < 0.7 - 1e-9) & (verts[:, 2] < 2.1 - 1.875 - 1e-9)
+    assert not inside.any()
+    print(f"✓ PASS: three openings, {len(faces)} quads, volume exact")
+
+
+def test_rejects_bad_openings():
+    for openings in (
+        [{'x': 0, 'z': 0, 'width': 1, 'height': 2}, {'x': 0.5, 'z': 1, 'width': 1, 'height': 2}],
+        [{'x': 4.0, 'z': 0, 'width': 1, 'height': 2}],
+        [{'x': 0, 'z': 3.0, 'width': 1, 'height': 1}],
+    ):
+        try:
+            wall_mesh(8.5, 0.18, 3.75, openings)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {openings}")
+    print("✓ PASS: overlapping and out-of-wall openings raise ValueError")
+
+
+def test_openings_from_spec():
+    with open(SPEC_PATH, 'r') as f:
+        spec = yaml.safe_load(f)
+    depth = spec['overall']['footprint']['depth']
+
+    for wall, center, axis in [('front', (0, -depth / 2), 'x'), ('rear', (0, depth / 2), 'x')]:
+        openings = openings_for_wall(spec, wall, center, axis)
+        expected = [c for c in spec['cutouts'].values() if c['wall'] == wall]
+        assert len(openings) == len(expected), (wall, openings)
+        verts, faces = wall_mesh(spec['overall']['footprint']['width'], spec['walls']['thickness'],
+                                 spec['walls']['height'], openings)
+        assert_closed(verts, faces)
+    print("✓ PASS: spec cutouts build closed walls")
+
+
+if __name__ == "__main__":
+    print("="*70)
+    print(" Testing Wall Generator")
+    print("="*70)
+    try:
+        test_plain_wall_is_box()
+        test_openings_are_exact_holes()
+        test_rejects_bad_openings()
+        test_openings_from_spec()
+    except AssertionError as e:
+        print(f"❌ FAIL: {e}")
+        sys.exit(1)
+    print("\n✅ ALL TESTS PASSED")
+    sys.exit(0)
@@ -6,6 +6,9 @@ Can run standalone (outside Blender) for CI/CD validation.
 
 Usage:
     python validate_geometry.py --metrics work/metrics/metrics_001.json
+
+    # Compute metrics directly from an exported GLB (no Blender needed)
+    python validate_geometry.py --glb exports/glb/building_phase_1a_iter_049.glb
 """
 
 import argparse
@@ -41,6 +44,15 @@ class GeometryValidator:
         if non_manifold > 0:
             self.errors.append(f"Found {non_manifold} non-manifold edges")
 
+        # Only reported by glb_analyzer: open edges and collapsed triangles
+        boundary = self.metrics.get("boundary_edges", 0)
+        if boundary > 0:
+            self.warnings.append(f"Found {boundary} boundary (open) edges")
+
+        degenerate = self.metrics.get("degenerate_triangles", 0)
+        if degenerate > 0:
+            self.warnings.append(f"Found {degenerate} degenerate triangles")
+
     def check_intersections(self):
         """
         Check for intersecting faces.
@@ -54,6 +66,13 @@ class GeometryValidator:
         if intersecting > 0:
             self.errors.append(f"Found {intersecting} intersecting faces")
 
+        # Offending nodes, when computed by glb_intersections
+        details = self.metrics.get("intersections", {})
+        for pair, count in details.get("between_nodes", {}).items():
+            self.errors.append(f"Intersecting nodes: {pair} ({count} triangle pairs)")
+        for node, count in details.get("within_nodes", {}).items():
+            self.errors.append(f"Self-intersecting node: {node} ({count} triangle pairs)")
+
     def check_coplanar_faces(self):
         """
         Check for excessive coplanar faces.
@@ -175,7 +194,9 @@ def load_metrics(metrics_path):
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Validate geometry metrics")
-    parser.add_argument("--metrics", required=True, help="Path to metrics JSON file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--metrics", help="Path to metrics JSON file")
+    source.add_argument("--glb", help="Path to GLB file (metrics computed by glb_analyzer)")
     return parser.parse_args()
 
 
@@ -183,13 +204,24 @@ def main():
     """Main execution."""
     args = parse_args()
 
-    metrics_path = Path(args.metrics)
-    if not metrics_path.exists():
-        print(f"ERROR: Metrics file not found: {metrics_path}")
-        sys.exit(1)
+    if args.glb:
+        glb_path = Path(args.glb)
+        if not glb_path.exists():
+            print(f"ERROR: GLB file not found: {glb_path}")
+            sys.exit(1)
+
+        from glb_analyzer import analyze_glb
+
+        print(f"Analyzing GLB: {glb_path}")
+        metrics = analyze_glb(glb_path, intersections=True)
+    else:
+        metrics_path = Path(args.metrics)
+        if not metrics_path.exists():
+            print(f"ERROR: Metrics file not found: {metrics_path}")
+            sys.exit(1)
 
-    print(f"Loading metrics from: {metrics_path}")
-    metrics = load_metrics(metrics_path)
+        print(f"Loading metrics from: {metrics_path}")
+        metrics = load_metrics(metrics_path)
 
     validator = GeometryValidator(metrics)
     passed = validator.validate()
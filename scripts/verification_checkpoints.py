@@ -4,12 +4,15 @@ Verification Checkpoint System
 Creates and validates checkpoint files that prove verification steps completed.
 This system makes it mechanically impossible to skip verification steps.
 
-Checkpoints are stored as JSON files in work/verification/checkpoints/
-Each checkpoint contains verification results and a timestamp.
+Checkpoints are stored in work/verification/checkpoints/, as one JSON file
+per checkpoint (default) or in a single indexed SQLite database
+(CHECKPOINT_BACKEND=sqlite; see checkpoint_store). Each checkpoint contains
+verification results and a timestamp. Inside Blender each checkpoint also
+records a scene fingerprint (see scene_fingerprint), so a checkpoint only
+counts for the geometry it actually verified.
 """
 
-import json
-import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -17,11 +20,89 @@ from pathlib import Path
 # Checkpoint directory - make it absolute to avoid working directory issues
 # Get the project root (parent of scripts directory)
 _SCRIPTS_DIR = Path(__file__).parent if '__file__' in globals() else Path.cwd() / 'scripts'
-_PROJECT_ROOT = _SCRIPTS_DIR.parent
-CHECKPOINT_DIR = _PROJECT_ROOT / "work" / "verification" / "checkpoints"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(_SCRIPTS_DIR))
 
+from checkpoint_store import (
+    DEFAULT_CHECKPOINT_DIR,
+    CheckpointIntegrityError,
+    open_checkpoint_store,
+    stamp_record,
+    verify_record
+)
+from scene_fingerprint import current_scene_fingerprint, diff_fingerprints
 
-def create_checkpoint(checkpoint_name, data):
+CHECKPOINT_DIR = DEFAULT_CHECKPOINT_DIR
+
+# Active store (opened on first use from CHECKPOINT_BACKEND / CHECKPOINT_DIR)
+_store = None
+
+
+class StaleCheckpointError(ValueError):
+    """
+    Raised when the scene changed after a checkpoint was created.
+
+    Checkpoints that recorded no fingerprint (written outside Blender or
+    before fingerprints existed) cannot show which scene they verified; they
+    are listed in `unbound` and count as stale.
+    """
+
+    def __init__(self, checkpoints, changed_objects, removed_objects, added_objects=(), unbound=()):
+        self.checkpoints = checkpoints
+        self.changed_objects = changed_objects
+        self.removed_objects = removed_objects
+        self.added_objects = list(added_objects)
+        self.unbound = list(unbound)
+        lines = [f"Scene changed since verification ({', '.join(checkpoints)})"]
+        if self.unbound:
+            lines.append(f"  No scene fingerprint recorded: {self.unbound}")
+        if changed_objects:
+            lines.append(f"  Changed objects: {changed_objects}")
+        if self.added_objects:
+            lines.append(f"  New objects: {self.added_objects}")
+        if removed_objects:
+            lines.append(f"  Removed objects: {removed_objects}")
+        super().__init__("\n".join(lines))
+
+
+def required_checkpoints(iteration_num):
+    """Names of the checkpoints Phase 1A export requires for an iteration."""
+    return [
+        f"inline_verification_{iteration_num:03d}",
+        f"batch_verification_{iteration_num:03d}",
+        f"automated_verification_{iteration_num:03d}"
+    ]
+
+
+def dimension_checkpoints(iteration_num):
+    """
+    Checkpoints made only of per-object dimension checks (verify_all_objects).
+
+    These can be refreshed from a re-check of the changed objects; the
+    automated verification checks spec targets across objects and has to be
+    re-run as a whole.
+    """
+    return required_checkpoints(iteration_num)[:2]
+
+
+def get_checkpoint_store():
+    """Get the active checkpoint store (JSON files unless CHECKPOINT_BACKEND=sqlite)."""
+    global _store
+    if _store is None:
+        _store = open_checkpoint_store(directory=CHECKPOINT_DIR)
+    return _store
+
+
+def set_checkpoint_store(store):
+    """
+    Use a different checkpoint store (e.g. a SQLiteCheckpointStore, or a
+    store in a temporary directory for tests). Pass None to reopen the default.
+    """
+    global _store
+    _store = store
+
+
+def create_checkpoint(checkpoint_name, data, fingerprint=None):
     """
     Create a verification checkpoint file.
 
@@ -34,9 +115,11 @@ def create_checkpoint(checkpoint_name, data):
         data (dict): Verification results containing:
             - For verify_all_objects: {'passed', 'results', 'critical_failures', 'major_failures'}
             - For custom verification: any dict, but must not have critical_failures
+        fingerprint (dict, optional): Scene fingerprint to bind the checkpoint to
+            (default: the open Blender scene; none outside Blender)
 
     Returns:
-        Path: Path to created checkpoint file
+        Path: Path to created checkpoint file (the database file for SQLite)
 
     Raises:
         ValueError: If data indicates verification failures (prevents checkpoint creation)
@@ -46,15 +129,17 @@ def create_checkpoint(checkpoint_name, data):
         >>> create_checkpoint("batch_verification_005", results)
         ✓ Checkpoint created: batch_verification_005
     """
-    # Ensure checkpoint directory exists
-    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
-
     checkpoint_data = {
         "checkpoint": checkpoint_name,
         "timestamp": datetime.now().isoformat(),
         "data": data
     }
 
+    if fingerprint is None:
+        fingerprint = current_scene_fingerprint()
+    if fingerprint is not None:
+        checkpoint_data["fingerprint"] = fingerprint
+
     # Validate: Check for critical failures
     if "critical_failures" in data and len(data["critical_failures"]) > 0:
         raise ValueError(
@@ -64,10 +149,8 @@ def create_checkpoint(checkpoint_name, data):
             f"Fix these failures before proceeding."
         )
 
-    # Write checkpoint file
-    checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_name}.json"
-    with open(checkpoint_file, 'w') as f:
-        json.dump(checkpoint_data, f, indent=2)
+    # Write checkpoint (atomically, stamped with a SHA-256 of its contents)
+    checkpoint_file = get_checkpoint_store().write(checkpoint_name, stamp_record(checkpoint_data))
 
     print(f"✓ Checkpoint created: {checkpoint_name}")
     return checkpoint_file
@@ -88,34 +171,34 @@ def require_checkpoint(checkpoint_name):
 
     Raises:
         FileNotFoundError: If checkpoint file doesn't exist (verification not completed)
+        CheckpointIntegrityError: If the checkpoint is truncated or fails its digest
 
     Example:
         >>> require_checkpoint("batch_verification_005")
         ✓ Checkpoint validated: batch_verification_005
         {'checkpoint': 'batch_verification_005', 'timestamp': '...', 'data': {...}}
     """
-    checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_name}.json"
+    store = get_checkpoint_store()
+    data = store.read(checkpoint_name)
 
-    if not checkpoint_file.exists():
+    if data is None:
         raise FileNotFoundError(
             f"\n{'='*70}\n"
             f"❌ VERIFICATION CHECKPOINT MISSING: {checkpoint_name}\n"
             f"{'='*70}\n\n"
             f"This verification step has not been completed.\n"
             f"Cannot proceed until verification passes.\n\n"
-            f"Expected checkpoint file: {checkpoint_file}\n\n"
+            f"Expected checkpoint: {store.location(checkpoint_name)}\n\n"
             f"You must complete the verification step that creates this checkpoint.\n"
         )
 
-    # Load and return checkpoint data
-    with open(checkpoint_file) as f:
-        data = json.load(f)
+    verify_record(checkpoint_name, data, store.location(checkpoint_name))
 
     print(f"✓ Checkpoint validated: {checkpoint_name}")
     return data
 
 
-def require_all_checkpoints(iteration_num):
+def require_all_checkpoints(iteration_num, fingerprint=None):
     """
     Verify all required checkpoints exist for an iteration.
 
@@ -124,12 +207,17 @@ def require_all_checkpoints(iteration_num):
 
     Args:
         iteration_num (int): Iteration number (e.g., 5)
+        fingerprint (dict, optional): Current scene fingerprint; if given, every
+            checkpoint must have recorded one that matches it
 
     Returns:
         bool: True if all checkpoints exist
 
     Raises:
         FileNotFoundError: If any required checkpoint is missing
+        CheckpointIntegrityError: If any required checkpoint is corrupt
+        StaleCheckpointError: If the scene changed since a checkpoint was created,
+            or (with fingerprint) a checkpoint recorded no fingerprint
 
     Example:
         >>> require_all_checkpoints(5)
@@ -139,23 +227,90 @@ def require_all_checkpoints(iteration_num):
         ✓ All verification checkpoints validated for iteration 5
         True
     """
-    # Define required checkpoints for Phase 1A
-    required = [
-        f"inline_verification_{iteration_num:03d}",
-        f"batch_verification_{iteration_num:03d}",
-        f"automated_verification_{iteration_num:03d}"
-    ]
-
     print(f"\nVerifying all checkpoints for iteration {iteration_num}...")
 
     # Check each checkpoint
-    for checkpoint in required:
-        require_checkpoint(checkpoint)
+    records = {checkpoint: require_checkpoint(checkpoint) for checkpoint in required_checkpoints(iteration_num)}
+
+    if fingerprint is not None:
+        stale, changed, removed, added, unbound = [], set(), set(), set(), []
+        for checkpoint, record in records.items():
+            # Written outside Blender or before fingerprints: verified an unknown scene
+            if 'fingerprint' not in record:
+                stale.append(checkpoint)
+                unbound.append(checkpoint)
+                continue
+            diff = diff_fingerprints(record['fingerprint'], fingerprint)
+            if any(diff.values()):
+                stale.append(checkpoint)
+                changed.update(diff['changed'])
+                added.update(diff['added'])
+                removed.update(diff['removed'])
+        if stale:
+            raise StaleCheckpointError(stale, sorted(changed), sorted(removed), sorted(added), unbound)
+        print("✓ Checkpoints match the current scene fingerprint")
 
     print(f"✓ All verification checkpoints validated for iteration {iteration_num}\n")
     return True
 
 
+def refresh_checkpoints(iteration_num, results, fingerprint, objects):
+    """
+    Re-create stale dimension checkpoints after re-verifying only the changed objects.
+
+    Only the checkpoints whose checks were re-run are refreshed (see
+    dimension_checkpoints): the new results are merged into each checkpoint's
+    'results' and the checkpoint is re-bound to the current fingerprint. A
+    stale automated_verification checkpoint is left stale.
+
+    Args:
+        iteration_num (int): Iteration number
+        results (dict): verify_all_objects output for the changed objects
+        fingerprint (dict): Current scene fingerprint
+        objects (list): Names of the changed objects (recorded in the checkpoint)
+
+    Returns:
+        list: Names of the refreshed checkpoints
+
+    Raises:
+        ValueError: If the re-verification has critical failures, or did not
+            cover every changed object
+    """
+    if results.get('critical_failures'):
+        raise ValueError(
+            f"Re-verification failed with {len(results['critical_failures'])} critical failures.\n"
+            f"Failed objects: {results['critical_failures']}"
+        )
+    unverified = [name for name in objects if name not in results.get('results', {})]
+    if unverified:
+        raise ValueError(
+            f"Re-verification did not cover {len(unverified)} changed object(s) (no dimension spec).\n"
+            f"Unverified objects: {unverified}"
+        )
+
+    store = get_checkpoint_store()
+    refreshed = []
+
+    for checkpoint in dimension_checkpoints(iteration_num):
+        record = store.read(checkpoint)
+        if record is None or record.get('fingerprint') == fingerprint:
+            continue
+
+        data = dict(record['data'])
+        if 'results' in data and 'results' in results:
+            data['results'] = {**data['results'], **results['results']}
+            data['passed'] = all(r.get('passed', True) for r in data['results'].values())
+            data['major_failures'] = [
+                name for name in data.get('major_failures', []) if name not in results['results']
+            ] + results.get('major_failures', [])
+        data['reverified_objects'] = sorted(objects)
+
+        create_checkpoint(checkpoint, data, fingerprint=fingerprint)
+        refreshed.append(checkpoint)
+
+    return refreshed
+
+
 def clear_checkpoints(iteration_num=None):
     """
     Clear checkpoints for an iteration (use when rebuilding).
@@ -168,22 +323,11 @@ def clear_checkpoints(iteration_num=None):
         >>> clear_checkpoints(5)  # Clear only iteration 5
         >>> clear_checkpoints()   # Clear all
     """
-    if not CHECKPOINT_DIR.exists():
-        print("No checkpoints to clear")
-        return
+    count = get_checkpoint_store().delete(iteration_num)
 
     if iteration_num is None:
-        # Clear all
-        for checkpoint_file in CHECKPOINT_DIR.glob("*.json"):
-            checkpoint_file.unlink()
-        print("✓ All checkpoints cleared")
+        print(f"✓ All checkpoints cleared ({count})")
     else:
-        # Clear specific iteration
-        pattern = f"*_{iteration_num:03d}.json"
-        count = 0
-        for checkpoint_file in CHECKPOINT_DIR.glob(pattern):
-            checkpoint_file.unlink()
-            count += 1
         print(f"✓ Cleared {count} checkpoint(s) for iteration {iteration_num}")
 
 
@@ -201,20 +345,7 @@ def list_checkpoints(iteration_num=None):
         >>> list_checkpoints(5)
         ['inline_verification_005', 'batch_verification_005']
     """
-    if not CHECKPOINT_DIR.exists():
-        return []
-
-    if iteration_num is None:
-        pattern = "*.json"
-    else:
-        pattern = f"*_{iteration_num:03d}.json"
-
-    checkpoints = []
-    for checkpoint_file in CHECKPOINT_DIR.glob(pattern):
-        checkpoint_name = checkpoint_file.stem
-        checkpoints.append(checkpoint_name)
-
-    return sorted(checkpoints)
+    return get_checkpoint_store().names(iteration_num)
 
 
 # Utility function for debugging
@@ -236,27 +367,11 @@ def get_checkpoint_status(iteration_num):
             'automated_verification_005': {'exists': False, 'timestamp': None}
         }
     """
-    required = [
-        f"inline_verification_{iteration_num:03d}",
-        f"batch_verification_{iteration_num:03d}",
-        f"automated_verification_{iteration_num:03d}"
-    ]
+    required = required_checkpoints(iteration_num)
 
-    status = {}
-    for checkpoint_name in required:
-        checkpoint_file = CHECKPOINT_DIR / f"{checkpoint_name}.json"
-
-        if checkpoint_file.exists():
-            with open(checkpoint_file) as f:
-                data = json.load(f)
-            status[checkpoint_name] = {
-                'exists': True,
-                'timestamp': data.get('timestamp')
-            }
-        else:
-            status[checkpoint_name] = {
-                'exists': False,
-                'timestamp': None
-            }
-
-    return status
+    # One query for the SQLite store
+    timestamps = get_checkpoint_store().timestamps(required)
+    return {
+        checkpoint_name: {'exists': checkpoint_name in timestamps, 'timestamp': timestamps.get(checkpoint_name)}
+        for checkpoint_name in required
+    }
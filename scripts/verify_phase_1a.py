@@ -22,7 +22,6 @@ Returns:
 """
 
 import bpy
-import yaml
 import sys
 from pathlib import Path
 
@@ -32,16 +31,15 @@ if str(scripts_dir) not in sys.path:
     sys.path.append(str(scripts_dir))
 
 from verification_checkpoints import create_checkpoint
+from scene_bounds import WorldBoundsCache
+from wall_generator import get_wall_openings
+from spec_loader import load_spec_data
 
 
 def load_spec():
-    """Load Phase 1A spec file."""
-    spec_path = Path(__file__).parent.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
-
-    with open(spec_path, 'r') as f:
-        spec = yaml.safe_load(f)
-
-    return spec
+    """Load Phase 1A spec file (the build template's spec_path when exec'd from it)."""
+    default_path = Path(__file__).parent.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
+    return load_spec_data(globals().get('spec_path', default_path))
 
 
 def verify_geometry(spec):
@@ -54,6 +52,9 @@ def verify_geometry(spec):
     targets = spec['validation_targets']
     scene = bpy.context.scene
 
+    # One bounds cache per run: each object's vertices are read once
+    bounds = WorldBoundsCache()
+
     issues = {
         'critical': [],  # >10% error
         'major': [],     # 5-10% error
@@ -63,17 +64,18 @@ def verify_geometry(spec):
 
     # Map validation targets to object measurements
     # NOTE: Only including measurements that are currently implemented
-    # Cutout dimensions (door/window sizes) are NOT included because
-    # measuring Boolean-modified geometry requires more sophisticated analysis
+    # Cutout dimensions are only measured on walls built with openings in the
+    # mesh (analytic_walls); Boolean-modified geometry is not analyzed
+    display_window = measure_display_window()
     measurements = {
         # Overall dimensions - measured from bounding box
-        'overall_width': measure_building_width(),
-        'overall_depth': measure_building_depth(),
-        'wall_height': measure_wall_height(),
+        'overall_width': measure_building_width(bounds),
+        'overall_depth': measure_building_depth(bounds),
+        'wall_height': measure_wall_height(bounds),
 
         # Parapet heights
-        'parapet_height_front': measure_parapet_front(),
-        'parapet_height_middle': measure_parapet_middle(),
+        'parapet_height_front': measure_parapet_front(bounds),
+        'parapet_height_middle': measure_parapet_middle(bounds),
 
         # Canopy
         'canopy_width': measure_canopy_width(),
@@ -81,12 +83,17 @@ def verify_geometry(spec):
         'canopy_post_count': count_canopy_posts(),
 
         # Chimney
-        'chimney_total_height': measure_chimney_total_height(),
+        'chimney_total_height': measure_chimney_total_height(bounds),
+
+        # Display window cutouts (None unless the front wall stores its openings)
+        'display_window_width': display_window and display_window['width'],
+        'display_window_height': display_window and display_window['height'],
+        'window_sill_height': display_window and display_window['z'],
     }
 
     # Compare each measurement against target
     for key, expected in targets.items():
-        if key not in measurements:
+        if measurements.get(key) is None:
             continue  # Skip targets we can't measure yet
 
         actual = measurements[key]
@@ -136,82 +143,97 @@ def verify_geometry(spec):
     return issues
 
 
-def measure_building_width():
+def _wall_objects():
+    """Get all visible wall mesh objects (hidden boolean cutters are skipped)."""
+    return [obj for obj in bpy.data.objects
+            if 'Wall' in obj.name and 'Cutter' not in obj.name
+            and obj.type == 'MESH' and not obj.hide_viewport]
+
+
+def measure_display_window():
+    """
+    Get the front display window opening from the front wall.
+
+    Only walls built by wall_generator store their openings, so this is exact
+    and needs no mesh analysis.
+
+    Returns:
+        dict: Opening ('x', 'z', 'width', 'height'), or None if not available
+    """
+    wall = bpy.data.objects.get("Wall_Front")
+    openings = get_wall_openings(wall) if wall else None
+    for opening in openings or []:
+        if opening.get('name') == 'front_left_display_window':
+            return opening
+    return None
+
+
+def measure_building_width(bounds=None):
     """Measure overall building width from wall objects."""
-    walls = [obj for obj in bpy.data.objects if 'Wall' in obj.name and obj.type == 'MESH']
-    if not walls:
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.union(_wall_objects())
+    if box is None:
         return 0
 
     # Get X bounds
-    x_coords = []
-    for wall in walls:
-        for v in wall.data.vertices:
-            world_co = wall.matrix_world @ v.co
-            x_coords.append(world_co.x)
-
-    return max(x_coords) - min(x_coords) if x_coords else 0
+    lo, hi = box
+    return float(hi[0] - lo[0])
 
 
-def measure_building_depth():
+def measure_building_depth(bounds=None):
     """Measure overall building depth from wall objects."""
-    walls = [obj for obj in bpy.data.objects if 'Wall' in obj.name and obj.type == 'MESH']
-    if not walls:
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.union(_wall_objects())
+    if box is None:
         return 0
 
     # Get Y bounds
-    y_coords = []
-    for wall in walls:
-        for v in wall.data.vertices:
-            world_co = wall.matrix_world @ v.co
-            y_coords.append(world_co.y)
+    lo, hi = box
+    return float(hi[1] - lo[1])
 
-    return max(y_coords) - min(y_coords) if y_coords else 0
 
-
-def measure_wall_height():
+def measure_wall_height(bounds=None):
     """Measure wall height from wall objects."""
-    walls = [obj for obj in bpy.data.objects if 'Wall' in obj.name and obj.type == 'MESH']
-    if not walls:
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.union(_wall_objects())
+    if box is None:
         return 0
 
     # Get Z bounds - in spec coordinates Z=0 is base of walls (top of foundation)
-    z_coords = []
-    for wall in walls:
-        for v in wall.data.vertices:
-            world_co = wall.matrix_world @ v.co
-            if world_co.z > 0.1:  # Above Z=0 (wall base)
-                z_coords.append(world_co.z)
-
-    return max(z_coords) if z_coords else 0  # Max Z is wall height (since walls start at Z=0)
+    # Only vertices above Z=0.1 count, so a max Z at or below that means no wall height
+    max_z = float(box[1][2])
+    return max_z if max_z > 0.1 else 0  # Max Z is wall height (since walls start at Z=0)
 
 
-def measure_parapet_front():
+def measure_parapet_front(bounds=None):
     """Measure front parapet height above roof."""
     parapet_objs = [obj for obj in bpy.data.objects if 'Parapet_Front' in obj.name or 'Parapet_Left_Front' in obj.name or 'Parapet_Right_Front' in obj.name]
     if not parapet_objs:
         return 0
 
     # Get max Z height
-    max_z = max(
-        max((obj.matrix_world @ v.co for v in obj.data.vertices), key=lambda co: co.z).z
-        for obj in parapet_objs
-    )
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.union(parapet_objs)
+    if box is None:
+        return 0
+    max_z = float(box[1][2])
 
     roof_top = 3.75 + 0.20  # 3.95m
     return max_z - roof_top
 
 
-def measure_parapet_middle():
+def measure_parapet_middle(bounds=None):
     """Measure middle parapet height above roof."""
     parapet_objs = [obj for obj in bpy.data.objects if 'Parapet_Left_Middle' in obj.name or 'Parapet_Right_Middle' in obj.name]
     if not parapet_objs:
         return 0
 
     # Get max Z height
-    max_z = max(
-        max((obj.matrix_world @ v.co for v in obj.data.vertices), key=lambda co: co.z).z
-        for obj in parapet_objs
-    )
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.union(parapet_objs)
+    if box is None:
+        return 0
+    max_z = float(box[1][2])
 
     roof_top = 3.75 + 0.20  # 3.95m
     return max_z - roof_top
@@ -239,15 +261,16 @@ def count_canopy_posts():
     return len(posts)
 
 
-def measure_chimney_total_height():
+def measure_chimney_total_height(bounds=None):
     """Measure chimney total height from ground."""
     chimney = bpy.data.objects.get('Chimney')
     if not chimney:
         return 0
 
     # Get max Z coordinate
-    max_z = max((chimney.matrix_world @ v.co for v in chimney.data.vertices), key=lambda co: co.z).z
-    return max_z
+    bounds = bounds or WorldBoundsCache()
+    box = bounds.aabb(chimney)
+    return float(box[1][2]) if box is not None else 0
 
 
 def print_report(issues):
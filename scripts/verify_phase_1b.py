@@ -15,7 +15,6 @@ Usage:
 """
 
 import bpy
-import yaml
 import sys
 import math
 from pathlib import Path
@@ -27,6 +26,7 @@ if str(scripts_dir) not in sys.path:
     sys.path.append(str(scripts_dir))
 
 from verification_checkpoints import create_checkpoint
+from spec_loader import load_spec_data
 
 
 def setup_camera_for_opening(opening_name, position, size, normal_direction):
@@ -312,12 +312,10 @@ def main():
 
     # Load specifications
     phase_1a_spec_path = scripts_dir.parent / 'work' / 'spec' / 'phase_1a' / 'building_geometry.yaml'
-    with open(phase_1a_spec_path, 'r') as f:
-        phase_1a_spec = yaml.safe_load(f)
+    phase_1a_spec = load_spec_data(phase_1a_spec_path)
 
     phase_1b_spec_path = scripts_dir.parent / 'work' / 'spec' / 'phase_1b' / 'opening_fill.yaml'
-    with open(phase_1b_spec_path, 'r') as f:
-        phase_1b_spec = yaml.safe_load(f)
+    phase_1b_spec = load_spec_data(phase_1b_spec_path)
 
     # Output directory for screenshots
     screenshot_dir = scripts_dir.parent / 'work' / 'verification' / f'phase_1b_iter_{iteration:03d}'
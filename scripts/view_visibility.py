@@ -0,0 +1,170 @@
+"""
+View Visibility
+Ray-cast occlusion test for render cache keys
+
+Decides which objects a camera cannot see because other geometry hides
+them, so the render cache can leave them out of a view's hash. Each object's
+world bounding box is sampled on a grid over its six faces; the object is
+hidden only if the segment from the camera to every sample point is blocked
+by another object's triangle. Interior geometry under a closed roof is then
+hidden from the top view, while an interior wall seen through a window
+opening stays visible.
+
+The test errs on the side of visible: occluders are only opaque geometry
+(callers leave glass out), and a sample point blocked only by geometry flush
+with it still counts as visible. Geometry hidden at every sample but visible
+between them (a gap narrower than the sample spacing) is missed; raise
+samples_per_edge for finer openings. Indirect effects of hidden geometry
+(shadows, reflections) are not considered.
+
+Pure NumPy (no Blender), so it can be tested offline.
+
+Usage:
+    from view_visibility import occluded_objects
+
+    hidden = occluded_objects(camera_location, {name: triangles, ...}, occluders)
+"""
+
+import numpy as np
+
+
+# Sample points per box edge (samples_per_edge**2 points per face)
+SAMPLES_PER_EDGE = 5
+
+# Triangles tested against the remaining points at once (bounds memory)
+TRIANGLE_CHUNK = 1024
+
+# Hits this close (meters) to the sample point are the sampled surface itself
+# or geometry flush with it, not occluders
+SURFACE_TOLERANCE = 1e-4
+
+
+def box_sample_points(lo, hi, samples_per_edge=SAMPLES_PER_EDGE):
+    """
+    Grid of points over the six faces of an axis-aligned box.
+
+    Args:
+        lo, hi: Box corners, shape (3,)
+        samples_per_edge: Points along each face edge (>= 2, corners included)
+
+    Returns:
+        np.ndarray: (M, 3) unique points
+    """
+    lo = np.asarray(lo, dtype=np.float64)
+    hi = np.asarray(hi, dtype=np.float64)
+    steps = np.linspace(0.0, 1.0, max(2, samples_per_edge))
+    a, b = np.meshgrid(steps, steps, indexing='ij')
+    a, b = a.ravel(), b.ravel()
+
+    faces = []
+    for axis in range(3):
+        u, v = [k for k in range(3) if k != axis]
+        for side in (lo[axis], hi[axis]):
+            points = np.empty((len(a), 3))
+            points[:, axis] = side
+            points[:, u] = lo[u] + a * (hi[u] - lo[u])
+            points[:, v] = lo[v] + b * (hi[v] - lo[v])
+            faces.append(points)
+    return np.unique(np.concatenate(faces), axis=0)
+
+
+def segments_blocked(origin, points, triangles):
+    """
+    Check which segments origin -> point cross a triangle (Moller-Trumbore).
+
+    Args:
+        origin: Segment start, shape (3,)
+        points: Segment ends, shape (P, 3)
+        triangles: Occluder corners, shape (T, 3, 3)
+
+    Returns:
+        np.ndarray: (P,) bool, True where a triangle lies strictly between
+            the origin and the point (hits within SURFACE_TOLERANCE of the
+            point do not count)
+    """
+    origin = np.asarray(origin, dtype=np.float64)
+    all_directions = np.asarray(points, dtype=np.float64) - origin
+    length = np.linalg.norm(all_directions, axis=1)
+    all_t_max = 1.0 - SURFACE_TOLERANCE / np.maximum(length, SURFACE_TOLERANCE)
+    blocked = np.zeros(len(all_directions), dtype=bool)
+
+    for start in range(0, len(triangles), TRIANGLE_CHUNK):
+        # Segments already blocked need no more tests
+        open_points = np.flatnonzero(~blocked)
+        if not len(open_points):
+            break
+        directions = all_directions[open_points]
+        t_max = all_t_max[open_points]
+        tri = np.asarray(triangles[start:start + TRIANGLE_CHUNK], dtype=np.float64)
+        v0 = tri[:, 0]
+        e1 = tri[:, 1] - v0
+        e2 = tri[:, 2] - v0
+        tvec = origin - v0
+        qvec = np.cross(tvec, e1)
+
+        pvec = np.cross(directions[:, None, :], e2[None, :, :])
+        det = np.einsum('tk,ptk->pt', e1, pvec)
+        valid = np.abs(det) > 1e-12
+        inv = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+
+        u = np.einsum('tk,ptk->pt', tvec, pvec) * inv
+        v = np.einsum('pk,tk->pt', directions, qvec) * inv
+        t = np.einsum('tk,tk->t', e2, qvec)[None, :] * inv
+
+        hit = valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 1e-9) & (t < t_max[:, None])
+        blocked[open_points] = hit.any(axis=1)
+    return blocked
+
+
+def occluded_objects(origin, objects, occluders=None, samples_per_edge=SAMPLES_PER_EDGE):
+    """
+    Find the objects a camera at origin cannot see.
+
+    Args:
+        origin: Camera location, shape (3,)
+        objects (dict): name -> (N, 3, 3) world-space triangles of the objects to test
+        occluders (dict): name -> triangles that can hide others (default:
+            objects). Leave out transparent geometry such as glass.
+        samples_per_edge: Bounding box sample density
+
+    Returns:
+        set: Names of objects hidden at every sample point
+    """
+    occluders = objects if occluders is None else occluders
+    names = [name for name, tris in occluders.items() if len(tris)]
+    if not names:
+        return set()
+    all_triangles = np.concatenate([np.asarray(occluders[name], dtype=np.float64).reshape(-1, 3, 3)
+                                    for name in names])
+    owner = np.repeat(np.arange(len(names)), [len(occluders[name]) for name in names])
+    # Largest first: walls and roof block most segments in the first chunks
+    area = np.linalg.norm(np.cross(all_triangles[:, 1] - all_triangles[:, 0],
+                                   all_triangles[:, 2] - all_triangles[:, 0]), axis=1)
+    order = np.argsort(-area, kind='stable')
+    all_triangles, owner = all_triangles[order], owner[order]
+    index = {name: i for i, name in enumerate(names)}
+    tri_lo = all_triangles.min(axis=1)
+    tri_hi = all_triangles.max(axis=1)
+    origin = np.asarray(origin, dtype=np.float64)
+
+    hidden = set()
+    for name, triangles in objects.items():
+        triangles = np.asarray(triangles, dtype=np.float64).reshape(-1, 3, 3)
+        if not len(triangles):
+            continue
+        lo = triangles.min(axis=(0, 1))
+        hi = triangles.max(axis=(0, 1))
+
+        # Only triangles overlapping the box spanned by the camera and the object can block
+        reach_lo = np.minimum(lo, origin)
+        reach_hi = np.maximum(hi, origin)
+        candidates = np.all((tri_hi >= reach_lo) & (tri_lo <= reach_hi), axis=1)
+        if name in index:
+            candidates &= owner != index[name]
+        if not candidates.any():
+            continue
+
+        points = box_sample_points(lo, hi, samples_per_edge)
+        if segments_blocked(origin, points, all_triangles[candidates]).all():
+            hidden.add(name)
+    return hidden
@@ -0,0 +1,232 @@
+"""
+Wall Generator
+Axis-aligned wall slabs with rectangular openings, built without booleans
+
+Builds a wall slab with N rectangular holes directly. The wall face is split
+into a conforming grid at every opening edge; solid cells become front and back
+quads, and every grid edge between a solid cell and a hole (or the outside)
+becomes a side quad through the wall thickness (outer edges and reveal faces).
+Grid vertices are shared, so the result is a closed, consistently wound
+manifold with no T-junctions, and the opening sizes are exact by construction.
+
+Openings are stored on the object (obj["openings"]) so verification can read
+cutout dimensions without measuring boolean-modified geometry.
+
+Mesh generation is pure NumPy; only create_wall_with_openings needs Blender.
+
+Usage:
+    from wall_generator import create_wall_with_openings, openings_for_wall
+
+    openings = openings_for_wall(spec, 'front', wall_center=(0, -7.5))
+    wall = create_wall_with_openings("Wall_Front", 8.5, 0.18, 3.75, (0, -7.5, 1.875), openings)
+"""
+
+import json
+
+import numpy as np
+
+
+def _validate_openings(length, height, openings):
+    """
+    Convert openings to (u0, u1, w0, w1) rectangles in wall-face coordinates.
+
+    u runs along the wall from its center, w up from the wall base.
+
+    Raises:
+        ValueError: If an opening leaves the wall face or overlaps another
+    """
+    rects = []
+    for opening in openings:
+        u0 = opening['x'] - opening['width'] / 2
+        u1 = opening['x'] + opening['width'] / 2
+        w0 = opening['z']
+        w1 = opening['z'] + opening['height']
+        name = opening.get('name', 'opening')
+
+        if opening['width'] <= 0 or opening['height'] <= 0:
+            raise ValueError(f"Opening '{name}' has no area")
+        if u0 < -length / 2 - 1e-9 or u1 > length / 2 + 1e-9 or w0 < -1e-9 or w1 > height + 1e-9:
+            raise ValueError(f"Opening '{name}' extends past the wall face")
+
+        for other_name, (a0, a1, b0, b1) in rects:
+            if u0 < a1 and a0 < u1 and w0 < b1 and b0 < w1:
+                raise ValueError(f"Openings '{other_name}' and '{name}' overlap")
+        rects.append((name, (u0, u1, w0, w1)))
+
+    return [rect for _, rect in rects]
+
+
+def wall_mesh(length, thickness, height, openings=()):
+    """
+    Build a wall slab with rectangular holes as a quad mesh.
+
+    The slab is centered on the origin: x along the wall (-length/2..length/2),
+    y through the thickness and z up (-height/2..height/2), matching a
+    create_box of the same size.
+
+    Args:
+        length (float): Wall length (X)
+        thickness (float): Wall thickness (Y)
+        height (float): Wall height (Z)
+        openings (list): Dicts with 'x' (center along the wall, from the wall
+            center), 'z' (bottom, from the wall base), 'width', 'height' and
+            optional 'name'. Openings may touch the wall edges (doors).
+
+    Returns:
+        tuple: (verts (N, 3) float array, faces list of 4-tuples)
+
+    Raises:
+        ValueError: If an opening leaves the wall face or overlaps another
+
+    Example:
+        >>> verts, faces = wall_mesh(4.0, 0.2, 3.0, [{'x': 0, 'z': 0, 'width': 1.0, 'height': 2.1}])
+        >>> len(faces)
+        22
+    """
+    rects = _validate_openings(length, height, openings)
+
+    # Conforming grid: break at every opening edge
+    us = np.unique(np.round([-length / 2, length / 2] + [v for r in rects for v in r[:2]], 9))
+    ws = np.unique(np.round([0.0, height] + [v for r in rects for v in r[2:]], 9))
+    us = us[(us >= -length / 2 - 1e-9) & (us <= length / 2 + 1e-9)]
+    ws = ws[(ws >= -1e-9) & (ws <= height + 1e-9)]
+
+    # solid[i, j]: cell between us[i]..us[i+1] and ws[j]..ws[j+1] is wall
+    mid_u = (us[:-1] + us[1:]) / 2
+    mid_w = (ws[:-1] + ws[1:]) / 2
+    solid = np.ones((len(mid_u), len(mid_w)), dtype=bool)
+    for u0, u1, w0, w1 in rects:
+        solid[np.ix_((mid_u > u0) & (mid_u < u1), (mid_w > w0) & (mid_w < w1))] = False
+
+    def is_solid(i, j):
+        return 0 <= i < solid.shape[0] and 0 <= j < solid.shape[1] and bool(solid[i, j])
+
+    half_t = thickness / 2
+    index = {}
+    verts = []
+
+    def vert(i, j, side):
+        """Grid vertex (us[i], ws[j]) on the front (side 0, -y) or back (side 1, +y) face."""
+        key = (i, j, side)
+        if key not in index:
+            index[key] = len(verts)
+            verts.append((us[i], half_t if side else -half_t, ws[j] - height / 2))
+        return index[key]
+
+    faces = []
+    for i in range(solid.shape[0]):
+        for j in range(solid.shape[1]):
+            if not solid[i, j]:
+                continue
+
+            # Front (-y) and back (+y) faces
+            faces.append((vert(i, j, 0), vert(i + 1, j, 0), vert(i + 1, j + 1, 0), vert(i, j + 1, 0)))
+            faces.append((vert(i, j, 1), vert(i, j + 1, 1), vert(i + 1, j + 1, 1), vert(i + 1, j, 1)))
+
+            # Side faces where the neighbouring cell is a hole or outside the wall
+            if not is_solid(i + 1, j):  # +x
+                faces.append((vert(i + 1, j, 0), vert(i + 1, j, 1), vert(i + 1, j + 1, 1), vert(i + 1, j + 1, 0)))
+            if not is_solid(i - 1, j):  # -x
+                faces.append((vert(i, j + 1, 0), vert(i, j + 1, 1), vert(i, j, 1), vert(i, j, 0)))
+            if not is_solid(i, j + 1):  # +z
+                faces.append((vert(i, j + 1, 0), vert(i + 1, j + 1, 0), vert(i + 1, j + 1, 1), vert(i, j + 1, 1)))
+            if not is_solid(i, j - 1):  # -z
+                faces.append((vert(i, j, 1), vert(i + 1, j, 1), vert(i + 1, j, 0), vert(i, j, 0)))
+
+    return np.array(verts, dtype=np.float64).reshape(-1, 3), faces
+
+
+def openings_for_wall(spec, wall_key, wall_center, axis='x'):
+    """
+    Get the openings of one wall from a Phase 1A spec's cutouts.
+
+    Args:
+        spec (dict): Loaded building_geometry.yaml
+        wall_key (str): Cutout 'wall' value ('front', 'rear', 'left', 'right', 'alcove_back')
+        wall_center (tuple): (x, y) of the wall center
+        axis (str): 'x' if the wall runs along X (front/rear), 'y' if along Y (left/right)
+
+    Returns:
+        list: Opening dicts for wall_mesh / create_wall_with_openings
+    """
+    along = 0 if axis == 'x' else 1
+    openings = []
+    for name, cutout in (spec.get('cutouts') or {}).items():
+        if cutout.get('wall') != wall_key:
+            continue
+        pos = cutout['position']
+        openings.append({
+            'name': name,
+            'x': (pos['x'], pos['y'])[along] - wall_center[along],
+            'z': pos['z'],
+            'width': cutout['width'],
+            'height': cutout['height'],
+        })
+    return openings
+
+
+def create_wall_with_openings(name, length, thickness, height, location, openings=(), axis='x'):
+    """
+    Create a wall slab with rectangular openings (no booleans).
+
+    The object matches create_box for the same slab: origin at the slab center,
+    so obj.dimensions and obj.location are what the box path produced.
+
+    Args:
+        name (str): Object name
+        length (float): Wall length along its axis
+        thickness (float): Wall thickness
+        height (float): Wall height
+        location (tuple): (x, y, z) wall center
+        openings (list): See wall_mesh ('x' is measured along the wall axis)
+        axis (str): 'x' for walls running along X, 'y' for walls running along Y
+
+    Returns:
+        bpy.types.Object: Wall object with obj["openings"] (JSON list of the
+            openings, in wall coordinates)
+
+    Example:
+        >>> wall = create_wall_with_openings("Wall_Rear", 8.5, 0.18, 3.75, (0, 7.5, 1.875),
+        ...     [{'name': 'rear_service_door', 'x': 0.0, 'z': 0.0, 'width': 1.0, 'height': 2.1}])
+    """
+    import bpy
+
+    verts, faces = wall_mesh(length, thickness, height, openings)
+    faces = np.array(faces, dtype=np.int32).reshape(-1, 4)
+    if axis == 'y':
+        # Swap x/y (a reflection), so reverse winding to keep normals outward
+        verts = verts[:, [1, 0, 2]]
+        faces = faces[:, ::-1]
+
+    mesh = bpy.data.meshes.new(f"{name}_Mesh")
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(faces.size)
+    mesh.polygons.add(len(faces))
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    mesh.polygons.foreach_set("loop_start", np.arange(0, faces.size, 4, dtype=np.int32))
+    # loop_total is derived from loop_start (read-only) in newer Blender versions
+    if not mesh.polygons.bl_rna.properties['loop_total'].is_readonly:
+        mesh.polygons.foreach_set("loop_total", np.full(len(faces), 4, dtype=np.int32))
+    mesh.update()
+    mesh.validate()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj["openings"] = json.dumps([dict(opening) for opening in openings])
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+
+    return obj
+
+
+def get_wall_openings(obj):
+    """
+    Read the openings stored on a generated wall.
+
+    Returns:
+        list: Opening dicts, or None if the wall was not built by create_wall_with_openings
+    """
+    if "openings" not in obj:
+        return None
+    return json.loads(obj["openings"])